@@ -1,3 +1,7 @@
+-- Schéma de base. Les index et évolutions ultérieures sont des migrations
+-- versionnées (data/migrations/), appliquées par ResetDatabase ou par :
+--   python src/utils/migrations.py
+
 -----------------------------------------------------
 -- TABLE : Utilisateur
 -----------------------------------------------------
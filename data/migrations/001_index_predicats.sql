@@ -0,0 +1,31 @@
+-----------------------------------------------------
+-- Migration 001 : index des prédicats des DAO
+-----------------------------------------------------
+
+-- Réservations d'un événement (find_by_event, liste des inscrits, statistiques,
+-- recomptage des compteurs) : la contrainte unique (fk_utilisateur, fk_evenement)
+-- ne sert pas quand on filtre sur fk_evenement seul.
+CREATE INDEX IF NOT EXISTS idx_reservation_evenement
+    ON reservation (fk_evenement, date_reservation DESC);
+
+-- Bus d'un événement (find_by_event, count_by_event)
+CREATE INDEX IF NOT EXISTS idx_bus_evenement
+    ON bus (fk_evenement, id_bus);
+
+-- Clé de tri de la consultation : pagination par curseur (date_evenement, id_evenement)
+CREATE INDEX IF NOT EXISTS idx_evenement_date_id
+    ON evenement (date_evenement, id_evenement);
+
+-- Événements réservables : index partiel, bien plus petit que la table
+CREATE INDEX IF NOT EXISTS idx_evenement_disponible_date_id
+    ON evenement (date_evenement, id_evenement)
+    WHERE statut = 'disponible en ligne';
+
+-- Administrateurs (peu nombreux) : index partiel sur la clé de tri
+CREATE INDEX IF NOT EXISTS idx_utilisateur_administrateur
+    ON utilisateur (id_utilisateur)
+    WHERE administrateur;
+
+-- Suppression en cascade des commentaires d'une réservation
+CREATE INDEX IF NOT EXISTS idx_commentaire_reservation
+    ON commentaire (fk_reservation);
@@ -0,0 +1,29 @@
+-----------------------------------------------------
+-- Migration 002 : recherche par ville (ILIKE '%x%')
+-----------------------------------------------------
+-- Un B-tree ne sert pas un motif commençant par '%' : index GIN trigramme.
+-- L'extension est installée dans 'public' (une seule fois par base, partagée
+-- par les schémas projet_dao et projet_test_dao). Sans le droit de la créer,
+-- la migration se contente d'un avertissement et la recherche reste fonctionnelle.
+
+DO $$
+DECLARE
+    schema_trgm TEXT;
+BEGIN
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public;
+    EXCEPTION WHEN insufficient_privilege OR undefined_file THEN
+        RAISE WARNING 'pg_trgm indisponible : index trigramme sur evenement.ville non créé';
+    END;
+
+    SELECT n.nspname INTO schema_trgm
+    FROM pg_extension x JOIN pg_namespace n ON n.oid = x.extnamespace
+    WHERE x.extname = 'pg_trgm';
+
+    IF schema_trgm IS NOT NULL THEN
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS idx_evenement_ville_trgm ON evenement USING gin (ville %I.gin_trgm_ops)',
+            schema_trgm
+        );
+    END IF;
+END $$;
@@ -0,0 +1,33 @@
+-----------------------------------------------------
+-- Migration 003 : boîte d'envoi des e-mails (outbox transactionnelle)
+-----------------------------------------------------
+
+-- Les e-mails sont écrits dans la même transaction que l'action qui les
+-- déclenche (réservation, annulation, ...), puis envoyés par les workers
+-- (service/outbox_email_service.py). Cycle de vie :
+--   en_attente -> envoye
+--   en_attente -> en_attente (échec temporaire : nouvelle tentative plus tard)
+--   en_attente -> abandonne (lettre morte : échec définitif ou trop de tentatives)
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id_email            BIGSERIAL PRIMARY KEY,
+    destinataire        VARCHAR(255) NOT NULL,
+    sujet               VARCHAR(255) NOT NULL,
+    contenu             TEXT NOT NULL,
+    statut              VARCHAR(20) NOT NULL DEFAULT 'en_attente'
+                        CHECK (statut IN ('en_attente', 'envoye', 'abandonne')),
+    tentatives          INT NOT NULL DEFAULT 0,
+    prochaine_tentative TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    derniere_erreur     TEXT,
+    date_creation       TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    date_envoi          TIMESTAMP
+);
+
+-- File des e-mails à envoyer : index partiel, ne contient que les en_attente
+CREATE INDEX IF NOT EXISTS idx_email_outbox_a_envoyer
+    ON email_outbox (prochaine_tentative, id_email)
+    WHERE statut = 'en_attente';
+
+-- Lettres mortes, consultées par l'administrateur
+CREATE INDEX IF NOT EXISTS idx_email_outbox_abandonne
+    ON email_outbox (id_email)
+    WHERE statut = 'abandonne';
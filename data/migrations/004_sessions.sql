@@ -0,0 +1,21 @@
+-----------------------------------------------------
+-- Migration 004 : sessions authentifiées
+-----------------------------------------------------
+
+-- Une ligne par session ouverte après une authentification réussie
+-- (service/session_service.py). Le jeton remis au client est signé et ne contient
+-- que id_session : le valider coûte une lecture par clé primaire, pas un bcrypt.
+-- expire_le glisse à chaque usage (au plus une écriture par minute et par session) ;
+-- il n'est volontairement pas indexé, pour que ces mises à jour restent HOT
+-- (fillfactor : place libre dans chaque page pour la nouvelle version de la ligne).
+CREATE TABLE IF NOT EXISTS session_utilisateur (
+    id_session      VARCHAR(64) PRIMARY KEY,
+    fk_utilisateur  INT NOT NULL REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
+    administrateur  BOOLEAN NOT NULL DEFAULT FALSE,
+    date_creation   TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expire_le       TIMESTAMP NOT NULL
+) WITH (fillfactor = 70);
+
+-- Fermeture de toutes les sessions d'un utilisateur (et ON DELETE CASCADE)
+CREATE INDEX IF NOT EXISTS idx_session_utilisateur_fk
+    ON session_utilisateur (fk_utilisateur);
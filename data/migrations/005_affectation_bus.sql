@@ -0,0 +1,57 @@
+-----------------------------------------------------
+-- Migration 005 : affectation des réservations aux bus
+-----------------------------------------------------
+
+-- bus_aller / bus_retour (réservation) expriment une demande ; la place est une
+-- ligne de affectation_bus, dans un bus de l'événement et du même sens. Le nombre
+-- de lignes d'un bus ne dépasse jamais bus.nombre_places : les affectations sont
+-- écrites par dao/affectation_bus_dao.py sous le verrou de la ligne evenement,
+-- comme les réservations. Une demande sans place reste en attente (pas de ligne)
+-- jusqu'à ce qu'une place se libère ou qu'un bus soit ajouté.
+CREATE TABLE IF NOT EXISTS affectation_bus (
+    fk_reservation  INT NOT NULL REFERENCES reservation(id_reservation) ON DELETE CASCADE,
+    direction       VARCHAR(10) NOT NULL CHECK (direction IN ('aller', 'retour')),
+    fk_bus          INT NOT NULL REFERENCES bus(id_bus) ON DELETE CASCADE,
+    PRIMARY KEY (fk_reservation, direction)
+);
+
+-- Inscrits par bus (COUNT ... GROUP BY fk_bus) et ON DELETE CASCADE depuis bus
+CREATE INDEX IF NOT EXISTS idx_affectation_bus_bus
+    ON affectation_bus (fk_bus);
+
+-- Reprise de l'existant : les demandes sont servies par ordre de réservation,
+-- les bus d'un même sens remplis par ordre d'id
+WITH places AS (
+    SELECT b.id_bus, b.fk_evenement, b.direction,
+           b.nombre_places - (SELECT COUNT(*) FROM affectation_bus a WHERE a.fk_bus = b.id_bus) AS libres
+    FROM bus b
+    WHERE b.fk_evenement IS NOT NULL
+),
+tranches AS (
+    SELECT id_bus, fk_evenement, direction,
+           SUM(libres) OVER w - libres AS debut,
+           SUM(libres) OVER w AS fin
+    FROM places
+    WHERE libres > 0
+    WINDOW w AS (PARTITION BY fk_evenement, direction ORDER BY id_bus)
+),
+attente AS (
+    SELECT r.id_reservation, r.fk_evenement, d.direction,
+           ROW_NUMBER() OVER (
+               PARTITION BY r.fk_evenement, d.direction ORDER BY r.date_reservation, r.id_reservation
+           ) AS rang
+    FROM reservation r
+    CROSS JOIN LATERAL (VALUES ('aller', r.bus_aller), ('retour', r.bus_retour)) AS d (direction, demande)
+    WHERE d.demande
+      AND NOT EXISTS (
+          SELECT 1 FROM affectation_bus a
+          WHERE a.fk_reservation = r.id_reservation AND a.direction = d.direction
+      )
+)
+INSERT INTO affectation_bus (fk_reservation, direction, fk_bus)
+SELECT w.id_reservation, w.direction, t.id_bus
+FROM attente w
+JOIN tranches t
+  ON t.fk_evenement = w.fk_evenement
+ AND t.direction = w.direction
+ AND w.rang > t.debut AND w.rang <= t.fin;
@@ -0,0 +1,26 @@
+-----------------------------------------------------
+-- Migration 006 : liste d'attente des événements complets
+-----------------------------------------------------
+
+-- Une demande de réservation refusée faute de place peut rejoindre la liste
+-- d'attente de l'événement, avec ses options. Quand une place se libère
+-- (annulation, capacité augmentée), la plus ancienne demande devient une
+-- réservation dans la même transaction, sous le verrou de la ligne evenement
+-- (dao/liste_attente_dao.py), et son e-mail part par la boîte d'envoi.
+-- L'ordre d'arrivée est celui de id_attente.
+CREATE TABLE IF NOT EXISTS liste_attente (
+    id_attente        BIGSERIAL PRIMARY KEY,
+    fk_utilisateur    INT NOT NULL REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
+    fk_evenement      INT NOT NULL REFERENCES evenement(id_evenement) ON DELETE CASCADE,
+    bus_aller         BOOLEAN NOT NULL DEFAULT FALSE,
+    bus_retour        BOOLEAN NOT NULL DEFAULT FALSE,
+    adherent          BOOLEAN NOT NULL DEFAULT FALSE,
+    sam               BOOLEAN NOT NULL DEFAULT FALSE,
+    boisson           BOOLEAN NOT NULL DEFAULT FALSE,
+    date_inscription  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT liste_attente_unique_user_event UNIQUE (fk_utilisateur, fk_evenement)
+);
+
+-- Tête de file d'un événement (promotion) et rang d'une demande (position)
+CREATE INDEX IF NOT EXISTS idx_liste_attente_evenement
+    ON liste_attente (fk_evenement, id_attente);
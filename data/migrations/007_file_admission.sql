@@ -0,0 +1,26 @@
+-----------------------------------------------------
+-- Migration 007 : file d'admission (salle d'attente virtuelle)
+-----------------------------------------------------
+
+-- Lors d'une ouverture de billetterie, les clients prennent un ticket (numéro
+-- croissant) et sont admis à réserver dans l'ordre, au débit d'un seau à jetons
+-- (service/admission_service.py). Une ligne par file : l'état du seau à l'instant
+-- `maj`, projeté à la lecture (dao/admission_dao.py). Seule l'entrée d'un nouveau
+-- client écrit cette ligne, sous son verrou ; consulter sa place est une lecture.
+CREATE TABLE IF NOT EXISTS file_admission (
+    nom             VARCHAR(64) PRIMARY KEY,
+    dernier_ticket  BIGINT NOT NULL DEFAULT 0,
+    admis_jusqu_a   BIGINT NOT NULL DEFAULT 0,
+    jetons          DOUBLE PRECISION NOT NULL,
+    maj             TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp()
+);
+
+-- Un ticket par client et par file : recharger la page ne fait pas perdre sa place.
+-- Un ticket plus vieux que la validité configurée est remplacé à la prochaine entrée.
+CREATE TABLE IF NOT EXISTS ticket_admission (
+    nom          VARCHAR(64) NOT NULL REFERENCES file_admission(nom) ON DELETE CASCADE,
+    cle          VARCHAR(128) NOT NULL,
+    ticket       BIGINT NOT NULL,
+    date_entree  TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+    PRIMARY KEY (nom, cle)
+);
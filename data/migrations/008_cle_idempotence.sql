@@ -0,0 +1,22 @@
+-----------------------------------------------------
+-- Migration 008 : clés d'idempotence
+-----------------------------------------------------
+
+-- Un client qui renvoie une réservation, une modification ou une annulation
+-- (délai dépassé pendant un rush) avec la même clé obtient le résultat du premier
+-- essai, sans que l'opération soit rejouée. La clé est prise et son résultat
+-- enregistré dans la transaction même de l'opération (dao/idempotence_dao.py) :
+-- un essai concurrent attend sur la clé, puis relit le résultat.
+-- Une clé expirée (expire_le) peut être reprise ; `purger` supprime les autres.
+CREATE TABLE IF NOT EXISTS cle_idempotence (
+    cle            VARCHAR(160) NOT NULL,
+    operation      VARCHAR(32) NOT NULL,
+    resultat       JSONB,
+    date_creation  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expire_le      TIMESTAMP NOT NULL,
+    PRIMARY KEY (cle, operation)
+);
+
+-- Purge des clés expirées
+CREATE INDEX IF NOT EXISTS idx_cle_idempotence_expire_le
+    ON cle_idempotence (expire_le);
@@ -0,0 +1,79 @@
+-----------------------------------------------------
+-- Migration 009 : compteur d'événement (dénormalisé)
+-----------------------------------------------------
+-- Nombre de réservations (et d'options bus) par événement, tenu à jour
+-- par triggers : les places restantes se lisent par clé primaire au lieu
+-- d'un COUNT(*) ... GROUP BY sur toute la table reservation.
+-- En cas de dérive : python src/utils/reconciliation_compteurs.py --reparer
+--
+-- Rejouable sur une base déjà déployée : la table et les triggers sont créés
+-- s'ils manquent, puis les compteurs sont recalculés depuis reservation.
+
+CREATE TABLE IF NOT EXISTS compteur_evenement (
+    id_evenement INT PRIMARY KEY REFERENCES evenement(id_evenement) ON DELETE CASCADE,
+    nb_reservations INT NOT NULL DEFAULT 0,
+    nb_bus_aller INT NOT NULL DEFAULT 0,
+    nb_bus_retour INT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION compteur_evenement_creer() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO compteur_evenement (id_evenement)
+    VALUES (NEW.id_evenement)
+    ON CONFLICT (id_evenement) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_evenement_compteur ON evenement;
+CREATE TRIGGER trg_evenement_compteur
+AFTER INSERT ON evenement
+FOR EACH ROW EXECUTE FUNCTION compteur_evenement_creer();
+
+CREATE OR REPLACE FUNCTION compteur_evenement_maj() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE compteur_evenement SET
+            nb_reservations = nb_reservations - 1,
+            nb_bus_aller = nb_bus_aller - COALESCE(OLD.bus_aller, FALSE)::int,
+            nb_bus_retour = nb_bus_retour - COALESCE(OLD.bus_retour, FALSE)::int
+        WHERE id_evenement = OLD.fk_evenement;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO compteur_evenement (id_evenement, nb_reservations, nb_bus_aller, nb_bus_retour)
+        VALUES (
+            NEW.fk_evenement, 1,
+            COALESCE(NEW.bus_aller, FALSE)::int,
+            COALESCE(NEW.bus_retour, FALSE)::int
+        )
+        ON CONFLICT (id_evenement) DO UPDATE SET
+            nb_reservations = compteur_evenement.nb_reservations + 1,
+            nb_bus_aller = compteur_evenement.nb_bus_aller + EXCLUDED.nb_bus_aller,
+            nb_bus_retour = compteur_evenement.nb_bus_retour + EXCLUDED.nb_bus_retour;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_reservation_compteur ON reservation;
+CREATE TRIGGER trg_reservation_compteur
+AFTER INSERT OR DELETE OR UPDATE OF fk_evenement, bus_aller, bus_retour ON reservation
+FOR EACH ROW EXECUTE FUNCTION compteur_evenement_maj();
+
+-- Rattrapage : aucune réservation ne passe pendant le recalcul
+LOCK TABLE reservation IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO compteur_evenement (id_evenement, nb_reservations, nb_bus_aller, nb_bus_retour)
+SELECT e.id_evenement,
+       COUNT(r.id_reservation),
+       COUNT(r.id_reservation) FILTER (WHERE r.bus_aller),
+       COUNT(r.id_reservation) FILTER (WHERE r.bus_retour)
+FROM evenement e
+LEFT JOIN reservation r ON r.fk_evenement = e.id_evenement
+GROUP BY e.id_evenement
+ON CONFLICT (id_evenement) DO UPDATE SET
+    nb_reservations = EXCLUDED.nb_reservations,
+    nb_bus_aller = EXCLUDED.nb_bus_aller,
+    nb_bus_retour = EXCLUDED.nb_bus_retour;
@@ -0,0 +1,337 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import math
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import dotenv
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from model.admission_models import TicketAdmissionModel
+from model.api_models import ConnexionModelIn, DemandeReservationModelIn, JetonModelOut
+from model.pagination_models import PageModel
+from model.reservation_models import ReservationModelIn, ReservationModelOut, ResultatReservationModel
+from model.statistiques_models import StatistiquesGlobalesModel
+from service.admission_service import AdmissionServiceAsync
+from service.consultation_evenement_service import ConsultationEvenementServiceAsync
+from service.reservation_service import ReservationServiceAsync
+from service.session_service import SessionServiceAsync
+from service.statistiques_service import StatistiquesService
+from service.utilisateur_service import UtilisateurServiceAsync
+from utils.metriques import TYPE_PROMETHEUS, RegistreMetriques
+from utils.securite import HachageMotDePasse
+
+"""
+API HTTP des réservations : liste des événements avec places restantes,
+réservation, annulation et statistiques.
+
+L'identité voyage dans un jeton signé (en-tête Authorization: Bearer) désignant
+une session de service/session_service.py, pas dans le singleton view.session.Session :
+le mot de passe n'est vérifié (bcrypt) qu'à la connexion, chaque requête suivante
+ne coûte qu'une lecture par clé. Avec SESSION_STOCKAGE=postgres (défaut), plusieurs
+workers uvicorn, derrière un répartiteur de charge, servent indifféremment
+n'importe quel client, à condition de partager API_SECRET.
+"""
+
+dotenv.load_dotenv()
+
+
+@asynccontextmanager
+async def cycle_de_vie(app: FastAPI):
+    yield
+    await DBConnectionAsync().fermer()
+    HachageMotDePasse().fermer()
+
+
+app = FastAPI(title="ENSAI BDE - Réservations", lifespan=cycle_de_vie)
+bearer = HTTPBearer(auto_error=False)
+
+
+# ---------- Dépendances ----------
+
+def utilisateur_service() -> UtilisateurServiceAsync:
+    return UtilisateurServiceAsync()
+
+
+def consultation_service() -> ConsultationEvenementServiceAsync:
+    return ConsultationEvenementServiceAsync()
+
+
+def reservation_service() -> ReservationServiceAsync:
+    return ReservationServiceAsync()
+
+
+def statistiques_service() -> StatistiquesService:
+    return StatistiquesService()
+
+
+def session_service() -> SessionServiceAsync:
+    return SessionServiceAsync()
+
+
+def admission_service() -> AdmissionServiceAsync:
+    return AdmissionServiceAsync()
+
+
+def _reessayer_apres(ticket: Optional[TicketAdmissionModel]) -> Dict[str, str]:
+    """En-tête Retry-After (secondes entières) d'un client pas encore admis."""
+    return {"Retry-After": str(max(1, math.ceil(ticket.attente_estimee))) if ticket else "1"}
+
+
+def _cle_idempotence(session: Dict[str, Any], cle: Optional[str]) -> Optional[str]:
+    """
+    Clé d'idempotence (en-tête Idempotency-Key) propre à l'utilisateur : deux
+    clients qui choisissent la même clé ne voient jamais leurs résultats mêlés.
+    """
+    if cle is None:
+        return None
+    if not 0 < len(cle) <= 128:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Idempotency-Key : 1 à 128 caractères.")
+    return f"{session['id']}:{cle}"
+
+
+def jeton(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer)) -> str:
+    if credentials is None:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Authentification requise.",
+                            headers={"WWW-Authenticate": "Bearer"})
+    return credentials.credentials
+
+
+async def identite(
+    jeton: str = Depends(jeton),
+    sessions: SessionServiceAsync = Depends(session_service),
+) -> Dict[str, Any]:
+    """Session du porteur du jeton ({"id", "admin"}), expiration repoussée ; 401 sinon."""
+    try:
+        session = await sessions.valider(jeton)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, str(exc), headers={"WWW-Authenticate": "Bearer"})
+    return {"id": session.fk_utilisateur, "admin": session.administrateur}
+
+
+def identite_admin(session: Dict[str, Any] = Depends(identite)) -> Dict[str, Any]:
+    if not session.get("admin"):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Réservé aux administrateurs.")
+    return session
+
+
+@app.exception_handler(ValueError)
+async def erreur_metier(request: Request, exc: ValueError) -> JSONResponse:
+    """Les services lèvent ValueError pour les erreurs métier : 400 avec le message."""
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
+# ---------- Authentification ----------
+
+@app.post("/connexion", response_model=JetonModelOut)
+async def connexion(
+    identifiants: ConnexionModelIn,
+    service: UtilisateurServiceAsync = Depends(utilisateur_service),
+    sessions: SessionServiceAsync = Depends(session_service),
+) -> JetonModelOut:
+    """Vérifie les identifiants (une seule fois) et ouvre une session : renvoie son jeton signé."""
+    try:
+        utilisateur = await service.authenticate_user(identifiants.email, identifiants.mot_de_passe)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, str(exc))
+
+    jeton_session, session = await sessions.ouvrir(utilisateur)
+    return JetonModelOut(jeton=jeton_session, expire_le=session.expire_le, utilisateur=utilisateur)
+
+
+@app.delete("/connexion", status_code=status.HTTP_204_NO_CONTENT)
+async def deconnexion(
+    jeton: str = Depends(jeton),
+    sessions: SessionServiceAsync = Depends(session_service),
+) -> Response:
+    """Ferme la session : le jeton est refusé dès la requête suivante."""
+    try:
+        await sessions.fermer(jeton)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, str(exc), headers={"WWW-Authenticate": "Bearer"})
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ---------- Événements ----------
+
+@app.get("/evenements", response_model=PageModel[Dict[str, Any]])
+async def lister_evenements(
+    limit: int = 20,
+    curseur: Optional[str] = None,
+    a_partir_du: Optional[date] = None,
+    service: ConsultationEvenementServiceAsync = Depends(consultation_service),
+):
+    """Événements disponibles avec leurs places restantes, paginés par curseur."""
+    return await service.lister_avec_places_restantes_page(
+        limit=min(max(limit, 1), 100), curseur=curseur, a_partir_du=a_partir_du
+    )
+
+
+@app.get("/evenements/{id_evenement}")
+async def lire_evenement(
+    id_evenement: int,
+    service: ConsultationEvenementServiceAsync = Depends(consultation_service),
+) -> Dict[str, Any]:
+    try:
+        return await service.get_evenement_avec_places_restantes(id_evenement)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc))
+
+
+# ---------- File d'admission ----------
+
+@app.post("/file-attente", response_model=TicketAdmissionModel)
+async def entrer_en_file(
+    response: Response,
+    session: Dict[str, Any] = Depends(identite),
+    admission: AdmissionServiceAsync = Depends(admission_service),
+) -> TicketAdmissionModel:
+    """
+    Prend (ou reprend) un ticket dans la file d'admission des réservations.
+    200 si le client est admis, 202 sinon, avec Retry-After : le délai avant de
+    consulter à nouveau sa place (GET) ou de réserver.
+    """
+    ticket = await admission.entrer(session["id"])
+    if not ticket.admis:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers.update(_reessayer_apres(ticket))
+    return ticket
+
+
+@app.get("/file-attente", response_model=TicketAdmissionModel)
+async def place_en_file(
+    response: Response,
+    session: Dict[str, Any] = Depends(identite),
+    admission: AdmissionServiceAsync = Depends(admission_service),
+) -> TicketAdmissionModel:
+    """Place du client dans la file (une lecture, sans écriture) ; 404 sans ticket valide."""
+    ticket = await admission.statut(session["id"])
+    if ticket is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Aucun ticket : entrez d'abord dans la file (POST).")
+    if not ticket.admis:
+        response.headers.update(_reessayer_apres(ticket))
+    return ticket
+
+
+# ---------- Réservations ----------
+
+@app.get("/reservations", response_model=List[ReservationModelOut])
+async def mes_reservations(
+    session: Dict[str, Any] = Depends(identite),
+    service: ReservationServiceAsync = Depends(reservation_service),
+):
+    return await service.get_reservations_by_user(session["id"])
+
+
+@app.post("/reservations", response_model=ResultatReservationModel, status_code=status.HTTP_201_CREATED)
+async def reserver(
+    demande: DemandeReservationModelIn,
+    response: Response,
+    session: Dict[str, Any] = Depends(identite),
+    service: ReservationServiceAsync = Depends(reservation_service),
+    admission: AdmissionServiceAsync = Depends(admission_service),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+) -> ResultatReservationModel:
+    """
+    Réserve une place pour l'utilisateur du jeton.
+    201 si la place est attribuée, 202 si la demande rejoint la liste d'attente
+    (`liste_attente`, événement complet), 409 si complet ou doublon, 404 si l'événement
+    n'existe pas ; le corps donne toujours l'issue typée.
+    Si la file d'admission est active (ADMISSION_DEBIT), 429 tant que le client
+    n'y a pas été admis.
+    Renvoyée avec le même en-tête Idempotency-Key, la requête rend l'issue du
+    premier essai sans réserver une seconde fois.
+    """
+    cle = _cle_idempotence(session, idempotency_key)
+    ticket = await admission.statut(session["id"])
+    try:
+        admission.controler(ticket)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_429_TOO_MANY_REQUESTS, str(exc), headers=_reessayer_apres(ticket))
+    resultat = await service.reserver(
+        ReservationModelIn(fk_utilisateur=session["id"], **demande.model_dump(exclude={"liste_attente"})),
+        liste_attente=demande.liste_attente,
+        cle_idempotence=cle,
+    )
+    if resultat.statut == "en_attente":
+        response.status_code = status.HTTP_202_ACCEPTED
+    elif resultat.statut in ("complet", "doublon"):
+        response.status_code = status.HTTP_409_CONFLICT
+    elif resultat.statut == "evenement_introuvable":
+        response.status_code = status.HTTP_404_NOT_FOUND
+    return resultat
+
+
+@app.delete("/reservations/{id_reservation}", status_code=status.HTTP_204_NO_CONTENT)
+async def annuler(
+    id_reservation: int,
+    session: Dict[str, Any] = Depends(identite),
+    service: ReservationServiceAsync = Depends(reservation_service),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+) -> Response:
+    """
+    Annule une réservation de l'utilisateur du jeton (un administrateur peut annuler toute réservation).
+    Renvoyée avec le même en-tête Idempotency-Key après un succès, la requête rend
+    encore 204 (et non 404, la réservation n'existant plus).
+    """
+    cle = _cle_idempotence(session, idempotency_key)
+    if await service.annulation_enregistree(cle):
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    try:
+        reservation = await service.get_reservation_by_id(id_reservation)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, str(exc))
+    if reservation.fk_utilisateur != session["id"] and not session.get("admin"):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Cette réservation ne vous appartient pas.")
+
+    await service.delete_reservation(id_reservation, cle_idempotence=cle)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ---------- Métriques ----------
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metriques() -> PlainTextResponse:
+    """Métriques du processus au format texte Prometheus (chaque worker a les siennes)."""
+    return PlainTextResponse(RegistreMetriques().exposition(), media_type=TYPE_PROMETHEUS)
+
+
+# ---------- Statistiques ----------
+
+@app.get("/statistiques", response_model=StatistiquesGlobalesModel)
+def statistiques(
+    limit: Optional[int] = None,
+    session: Dict[str, Any] = Depends(identite_admin),
+    service: StatistiquesService = Depends(statistiques_service),
+):
+    """Tableau de bord admin (DAO synchrone : exécuté dans le pool de threads de FastAPI)."""
+    return service.statistiques_globales(limit=limit)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Lance l'API HTTP des réservations.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Nombre de processus uvicorn.")
+    args = parser.parse_args()
+
+    if not os.getenv("API_SECRET"):
+        sys.exit("Définir API_SECRET (partagé par tous les workers) avant de lancer l'API.")
+
+    uvicorn.run("api.app:app", host=args.host, port=args.port, workers=args.workers,
+                app_dir=os.path.join(os.path.dirname(__file__), ".."))
+
+# Exemple :
+# python src/api/app.py -w 4
+# uvicorn api.app:app --app-dir src --workers 4 --port 8000
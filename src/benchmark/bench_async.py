@@ -0,0 +1,145 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+
+from benchmark.outils import configurer, preparer_schema, executer_sql
+
+
+def peupler(nb_evenements: int, nb_utilisateurs: int) -> None:
+    """Remplit le schéma de benchmark (comptes sans hash bcrypt : ils ne servent qu'au test)."""
+    executer_sql(
+        """
+        INSERT INTO utilisateur (nom, prenom, email, mot_de_passe)
+        SELECT 'Bench', 'U' || n, 'u' || n || '@bench.test', 'x'
+        FROM generate_series(1, %(nu)s) AS n;
+
+        INSERT INTO evenement (titre, ville, date_evenement, capacite, statut)
+        SELECT 'Evénement ' || n, 'Rennes', DATE '2030-01-01' + n, 1000000, 'disponible en ligne'
+        FROM generate_series(1, %(ne)s) AS n;
+
+        ANALYZE;
+        """,
+        {"ne": nb_evenements, "nu": nb_utilisateurs},
+    )
+
+
+def vider_reservations() -> None:
+    executer_sql("DELETE FROM reservation")
+
+
+async def mesurer_async(nb_clients: int, requetes: int, nb_evenements: int) -> tuple:
+    """
+    `nb_clients` tâches dans une seule boucle ; chaque client enchaîne `requetes`
+    opérations : 3 listes paginées pour 1 réservation, comme un utilisateur qui navigue.
+    """
+    from model.reservation_models import ReservationModelIn
+    from service.consultation_evenement_service import ConsultationEvenementServiceAsync
+    from service.reservation_service import ReservationServiceAsync
+
+    consultation = ConsultationEvenementServiceAsync()
+    reservations = ReservationServiceAsync()
+    issues = Counter()
+
+    async def client(numero: int):
+        curseur = None
+        for i in range(requetes):
+            if i % 4 == 3:
+                resultat = await reservations.reserver(
+                    ReservationModelIn(
+                        fk_utilisateur=numero + 1,
+                        fk_evenement=(numero * requetes + i) % nb_evenements + 1,
+                    )
+                )
+                issues[resultat.statut] += 1
+            else:
+                page = await consultation.lister_avec_places_restantes_page(limit=20, curseur=curseur)
+                curseur = page.curseur_suivant
+                issues["liste"] += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(n) for n in range(nb_clients)))
+    return time.perf_counter() - t0, issues
+
+
+def mesurer_threads(nb_clients: int, requetes: int, nb_evenements: int) -> tuple:
+    """Même charge, via les services synchrones et un thread par client."""
+    from model.reservation_models import ReservationModelIn
+    from service.consultation_evenement_service import ConsultationEvenementService
+    from service.reservation_service import ReservationService
+
+    consultation = ConsultationEvenementService()
+    reservations = ReservationService()
+    issues = Counter()
+    verrou = threading.Lock()
+
+    def client(numero: int):
+        curseur = None
+        for i in range(requetes):
+            if i % 4 == 3:
+                statut = reservations.reserver(
+                    ReservationModelIn(
+                        fk_utilisateur=numero + 1,
+                        fk_evenement=(numero * requetes + i) % nb_evenements + 1,
+                    )
+                ).statut
+            else:
+                page = consultation.lister_avec_places_restantes_page(limit=20, curseur=curseur)
+                curseur = page.curseur_suivant
+                statut = "liste"
+            with verrou:
+                issues[statut] += 1
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=nb_clients) as executor:
+        list(executor.map(client, range(nb_clients)))
+    return time.perf_counter() - t0, issues
+
+
+async def lancer_async(paliers, requetes: int, nb_evenements: int, comparer: bool) -> None:
+    from dao.asynchrone.db_connection import DBConnectionAsync
+
+    print(f"{'Clients':>8} | {'asyncio (req/s)':>16}" + (f" | {'threads (req/s)':>16}" if comparer else ""))
+    try:
+        for nb_clients in paliers:
+            vider_reservations()
+            duree, issues = await mesurer_async(nb_clients, requetes, nb_evenements)
+            ligne = f"{nb_clients:>8} | {sum(issues.values()) / duree:>16,.0f}"
+            if comparer:
+                vider_reservations()
+                duree_t, issues_t = await asyncio.to_thread(mesurer_threads, nb_clients, requetes, nb_evenements)
+                ligne += f" | {sum(issues_t.values()) / duree_t:>16,.0f}"
+            print(ligne)
+    finally:
+        await DBConnectionAsync().fermer()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Débit des listes et réservations concurrentes via les DAO asyncio, par nombre de clients."
+    )
+    parser.add_argument("-c", "--clients", type=int, nargs="+", default=[1, 10, 50, 100],
+                        help="Paliers de clients concurrents.")
+    parser.add_argument("-r", "--requetes", type=int, default=40, help="Requêtes par client.")
+    parser.add_argument("-e", "--evenements", type=int, default=1000, help="Nombre d'événements.")
+    parser.add_argument("--pool-max", type=int, default=20, help="Taille maximale des pools de connexions.")
+    parser.add_argument("--comparer", action="store_true",
+                        help="Mesurer aussi les services synchrones (un thread par client).")
+    parser.add_argument("--schema", default="bench_async", help="Schéma jetable (recréé).")
+    args = parser.parse_args()
+
+    configurer(args.schema, pool_max=args.pool_max)
+    preparer_schema(args.schema)
+    peupler(args.evenements, max(args.clients))
+    asyncio.run(lancer_async(args.clients, args.requetes, args.evenements, args.comparer))
+
+# Exemple :
+# python src/benchmark/bench_async.py -c 1 10 50 100 --comparer
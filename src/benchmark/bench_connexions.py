@@ -0,0 +1,99 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import threading
+import time
+from statistics import quantiles
+
+from benchmark.outils import configurer, preparer_schema, executer_sql
+
+MOT_DE_PASSE = "Bench-connexion-1"
+
+
+def peupler(nb_comptes: int, cout: int) -> None:
+    """Crée nb_comptes comptes partageant un même hash (le coût de vérification est identique)."""
+    from utils.securite import hash_password
+
+    executer_sql(
+        """
+        INSERT INTO utilisateur (nom, prenom, email, mot_de_passe)
+        SELECT 'Bench', 'U' || n, 'u' || n || '@bench.test', %(hache)s
+        FROM generate_series(1, %(n)s) AS n;
+        ANALYZE utilisateur;
+        """,
+        {"n": nb_comptes, "hache": hash_password(MOT_DE_PASSE, rounds=cout)},
+    )
+
+
+def rafale(nb_clients: int, nb_comptes: int) -> None:
+    """nb_clients threads se connectent en même temps (ouverture d'un shotgun), un compte chacun."""
+    from dao.utilisateur_dao import UtilisateurDao
+
+    latences, echecs = [], 0
+    verrou = threading.Lock()
+    depart = threading.Barrier(nb_clients + 1)
+
+    def client(n: int):
+        nonlocal echecs
+        depart.wait()
+        t0 = time.perf_counter()
+        ok = UtilisateurDao().authenticate(f"u{n % nb_comptes + 1}@bench.test", MOT_DE_PASSE) is not None
+        with verrou:
+            latences.append(time.perf_counter() - t0)
+            echecs += not ok
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(nb_clients)]
+    for t in threads:
+        t.start()
+    depart.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    duree = time.perf_counter() - t0
+
+    p50, p95 = (quantiles(latences, n=100)[i] for i in (49, 94)) if len(latences) > 1 else (latences[0],) * 2
+    print(f"  {nb_clients} connexions en {duree:6.2f} s ({nb_clients / duree:6.1f} connexions/s), "
+          f"latence p50 {p50 * 1000:,.0f} ms / p95 {p95 * 1000:,.0f} ms, échecs {echecs}")
+
+
+def lancer(nb_clients: int, cout: int, schema: str, comparer: bool) -> None:
+    from utils.securite import HachageMotDePasse
+
+    preparer_schema(schema)
+    peupler(nb_clients, cout)
+
+    hachage = HachageMotDePasse()
+    hachage.cout = cout  # pas de rehash pendant la mesure
+    modes = [(f"Pool de {hachage.processus} processus", hachage.processus)]
+    if comparer:
+        modes.append(("Thread appelant (ancien chemin)", 0))
+
+    for nom, processus in modes:
+        hachage.fermer()
+        hachage.processus = processus
+        print(nom)
+        rafale(min(nb_clients, 20), nb_clients)  # chauffe (pool de processus et connexions)
+        rafale(nb_clients, nb_clients)
+    hachage.fermer()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Débit des connexions simultanées : vérification bcrypt en pool de processus vs dans le thread."
+    )
+    parser.add_argument("-n", "--clients", type=int, default=200, help="Connexions simultanées.")
+    parser.add_argument("--cout", type=int, default=12, help="Facteur de coût bcrypt des comptes.")
+    parser.add_argument("--pool-max", type=int, default=50, help="Taille maximale du pool de connexions.")
+    parser.add_argument("--sans-comparaison", action="store_true", help="Ne pas mesurer l'ancien chemin.")
+    parser.add_argument("--schema", default="bench_connexions", help="Schéma jetable (recréé).")
+    args = parser.parse_args()
+
+    configurer(args.schema, pool_max=args.pool_max)
+    lancer(args.clients, args.cout, args.schema, not args.sans_comparaison)
+
+# Exemple :
+# BCRYPT_PROCESSUS=8 python src/benchmark/bench_connexions.py -n 500 --cout 12
@@ -0,0 +1,98 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import resource
+import time
+
+from benchmark.outils import configurer, preparer_schema, executer_sql
+
+
+def peupler(nb_reservations: int) -> None:
+    """Remplit le schéma de benchmark : nb_reservations réservations sur 1000 événements."""
+    nb_evenements = 1000
+    par_evenement = max(1, nb_reservations // nb_evenements)
+    executer_sql(
+        """
+        INSERT INTO utilisateur (nom, prenom, email, mot_de_passe)
+        SELECT 'Bench', 'U' || n, 'u' || n || '@bench.test', 'x'
+        FROM generate_series(1, %(per)s) AS n;
+
+        INSERT INTO evenement (titre, date_evenement, capacite, statut)
+        SELECT 'Evénement ' || n, DATE '2030-01-01' + n, %(per)s, 'disponible en ligne'
+        FROM generate_series(1, %(ne)s) AS n;
+
+        INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, boisson)
+        SELECT u, e, random() < 0.5, random() < 0.5
+        FROM generate_series(1, %(ne)s) AS e, generate_series(1, %(per)s) AS u;
+
+        ANALYZE reservation;
+        """,
+        {"ne": nb_evenements, "per": par_evenement},
+    )
+
+
+def rss_max_mo() -> float:
+    """Pic de mémoire résidente du processus (Mo, Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def export_en_flux(itersize: int) -> int:
+    """Nouveau chemin : curseur serveur + écriture CSV au fil de l'eau."""
+    from utils.export import exporter
+
+    with open(os.devnull, "w", encoding="utf-8", newline="") as f:
+        return exporter("reservations", "csv", f, itersize=itersize)
+
+
+def export_fetchall() -> int:
+    """Ancien chemin : fetchall() puis liste complète de modèles, puis écriture."""
+    from dao.db_connection import DBConnection
+    from model.reservation_models import ReservationModelOut
+    from utils.export import ecrire_csv
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SELECT * FROM reservation ORDER BY id_reservation")
+            rows = curs.fetchall()
+    modeles = [ReservationModelOut(**r) for r in rows]
+    with open(os.devnull, "w", encoding="utf-8", newline="") as f:
+        return ecrire_csv(list(ReservationModelOut.model_fields), modeles, f)
+
+
+def lancer(nb_reservations: int, itersize: int, schema: str, comparer: bool) -> None:
+    preparer_schema(schema)
+    peupler(nb_reservations)
+
+    # Le pic RSS est monotone : on mesure le flux d'abord, fetchall ensuite
+    for nom, fonction in [("Flux (curseur serveur)", lambda: export_en_flux(itersize)),
+                          ("fetchall()", export_fetchall)]:
+        if nom == "fetchall()" and not comparer:
+            continue
+        avant = rss_max_mo()
+        t0 = time.perf_counter()
+        n = fonction()
+        duree = time.perf_counter() - t0
+        print(f"{nom:<24}: {n} lignes en {duree:6.1f} s ({n / duree:,.0f} lignes/s), "
+              f"pic mémoire +{rss_max_mo() - avant:,.0f} Mo")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mémoire et débit de l'export des réservations : flux vs fetchall()."
+    )
+    parser.add_argument("-r", "--reservations", type=int, default=1_000_000, help="Nombre de réservations.")
+    parser.add_argument("--itersize", type=int, default=2000, help="Lignes par aller-retour.")
+    parser.add_argument("--sans-comparaison", action="store_true",
+                        help="Ne pas lancer le chemin fetchall() (gros volumes).")
+    parser.add_argument("--schema", default="bench_export", help="Schéma jetable (recréé).")
+    args = parser.parse_args()
+
+    configurer(args.schema)
+    lancer(args.reservations, args.itersize, args.schema, not args.sans_comparaison)
+
+# Exemple :
+# python src/benchmark/bench_export.py -r 10000000 --sans-comparaison
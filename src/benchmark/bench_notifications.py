@@ -0,0 +1,86 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+
+def faux_brevo(latence: float) -> ThreadingHTTPServer:
+    """Serveur local imitant Brevo (201 après `latence` secondes), en keep-alive HTTP/1.1."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(latence)
+            self.send_response(201)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    serveur = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    return serveur
+
+
+def un_appel_par_destinataire(destinataires, url: str) -> int:
+    """Ancien chemin : un requests.post (nouvelle connexion) par destinataire, en séquence."""
+    for d in destinataires:
+        requests.post(url, json={"to": [{"email": d["email"]}], "subject": "s", "textContent": "t"}, timeout=10)
+    return len(destinataires)
+
+
+def par_lots(destinataires, taille_lot: int, concurrence: int) -> int:
+    """Nouveau chemin : NotificationService (lots Brevo, session partagée, lots concurrents)."""
+    from service.notification_service import NotificationService
+
+    service = NotificationService(dao=object(), taille_lot=taille_lot, concurrence=concurrence)
+    return service.envoyer(destinataires, "Sujet", "Texte").nb_envoyes
+
+
+def lancer(nb: int, latence: float, taille_lot: int, concurrence: int, comparer: bool) -> None:
+    serveur = faux_brevo(latence)
+    url = f"http://127.0.0.1:{serveur.server_port}/v3/smtp/email"
+    os.environ.update({"BREVO_URL": url, "TOKEN_BREVO": "bench", "EMAIL_BREVO": "bench@exemple.fr"})
+    destinataires = [{"email": f"u{i}@bench.test", "nom": "Bench", "prenom": f"U{i}"} for i in range(nb)]
+
+    chemins = [(f"Lots de {taille_lot} x{concurrence}", lambda: par_lots(destinataires, taille_lot, concurrence))]
+    if comparer:
+        chemins.append(("Un appel par e-mail", lambda: un_appel_par_destinataire(destinataires, url)))
+
+    for nom, fonction in chemins:
+        t0 = time.perf_counter()
+        n = fonction()
+        duree = time.perf_counter() - t0
+        print(f"{nom:<22}: {n} e-mails en {duree:6.2f} s ({n / duree:,.0f} e-mails/s)")
+
+    serveur.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Débit des notifications groupées (faux Brevo local) : lots + session vs un appel par e-mail."
+    )
+    parser.add_argument("-n", "--destinataires", type=int, default=2000, help="Nombre de destinataires.")
+    parser.add_argument("--latence", type=float, default=0.02, help="Latence simulée par requête (s).")
+    parser.add_argument("-l", "--lot", type=int, default=100, help="Destinataires par requête.")
+    parser.add_argument("-c", "--concurrence", type=int, default=4, help="Lots envoyés en parallèle.")
+    parser.add_argument("--sans-comparaison", action="store_true",
+                        help="Ne pas lancer le chemin un appel par e-mail.")
+    args = parser.parse_args()
+
+    lancer(args.destinataires, args.latence, args.lot, args.concurrence, not args.sans_comparaison)
+
+# Exemple :
+# python src/benchmark/bench_notifications.py -n 5000 --latence 0.05
@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+
+from benchmark.outils import configurer, preparer_schema, executer_sql, chronometrer
+
+
+def peupler(nb_evenements: int) -> None:
+    """Remplit le schéma de benchmark avec nb_evenements événements répartis sur ~10 ans."""
+    executer_sql(
+        """
+        INSERT INTO evenement (titre, ville, date_evenement, capacite, statut)
+        SELECT 'Evénement ' || n, 'Rennes', DATE '2030-01-01' + (n %% 3650), 100, 'disponible en ligne'
+        FROM generate_series(1, %(ne)s) AS n;
+
+        ANALYZE evenement;
+        ANALYZE compteur_evenement;
+        """,
+        {"ne": nb_evenements},
+    )
+
+
+def curseur_de_page(numero: int, taille: int):
+    """Avance page par page jusqu'à la page `numero` (0-indexée) et retourne son curseur."""
+    from dao.consultation_evenement_dao import ConsultationEvenementDao
+
+    dao = ConsultationEvenementDao()
+    curseur = None
+    # Les pages intermédiaires sont lues en gros blocs pour aller vite : seul le curseur compte
+    saut = taille * numero
+    while saut > 0:
+        bloc = min(saut, 10_000)
+        page = dao.lister_avec_places_restantes_page(limit=bloc, curseur=curseur)
+        curseur = page.curseur_suivant
+        saut -= bloc
+    return curseur
+
+
+def lancer(nb_evenements: int, taille: int, repetitions: int, schema: str) -> None:
+    from dao.consultation_evenement_dao import ConsultationEvenementDao
+
+    preparer_schema(schema)
+    peupler(nb_evenements)
+
+    dao = ConsultationEvenementDao()
+    profonde = nb_evenements // taille - 1
+    curseur_profond = curseur_de_page(profonde, taille)
+
+    # Contrôle de cohérence : les deux chemins renvoient la même page profonde
+    par_offset = dao.lister_avec_places_restantes(limit=taille, offset=profonde * taille)
+    par_cle = dao.lister_avec_places_restantes_page(limit=taille, curseur=curseur_profond).elements
+    assert [r["id_evenement"] for r in par_offset] == [r["id_evenement"] for r in par_cle]
+
+    mesures = {
+        "OFFSET, page 1": lambda: dao.lister_avec_places_restantes(limit=taille, offset=0),
+        f"OFFSET, page {profonde + 1}": lambda: dao.lister_avec_places_restantes(
+            limit=taille, offset=profonde * taille
+        ),
+        "Curseur, page 1": lambda: dao.lister_avec_places_restantes_page(limit=taille),
+        f"Curseur, page {profonde + 1}": lambda: dao.lister_avec_places_restantes_page(
+            limit=taille, curseur=curseur_profond
+        ),
+    }
+
+    print(f"Données : {nb_evenements} événements, pages de {taille}")
+    for nom, fonction in mesures.items():
+        print(f"{nom:<24}: {chronometrer(fonction, repetitions) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare la pagination LIMIT/OFFSET et la pagination par curseur (keyset)."
+    )
+    parser.add_argument("-e", "--evenements", type=int, default=1_000_000, help="Nombre d'événements.")
+    parser.add_argument("-t", "--taille", type=int, default=50, help="Taille d'une page.")
+    parser.add_argument("--repetitions", type=int, default=5, help="Mesures par cas (médiane).")
+    parser.add_argument("--schema", default="bench_pagination", help="Schéma jetable (recréé).")
+    args = parser.parse_args()
+
+    configurer(args.schema)
+    lancer(args.evenements, args.taille, args.repetitions, args.schema)
+
+# Exemple :
+# python src/benchmark/bench_pagination.py -e 1000000 -t 50
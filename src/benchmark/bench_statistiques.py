@@ -0,0 +1,100 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+
+from benchmark.outils import configurer, preparer_schema, executer_sql, chronometrer
+
+
+def peupler(nb_evenements: int, nb_reservations: int) -> None:
+    """Remplit le schéma de benchmark : nb_evenements x (nb_reservations / nb_evenements) réservations."""
+    par_evenement = max(1, nb_reservations // nb_evenements)
+    nb_utilisateurs = max(par_evenement, 1000)
+    executer_sql(
+        """
+        INSERT INTO utilisateur (nom, prenom, email, mot_de_passe)
+        SELECT 'Bench', 'U' || n, 'u' || n || '@bench.test', 'x'
+        FROM generate_series(1, %(nu)s) AS n;
+
+        INSERT INTO evenement (titre, date_evenement, capacite, statut)
+        SELECT 'Evénement ' || n, DATE '2030-01-01' + (n %% 365), %(capacite)s, 'disponible en ligne'
+        FROM generate_series(1, %(ne)s) AS n;
+
+        INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+        SELECT ((e * 7 + k) %% %(nu)s) + 1, e,
+               random() < 0.6, random() < 0.5, random() < 0.3, random() < 0.1, random() < 0.4
+        FROM generate_series(1, %(ne)s) AS e, generate_series(0, %(per)s - 1) AS k;
+
+        ANALYZE utilisateur;
+        ANALYZE evenement;
+        ANALYZE reservation;
+        """,
+        {"nu": nb_utilisateurs, "ne": nb_evenements, "per": par_evenement, "capacite": par_evenement * 2},
+    )
+
+
+def ancien_chemin(nb_evenements: int):
+    """Chemin historique de StatistiquesInscriptionsVue : 1 requête par événement + comptage Python."""
+    from service.consultation_evenement_service import ConsultationEvenementService
+    from service.reservation_service import ReservationService
+
+    service_resa = ReservationService()
+    tableau = []
+    for e in ConsultationEvenementService().lister_tous(limit=nb_evenements):
+        reservations = service_resa.get_reservations_by_event(e.id_evenement)
+        tableau.append({
+            "id_evenement": e.id_evenement,
+            "inscrits": len(reservations),
+            "bus_aller": sum(1 for r in reservations if r.bus_aller),
+            "bus_retour": sum(1 for r in reservations if r.bus_retour),
+            "adherent": sum(1 for r in reservations if r.adherent),
+            "sam": sum(1 for r in reservations if r.sam),
+            "boisson": sum(1 for r in reservations if r.boisson),
+        })
+    return tableau
+
+
+def nouveau_chemin(nb_evenements: int):
+    """StatistiquesService : une seule requête groupée."""
+    from service.statistiques_service import StatistiquesService
+
+    return StatistiquesService().statistiques_globales(limit=nb_evenements)
+
+
+def lancer(nb_evenements: int, nb_reservations: int, repetitions: int, schema: str) -> None:
+    preparer_schema(schema)
+    peupler(nb_evenements, nb_reservations)
+
+    # Contrôle de cohérence entre les deux chemins
+    ancien = ancien_chemin(nb_evenements)
+    nouveau = nouveau_chemin(nb_evenements)
+    assert sum(r["inscrits"] for r in ancien) == nouveau.total.inscrits
+    assert sum(r["sam"] for r in ancien) == nouveau.total.sam
+
+    t_ancien = chronometrer(lambda: ancien_chemin(nb_evenements), repetitions)
+    t_nouveau = chronometrer(lambda: nouveau_chemin(nb_evenements), repetitions)
+
+    print(f"Données             : {nb_evenements} événements x {nouveau.total.inscrits} réservations")
+    print(f"Ancien chemin (N+1) : {t_ancien * 1000:9.1f} ms  ({nb_evenements + 1} requêtes)")
+    print(f"StatistiquesService : {t_nouveau * 1000:9.1f} ms  (1 requête)")
+    print(f"Gain                : x{t_ancien / t_nouveau:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare le calcul des statistiques admin : N+1 requêtes vs requête groupée."
+    )
+    parser.add_argument("-e", "--evenements", type=int, default=1000, help="Nombre d'événements.")
+    parser.add_argument("-r", "--reservations", type=int, default=100_000, help="Nombre de réservations.")
+    parser.add_argument("--repetitions", type=int, default=5, help="Mesures par chemin (médiane).")
+    parser.add_argument("--schema", default="bench_statistiques", help="Schéma jetable (recréé).")
+    args = parser.parse_args()
+
+    configurer(args.schema)
+    lancer(args.evenements, args.reservations, args.repetitions, args.schema)
+
+# Exemple :
+# python src/benchmark/bench_statistiques.py -e 1000 -r 100000
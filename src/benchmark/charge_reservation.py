@@ -0,0 +1,144 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+
+from benchmark.outils import configurer
+
+
+def _preparer(nb_clients: int, capacite: int):
+    """Crée un événement de capacité donnée et `nb_clients` utilisateurs jetables."""
+    from dao.db_connection import DBConnection
+    from dao.evenement_dao import EvenementDao
+    from model.evenement_models import EvenementModelIn
+
+    evenement = EvenementDao().create(
+        EvenementModelIn(
+            titre=f"Charge shotgun {uuid.uuid4().hex[:8]}",
+            date_evenement=date.today() + timedelta(days=30),
+            capacite=capacite,
+            statut="disponible en ligne",
+        )
+    )
+
+    prefixe = uuid.uuid4().hex[:8]
+    # Insertion ensembliste : pas de hash bcrypt, ces comptes ne servent qu'au test
+    query = """
+        INSERT INTO utilisateur (nom, prenom, email, mot_de_passe)
+        SELECT 'Charge', 'Client ' || n, %(prefixe)s || '.' || n || '@charge.test', 'x'
+        FROM generate_series(1, %(n)s) AS n
+        RETURNING id_utilisateur
+    """
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(query, {"prefixe": prefixe, "n": nb_clients})
+            ids = [r["id_utilisateur"] for r in curs.fetchall()]
+
+    return evenement, ids
+
+
+def _nettoyer(id_evenement: int, ids_utilisateurs):
+    from dao.db_connection import DBConnection
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("DELETE FROM evenement WHERE id_evenement = %(id)s", {"id": id_evenement})
+            curs.execute(
+                "DELETE FROM utilisateur WHERE id_utilisateur = ANY(%(ids)s)",
+                {"ids": list(ids_utilisateurs)},
+            )
+
+
+def lancer(nb_clients: int = 500, capacite: int = 100, tentatives: int = 2, garder: bool = False) -> bool:
+    """
+    Lance `nb_clients` threads qui réservent simultanément le même événement
+    (`tentatives` essais chacun, les suivants devant être refusés comme doublons).
+
+    Vérifie qu'aucune surréservation n'a eu lieu et affiche le débit.
+    Retourne True si l'invariant est respecté.
+    """
+    from dao.db_connection import DBConnection
+    from model.reservation_models import ReservationModelIn
+    from service.reservation_service import ReservationService
+
+    evenement, ids = _preparer(nb_clients, capacite)
+    service = ReservationService()
+    issues = Counter()
+    verrou = threading.Lock()
+    depart = threading.Barrier(nb_clients + 1)
+
+    def client(id_utilisateur: int):
+        depart.wait()
+        for _ in range(tentatives):
+            try:
+                statut = service.reserver(
+                    ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=evenement.id_evenement)
+                ).statut
+            except Exception as exc:
+                statut = f"erreur ({type(exc).__name__})"
+            with verrou:
+                issues[statut] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in ids]
+    for t in threads:
+        t.start()
+
+    depart.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    duree = time.perf_counter() - t0
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "SELECT COUNT(*) AS c FROM reservation WHERE fk_evenement = %(id)s",
+                {"id": evenement.id_evenement},
+            )
+            en_base = int(curs.fetchone()["c"])
+
+    total = sum(issues.values())
+    attendu = min(capacite, nb_clients)
+    ok = en_base == issues["reservee"] == attendu
+
+    print(f"Clients concurrents   : {nb_clients} (x{tentatives} tentatives)")
+    print(f"Capacité              : {capacite}")
+    print(f"Issues                : {dict(issues)}")
+    print(f"Réservations en base  : {en_base} (attendu : {attendu})")
+    print(f"Durée                 : {duree:.3f} s")
+    print(f"Débit                 : {total / duree:.0f} tentatives/s, "
+          f"{issues['reservee'] / duree:.0f} réservations/s")
+    print("Surréservation        : " + ("aucune ✅" if en_base <= capacite else "DÉTECTÉE ❌"))
+
+    if not garder:
+        _nettoyer(evenement.id_evenement, ids)
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Test de charge du chemin de réservation (aucune surréservation, débit)."
+    )
+    parser.add_argument("-n", "--clients", type=int, default=500, help="Nombre de clients concurrents.")
+    parser.add_argument("-c", "--capacite", type=int, default=100, help="Capacité de l'événement.")
+    parser.add_argument("-t", "--tentatives", type=int, default=2, help="Tentatives par client.")
+    parser.add_argument("--pool-max", type=int, default=50, help="Taille maximale du pool de connexions.")
+    parser.add_argument("--schema", default="projet_test_dao", help="Schéma PostgreSQL utilisé.")
+    parser.add_argument("--garder", action="store_true", help="Ne pas supprimer les données créées.")
+    args = parser.parse_args()
+
+    configurer(args.schema, pool_max=args.pool_max)
+
+    succes = lancer(args.clients, args.capacite, args.tentatives, args.garder)
+    sys.exit(0 if succes else 1)
+
+# Exemple :
+# python src/benchmark/charge_reservation.py -n 500 -c 100
@@ -0,0 +1,56 @@
+import os
+import time
+from statistics import median
+from typing import Callable, Dict
+
+RACINE = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+def configurer(schema: str, pool_max: int = 10) -> None:
+    """
+    Fixe le schéma et la taille du pool AVANT la première utilisation de DBConnection
+    (le search_path est appliqué à l'ouverture de chaque connexion).
+    """
+    import dotenv
+
+    dotenv.load_dotenv()
+    os.environ["POSTGRES_SCHEMA"] = schema
+    os.environ["POSTGRES_POOL_MAX"] = str(pool_max)
+
+
+def preparer_schema(schema: str) -> None:
+    """(Re)crée un schéma de benchmark vide à partir de data/init_db.sql et des migrations."""
+    from dao.db_connection import DBConnection
+    from utils.migrations import Migrations
+
+    with open(os.path.join(RACINE, "data", "init_db.sql"), encoding="utf-8") as f:
+        init_db = f.read()
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE; CREATE SCHEMA {schema};")
+            curs.execute(f"SET search_path TO {schema};")
+            curs.execute(init_db)
+            curs.execute("RESET search_path;")
+
+    Migrations().appliquer(schema)
+
+
+def executer_sql(query: str, params: Dict = None) -> None:
+    """Exécute une instruction SQL de préparation (sans résultat)."""
+    from dao.db_connection import DBConnection
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(query, params or {})
+
+
+def chronometrer(fonction: Callable[[], object], repetitions: int = 5) -> float:
+    """Retourne la durée médiane (secondes) de `repetitions` appels, après un appel de chauffe."""
+    fonction()
+    durees = []
+    for _ in range(repetitions):
+        t0 = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - t0)
+    return median(durees)
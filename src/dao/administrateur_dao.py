@@ -1,10 +1,13 @@
 # dao/administrateur_dao.py
 from typing import List, Optional
 from datetime import datetime
-import bcrypt
 
 from dao.db_connection import DBConnection
+from dao.utilisateur_dao import UtilisateurDao
 from model.utilisateur_models import AdministrateurModelOut, AdministrateurModelIn
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
+from utils.securite import HachageMotDePasse
 
 
 class AdministrateurDao:
@@ -17,22 +20,6 @@ class AdministrateurDao:
     Les mots de passe sont stockés hashés (bcrypt).
     """
 
-    # ---------- Helpers mot de passe ----------
-
-    @staticmethod
-    def _hash_password(plain: str) -> str:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        return bcrypt.hashpw(plain, bcrypt.gensalt()).decode("utf-8")
-
-    @staticmethod
-    def _check_password(plain: str, hashed: str) -> bool:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        if isinstance(hashed, str):
-            hashed = hashed.encode("utf-8")
-        return bcrypt.checkpw(plain, hashed)
-
     # ---------- READ ----------
 
     def find_all(self, limit: int = 100, offset: int = 0) -> List[AdministrateurModelOut]:
@@ -68,6 +55,36 @@ class AdministrateurDao:
             )
         return admins
 
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[AdministrateurModelOut]:
+        """
+        Récupère une page d'administrateurs par clé (id_utilisateur) : le coût d'une page
+        ne dépend pas de sa profondeur, contrairement à OFFSET.
+        `curseur` est le jeton `curseur_suivant` de la page précédente.
+        """
+        where = ["administrateur = TRUE"]
+        params = {"limit": max(limit, 0) + 1}
+        if curseur:
+            (params["apres_id"],) = decoder_curseur(curseur, int)
+            where.append("id_utilisateur > %(apres_id)s")
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+        query = (
+            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+            "FROM utilisateur "
+            f"{where_clause}"
+            "ORDER BY id_utilisateur "
+            "LIMIT %(limit)s"
+        )
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        rows, suivant = decouper_page(rows, max(limit, 0), lambda r: (r["id_utilisateur"],))
+        elements = [AdministrateurModelOut(**r) for r in rows]
+        return PageModel[AdministrateurModelOut](elements=elements, curseur_suivant=suivant)
+
     def find_by_id(self, id_utilisateur: int) -> Optional[AdministrateurModelOut]:
         """
         Récupère un administrateur par son ID.
@@ -139,7 +156,7 @@ class AdministrateurDao:
             "prenom": admin_in.prenom,
             "nom": admin_in.nom,
             "telephone": admin_in.telephone,
-            "mot_de_passe": self._hash_password(admin_in.mot_de_passe),
+            "mot_de_passe": HachageMotDePasse().hacher(admin_in.mot_de_passe),
         }
 
         with DBConnection().getConnexion() as con:
@@ -231,8 +248,9 @@ class AdministrateurDao:
         if res is None:
             return None
 
-        if not self._check_password(mot_de_passe, res["mot_de_passe"]):
+        if not HachageMotDePasse().verifier(mot_de_passe, res["mot_de_passe"]):
             return None
+        UtilisateurDao._rehacher_si_besoin(res["id_utilisateur"], mot_de_passe, res["mot_de_passe"])
 
         return AdministrateurModelOut(
             id_utilisateur=res["id_utilisateur"],
@@ -252,7 +270,7 @@ class AdministrateurDao:
             "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
             "WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
         )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": HachageMotDePasse().hacher(new_password), "id": id_utilisateur}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
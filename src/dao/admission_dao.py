@@ -0,0 +1,182 @@
+# dao/admission_dao.py
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dao.db_connection import DBConnection
+from model.admission_models import EtatFileModel
+from utils.singleton import Singleton
+
+
+class AdmissionDao:
+    """
+    DAO des files d'admission (tables 'file_admission' et 'ticket_admission', migration 007).
+
+    Le seau à jetons n'est pas rechargé par une tâche de fond : la ligne de la file
+    garde son état à l'instant `maj`, et `_projeter` le calcule à tout instant
+    ultérieur (jetons gagnés au débit, tickets admis dans l'ordre). Consulter sa
+    place est donc une simple lecture ; seule l'entrée d'un nouveau client écrit,
+    sous le verrou de la ligne (les entrées concurrentes sont sérialisées). L'heure
+    est celle du serveur PostgreSQL, commune à tous les workers.
+
+    Les requêtes SQL sont partagées avec AdmissionDaoAsync (dao/asynchrone/).
+    """
+
+    _SQL_CREER_FILE = """
+            INSERT INTO file_admission (nom, jetons) VALUES (%(nom)s, %(rafale)s)
+            ON CONFLICT (nom) DO NOTHING;
+        """
+
+    _SQL_LIRE = """
+            SELECT f.nom, f.dernier_ticket, f.admis_jusqu_a, f.jetons,
+                   EXTRACT(EPOCH FROM f.maj) AS maj,
+                   EXTRACT(EPOCH FROM clock_timestamp()) AS maintenant,
+                   (SELECT t.ticket FROM ticket_admission t
+                    WHERE t.nom = f.nom AND t.cle = %(cle)s
+                      AND t.date_entree > clock_timestamp() - %(validite)s * INTERVAL '1 second') AS ticket
+            FROM file_admission f
+            WHERE f.nom = %(nom)s
+        """
+
+    _SQL_LIRE_VERROU = _SQL_LIRE + " FOR UPDATE OF f"
+
+    _SQL_ENTRER = """
+            INSERT INTO ticket_admission (nom, cle, ticket) VALUES (%(nom)s, %(cle)s, %(ticket)s)
+            ON CONFLICT (nom, cle) DO UPDATE SET ticket = EXCLUDED.ticket, date_entree = EXCLUDED.date_entree
+        """
+
+    _SQL_ENREGISTRER = """
+            UPDATE file_admission
+            SET dernier_ticket = %(dernier_ticket)s,
+                admis_jusqu_a = %(admis_jusqu_a)s,
+                jetons = %(jetons)s,
+                maj = to_timestamp(%(maj)s)
+            WHERE nom = %(nom)s
+        """
+
+    _SQL_VIDER = "DELETE FROM file_admission WHERE nom = %(nom)s"
+
+    # ---------- Helpers (partagés avec le stockage en mémoire et la version asynchrone) ----------
+    @staticmethod
+    def _projeter(etat: EtatFileModel, maintenant: float, debit: float, rafale: float) -> EtatFileModel:
+        """
+        État de la file à `maintenant` : les jetons gagnés depuis `maj` admettent les
+        tickets en attente, un par jeton, dans l'ordre. La réserve n'est plafonnée à
+        `rafale` que file vide : ce qu'elle accumule pendant un creux sert la rafale
+        suivante, sans jamais dépasser `rafale` admissions d'un coup.
+        """
+        jetons = etat.jetons + max(maintenant - etat.maj, 0.0) * debit
+        admis = min(int(jetons), etat.dernier_ticket - etat.admis_jusqu_a)
+        jetons -= admis
+        if etat.admis_jusqu_a + admis == etat.dernier_ticket:
+            jetons = min(jetons, rafale)
+        return etat.model_copy(update={"admis_jusqu_a": etat.admis_jusqu_a + admis, "jetons": jetons, "maj": maintenant})
+
+    @staticmethod
+    def _params(nom: str, cle: str, rafale: float, validite: float) -> Dict[str, Any]:
+        return {"nom": nom, "cle": cle, "rafale": rafale, "validite": validite}
+
+    @classmethod
+    def _lu(cls, row: Dict[str, Any], debit: float, rafale: float) -> Tuple[Optional[int], EtatFileModel]:
+        """(ticket valide du client ou None, état projeté) d'une ligne de _SQL_LIRE."""
+        etat = EtatFileModel(**{k: row[k] for k in ("nom", "dernier_ticket", "admis_jusqu_a", "jetons", "maj")})
+        return row["ticket"], cls._projeter(etat, float(row["maintenant"]), debit, rafale)
+
+    @classmethod
+    def _nouveau_ticket(cls, etat: EtatFileModel, debit: float, rafale: float) -> Tuple[int, EtatFileModel]:
+        """Ajoute un ticket en fin de file ; il est admis aussitôt s'il reste un jeton."""
+        ticket = etat.dernier_ticket + 1
+        etat = etat.model_copy(update={"dernier_ticket": ticket})
+        return ticket, cls._projeter(etat, etat.maj, debit, rafale)
+
+    # ---------- API ----------
+    def entrer(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Tuple[int, EtatFileModel]:
+        """
+        Ticket du client `cle` dans la file `nom` (créée au besoin, seau plein) :
+        le même tant qu'il est valide, sinon un nouveau en fin de file.
+        Retourne (ticket, état de la file).
+        """
+        params = self._params(nom, cle, rafale, validite)
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_CREER_FILE + self._SQL_LIRE_VERROU, params)
+                ticket, etat = self._lu(curs.fetchone(), debit, rafale)
+                if ticket is not None:
+                    return ticket, etat
+                ticket, etat = self._nouveau_ticket(etat, debit, rafale)
+                curs.execute(
+                    self._SQL_ENTRER + ";" + self._SQL_ENREGISTRER,
+                    {**params, **etat.model_dump(), "ticket": ticket},
+                )
+        return ticket, etat
+
+    def consulter(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Optional[Tuple[int, EtatFileModel]]:
+        """(ticket, état de la file) du client, ou None s'il n'a pas de ticket valide (lecture seule)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_LIRE, self._params(nom, cle, rafale, validite))
+                row = curs.fetchone()
+        if row is None or row["ticket"] is None:
+            return None
+        return self._lu(row, debit, rafale)
+
+    def vider(self, nom: str) -> bool:
+        """Supprime la file et ses tickets (fin de l'ouverture)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_VIDER, {"nom": nom})
+                return curs.rowcount > 0
+
+
+class AdmissionMemoireDao(metaclass=Singleton):
+    """
+    Même interface qu'AdmissionDao, dans la mémoire du processus : sans aller-retour
+    réseau, mais la file n'est connue que de ce processus (CLI, API à un seul worker).
+    """
+
+    def __init__(self, horloge: Callable[[], float] = time.monotonic):
+        self.horloge = horloge
+        self.__files: Dict[str, EtatFileModel] = {}
+        # (nom, cle) -> (ticket, date d'entrée)
+        self.__tickets: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self.__verrou = threading.Lock()
+
+    def _ticket_valide(self, nom: str, cle: str, maintenant: float, validite: float) -> Optional[int]:
+        ticket = self.__tickets.get((nom, cle))
+        return ticket[0] if ticket is not None and ticket[1] > maintenant - validite else None
+
+    def entrer(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Tuple[int, EtatFileModel]:
+        with self.__verrou:
+            maintenant = self.horloge()
+            etat = self.__files.get(nom) or EtatFileModel(nom=nom, jetons=rafale, maj=maintenant)
+            etat = AdmissionDao._projeter(etat, maintenant, debit, rafale)
+            ticket = self._ticket_valide(nom, cle, maintenant, validite)
+            if ticket is not None:
+                return ticket, etat
+            ticket, etat = AdmissionDao._nouveau_ticket(etat, debit, rafale)
+            self.__files[nom] = etat
+            self.__tickets[(nom, cle)] = (ticket, maintenant)
+            return ticket, etat
+
+    def consulter(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Optional[Tuple[int, EtatFileModel]]:
+        with self.__verrou:
+            maintenant = self.horloge()
+            etat = self.__files.get(nom)
+            ticket = self._ticket_valide(nom, cle, maintenant, validite)
+        if etat is None or ticket is None:
+            return None
+        return ticket, AdmissionDao._projeter(etat, maintenant, debit, rafale)
+
+    def vider(self, nom: str) -> bool:
+        with self.__verrou:
+            for cle in [c for c in self.__tickets if c[0] == nom]:
+                del self.__tickets[cle]
+            return self.__files.pop(nom, None) is not None
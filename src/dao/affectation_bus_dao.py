@@ -0,0 +1,164 @@
+# dao/affectation_bus_dao.py
+from typing import Any, Dict, List, Sequence
+
+from dao.db_connection import DBConnection
+from model.bus_models import AffectationBusModel
+
+
+class AffectationBusDao:
+    """
+    DAO des places de bus (table 'affectation_bus', migration 005).
+
+    Une réservation qui demande le bus aller (ou retour) reçoit une place dans un
+    bus de son événement et du même sens : les demandes sont servies par ordre de
+    réservation, les bus remplis par ordre d'id. Une demande sans place reste en
+    attente jusqu'à ce qu'une place se libère (annulation, bus ajouté ou agrandi).
+
+    `repartir` remet les affectations d'un ou plusieurs événements en accord avec
+    les demandes et les bus, en deux instructions :
+      1. libère les places qui ne sont plus dues (sens plus demandé, bus retiré de
+         l'événement ou changé de sens, bus réduit : les dernières arrivées) ;
+      2. attribue les places libres aux demandes en attente.
+    Elles s'exécutent sous le verrou des lignes evenement (FOR UPDATE), pris dans
+    une instruction distincte comme dans ReservationDao.reserver : toutes les
+    écritures d'un même événement sont sérialisées, et en READ COMMITTED chaque
+    instruction suivante voit les places déjà validées. Un bus ne reçoit donc
+    jamais plus de `nombre_places` affectations, même sous forte concurrence.
+
+    Avec `curs`, la répartition rejoint la transaction de l'appelant (réservation,
+    modification, annulation). Les requêtes sont partagées avec ReservationDaoAsync.
+    """
+
+    _SQL_VERROU_EVENEMENTS = """
+            SELECT id_evenement FROM evenement
+            WHERE id_evenement = ANY(%(evenements)s)
+            ORDER BY id_evenement
+            FOR UPDATE;
+        """
+
+    _SQL_LIBERER = """
+            DELETE FROM affectation_bus a
+            USING (
+                SELECT a.fk_reservation, a.direction,
+                       NOT (CASE a.direction WHEN 'aller' THEN r.bus_aller ELSE r.bus_retour END)
+                       OR b.direction IS DISTINCT FROM a.direction
+                       OR b.fk_evenement IS DISTINCT FROM r.fk_evenement
+                       OR ROW_NUMBER() OVER (
+                              PARTITION BY a.fk_bus ORDER BY r.date_reservation, r.id_reservation
+                          ) > b.nombre_places AS a_liberer
+                FROM affectation_bus a
+                JOIN reservation r ON r.id_reservation = a.fk_reservation
+                JOIN bus b ON b.id_bus = a.fk_bus
+                WHERE r.fk_evenement = ANY(%(evenements)s)
+            ) x
+            WHERE x.a_liberer
+              AND a.fk_reservation = x.fk_reservation
+              AND a.direction = x.direction;
+        """
+
+    _SQL_AFFECTER = """
+            WITH places AS (
+                SELECT b.id_bus, b.fk_evenement, b.direction,
+                       b.nombre_places - (
+                           SELECT COUNT(*) FROM affectation_bus a WHERE a.fk_bus = b.id_bus
+                       ) AS libres
+                FROM bus b
+                WHERE b.fk_evenement = ANY(%(evenements)s)
+            ),
+            tranches AS (
+                SELECT id_bus, fk_evenement, direction,
+                       SUM(libres) OVER w - libres AS debut,
+                       SUM(libres) OVER w AS fin
+                FROM places
+                WHERE libres > 0
+                WINDOW w AS (PARTITION BY fk_evenement, direction ORDER BY id_bus)
+            ),
+            attente AS (
+                SELECT r.id_reservation, r.fk_evenement, d.direction,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY r.fk_evenement, d.direction
+                           ORDER BY r.date_reservation, r.id_reservation
+                       ) AS rang
+                FROM reservation r
+                CROSS JOIN LATERAL (VALUES ('aller', r.bus_aller), ('retour', r.bus_retour))
+                     AS d (direction, demande)
+                WHERE r.fk_evenement = ANY(%(evenements)s)
+                  AND d.demande
+                  AND NOT EXISTS (
+                      SELECT 1 FROM affectation_bus a
+                      WHERE a.fk_reservation = r.id_reservation AND a.direction = d.direction
+                  )
+            )
+            INSERT INTO affectation_bus (fk_reservation, direction, fk_bus)
+            SELECT w.id_reservation, w.direction, t.id_bus
+            FROM attente w
+            JOIN tranches t
+              ON t.fk_evenement = w.fk_evenement
+             AND t.direction = w.direction
+             AND w.rang > t.debut AND w.rang <= t.fin
+            RETURNING fk_reservation, direction, fk_bus
+        """
+
+    _SQL_FIND_BY_RESERVATION = """
+            SELECT fk_reservation, direction, fk_bus
+            FROM affectation_bus
+            WHERE fk_reservation = %(id)s
+            ORDER BY direction
+        """
+
+    _SQL_EN_ATTENTE = """
+            SELECT COUNT(*) FILTER (
+                       WHERE r.bus_aller AND NOT EXISTS (
+                           SELECT 1 FROM affectation_bus a
+                           WHERE a.fk_reservation = r.id_reservation AND a.direction = 'aller'
+                       )
+                   ) AS aller,
+                   COUNT(*) FILTER (
+                       WHERE r.bus_retour AND NOT EXISTS (
+                           SELECT 1 FROM affectation_bus a
+                           WHERE a.fk_reservation = r.id_reservation AND a.direction = 'retour'
+                       )
+                   ) AS retour
+            FROM reservation r
+            WHERE r.fk_evenement = %(id_evenement)s
+        """
+
+    @staticmethod
+    def _params(evenements: Sequence[int]) -> Dict[str, Any]:
+        return {"evenements": sorted(set(evenements))}
+
+    # ---------- RÉPARTITION ----------
+    def repartir(self, evenements: Sequence[int], curs=None) -> List[AffectationBusModel]:
+        """
+        Met les places de bus des événements en accord avec les demandes (voir la
+        classe) et retourne les places nouvellement attribuées.
+        Avec `curs`, la répartition rejoint la transaction de l'appelant.
+        """
+        if not evenements:
+            return []
+        requete = self._SQL_VERROU_EVENEMENTS + self._SQL_LIBERER + self._SQL_AFFECTER
+        if curs is not None:
+            curs.execute(requete, self._params(evenements))
+            return [AffectationBusModel(**r) for r in curs.fetchall()]
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(requete, self._params(evenements))
+                return [AffectationBusModel(**r) for r in curs.fetchall()]
+
+    # ---------- READ ----------
+    def find_by_reservation(self, id_reservation: int) -> List[AffectationBusModel]:
+        """Places de bus d'une réservation (0, 1 ou 2 : aller, retour)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_RESERVATION, {"id": id_reservation})
+                rows = curs.fetchall()
+        return [AffectationBusModel(**r) for r in rows]
+
+    def en_attente(self, id_evenement: int) -> Dict[str, int]:
+        """Demandes de bus sans place pour un événement, par sens : {'aller': n, 'retour': n}."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_EN_ATTENTE, {"id_evenement": id_evenement})
+                row = curs.fetchone()
+        return {"aller": int(row["aller"]), "retour": int(row["retour"])}
@@ -0,0 +1,62 @@
+# dao/asynchrone/admission_dao.py
+from typing import Optional, Tuple
+
+from dao.admission_dao import AdmissionDao, AdmissionMemoireDao
+from dao.asynchrone.db_connection import DBConnectionAsync
+from model.admission_models import EtatFileModel
+
+
+class AdmissionDaoAsync:
+    """
+    Version asyncio d'AdmissionDao : mêmes requêtes SQL, exécutées sur le pool de
+    DBConnectionAsync (une instruction par exécution, dans la même transaction).
+    """
+
+    async def entrer(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Tuple[int, EtatFileModel]:
+        params = AdmissionDao._params(nom, cle, rafale, validite)
+        async with DBConnectionAsync().connexion() as con:
+            await con.execute(AdmissionDao._SQL_CREER_FILE, params)
+            curs = await con.execute(AdmissionDao._SQL_LIRE_VERROU, params)
+            ticket, etat = AdmissionDao._lu(await curs.fetchone(), debit, rafale)
+            if ticket is not None:
+                return ticket, etat
+            ticket, etat = AdmissionDao._nouveau_ticket(etat, debit, rafale)
+            await con.execute(AdmissionDao._SQL_ENTRER, {**params, "ticket": ticket})
+            await con.execute(AdmissionDao._SQL_ENREGISTRER, etat.model_dump())
+        return ticket, etat
+
+    async def consulter(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Optional[Tuple[int, EtatFileModel]]:
+        row = await DBConnectionAsync().fetchone(AdmissionDao._SQL_LIRE, AdmissionDao._params(nom, cle, rafale, validite))
+        if row is None or row["ticket"] is None:
+            return None
+        return AdmissionDao._lu(row, debit, rafale)
+
+    async def vider(self, nom: str) -> bool:
+        return await DBConnectionAsync().rowcount(AdmissionDao._SQL_VIDER, {"nom": nom}) > 0
+
+
+class AdmissionMemoireDaoAsync:
+    """
+    Interface asyncio du stockage en mémoire (partagé avec AdmissionMemoireDao) :
+    les opérations ne bloquent pas, elles s'exécutent directement dans la boucle.
+    """
+
+    def __init__(self, memoire: Optional[AdmissionMemoireDao] = None):
+        self.memoire = memoire or AdmissionMemoireDao()
+
+    async def entrer(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Tuple[int, EtatFileModel]:
+        return self.memoire.entrer(nom, cle, debit, rafale, validite)
+
+    async def consulter(
+        self, nom: str, cle: str, debit: float, rafale: float, validite: float
+    ) -> Optional[Tuple[int, EtatFileModel]]:
+        return self.memoire.consulter(nom, cle, debit, rafale, validite)
+
+    async def vider(self, nom: str) -> bool:
+        return self.memoire.vider(nom)
@@ -0,0 +1,92 @@
+# dao/asynchrone/consultation_evenement_dao.py
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.consultation_evenement_dao import ConsultationEvenementDao as Sync
+from model.evenement_models import EvenementModelOut
+from model.pagination_models import PageModel
+
+
+class ConsultationEvenementDaoAsync:
+    """
+    Version asyncio de ConsultationEvenementDao (lecture seule) : les requêtes
+    sont construites par les helpers du DAO synchrone.
+    """
+
+    async def _lister(self, colonnes, from_clause, where, params, limit, offset) -> List[Dict[str, Any]]:
+        query, params = Sync._requete_liste(colonnes, from_clause, where, params, limit, offset)
+        return await DBConnectionAsync().fetchall(query, params)
+
+    async def _lister_page(self, colonnes, from_clause, where, params, limit, curseur):
+        query, params = Sync._requete_page(colonnes, from_clause, where, params, limit, curseur)
+        return Sync._decouper(await DBConnectionAsync().fetchall(query, params), limit)
+
+    # ---------- Listes simples ----------
+    async def lister_tous_page(
+        self, limit: int = 100, curseur: Optional[str] = None
+    ) -> PageModel[EvenementModelOut]:
+        rows, suivant = await self._lister_page(Sync._COLONNES, "FROM evenement e ", [], {}, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
+        )
+
+    async def lister_disponibles(
+        self, limit: int = 100, offset: int = 0, a_partir_du: Optional[date] = None
+    ) -> List[EvenementModelOut]:
+        where, params = Sync._filtres_disponibles(a_partir_du)
+        rows = await self._lister(Sync._COLONNES, "FROM evenement e ", where, params, limit, offset)
+        return [EvenementModelOut(**row) for row in rows]
+
+    async def lister_disponibles_page(
+        self, limit: int = 100, curseur: Optional[str] = None, a_partir_du: Optional[date] = None
+    ) -> PageModel[EvenementModelOut]:
+        where, params = Sync._filtres_disponibles(a_partir_du)
+        rows, suivant = await self._lister_page(Sync._COLONNES, "FROM evenement e ", where, params, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
+        )
+
+    # ---------- Recherche avec filtres ----------
+    async def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageModel[EvenementModelOut]:
+        where, params = Sync._filtres_recherche(ville, categorie, statut, date_min, date_max)
+        rows, suivant = await self._lister_page(Sync._COLONNES, "FROM evenement e ", where, params, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
+        )
+
+    # ---------- Avec places restantes ----------
+    async def lister_avec_places_restantes(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        where, params = Sync._filtres_places(seulement_disponibles, a_partir_du)
+        return await self._lister(Sync._COLONNES_PLACES, Sync._FROM_PLACES, where, params, limit, offset)
+
+    async def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[Dict[str, Any]]:
+        where, params = Sync._filtres_places(seulement_disponibles, a_partir_du)
+        rows, suivant = await self._lister_page(
+            Sync._COLONNES_PLACES, Sync._FROM_PLACES, where, params, limit, curseur
+        )
+        return PageModel[Dict[str, Any]](elements=rows, curseur_suivant=suivant)
+
+    async def trouver_avec_places_restantes(self, id_evenement: int) -> Optional[Dict[str, Any]]:
+        return await DBConnectionAsync().fetchone(Sync._SQL_AVEC_PLACES_PAR_ID, {"id": id_evenement})
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+import dotenv
+from psycopg import AsyncCursor
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from utils.metriques import RegistreMetriques
+from utils.profilage_sql import A_EXPLIQUER, ProfilageRequetes, est_explicable
+from utils.singleton import Singleton
+
+
+class CurseurProfileAsync(AsyncCursor):
+    """Pendant psycopg 3 de CurseurProfile : chaque execute alimente ProfilageRequetes."""
+
+    async def execute(self, query, params=None, **kwargs):
+        texte = query if isinstance(query, str) else query.as_string(self)
+        profilage = ProfilageRequetes()
+        t0 = time.perf_counter()
+        try:
+            resultat = await super().execute(query, params, **kwargs)
+        except Exception:
+            profilage.enregistrer(texte, time.perf_counter() - t0, -1, erreur=True)
+            raise
+        duree = time.perf_counter() - t0
+
+        issue = profilage.enregistrer(texte, duree, self.rowcount)
+        if issue is not None:
+            plan = await self._plan(texte, params) if issue == A_EXPLIQUER else None
+            profilage.journaliser_lente(texte, duree, self.rowcount, plan)
+        return resultat
+
+    async def _plan(self, texte: str, params) -> Optional[str]:
+        """Plan EXPLAIN (sans exécution), dans un point de sauvegarde (transaction imbriquée)."""
+        if not est_explicable(texte):
+            return None
+        try:
+            async with self.connection.transaction():
+                curs = AsyncCursor(self.connection, row_factory=dict_row)
+                await curs.execute("EXPLAIN " + texte, params)
+                return "\n".join(r["QUERY PLAN"] for r in await curs.fetchall())
+        except Exception:
+            return None
+
+
+class DBConnectionAsync(metaclass=Singleton):
+    """
+    Pendant asyncio de DBConnection : pool de connexions psycopg 3 partagé,
+    pour servir de nombreuses requêtes concurrentes depuis une seule boucle.
+
+    Mêmes variables d'environnement que DBConnection (POSTGRES_*, POSTGRES_POOL_MIN,
+    POSTGRES_POOL_MAX, POSTGRES_POOL_TIMEOUT). Les lignes sont des dict, comme avec
+    RealDictCursor, et les paramètres gardent la syntaxe %(nom)s : les DAO
+    asynchrones réutilisent les requêtes des DAO synchrones.
+
+    Le pool est ouvert au premier usage dans la boucle courante ; `fermer()` le
+    ferme et permet d'en rouvrir un dans une autre boucle (tests, scripts).
+    """
+
+    def __init__(self):
+        dotenv.load_dotenv()
+        self.__pool: Optional[AsyncConnectionPool] = None
+        self.__verrou = asyncio.Lock()
+        RegistreMetriques().jauge(
+            "bde_db_pool_async_connexions",
+            "Pool asynchrone : connexions ouvertes, libres, et demandes en attente d'une connexion.",
+            ("etat",),
+            fonction=self._etat_pool,
+        )
+
+    def _etat_pool(self) -> Dict[tuple, float]:
+        if self.__pool is None:
+            return {}
+        stats = self.__pool.get_stats()
+        return {
+            ("ouvertes",): stats.get("pool_size", 0),
+            ("libres",): stats.get("pool_available", 0),
+            ("en_attente",): stats.get("requests_waiting", 0),
+        }
+
+    def _nouveau_pool(self) -> AsyncConnectionPool:
+        return AsyncConnectionPool(
+            kwargs={
+                "host": os.getenv("POSTGRES_HOST"),
+                "port": os.getenv("POSTGRES_PORT"),
+                "dbname": os.getenv("POSTGRES_DATABASE"),
+                "user": os.getenv("POSTGRES_USER"),
+                "password": os.getenv("POSTGRES_PASSWORD"),
+                "options": f"-c search_path={os.getenv('POSTGRES_SCHEMA')}",
+                "row_factory": dict_row,
+                "cursor_factory": CurseurProfileAsync if ProfilageRequetes().actif else AsyncCursor,
+            },
+            min_size=int(os.getenv("POSTGRES_POOL_MIN", "1")),
+            max_size=int(os.getenv("POSTGRES_POOL_MAX", "10")),
+            timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+        )
+
+    async def pool(self) -> AsyncConnectionPool:
+        """Retourne le pool, ouvert au besoin."""
+        if self.__pool is None:
+            async with self.__verrou:
+                if self.__pool is None:
+                    pool = self._nouveau_pool()
+                    await pool.open(wait=True)
+                    self.__pool = pool
+        return self.__pool
+
+    @asynccontextmanager
+    async def connexion(self):
+        """
+        `async with DBConnectionAsync().connexion() as con` : emprunte une connexion,
+        COMMIT si tout va bien, ROLLBACK sinon, puis la rend au pool.
+        """
+        pool = await self.pool()
+        async with pool.connection() as con:
+            yield con
+
+    # ---------- Raccourcis utilisés par les DAO ----------
+
+    async def fetchone(self, query: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        async with self.connexion() as con:
+            curs = await con.execute(query, params or {})
+            return await curs.fetchone()
+
+    async def fetchall(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        async with self.connexion() as con:
+            curs = await con.execute(query, params or {})
+            return await curs.fetchall()
+
+    async def rowcount(self, query: str, params: Optional[Dict[str, Any]] = None) -> int:
+        async with self.connexion() as con:
+            curs = await con.execute(query, params or {})
+            return curs.rowcount
+
+    async def fermer(self) -> None:
+        """Ferme le pool (il sera recréé au prochain usage)."""
+        if self.__pool is not None:
+            pool, self.__pool = self.__pool, None
+            self.__verrou = asyncio.Lock()
+            await pool.close()
@@ -0,0 +1,52 @@
+# dao/asynchrone/evenement_dao.py
+from typing import List, Optional
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.evenement_dao import EvenementDao
+from model.evenement_models import EvenementModelIn, EvenementModelOut, EvenementModifieModel
+from model.pagination_models import PageModel
+
+
+class EvenementDaoAsync:
+    """
+    Version asyncio d'EvenementDao : mêmes méthodes, mêmes requêtes SQL
+    (reprises d'EvenementDao), exécutées sur le pool de DBConnectionAsync.
+    """
+
+    # ---------- READ ----------
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
+        """Récupère une liste paginée d'événements."""
+        rows = await DBConnectionAsync().fetchall(
+            EvenementDao._SQL_FIND_ALL, {"limit": max(limit, 0), "offset": max(offset, 0)}
+        )
+        return [EvenementModelOut(**r) for r in rows]
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        """Récupère une page d'événements par clé (id_evenement)."""
+        query, params = EvenementDao._requete_page(limit, curseur)
+        rows = await DBConnectionAsync().fetchall(query, params)
+        return EvenementDao._construire_page(rows, limit)
+
+    async def find_by_id(self, id_evenement: int) -> Optional[EvenementModelOut]:
+        """Récupère un événement par son ID."""
+        r = await DBConnectionAsync().fetchone(EvenementDao._SQL_FIND_BY_ID, {"id": id_evenement})
+        return EvenementModelOut(**r) if r else None
+
+    # ---------- CREATE ----------
+    async def create(self, evenement_in: EvenementModelIn) -> Optional[EvenementModelOut]:
+        """Crée un nouvel événement."""
+        row = await DBConnectionAsync().fetchone(
+            EvenementDao._SQL_CREATE, EvenementDao._params_creation(evenement_in)
+        )
+        return EvenementDao._modele_cree(evenement_in, row) if row else None
+
+    # ---------- UPDATE ----------
+    async def update(self, evenement: EvenementModelOut) -> Optional[EvenementModifieModel]:
+        """Met à jour un événement existant (capacité précédente comprise), None s'il n'existe pas."""
+        r = await DBConnectionAsync().fetchone(EvenementDao._SQL_UPDATE, EvenementDao._params_maj(evenement))
+        return EvenementModifieModel(**r) if r else None
+
+    # ---------- DELETE ----------
+    async def delete(self, id_evenement: int) -> bool:
+        """Supprime un événement par son ID."""
+        return await DBConnectionAsync().rowcount(EvenementDao._SQL_DELETE, {"id": id_evenement}) > 0
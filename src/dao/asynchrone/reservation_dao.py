@@ -0,0 +1,187 @@
+# dao/asynchrone/reservation_dao.py
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.idempotence_dao import IdempotenceDao
+from dao.liste_attente_dao import ListeAttenteDao
+from dao.reservation_dao import ReservationDao
+from model.bus_models import AffectationBusModel
+from model.ecriture_models import EcritureModel
+from model.email_models import EmailModelIn
+from model.idempotence_models import CleIdempotenceModel
+from model.reservation_models import (
+    PromotionModel,
+    ReservationModelIn,
+    ReservationModelOut,
+    ResultatReservationModel,
+)
+
+
+class ReservationDaoAsync:
+    """
+    Version asyncio de ReservationDao : mêmes requêtes SQL, exécutées sur le pool
+    de DBConnectionAsync.
+    """
+
+    @staticmethod
+    async def _repartir(con, evenements: Sequence[int]) -> List[AffectationBusModel]:
+        """AffectationBusDao.repartir dans la transaction de `con`, une instruction par exécution."""
+        params = AffectationBusDao._params(evenements)
+        await con.execute(AffectationBusDao._SQL_VERROU_EVENEMENTS, params)
+        await con.execute(AffectationBusDao._SQL_LIBERER, params)
+        curs = await con.execute(AffectationBusDao._SQL_AFFECTER, params)
+        return [AffectationBusModel(**r) for r in await curs.fetchall()]
+
+    @staticmethod
+    async def _inscrire_en_attente(con, reservation_in: ReservationModelIn) -> int:
+        """ListeAttenteDao.inscrire dans la transaction de `con`, une instruction par exécution."""
+        params = ListeAttenteDao._params_demande(reservation_in)
+        await con.execute(ListeAttenteDao._SQL_INSCRIRE, params)
+        curs = await con.execute(ListeAttenteDao._SQL_POSITION, params)
+        return int((await curs.fetchone())["position"])
+
+    @staticmethod
+    async def _rejouer_ou_prendre(
+        con, idempotence: CleIdempotenceModel, operation: str
+    ) -> Optional[Dict[str, Any]]:
+        """IdempotenceDao.rejouer_ou_prendre dans la transaction de `con`."""
+        params = IdempotenceDao._params(idempotence, operation)
+        curs = await con.execute(IdempotenceDao._SQL_PRENDRE, params)
+        if await curs.fetchone() is not None:
+            return None
+        curs = await con.execute(IdempotenceDao._SQL_LIRE, params)
+        r = await curs.fetchone()
+        return r["resultat"] if r else {"valeur": None}
+
+    @staticmethod
+    async def _enregistrer(con, idempotence: CleIdempotenceModel, operation: str, valeur: Any) -> None:
+        await con.execute(
+            IdempotenceDao._SQL_ENREGISTRER, IdempotenceDao._params_resultat(idempotence, operation, valeur)
+        )
+
+    # ---------- READ ----------
+    async def find_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
+        rows = await DBConnectionAsync().fetchall(
+            ReservationDao._SQL_FIND_BY_USER, {"id_utilisateur": id_utilisateur}
+        )
+        return [ReservationModelOut(**r) for r in rows]
+
+    async def find_by_event(self, id_evenement: int) -> List[ReservationModelOut]:
+        rows = await DBConnectionAsync().fetchall(
+            ReservationDao._SQL_FIND_BY_EVENT, {"id_evenement": id_evenement}
+        )
+        return [ReservationModelOut(**r) for r in rows]
+
+    async def find_by_id(self, id_reservation: int) -> Optional[ReservationModelOut]:
+        r = await DBConnectionAsync().fetchone(ReservationDao._SQL_FIND_BY_ID, {"id": id_reservation})
+        return ReservationModelOut(**r) if r else None
+
+    async def resultat_enregistre(
+        self, idempotence: CleIdempotenceModel, operation: str
+    ) -> Optional[Dict[str, Any]]:
+        r = await DBConnectionAsync().fetchone(
+            IdempotenceDao._SQL_LIRE, IdempotenceDao._params(idempotence, operation)
+        )
+        return r["resultat"] if r and r["resultat"] is not None else None
+
+    # ---------- CREATE ----------
+    async def reserver(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        liste_attente: bool = False,
+        idempotence: Optional[CleIdempotenceModel] = None,
+    ) -> ResultatReservationModel:
+        """
+        Réservation atomique, voir ReservationDao.reserver. psycopg 3 n'accepte
+        qu'une instruction par exécution paramétrée : le verrou FOR UPDATE et
+        l'insertion sont deux exécutions, dans la même transaction (comme l'e-mail).
+        """
+        params = ReservationDao._params_reservation(reservation_in)
+        affectations = []
+        position = None
+        async with DBConnectionAsync().connexion() as con:
+            if idempotence is not None:
+                deja = await self._rejouer_ou_prendre(con, idempotence, ReservationDao.OPERATION_RESERVER)
+                if deja is not None:
+                    return ResultatReservationModel(**deja["valeur"])
+            await con.execute(ReservationDao._SQL_VERROU_EVENEMENT, params)
+            curs = await con.execute(ReservationDao._SQL_RESERVER, params)
+            row = await curs.fetchone()
+            if row["id_reservation"] is not None and ReservationDao._demande_bus([reservation_in]):
+                affectations = await self._repartir(con, [reservation_in.fk_evenement])
+            if email is not None and row["id_reservation"] is not None:
+                await con.execute(EmailOutboxDao._SQL_AJOUTER, EmailOutboxDao._params(email))
+            if liste_attente and ReservationDao._refus_complet(row):
+                position = await self._inscrire_en_attente(con, reservation_in)
+            resultat = ReservationDao._resultat_reservation(row, reservation_in, affectations, position)
+            if idempotence is not None:
+                await self._enregistrer(
+                    con, idempotence, ReservationDao.OPERATION_RESERVER, resultat.model_dump(mode="json")
+                )
+
+        return resultat
+
+    # ---------- DELETE ----------
+    async def delete(
+        self,
+        id_reservation: int,
+        email: Optional[EmailModelIn] = None,
+        email_promotion: Optional[Callable[[PromotionModel], EmailModelIn]] = None,
+        idempotence: Optional[CleIdempotenceModel] = None,
+    ) -> EcritureModel:
+        """Annulation avec promotion de la liste d'attente, voir ReservationDao.delete."""
+        async with DBConnectionAsync().connexion() as con:
+            if idempotence is not None:
+                deja = await self._rejouer_ou_prendre(con, idempotence, ReservationDao.OPERATION_ANNULER)
+                if deja is not None:
+                    return EcritureModel(**deja["valeur"])
+            await con.execute(ReservationDao._SQL_VERROU_RESERVATION, {"id": id_reservation})
+            curs = await con.execute(ReservationDao._SQL_DELETE, {"id": id_reservation})
+            r = await curs.fetchone()
+            issue = ReservationDao._suppression(r)
+            if idempotence is not None:
+                await self._enregistrer(con, idempotence, ReservationDao.OPERATION_ANNULER, issue.model_dump())
+            if r is None:
+                return issue
+            curs = await con.execute(ListeAttenteDao._SQL_PROMOUVOIR, {"id_evenement": r["fk_evenement"]})
+            promues = [PromotionModel(**p) for p in await curs.fetchall()]
+            if r["bus"] or ReservationDao._demande_bus(promues):
+                await self._repartir(con, [r["fk_evenement"]])
+            if email is not None:
+                await con.execute(EmailOutboxDao._SQL_AJOUTER, EmailOutboxDao._params(email))
+            if email_promotion is not None:
+                for promue in promues:
+                    await con.execute(EmailOutboxDao._SQL_AJOUTER, EmailOutboxDao._params(email_promotion(promue)))
+        return issue
+
+    async def promouvoir(
+        self,
+        id_evenement: int,
+        email_promotion: Optional[Callable[[PromotionModel], EmailModelIn]] = None,
+    ) -> List[PromotionModel]:
+        """Sert la liste d'attente sous le verrou de l'événement, voir ListeAttenteDao.promouvoir."""
+        params = {"id_evenement": id_evenement}
+        async with DBConnectionAsync().connexion() as con:
+            await con.execute(ListeAttenteDao._SQL_VERROU_EVENEMENT, params)
+            curs = await con.execute(ListeAttenteDao._SQL_PROMOUVOIR, params)
+            promues = [PromotionModel(**p) for p in await curs.fetchall()]
+            if ReservationDao._demande_bus(promues):
+                await self._repartir(con, [id_evenement])
+            if email_promotion is not None:
+                for promue in promues:
+                    await con.execute(EmailOutboxDao._SQL_AJOUTER, EmailOutboxDao._params(email_promotion(promue)))
+        return promues
+
+    # ---------- HELPERS / STATS ----------
+    async def count_by_event(self, id_evenement: int) -> int:
+        r = await DBConnectionAsync().fetchone(ReservationDao._SQL_COUNT_BY_EVENT, {"id": id_evenement})
+        return int(r["c"]) if r else 0
+
+    async def exists_for_user_and_event(self, id_utilisateur: int, id_evenement: int) -> bool:
+        r = await DBConnectionAsync().fetchone(
+            ReservationDao._SQL_EXISTS, {"id_user": id_utilisateur, "id_event": id_evenement}
+        )
+        return r is not None
@@ -0,0 +1,63 @@
+# dao/asynchrone/session_dao.py
+from typing import Optional
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.session_dao import SessionDao, SessionMemoireDao
+from model.session_models import SessionModel
+
+
+class SessionDaoAsync:
+    """
+    Version asyncio de SessionDao : mêmes méthodes, mêmes requêtes SQL
+    (reprises de SessionDao), exécutées sur le pool de DBConnectionAsync.
+    """
+
+    async def creer(self, id_session: str, fk_utilisateur: int, administrateur: bool, duree: int) -> SessionModel:
+        r = await DBConnectionAsync().fetchone(
+            SessionDao._SQL_CREER,
+            {"id_session": id_session, "fk_utilisateur": fk_utilisateur,
+             "administrateur": administrateur, "duree": duree},
+        )
+        return SessionModel(**r)
+
+    async def lire_et_prolonger(self, id_session: str, duree: int) -> Optional[SessionModel]:
+        r = await DBConnectionAsync().fetchone(
+            SessionDao._SQL_LIRE_ET_PROLONGER, SessionDao._params_lecture(id_session, duree)
+        )
+        return SessionModel(**r) if r else None
+
+    async def supprimer(self, id_session: str) -> bool:
+        return await DBConnectionAsync().rowcount(SessionDao._SQL_SUPPRIMER, {"id_session": id_session}) > 0
+
+    async def supprimer_par_utilisateur(self, fk_utilisateur: int) -> int:
+        return await DBConnectionAsync().rowcount(
+            SessionDao._SQL_SUPPRIMER_UTILISATEUR, {"fk_utilisateur": fk_utilisateur}
+        )
+
+    async def purger(self) -> int:
+        return await DBConnectionAsync().rowcount(SessionDao._SQL_PURGER)
+
+
+class SessionMemoireDaoAsync:
+    """
+    Interface asyncio du stockage en mémoire (partagé avec SessionMemoireDao) :
+    les opérations ne bloquent pas, elles s'exécutent directement dans la boucle.
+    """
+
+    def __init__(self, memoire: Optional[SessionMemoireDao] = None):
+        self.memoire = memoire or SessionMemoireDao()
+
+    async def creer(self, id_session: str, fk_utilisateur: int, administrateur: bool, duree: int) -> SessionModel:
+        return self.memoire.creer(id_session, fk_utilisateur, administrateur, duree)
+
+    async def lire_et_prolonger(self, id_session: str, duree: int) -> Optional[SessionModel]:
+        return self.memoire.lire_et_prolonger(id_session, duree)
+
+    async def supprimer(self, id_session: str) -> bool:
+        return self.memoire.supprimer(id_session)
+
+    async def supprimer_par_utilisateur(self, fk_utilisateur: int) -> int:
+        return self.memoire.supprimer_par_utilisateur(fk_utilisateur)
+
+    async def purger(self) -> int:
+        return self.memoire.purger()
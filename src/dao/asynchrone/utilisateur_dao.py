@@ -0,0 +1,65 @@
+# dao/asynchrone/utilisateur_dao.py
+from typing import Optional
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.utilisateur_dao import UtilisateurDao
+from model.email_models import EmailModelIn
+from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from utils.securite import HachageMotDePasse
+
+
+class UtilisateurDaoAsync:
+    """
+    Version asyncio d'UtilisateurDao (lecture, création, authentification).
+    Le hachage bcrypt, coûteux en CPU, part dans le pool de processus de
+    HachageMotDePasse pour ne pas bloquer la boucle d'événements.
+    """
+
+    # ---------- READ ----------
+    async def find_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
+        r = await DBConnectionAsync().fetchone(UtilisateurDao._SQL_FIND_BY_ID, {"id": id_utilisateur})
+        return UtilisateurModelOut(**r) if r else None
+
+    async def find_by_email(self, email: str) -> Optional[UtilisateurModelOut]:
+        r = await DBConnectionAsync().fetchone(UtilisateurDao._SQL_FIND_BY_EMAIL, {"email": email})
+        return UtilisateurModelOut(**r) if r else None
+
+    # ---------- CREATE ----------
+    async def create(self, user_in: UtilisateurModelIn, email: Optional[EmailModelIn] = None) -> UtilisateurModelOut:
+        params = {
+            "email": user_in.email,
+            "prenom": user_in.prenom,
+            "nom": user_in.nom,
+            "telephone": user_in.telephone,
+            "mot_de_passe": await HachageMotDePasse().hacher_async(user_in.mot_de_passe),
+            "administrateur": getattr(user_in, "administrateur", False),
+        }
+        async with DBConnectionAsync().connexion() as con:
+            curs = await con.execute(UtilisateurDao._SQL_CREATE, params)
+            row = await curs.fetchone()
+            if email is not None:
+                await con.execute(EmailOutboxDao._SQL_AJOUTER, EmailOutboxDao._params(email))
+        return UtilisateurModelOut(
+            id_utilisateur=row["id_utilisateur"],
+            email=user_in.email,
+            prenom=user_in.prenom,
+            nom=user_in.nom,
+            telephone=user_in.telephone,
+            administrateur=params["administrateur"],
+            date_creation=row["date_creation"],
+        )
+
+    # ---------- AUTH ----------
+    async def authenticate(self, email: str, mot_de_passe: str) -> Optional[UtilisateurModelOut]:
+        r = await DBConnectionAsync().fetchone(UtilisateurDao._SQL_AUTHENTICATE, {"email": email})
+        if r is None:
+            return None
+        hache = r.pop("mot_de_passe")
+        hachage = HachageMotDePasse()
+        if not await hachage.verifier_async(mot_de_passe, hache):
+            return None
+        if hachage.a_rehacher(hache):
+            params = {"nouveau": await hachage.hacher_async(mot_de_passe), "id": r["id_utilisateur"], "ancien": hache}
+            await DBConnectionAsync().rowcount(UtilisateurDao._SQL_REHACHER, params)
+        return UtilisateurModelOut(**r)
@@ -0,0 +1,105 @@
+# dao/compteur_evenement_dao.py
+from typing import List, Optional, Dict, Any
+
+from dao.db_connection import DBConnection
+
+
+class CompteurEvenementDao:
+    """
+    DAO du compteur dénormalisé par événement (table 'compteur_evenement').
+
+    Schéma :
+      id_evenement INT PK REFERENCES evenement(id_evenement) ON DELETE CASCADE
+      nb_reservations INT NOT NULL DEFAULT 0
+      nb_bus_aller INT NOT NULL DEFAULT 0
+      nb_bus_retour INT NOT NULL DEFAULT 0
+
+    Les compteurs sont maintenus par les triggers de la migration 009 ;
+    ce DAO sert à les lire et à détecter / réparer une éventuelle dérive.
+    """
+
+    # Valeurs réelles recalculées depuis la table reservation
+    _REEL = """
+        SELECT e.id_evenement,
+               COUNT(r.id_reservation) AS nb_reservations,
+               COUNT(r.id_reservation) FILTER (WHERE r.bus_aller) AS nb_bus_aller,
+               COUNT(r.id_reservation) FILTER (WHERE r.bus_retour) AS nb_bus_retour
+        FROM evenement e
+        LEFT JOIN reservation r ON r.fk_evenement = e.id_evenement
+        {where}
+        GROUP BY e.id_evenement
+    """
+
+    # ---------- READ ----------
+    def find_by_event(self, id_evenement: int) -> Optional[Dict[str, Any]]:
+        """Retourne les compteurs d'un événement (lecture par clé primaire)."""
+        query = """
+            SELECT id_evenement, nb_reservations, nb_bus_aller, nb_bus_retour
+            FROM compteur_evenement
+            WHERE id_evenement = %(id)s
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_evenement})
+                row = curs.fetchone()
+        return dict(row) if row else None
+
+    # ---------- RÉCONCILIATION ----------
+    def find_derives(self, id_evenement: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Liste les événements dont le compteur diffère de la réalité
+        (ou dont la ligne de compteur est absente).
+
+        Retourne des dicts : {id_evenement, compteur_*, reel_*}
+        """
+        where = "WHERE e.id_evenement = %(id)s" if id_evenement is not None else ""
+        query = f"""
+            WITH reel AS ({self._REEL.format(where=where)})
+            SELECT reel.id_evenement,
+                   c.nb_reservations AS compteur_reservations,
+                   reel.nb_reservations AS reel_reservations,
+                   c.nb_bus_aller AS compteur_bus_aller,
+                   reel.nb_bus_aller AS reel_bus_aller,
+                   c.nb_bus_retour AS compteur_bus_retour,
+                   reel.nb_bus_retour AS reel_bus_retour
+            FROM reel
+            LEFT JOIN compteur_evenement c ON c.id_evenement = reel.id_evenement
+            WHERE (c.nb_reservations, c.nb_bus_aller, c.nb_bus_retour)
+                  IS DISTINCT FROM
+                  (reel.nb_reservations, reel.nb_bus_aller, reel.nb_bus_retour)
+            ORDER BY reel.id_evenement
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_evenement})
+                rows = curs.fetchall()
+        return [dict(r) for r in rows]
+
+    def reparer(self, id_evenement: Optional[int] = None) -> List[int]:
+        """
+        Recalcule les compteurs en dérive et retourne les ids corrigés.
+        Les écritures sur `reservation` sont bloquées le temps du recalcul
+        (LOCK SHARE) pour ne pas figer une valeur déjà périmée.
+        """
+        where = "WHERE e.id_evenement = %(id)s" if id_evenement is not None else ""
+        query = f"""
+            LOCK TABLE reservation IN SHARE MODE;
+
+            INSERT INTO compteur_evenement (id_evenement, nb_reservations, nb_bus_aller, nb_bus_retour)
+            {self._REEL.format(where=where)}
+            ON CONFLICT (id_evenement) DO UPDATE SET
+                nb_reservations = EXCLUDED.nb_reservations,
+                nb_bus_aller = EXCLUDED.nb_bus_aller,
+                nb_bus_retour = EXCLUDED.nb_bus_retour
+            WHERE (compteur_evenement.nb_reservations,
+                   compteur_evenement.nb_bus_aller,
+                   compteur_evenement.nb_bus_retour)
+                  IS DISTINCT FROM
+                  (EXCLUDED.nb_reservations, EXCLUDED.nb_bus_aller, EXCLUDED.nb_bus_retour)
+            RETURNING id_evenement
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_evenement})
+                rows = curs.fetchall()
+        return [r["id_evenement"] for r in rows]
@@ -1,18 +1,174 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 
 from psycopg2.extras import RealDictCursor
 
 from dao.db_connection import DBConnection
 from model.evenement_models import EvenementModelOut
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
 
 
 class ConsultationEvenementDao:
     """
     DAO de consultation (lecture seule) des événements.
     Minimalement adapté au nouveau schéma SQL (suppression de fk_transport, comptage par événement).
+    Les places restantes s'appuient sur le compteur dénormalisé 'compteur_evenement'.
+
+    Chaque liste existe en deux variantes :
+      - lister_* / rechercher : pagination LIMIT/OFFSET (historique) ;
+      - *_page : pagination par clé (date_evenement, id_evenement) avec curseur opaque,
+        dont le coût ne dépend pas de la profondeur de la page.
+
+    Les requêtes sont construites par des helpers partagés avec
+    ConsultationEvenementDaoAsync (dao/asynchrone/).
     """
 
+    _COLONNES = (
+        "e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
+        "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation "
+    )
+    _COLONNES_PLACES = (
+        _COLONNES
+        + ",      (e.capacite - COALESCE(c.nb_reservations, 0)) AS places_restantes "
+    )
+    _FROM_PLACES = "FROM evenement e LEFT JOIN compteur_evenement c ON c.id_evenement = e.id_evenement "
+    _SQL_AVEC_PLACES_PAR_ID = f"SELECT {_COLONNES_PLACES}{_FROM_PLACES}WHERE e.id_evenement = %(id)s"
+
+    # ---------- Helpers ----------
+
+    @staticmethod
+    def _filtres_disponibles(a_partir_du: Optional[date]) -> Tuple[List[str], Dict[str, Any]]:
+        where = ["e.statut = 'disponible en ligne'"]
+        params: Dict[str, Any] = {}
+        if a_partir_du is not None:
+            where.append("e.date_evenement >= %(dmin)s")
+            params["dmin"] = a_partir_du
+        return where, params
+
+    @staticmethod
+    def _filtres_recherche(
+        ville: Optional[str],
+        categorie: Optional[str],
+        statut: Optional[str],
+        date_min: Optional[date],
+        date_max: Optional[date],
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        where = []
+        params: Dict[str, Any] = {}
+        if ville:
+            where.append("e.ville ILIKE %(ville)s")
+            params["ville"] = f"%{ville}%"
+        if categorie:
+            where.append("e.categorie = %(categorie)s")
+            params["categorie"] = categorie
+        if statut:
+            where.append("e.statut = %(statut)s")
+            params["statut"] = statut
+        if date_min:
+            where.append("e.date_evenement >= %(date_min)s")
+            params["date_min"] = date_min
+        if date_max:
+            where.append("e.date_evenement <= %(date_max)s")
+            params["date_max"] = date_max
+        return where, params
+
+    @staticmethod
+    def _filtres_places(
+        seulement_disponibles: bool, a_partir_du: Optional[date]
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        where = []
+        params: Dict[str, Any] = {}
+        if seulement_disponibles:
+            where.append("e.statut = 'disponible en ligne'")
+        if a_partir_du is not None:
+            where.append("e.date_evenement >= %(dmin)s")
+            params["dmin"] = a_partir_du
+        return where, params
+
+    @staticmethod
+    def _executer(query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(query, params)
+                return curs.fetchall()
+
+    @staticmethod
+    def _requete_liste(
+        colonnes: str,
+        from_clause: str,
+        where: List[str],
+        params: Dict[str, Any],
+        limit: int,
+        offset: int,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Liste paginée par LIMIT/OFFSET, triée par (date_evenement, id_evenement)."""
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+        query = (
+            f"SELECT {colonnes}"
+            f"{from_clause}"
+            f"{where_clause}"
+            "ORDER BY e.date_evenement ASC, e.id_evenement ASC "
+            "LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, {**params, "limit": max(limit, 0), "offset": max(offset, 0)}
+
+    @staticmethod
+    def _requete_page(
+        colonnes: str,
+        from_clause: str,
+        where: List[str],
+        params: Dict[str, Any],
+        limit: int,
+        curseur: Optional[str],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Liste paginée par clé : reprend strictement après (date_evenement, id_evenement)
+        du curseur. Lit limit + 1 lignes pour savoir s'il existe une page suivante.
+        """
+        where = list(where)
+        params = {**params, "limit": max(limit, 0) + 1}
+        if curseur:
+            params["apres_date"], params["apres_id"] = decoder_curseur(curseur, date.fromisoformat, int)
+            where.append("(e.date_evenement, e.id_evenement) > (%(apres_date)s, %(apres_id)s)")
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+        query = (
+            f"SELECT {colonnes}"
+            f"{from_clause}"
+            f"{where_clause}"
+            "ORDER BY e.date_evenement ASC, e.id_evenement ASC "
+            "LIMIT %(limit)s"
+        )
+        return query, params
+
+    @staticmethod
+    def _decouper(rows: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return decouper_page(rows, max(limit, 0), lambda r: (r["date_evenement"], r["id_evenement"]))
+
+    def _lister(
+        self,
+        colonnes: str,
+        from_clause: str,
+        where: List[str],
+        params: Dict[str, Any],
+        limit: int,
+        offset: int,
+    ) -> List[Dict[str, Any]]:
+        return self._executer(*self._requete_liste(colonnes, from_clause, where, params, limit, offset))
+
+    def _lister_page(
+        self,
+        colonnes: str,
+        from_clause: str,
+        where: List[str],
+        params: Dict[str, Any],
+        limit: int,
+        curseur: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        query, params = self._requete_page(colonnes, from_clause, where, params, limit, curseur)
+        return self._decouper(self._executer(query, params), limit)
+
     # ---------- Listes simples ----------
 
     def lister_tous(
@@ -33,13 +189,20 @@ class ConsultationEvenementDao:
         )
         params = {"limit": max(limit, 0), "offset": max(offset, 0)}
 
-        with DBConnection().getConnexion() as con:
-            with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, params)
-                rows = curs.fetchall()
-
+        rows = self._executer(query, params)
         return [EvenementModelOut(**row) for row in rows]
 
+    def lister_tous_page(
+        self, limit: int = 100, curseur: Optional[str] = None
+    ) -> PageModel[EvenementModelOut]:
+        """
+        Page de tous les événements, triés par (date_evenement, id_evenement).
+        """
+        rows, suivant = self._lister_page(self._COLONNES, "FROM evenement e ", [], {}, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
+        )
+
     def lister_disponibles(
         self,
         limit: int = 100,
@@ -50,29 +213,25 @@ class ConsultationEvenementDao:
         Liste des événements au statut 'disponible en ligne'.
         Optionnel: ne renvoyer qu'à partir d'une date (incluse).
         """
-        where = ["statut = 'disponible en ligne'"]
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
-
-        if a_partir_du is not None:
-            where.append("date_evenement >= %(dmin)s")
-            params["dmin"] = a_partir_du
+        where, params = self._filtres_disponibles(a_partir_du)
+        rows = self._lister(self._COLONNES, "FROM evenement e ", where, params, limit, offset)
+        return [EvenementModelOut(**row) for row in rows]
 
-        query = (
-            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
-            "       date_evenement, description, capacite, categorie, statut, date_creation "
-            "FROM evenement "
-            f"WHERE {' AND '.join(where)} "
-            "ORDER BY date_evenement ASC, id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
+    def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[EvenementModelOut]:
+        """
+        Page des événements au statut 'disponible en ligne' (pagination par clé).
+        """
+        where, params = self._filtres_disponibles(a_partir_du)
+        rows, suivant = self._lister_page(self._COLONNES, "FROM evenement e ", where, params, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
         )
 
-        with DBConnection().getConnexion() as con:
-            with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, params)
-                rows = curs.fetchall()
-
-        return [EvenementModelOut(**row) for row in rows]
-
     # ---------- Recherche avec filtres ----------
 
     def rechercher(
@@ -92,42 +251,29 @@ class ConsultationEvenementDao:
         - statut : égalité stricte
         - date_min / date_max : intervalle fermé [date_min, date_max]
         """
-        where = []
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
-
-        if ville:
-            where.append("ville ILIKE %(ville)s")
-            params["ville"] = f"%{ville}%"
-        if categorie:
-            where.append("categorie = %(categorie)s")
-            params["categorie"] = categorie
-        if statut:
-            where.append("statut = %(statut)s")
-            params["statut"] = statut
-        if date_min:
-            where.append("date_evenement >= %(date_min)s")
-            params["date_min"] = date_min
-        if date_max:
-            where.append("date_evenement <= %(date_max)s")
-            params["date_max"] = date_max
+        where, params = self._filtres_recherche(ville, categorie, statut, date_min, date_max)
+        rows = self._lister(self._COLONNES, "FROM evenement e ", where, params, limit, offset)
+        return [EvenementModelOut(**row) for row in rows]
 
-        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
-        query = (
-            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
-            "       date_evenement, description, capacite, categorie, statut, date_creation "
-            "FROM evenement "
-            f"{where_clause}"
-            "ORDER BY date_evenement ASC, id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
+    def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageModel[EvenementModelOut]:
+        """
+        Recherche d'événements (mêmes filtres que rechercher), pagination par clé.
+        """
+        where, params = self._filtres_recherche(ville, categorie, statut, date_min, date_max)
+        rows, suivant = self._lister_page(self._COLONNES, "FROM evenement e ", where, params, limit, curseur)
+        return PageModel[EvenementModelOut](
+            elements=[EvenementModelOut(**row) for row in rows], curseur_suivant=suivant
         )
 
-        with DBConnection().getConnexion() as con:
-            with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, params)
-                rows = curs.fetchall()
-
-        return [EvenementModelOut(**row) for row in rows]
-
     # ---------- Avec places restantes ----------
 
     def lister_avec_places_restantes(
@@ -139,42 +285,39 @@ class ConsultationEvenementDao:
     ) -> List[Dict[str, Any]]:
         """
         Liste des événements avec le calcul des places restantes :
-        places_restantes = capacite - COUNT(reservation.id_reservation) pour l'événement.
+        places_restantes = capacite - compteur_evenement.nb_reservations.
+
+        Le compteur est maintenu par trigger : une simple jointure par clé primaire
+        remplace le COUNT(*) ... GROUP BY sur toute la table reservation.
 
         Retourne des dicts : {**EvenementModelOut fields..., "places_restantes": int}
         """
-        where = []
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
+        where, params = self._filtres_places(seulement_disponibles, a_partir_du)
+        rows = self._lister(self._COLONNES_PLACES, self._FROM_PLACES, where, params, limit, offset)
 
-        if seulement_disponibles:
-            where.append("e.statut = 'disponible en ligne'")
-        if a_partir_du is not None:
-            where.append("e.date_evenement >= %(dmin)s")
-            params["dmin"] = a_partir_du
-
-        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+        # rows est déjà une liste de dicts (RealDictCursor)
+        return [dict(row) for row in rows]
 
-        # Comptage des réservations par événement (nouveau schéma)
-        query = (
-            "WITH resa AS ( "
-            "  SELECT fk_evenement, COUNT(*) AS nb_resa "
-            "  FROM reservation "
-            "  GROUP BY fk_evenement "
-            ") "
-            "SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
-            "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, "
-            "       (e.capacite - COALESCE(r.nb_resa, 0)) AS places_restantes "
-            "FROM evenement e "
-            "LEFT JOIN resa r ON r.fk_evenement = e.id_evenement "
-            f"{where_clause}"
-            "ORDER BY e.date_evenement ASC, e.id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
+    def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[Dict[str, Any]]:
+        """
+        Page des événements avec places restantes, pagination par clé.
+        """
+        where, params = self._filtres_places(seulement_disponibles, a_partir_du)
+        rows, suivant = self._lister_page(
+            self._COLONNES_PLACES, self._FROM_PLACES, where, params, limit, curseur
         )
+        return PageModel[Dict[str, Any]](elements=[dict(row) for row in rows], curseur_suivant=suivant)
 
-        with DBConnection().getConnexion() as con:
-            with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, params)
-                rows = curs.fetchall()
-
-        # rows est déjà une liste de dicts (RealDictCursor)
-        return [dict(row) for row in rows]
+    def trouver_avec_places_restantes(self, id_evenement: int) -> Optional[Dict[str, Any]]:
+        """
+        Retourne un événement avec ses places restantes (lecture par clé primaire),
+        ou None s'il n'existe pas.
+        """
+        rows = self._executer(self._SQL_AVEC_PLACES_PAR_ID, {"id": id_evenement})
+        return dict(rows[0]) if rows else None
@@ -1,8 +1,11 @@
-# dao/bus_dao.py
+# dao/creneau_bus_dao.py
 from typing import List, Optional
 
+from business_object.CreneauBus import CreneauBus
 from dao.db_connection import DBConnection
-from model.creneau_bus import CreneauBus
+from model.ecriture_models import EcritureModel
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
 
 
 class CreneauBusDao:
@@ -15,12 +18,19 @@ class CreneauBusDao:
       nombre_places INT NOT NULL CHECK (nombre_places > 0)
       direction VARCHAR(10) IN ('aller','retour') DEFAULT 'aller'
       description VARCHAR(100) UNIQUE NOT NULL
+
+    Les lectures renseignent `inscrits` : nombre de places attribuées dans le bus
+    (table affectation_bus, voir AffectationBusDao).
     """
 
+    # Lecture d'un bus ou d'une page de bus : inscrits comptés par l'index idx_affectation_bus_bus
+    _COLONNES = """b.id_bus, b.fk_evenement, b.matricule, b.nombre_places, b.direction, b.description,
+                   (SELECT COUNT(*) FROM affectation_bus a WHERE a.fk_bus = b.id_bus) AS inscrits"""
+
     # ------------- HELPERS -------------
     @staticmethod
     def _row_to_model(row: dict) -> CreneauBus:
-        # Le DAO ne gère pas `inscrits` (logique métier) -> 0 par défaut ici
+        # Après une écriture (RETURNING), `inscrits` n'est pas relu -> 0 par défaut
         return CreneauBus(
             id_bus=row.get("id_bus"),
             fk_evenement=row.get("fk_evenement"),
@@ -28,7 +38,7 @@ class CreneauBusDao:
             description=row.get("description"),
             nombre_places=row.get("nombre_places"),
             direction=row.get("direction"),
-            inscrits=0,
+            inscrits=row.get("inscrits") or 0,
         )
 
     # ------------- CREATE -------------
@@ -64,10 +74,10 @@ class CreneauBusDao:
 
     # ------------- READ -------------
     def find_by_id(self, id_bus: int) -> Optional[CreneauBus]:
-        query = """
-            SELECT id_bus, fk_evenement, matricule, nombre_places, direction, description
-            FROM bus
-            WHERE id_bus = %(id)s
+        query = f"""
+            SELECT {self._COLONNES}
+            FROM bus b
+            WHERE b.id_bus = %(id)s
         """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
@@ -76,11 +86,15 @@ class CreneauBusDao:
         return self._row_to_model(row) if row else None
 
     def find_by_event(self, id_evenement: int) -> List[CreneauBus]:
+        """Bus d'un événement (aller et retour) avec leurs inscrits, en une requête agrégée."""
         query = """
-            SELECT id_bus, fk_evenement, matricule, nombre_places, direction, description
-            FROM bus
-            WHERE fk_evenement = %(id_evenement)s
-            ORDER BY id_bus
+            SELECT b.id_bus, b.fk_evenement, b.matricule, b.nombre_places, b.direction, b.description,
+                   COUNT(a.fk_reservation) AS inscrits
+            FROM bus b
+            LEFT JOIN affectation_bus a ON a.fk_bus = b.id_bus
+            WHERE b.fk_evenement = %(id_evenement)s
+            GROUP BY b.id_bus
+            ORDER BY b.id_bus
         """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
@@ -89,10 +103,10 @@ class CreneauBusDao:
         return [self._row_to_model(r) for r in rows]
 
     def find_by_description(self, description: str) -> Optional[CreneauBus]:
-        query = """
-            SELECT id_bus, fk_evenement, matricule, nombre_places, direction, description
-            FROM bus
-            WHERE description = %(description)s
+        query = f"""
+            SELECT {self._COLONNES}
+            FROM bus b
+            WHERE b.description = %(description)s
         """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
@@ -101,10 +115,10 @@ class CreneauBusDao:
         return self._row_to_model(row) if row else None
 
     def find_all(self, limit: int = 100, offset: int = 0) -> List[CreneauBus]:
-        query = """
-            SELECT id_bus, fk_evenement, matricule, nombre_places, direction, description
-            FROM bus
-            ORDER BY id_bus
+        query = f"""
+            SELECT {self._COLONNES}
+            FROM bus b
+            ORDER BY b.id_bus
             LIMIT %(limit)s OFFSET %(offset)s
         """
         with DBConnection().getConnexion() as con:
@@ -113,27 +127,61 @@ class CreneauBusDao:
                 rows = curs.fetchall()
         return [self._row_to_model(r) for r in rows]
 
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[CreneauBus]:
+        """
+        Récupère une page de bus par clé (id_bus), sans OFFSET.
+        `curseur` est le jeton `curseur_suivant` de la page précédente.
+        """
+        where_clause = ""
+        params = {"limit": max(0, limit) + 1}
+        if curseur:
+            (params["apres_id"],) = decoder_curseur(curseur, int)
+            where_clause = "WHERE b.id_bus > %(apres_id)s"
+
+        query = f"""
+            SELECT {self._COLONNES}
+            FROM bus b
+            {where_clause}
+            ORDER BY b.id_bus
+            LIMIT %(limit)s
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        rows, suivant = decouper_page(rows, max(0, limit), lambda r: (r["id_bus"],))
+        return PageModel[CreneauBus](
+            elements=[self._row_to_model(r) for r in rows], curseur_suivant=suivant
+        )
+
     # ------------- UPDATE -------------
-    def update(self, bus: CreneauBus) -> Optional[CreneauBus]:
+    def update(self, bus: CreneauBus) -> Optional[EcritureModel]:
         """
-        Met à jour un bus (tous champs sauf id).
+        Met à jour un bus (tous champs sauf id), en une seule instruction.
         Nécessite bus.id_bus.
+        Retourne l'issue typée : 'introuvable', ou 'ecrite' avec le bus mis à jour
+        (`ligne`) et son événement d'avant la mise à jour (`fk_evenement`) ;
+        None si l'écriture échoue (description déjà prise, événement inconnu...).
         """
         if bus.id_bus is None:
             raise ValueError("id_bus requis pour update().")
 
+        # `avant` verrouille puis lit la ligne : l'événement qu'elle portait juste avant la mise à jour,
+        # dans l'instruction même de l'UPDATE (un CTE voisin pourrait s'exécuter après lui)
         query = """
-            WITH updated AS (
-                UPDATE bus
-                SET fk_evenement = %(fk_evenement)s,
-                    matricule    = %(matricule)s,
-                    nombre_places= %(nombre_places)s,
-                    direction    = %(direction)s,
-                    description  = %(description)s
-                WHERE id_bus = %(id_bus)s
-                RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
-            )
-            SELECT * FROM updated
+            UPDATE bus b
+            SET fk_evenement = %(fk_evenement)s,
+                matricule    = %(matricule)s,
+                nombre_places= %(nombre_places)s,
+                direction    = %(direction)s,
+                description  = %(description)s
+            FROM (
+                SELECT id_bus, fk_evenement FROM bus WHERE id_bus = %(id_bus)s FOR UPDATE
+            ) avant
+            WHERE b.id_bus = avant.id_bus
+            RETURNING b.id_bus, b.fk_evenement, b.matricule, b.nombre_places, b.direction, b.description,
+                      avant.fk_evenement AS fk_evenement_precedent
         """
         params = {
             "id_bus": bus.id_bus,
@@ -155,7 +203,9 @@ class CreneauBusDao:
                     print(f"Erreur DAO (update bus): {e}")
                     return None
 
-        return self._row_to_model(row) if row else None
+        if row is None:
+            return EcritureModel(statut="introuvable")
+        return EcritureModel(statut="ecrite", ligne=self._row_to_model(row), fk_evenement=row["fk_evenement_precedent"])
 
     def update_places(self, id_bus: int, nombre_places: int) -> Optional[CreneauBus]:
         """
@@ -184,12 +234,16 @@ class CreneauBusDao:
         return self._row_to_model(row) if row else None
 
     # ------------- DELETE -------------
-    def delete(self, id_bus: int) -> bool:
-        query = "DELETE FROM bus WHERE id_bus = %(id)s"
+    def delete(self, id_bus: int) -> EcritureModel:
+        """Supprime un bus ; l'issue donne l'événement qu'il desservait (à répartir de nouveau)."""
+        query = "DELETE FROM bus WHERE id_bus = %(id)s RETURNING fk_evenement"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, {"id": id_bus})
-                return curs.rowcount > 0
+                row = curs.fetchone()
+        if row is None:
+            return EcritureModel(statut="introuvable")
+        return EcritureModel(statut="ecrite", fk_evenement=row["fk_evenement"])
 
     # ------------- UTILS -------------
     def count_for_event(self, id_evenement: int) -> int:
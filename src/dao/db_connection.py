@@ -1,40 +1,474 @@
+import itertools
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
 import dotenv
 import psycopg2
+from psycopg2 import extensions
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError
 
+from utils.metriques import RegistreMetriques
+from utils.profilage_sql import A_EXPLIQUER, ProfilageRequetes, est_explicable
 from utils.singleton import Singleton
 
 
+_ATTENTE_POOL = RegistreMetriques().histogramme(
+    "bde_db_pool_attente_secondes", "Temps passé à emprunter une connexion au pool (attente et ouverture comprises)."
+)
+_EXPIRATIONS_POOL = RegistreMetriques().compteur(
+    "bde_db_pool_expirations_total", "Emprunts abandonnés faute de connexion libre dans le délai (PoolError)."
+)
+
+
+class PoolConnexions:
+    """
+    Pool borné de connexions PostgreSQL, utilisable depuis plusieurs threads.
+
+    - min_size / max_size : nombre de connexions ouvertes au démarrage / au maximum
+    - timeout : attente maximale (secondes) pour emprunter une connexion, sinon PoolError
+    - max_uses : une connexion est recyclée (fermée puis rouverte) après N emprunts
+    - ping_apres : au-delà de ce délai d'inactivité (secondes), la connexion est
+      testée par un `SELECT 1` avant d'être prêtée (0 = à chaque emprunt)
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], "extensions.connection"],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_uses: int = 1000,
+        ping_apres: float = 30.0,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Tailles de pool invalides (0 <= min_size <= max_size, max_size >= 1).")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_uses = max_uses
+        self.ping_apres = ping_apres
+
+        self._cond = threading.Condition()
+        self._libres: List = []  # pile LIFO : la connexion la plus chaude ressort en premier
+        self._utilisations = {}  # id(con) -> nombre d'emprunts
+        self._derniere_restitution = {}  # id(con) -> time.monotonic()
+        self._ouvertes = 0
+        self._ferme = False
+
+        for _ in range(min_size):
+            self._ouvertes += 1
+            self._libres.append(self._ouvrir())
+
+    # ---------- Cycle de vie des connexions ----------
+    def _ouvrir(self):
+        """Ouvre une connexion ; la place doit déjà avoir été réservée dans `_ouvertes`."""
+        try:
+            con = self._connect()
+        except Exception:
+            with self._cond:
+                self._ouvertes -= 1
+                self._cond.notify()
+            raise
+        self._utilisations[id(con)] = 0
+        self._derniere_restitution[id(con)] = time.monotonic()
+        return con
+
+    def _oublier(self, con) -> None:
+        """Libère la place d'une connexion dans le pool (sous le verrou)."""
+        self._utilisations.pop(id(con), None)
+        self._derniere_restitution.pop(id(con), None)
+        self._ouvertes -= 1
+        self._cond.notify()
+
+    @staticmethod
+    def _fermer_connexion(con) -> None:
+        """Ferme une connexion oubliée par le pool (hors du verrou : peut attendre le réseau)."""
+        try:
+            if not con.closed:
+                con.close()
+        except Exception:
+            pass
+
+    def _est_saine(self, con) -> bool:
+        """
+        Vérifie qu'une connexion sortie de la pile peut être prêtée. Appelée hors du
+        verrou : le `SELECT 1` ne bloque pas les autres emprunts et restitutions.
+        """
+        if con.closed:
+            return False
+        if self._utilisations.get(id(con), 0) >= self.max_uses:
+            return False
+        inactif = time.monotonic() - self._derniere_restitution.get(id(con), 0)
+        if inactif < self.ping_apres:
+            return True
+        try:
+            with con.cursor() as curs:
+                curs.execute("SELECT 1")
+            con.rollback()
+            return True
+        except Exception:
+            return False
+
+    # ---------- Emprunt / restitution ----------
+    def emprunter(self):
+        """Retourne une connexion du pool, en attendant au plus `timeout` secondes."""
+        t0 = time.perf_counter()
+        con = self._emprunter()
+        _ATTENTE_POOL.observer(time.perf_counter() - t0)
+        return con
+
+    def _emprunter(self):
+        echeance = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                if self._ferme:
+                    raise PoolError("Le pool de connexions est fermé.")
+
+                if self._libres:
+                    # Sortie de la pile, la connexion n'est plus qu'à nous : on la vérifie hors du verrou
+                    con = self._libres.pop()
+                elif self._ouvertes < self.max_size:
+                    # On réserve la place puis on se connecte hors du verrou
+                    self._ouvertes += 1
+                    break
+                else:
+                    restant = echeance - time.monotonic()
+                    if restant <= 0:
+                        _EXPIRATIONS_POOL.inc()
+                        raise PoolError(
+                            f"Aucune connexion disponible après {self.timeout}s "
+                            f"(pool plein : {self.max_size} connexions)."
+                        )
+                    self._cond.wait(restant)
+                    continue
+
+            saine = self._est_saine(con)
+            with self._cond:
+                if saine:
+                    self._utilisations[id(con)] += 1
+                    return con
+                self._oublier(con)
+            self._fermer_connexion(con)
+
+        con = self._ouvrir()
+        with self._cond:
+            self._utilisations[id(con)] += 1
+        return con
+
+    def restituer(self, con) -> None:
+        """
+        Remet une connexion dans le pool (ou la ferme si elle est inutilisable).
+        Le rollback et la fermeture, qui attendent le serveur, se font hors du verrou.
+        """
+        with self._cond:
+            if id(con) not in self._utilisations:
+                return
+        if not con.closed and con.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            # Transaction laissée ouverte ou en erreur : on ne la transmet pas au suivant
+            try:
+                con.rollback()
+            except Exception:
+                pass
+        with self._cond:
+            jeter = self._ferme or con.closed or self._utilisations[id(con)] >= self.max_uses
+            if jeter:
+                self._oublier(con)
+            else:
+                self._derniere_restitution[id(con)] = time.monotonic()
+                self._libres.append(con)
+                self._cond.notify()
+        if jeter:
+            self._fermer_connexion(con)
+
+    def fermer(self) -> None:
+        """Ferme toutes les connexions libres ; les connexions prêtées le seront à leur retour."""
+        with self._cond:
+            self._ferme = True
+            libres, self._libres = self._libres, []
+            for con in libres:
+                self._oublier(con)
+            self._cond.notify_all()
+        for con in libres:
+            self._fermer_connexion(con)
+
+    # ---------- Observabilité ----------
+    @property
+    def nb_ouvertes(self) -> int:
+        return self._ouvertes
+
+    @property
+    def nb_libres(self) -> int:
+        return len(self._libres)
+
+
+class CurseurProfile(RealDictCursor):
+    """
+    RealDictCursor chronométré : chaque execute est enregistré dans ProfilageRequetes
+    (empreinte, durée, lignes, méthode DAO appelante) ; une requête lente est
+    journalisée avec son plan.
+    """
+
+    def execute(self, query, vars=None):
+        texte = query if isinstance(query, str) else query.as_string(self)
+        profilage = ProfilageRequetes()
+        t0 = time.perf_counter()
+        try:
+            resultat = super().execute(query, vars)
+        except Exception:
+            profilage.enregistrer(texte, time.perf_counter() - t0, -1, erreur=True)
+            raise
+        duree = time.perf_counter() - t0
+
+        issue = profilage.enregistrer(texte, duree, self.rowcount)
+        if issue is not None:
+            plan = self._plan(texte, vars) if issue == A_EXPLIQUER else None
+            profilage.journaliser_lente(texte, duree, self.rowcount, plan)
+        return resultat
+
+    def _plan(self, texte: str, vars) -> Optional[str]:
+        """Plan EXPLAIN (sans exécution), dans un point de sauvegarde pour ne pas casser la transaction."""
+        if self.name or not est_explicable(texte):
+            return None
+        con = self.connection
+        try:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                if not con.autocommit:
+                    curs.execute("SAVEPOINT profilage_plan")
+                try:
+                    curs.execute("EXPLAIN " + texte, vars)
+                    return "\n".join(r["QUERY PLAN"] for r in curs.fetchall())
+                except Exception:
+                    if not con.autocommit:
+                        curs.execute("ROLLBACK TO SAVEPOINT profilage_plan")
+                    return None
+                finally:
+                    if not con.autocommit:
+                        curs.execute("RELEASE SAVEPOINT profilage_plan")
+        except Exception:
+            return None
+
+
+class ConnexionEmpruntee:
+    """
+    Gestionnaire de contexte retourné par DBConnection.getConnexion().
+
+    `with ... as con` emprunte une connexion au pool et reproduit la sémantique de
+    `with connexion_psycopg2` (COMMIT si tout va bien, ROLLBACK sinon), puis rend
+    la connexion au pool.
+    """
+
+    def __init__(self, pool: PoolConnexions):
+        self._pool = pool
+        self._con = None
+
+    def __enter__(self):
+        self._con = self._pool.emprunter()
+        try:
+            return self._con.__enter__()
+        except Exception:
+            self._pool.restituer(self._con)
+            self._con = None
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        con, self._con = self._con, None
+        try:
+            if not con.closed:
+                con.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._pool.restituer(con)
+        return False
+
+
+class PointDeSauvegarde:
+    """
+    Remplace ConnexionEmpruntee pendant DBConnection.transaction_de_test().
+
+    Toutes les connexions "empruntées" sont la même connexion, dont la transaction
+    sera annulée en fin de test : `with ... as con` y ouvre un SAVEPOINT (libéré en
+    sortie, annulé en cas d'exception), et `commit()` / `rollback()` des DAO
+    n'agissent que jusqu'à ce point de sauvegarde. Le code testé garde ainsi sa
+    sémantique transactionnelle sans rien écrire pour de bon.
+
+    Les ordres SAVEPOINT passent par un curseur psycopg2 simple : ils ne sont ni
+    profilés ni visibles des tests qui espionnent RealDictCursor.execute.
+    """
+
+    _numeros = itertools.count(1)
+
+    def __init__(self, con, verrou: threading.RLock):
+        self._con = con
+        self._verrou = verrou
+        self._nom: Optional[str] = None
+
+    def _sql(self, requete: str) -> None:
+        with self._con.cursor(cursor_factory=extensions.cursor) as curs:
+            curs.execute(requete)
+
+    def _en_erreur(self) -> bool:
+        return self._con.get_transaction_status() == extensions.TRANSACTION_STATUS_INERROR
+
+    def __enter__(self):
+        self._verrou.acquire()
+        try:
+            self._nom = f"test_{next(self._numeros)}"
+            self._sql(f"SAVEPOINT {self._nom}")
+        except Exception:
+            self._verrou.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is not None or self._en_erreur():
+                self._sql(f"ROLLBACK TO SAVEPOINT {self._nom}")
+            self._sql(f"RELEASE SAVEPOINT {self._nom}")
+        finally:
+            self._nom = None
+            self._verrou.release()
+        return False
+
+    def commit(self) -> None:
+        """Valide jusqu'au point de sauvegarde et en ouvre un nouveau."""
+        if self._en_erreur():
+            self._sql(f"ROLLBACK TO SAVEPOINT {self._nom}")
+        self._sql(f"RELEASE SAVEPOINT {self._nom}")
+        self._sql(f"SAVEPOINT {self._nom}")
+
+    def rollback(self) -> None:
+        self._sql(f"ROLLBACK TO SAVEPOINT {self._nom}")
+
+    def __getattr__(self, nom):
+        return getattr(self._con, nom)
+
+
 class DBConnection(metaclass=Singleton):
     """
-    Classe gérant une unique connexion à la base PostgreSQL.
-    Utilise le patron Singleton pour éviter plusieurs connexions simultanées.
+    Classe donnant accès à la base PostgreSQL via un pool de connexions partagé.
+    Utilise le patron Singleton pour n'avoir qu'un seul pool par processus.
+
+    Paramètres du pool (variables d'environnement, facultatives) :
+      POSTGRES_POOL_MIN (1), POSTGRES_POOL_MAX (10), POSTGRES_POOL_TIMEOUT (30 s),
+      POSTGRES_POOL_MAX_USES (1000), POSTGRES_POOL_PING_APRES (30 s)
+
+    Lectures en flux (iterer) : POSTGRES_ITERSIZE (2000 lignes par aller-retour)
+
+    Attente d'une connexion, expirations et occupation du pool : métriques
+    bde_db_pool_* (utils/metriques.py).
+
+    Chaque requête est chronométrée par CurseurProfile (voir utils/profilage_sql.py,
+    PROFILAGE_SQL=0 pour désactiver).
+
+    Tests DAO : `transaction_de_test()` fait passer toutes les connexions par une
+    seule transaction, annulée à la fin (voir tests/test_dao/conftest.py).
     """
 
     def __init__(self):
-        """Initialise la connexion à la base de données."""
+        """Initialise le pool de connexions à la base de données."""
         dotenv.load_dotenv()  # charge le fichier .env
         try:
-            self.__connection = psycopg2.connect(
-                host=os.getenv("POSTGRES_HOST"),
-                port=os.getenv("POSTGRES_PORT"),
-                database=os.getenv("POSTGRES_DATABASE"),
-                user=os.getenv("POSTGRES_USER"),
-                password=os.getenv("POSTGRES_PASSWORD"),
-                options=f"-c search_path={os.getenv('POSTGRES_SCHEMA')}",
-                cursor_factory=RealDictCursor,
+            self.__pool = PoolConnexions(
+                self._nouvelle_connexion,
+                min_size=int(os.getenv("POSTGRES_POOL_MIN", "1")),
+                max_size=int(os.getenv("POSTGRES_POOL_MAX", "10")),
+                timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+                max_uses=int(os.getenv("POSTGRES_POOL_MAX_USES", "1000")),
+                ping_apres=float(os.getenv("POSTGRES_POOL_PING_APRES", "30")),
+            )
+            RegistreMetriques().jauge(
+                "bde_db_pool_connexions", "Connexions du pool synchrone (ouvertes, libres, max).", ("etat",),
+                fonction=lambda: {
+                    ("ouvertes",): self.__pool.nb_ouvertes,
+                    ("libres",): self.__pool.nb_libres,
+                    ("max",): self.__pool.max_size,
+                },
             )
+            self.__epinglee = None
+            self.__verrou_epinglee = threading.RLock()
             print(f"Connexion réussie au schéma : {os.getenv('POSTGRES_SCHEMA')}")
         except Exception as e:
             print("Erreur de connexion à la base de données :", e)
             raise
 
+    @staticmethod
+    def _nouvelle_connexion():
+        """Ouvre une nouvelle connexion psycopg2 à partir du .env."""
+        return psycopg2.connect(
+            host=os.getenv("POSTGRES_HOST"),
+            port=os.getenv("POSTGRES_PORT"),
+            database=os.getenv("POSTGRES_DATABASE"),
+            user=os.getenv("POSTGRES_USER"),
+            password=os.getenv("POSTGRES_PASSWORD"),
+            options=f"-c search_path={os.getenv('POSTGRES_SCHEMA')}",
+            cursor_factory=CurseurProfile if ProfilageRequetes().actif else RealDictCursor,
+        )
+
+    @property
+    def pool(self) -> PoolConnexions:
+        """Retourne le pool de connexions sous-jacent."""
+        return self.__pool
+
     @property
-    def connection(self):
-        """Retourne la connexion PostgreSQL active."""
-        return self.__connection
+    def connection(self) -> Union[ConnexionEmpruntee, PointDeSauvegarde]:
+        """Retourne une connexion empruntée au pool (à utiliser avec `with`)."""
+        return self.getConnexion()
+
+    def getConnexion(self) -> Union[ConnexionEmpruntee, PointDeSauvegarde]:
+        """Alias pour compatibilité : `with DBConnection().getConnexion() as con`."""
+        epinglee = self.__epinglee
+        if epinglee is not None:
+            return PointDeSauvegarde(epinglee, self.__verrou_epinglee)
+        return ConnexionEmpruntee(self.__pool)
+
+    @contextmanager
+    def transaction_de_test(self) -> Iterator[None]:
+        """
+        Tests uniquement : pendant le bloc, toutes les connexions empruntées sont une
+        même connexion, dont la transaction est annulée en sortie (chaque emprunt y
+        devient un PointDeSauvegarde). Le schéma de test est ainsi rendu intact sans
+        être reconstruit.
+        """
+        if self.__epinglee is not None:
+            raise RuntimeError("Une transaction de test est déjà en cours.")
+        con = self.__pool.emprunter()
+        self.__epinglee = con
+        try:
+            yield
+        finally:
+            self.__epinglee = None
+            try:
+                if not con.closed:
+                    con.rollback()
+            finally:
+                self.__pool.restituer(con)
+
+    def iterer(
+        self, query: str, params: Optional[Dict[str, Any]] = None, itersize: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Générateur de lignes lues par un curseur serveur nommé : PostgreSQL renvoie
+        les lignes par lots de `itersize`, la mémoire reste constante quelle que soit
+        la taille du résultat.
+
+        La connexion (et sa transaction) reste empruntée tant que le générateur
+        n'est pas épuisé ou fermé : le consommer dans la foulée.
+        """
+        if itersize is None:
+            itersize = int(os.getenv("POSTGRES_ITERSIZE", "2000"))
+        with self.getConnexion() as con:
+            with con.cursor(name=f"iter_{uuid.uuid4().hex}") as curs:
+                curs.itersize = itersize
+                curs.execute(query, params or {})
+                for row in curs:
+                    yield row
 
-    def getConnexion(self):
-        """Alias pour compatibilité."""
-        return self.__connection
+    def fermer(self) -> None:
+        """Ferme toutes les connexions du pool."""
+        self.__pool.fermer()
@@ -0,0 +1,162 @@
+# dao/email_outbox_dao.py
+from typing import Any, Dict, List, Optional, Sequence
+
+from dao.db_connection import DBConnection
+from model.email_models import EmailModelIn, EmailOutboxModelOut
+
+
+class EmailOutboxDao:
+    """
+    DAO de la boîte d'envoi des e-mails (table 'email_outbox', migration 003).
+
+    `ajouter` accepte le curseur de l'appelant : l'e-mail est alors écrit dans la
+    même transaction que la réservation (ou l'annulation...) qui le déclenche,
+    et n'existe que si celle-ci est validée.
+
+    Les workers prennent les e-mails par lots (`reserver_lot`, FOR UPDATE SKIP LOCKED) :
+    plusieurs workers ou processus ne prennent jamais le même e-mail. Un lot pris est
+    « loué » `bail` secondes : si le worker meurt, les e-mails reviennent dans la file.
+    """
+
+    _SQL_AJOUTER = """
+            INSERT INTO email_outbox (destinataire, sujet, contenu)
+            VALUES (%(destinataire)s, %(sujet)s, %(contenu)s)
+            RETURNING id_email
+        """
+
+    @staticmethod
+    def _params(email: EmailModelIn) -> Dict[str, Any]:
+        return {"destinataire": email.destinataire, "sujet": email.sujet, "contenu": email.contenu}
+
+    # ---------- CREATE ----------
+    def ajouter(self, email: EmailModelIn, curs=None) -> int:
+        """
+        Dépose un e-mail dans la boîte d'envoi et retourne son id.
+        Avec `curs`, l'insertion rejoint la transaction de l'appelant.
+        """
+        params = self._params(email)
+        if curs is not None:
+            curs.execute(self._SQL_AJOUTER, params)
+            return curs.fetchone()["id_email"]
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_AJOUTER, params)
+                return curs.fetchone()["id_email"]
+
+    # ---------- FILE D'ENVOI ----------
+    def reserver_lot(self, limit: int = 20, bail: float = 300) -> List[EmailOutboxModelOut]:
+        """
+        Prend jusqu'à `limit` e-mails à envoyer (les plus anciens d'abord),
+        incrémente leur nombre de tentatives et les rend invisibles `bail` secondes.
+        """
+        query = """
+            WITH lot AS (
+                SELECT id_email
+                FROM email_outbox
+                WHERE statut = 'en_attente'
+                  AND prochaine_tentative <= CURRENT_TIMESTAMP
+                ORDER BY prochaine_tentative, id_email
+                LIMIT %(limit)s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE email_outbox o
+            SET tentatives = o.tentatives + 1,
+                prochaine_tentative = CURRENT_TIMESTAMP + make_interval(secs => %(bail)s)
+            FROM lot
+            WHERE o.id_email = lot.id_email
+            RETURNING o.*
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"limit": max(limit, 0), "bail": bail})
+                rows = curs.fetchall()
+
+        return sorted((EmailOutboxModelOut(**r) for r in rows), key=lambda e: e.id_email)
+
+    def marquer_envoyes(self, ids: Sequence[int]) -> int:
+        """Marque les e-mails comme envoyés (une seule requête pour tout le lot)."""
+        if not ids:
+            return 0
+        query = """
+            UPDATE email_outbox
+            SET statut = 'envoye', date_envoi = CURRENT_TIMESTAMP, derniere_erreur = NULL
+            WHERE id_email = ANY(%(ids)s)
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"ids": list(ids)})
+                return curs.rowcount
+
+    def replanifier(self, id_email: int, erreur: str, delai: float) -> bool:
+        """Échec temporaire : nouvelle tentative dans `delai` secondes."""
+        query = """
+            UPDATE email_outbox
+            SET prochaine_tentative = CURRENT_TIMESTAMP + make_interval(secs => %(delai)s),
+                derniere_erreur = %(erreur)s
+            WHERE id_email = %(id)s AND statut = 'en_attente'
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_email, "erreur": erreur, "delai": delai})
+                return curs.rowcount > 0
+
+    def abandonner(self, id_email: int, erreur: str) -> bool:
+        """Échec définitif : l'e-mail passe en lettre morte."""
+        query = """
+            UPDATE email_outbox
+            SET statut = 'abandonne', derniere_erreur = %(erreur)s
+            WHERE id_email = %(id)s AND statut = 'en_attente'
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_email, "erreur": erreur})
+                return curs.rowcount > 0
+
+    # ---------- LETTRES MORTES ----------
+    def find_abandonnes(self, limit: int = 100) -> List[EmailOutboxModelOut]:
+        query = """
+            SELECT *
+            FROM email_outbox
+            WHERE statut = 'abandonne'
+            ORDER BY id_email
+            LIMIT %(limit)s
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"limit": max(limit, 0)})
+                rows = curs.fetchall()
+
+        return [EmailOutboxModelOut(**r) for r in rows]
+
+    def relancer(self, id_email: int) -> bool:
+        """Remet une lettre morte dans la file, avec un compteur de tentatives à zéro."""
+        query = """
+            UPDATE email_outbox
+            SET statut = 'en_attente', tentatives = 0, prochaine_tentative = CURRENT_TIMESTAMP
+            WHERE id_email = %(id)s AND statut = 'abandonne'
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"id": id_email})
+                return curs.rowcount > 0
+
+    # ---------- STATS ----------
+    def compter_par_statut(self) -> Dict[str, int]:
+        query = "SELECT statut, COUNT(*) AS n FROM email_outbox GROUP BY statut"
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query)
+                rows = curs.fetchall()
+
+        compteurs: Dict[str, Any] = dict.fromkeys(("en_attente", "envoye", "abandonne"), 0)
+        compteurs.update({r["statut"]: r["n"] for r in rows})
+        return compteurs
+
+    def find_by_id(self, id_email: int) -> Optional[EmailOutboxModelOut]:
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute("SELECT * FROM email_outbox WHERE id_email = %(id)s", {"id": id_email})
+                r = curs.fetchone()
+
+        return EmailOutboxModelOut(**r) if r else None
@@ -1,7 +1,9 @@
 # dao/evenement_dao.py
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from dao.db_connection import DBConnection
-from model.evenement_models import EvenementModelOut, EvenementModelIn
+from model.evenement_models import EvenementModelOut, EvenementModelIn, EvenementModifieModel
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
 
 
 class EvenementDao:
@@ -20,80 +22,28 @@ class EvenementDao:
       date_creation TIMESTAMP DEFAULT NOW()
       categorie VARCHAR(50)
       statut VARCHAR(50) CHECK (...)
-    """
 
-    # ---------- READ ----------
+    Les requêtes SQL sont partagées avec EvenementDaoAsync (dao/asynchrone/).
+    """
 
-    def find_all(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
-        """Récupère une liste paginée d'événements."""
-        query = """
-            SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
+    _COLONNES = """id_evenement, fk_utilisateur, titre, adresse, ville,
                    date_evenement, description, capacite, categorie,
-                   statut, date_creation
+                   statut, date_creation"""
+
+    _SQL_FIND_ALL = f"""
+            SELECT {_COLONNES}
             FROM evenement
             ORDER BY id_evenement
             LIMIT %(limit)s OFFSET %(offset)s
         """
-        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
-
-        with DBConnection().getConnexion() as con:
-            with con.cursor() as curs:
-                curs.execute(query, params)
-                rows = curs.fetchall()
-
-        return [
-            EvenementModelOut(
-                id_evenement=r["id_evenement"],
-                fk_utilisateur=r["fk_utilisateur"],
-                titre=r["titre"],
-                adresse=r["adresse"],
-                ville=r["ville"],
-                date_evenement=r["date_evenement"],
-                description=r["description"],
-                capacite=r["capacite"],
-                categorie=r["categorie"],
-                statut=r["statut"],
-                date_creation=r["date_creation"],
-            )
-            for r in rows
-        ]
 
-    def find_by_id(self, id_evenement: int) -> Optional[EvenementModelOut]:
-        """Récupère un événement par son ID."""
-        query = """
-            SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
-                   date_evenement, description, capacite, categorie,
-                   statut, date_creation
+    _SQL_FIND_BY_ID = f"""
+            SELECT {_COLONNES}
             FROM evenement
             WHERE id_evenement = %(id)s
         """
-        with DBConnection().getConnexion() as con:
-            with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
-                r = curs.fetchone()
-
-        if r is None:
-            return None
-
-        return EvenementModelOut(
-            id_evenement=r["id_evenement"],
-            fk_utilisateur=r["fk_utilisateur"],
-            titre=r["titre"],
-            adresse=r["adresse"],
-            ville=r["ville"],
-            date_evenement=r["date_evenement"],
-            description=r["description"],
-            capacite=r["capacite"],
-            categorie=r["categorie"],
-            statut=r["statut"],
-            date_creation=r["date_creation"],
-        )
-
-    # ---------- CREATE ----------
 
-    def create(self, evenement_in: EvenementModelIn) -> EvenementModelOut:
-        """Crée un nouvel événement."""
-        query = """
+    _SQL_CREATE = """
             INSERT INTO evenement (
                 fk_utilisateur, titre, adresse, ville, date_evenement,
                 description, capacite, categorie, statut
@@ -105,7 +55,61 @@ class EvenementDao:
             )
             RETURNING id_evenement, date_creation
         """
-        params = {
+
+    # `avant` verrouille la ligne (FOR UPDATE) et rend la dernière capacité validée,
+    # celle que remplace l'UPDATE. Verrou et écriture forment UNE instruction : pas
+    # de CTE voisin verrouillant une ligne que l'UPDATE aurait déjà modifiée
+    _SQL_UPDATE = """
+            UPDATE evenement e SET
+                fk_utilisateur = %(fk_utilisateur)s,
+                titre = %(titre)s,
+                adresse = %(adresse)s,
+                ville = %(ville)s,
+                date_evenement = %(date_evenement)s,
+                description = %(description)s,
+                capacite = %(capacite)s,
+                categorie = %(categorie)s,
+                statut = %(statut)s
+            FROM (
+              SELECT id_evenement, capacite FROM evenement WHERE id_evenement = %(id_evenement)s FOR UPDATE
+            ) avant
+            WHERE e.id_evenement = avant.id_evenement
+            RETURNING e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville,
+                      e.date_evenement, e.description, e.capacite, e.categorie,
+                      e.statut, e.date_creation, avant.capacite AS capacite_precedente
+        """
+
+    _SQL_DELETE = "DELETE FROM evenement WHERE id_evenement = %(id)s"
+
+    # ---------- Helpers (partagés avec la version asynchrone) ----------
+
+    @classmethod
+    def _requete_page(cls, limit: int, curseur: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        """Requête d'une page par clé (id_evenement), lisant limit + 1 lignes."""
+        where_clause = ""
+        params = {"limit": max(limit, 0) + 1}
+        if curseur:
+            (params["apres_id"],) = decoder_curseur(curseur, int)
+            where_clause = "WHERE id_evenement > %(apres_id)s"
+
+        query = f"""
+            SELECT {cls._COLONNES}
+            FROM evenement
+            {where_clause}
+            ORDER BY id_evenement
+            LIMIT %(limit)s
+        """
+        return query, params
+
+    @staticmethod
+    def _construire_page(rows: List[Dict[str, Any]], limit: int) -> PageModel[EvenementModelOut]:
+        rows, suivant = decouper_page(rows, max(limit, 0), lambda r: (r["id_evenement"],))
+        elements = [EvenementModelOut(**r) for r in rows]
+        return PageModel[EvenementModelOut](elements=elements, curseur_suivant=suivant)
+
+    @staticmethod
+    def _params_creation(evenement_in: EvenementModelIn) -> Dict[str, Any]:
+        return {
             "fk_utilisateur": evenement_in.fk_utilisateur,
             "titre": evenement_in.titre,
             "adresse": evenement_in.adresse,
@@ -117,15 +121,8 @@ class EvenementDao:
             "statut": evenement_in.statut,
         }
 
-        with DBConnection().getConnexion() as con:
-            with con.cursor() as curs:
-                curs.execute(query, params)
-                row = curs.fetchone()
-                con.commit()
-
-                if not row:
-                    return None
-
+    @staticmethod
+    def _modele_cree(evenement_in: EvenementModelIn, row: Dict[str, Any]) -> EvenementModelOut:
         return EvenementModelOut(
             id_evenement=row["id_evenement"],
             fk_utilisateur=evenement_in.fk_utilisateur,
@@ -140,30 +137,9 @@ class EvenementDao:
             date_creation=row["date_creation"],
         )
 
-    # ---------- UPDATE ----------
-
-    def update(self, evenement: EvenementModelOut) -> Optional[EvenementModelOut]:
-        """Met à jour un événement existant."""
-        query = """
-            WITH updated AS (
-              UPDATE evenement SET
-                  fk_utilisateur = %(fk_utilisateur)s,
-                  titre = %(titre)s,
-                  adresse = %(adresse)s,
-                  ville = %(ville)s,
-                  date_evenement = %(date_evenement)s,
-                  description = %(description)s,
-                  capacite = %(capacite)s,
-                  categorie = %(categorie)s,
-                  statut = %(statut)s
-              WHERE id_evenement = %(id_evenement)s
-              RETURNING id_evenement, fk_utilisateur, titre, adresse, ville,
-                        date_evenement, description, capacite, categorie,
-                        statut, date_creation
-            )
-            SELECT * FROM updated
-        """
-        params = {
+    @staticmethod
+    def _params_maj(evenement: EvenementModelOut) -> Dict[str, Any]:
+        return {
             "id_evenement": evenement.id_evenement,
             "fk_utilisateur": evenement.fk_utilisateur,
             "titre": evenement.titre,
@@ -176,34 +152,95 @@ class EvenementDao:
             "statut": evenement.statut,
         }
 
+    # ---------- READ ----------
+
+    def find_all(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
+        """Récupère une liste paginée d'événements."""
+        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_ALL, params)
+                rows = curs.fetchall()
+
+        return [EvenementModelOut(**r) for r in rows]
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        """
+        Récupère une page d'événements par clé (id_evenement) : le coût d'une page
+        ne dépend pas de sa profondeur, contrairement à OFFSET.
+        `curseur` est le jeton `curseur_suivant` de la page précédente.
+        """
+        query, params = self._requete_page(limit, curseur)
+
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, params)
+                rows = curs.fetchall()
+
+        return self._construire_page(rows, limit)
+
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[EvenementModelOut]:
+        """
+        Parcourt tous les événements (triés par id) en flux, via un curseur serveur.
+        """
+        query = f"""
+            SELECT {self._COLONNES}
+            FROM evenement
+            ORDER BY id_evenement
+        """
+        for r in DBConnection().iterer(query, itersize=itersize):
+            yield EvenementModelOut(**r)
+
+    def find_by_id(self, id_evenement: int) -> Optional[EvenementModelOut]:
+        """Récupère un événement par son ID."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_ID, {"id": id_evenement})
+                r = curs.fetchone()
+
+        if r is None:
+            return None
+
+        return EvenementModelOut(**r)
+
+    # ---------- CREATE ----------
+
+    def create(self, evenement_in: EvenementModelIn) -> EvenementModelOut:
+        """Crée un nouvel événement."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_CREATE, self._params_creation(evenement_in))
+                row = curs.fetchone()
+                con.commit()
+
+                if not row:
+                    return None
+
+        return self._modele_cree(evenement_in, row)
+
+    # ---------- UPDATE ----------
+
+    def update(self, evenement: EvenementModelOut) -> Optional[EvenementModifieModel]:
+        """
+        Met à jour un événement existant, en une instruction qui renvoie aussi la
+        capacité précédente. None si l'événement n'existe pas.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_UPDATE, self._params_maj(evenement))
                 r = curs.fetchone()
 
         if not r:
             return None
 
-        return EvenementModelOut(
-            id_evenement=r["id_evenement"],
-            fk_utilisateur=r["fk_utilisateur"],
-            titre=r["titre"],
-            adresse=r["adresse"],
-            ville=r["ville"],
-            date_evenement=r["date_evenement"],
-            description=r["description"],
-            capacite=r["capacite"],
-            categorie=r["categorie"],
-            statut=r["statut"],
-            date_creation=r["date_creation"],
-        )
+        return EvenementModifieModel(**r)
 
     # ---------- DELETE ----------
 
     def delete(self, id_evenement: int) -> bool:
         """Supprime un événement par son ID."""
-        query = "DELETE FROM evenement WHERE id_evenement = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self._SQL_DELETE, {"id": id_evenement})
                 return curs.rowcount > 0
@@ -0,0 +1,91 @@
+# dao/idempotence_dao.py
+import json
+from typing import Any, Dict, Optional
+
+from dao.db_connection import DBConnection
+from model.idempotence_models import CleIdempotenceModel
+
+
+class IdempotenceDao:
+    """
+    DAO des clés d'idempotence (table 'cle_idempotence', migration 008).
+
+    Une écriture munie d'une clé s'exécute ainsi, dans SA transaction (curs) :
+      1. `rejouer_ou_prendre` prend la clé (INSERT ... ON CONFLICT). Si elle est
+         déjà prise, il retourne le résultat enregistré et l'opération n'est pas
+         rejouée. Un essai concurrent attend que le premier valide ou annule ;
+      2. l'opération s'exécute ;
+      3. `enregistrer` y attache son résultat.
+    Si l'opération échoue, la transaction annule aussi la prise de la clé : un
+    nouvel essai la rejouera.
+
+    Le résultat est stocké enveloppé ({"valeur": ...}), pour distinguer un résultat
+    None d'une clé absente. Les requêtes sont partagées avec la version asynchrone
+    (dao/asynchrone/reservation_dao.py).
+    """
+
+    _SQL_PRENDRE = """
+            INSERT INTO cle_idempotence (cle, operation, expire_le)
+            VALUES (%(cle)s, %(operation)s, CURRENT_TIMESTAMP + %(ttl)s * INTERVAL '1 second')
+            ON CONFLICT (cle, operation) DO UPDATE
+                SET resultat = NULL, date_creation = CURRENT_TIMESTAMP, expire_le = EXCLUDED.expire_le
+                WHERE cle_idempotence.expire_le <= CURRENT_TIMESTAMP
+            RETURNING cle
+        """
+
+    _SQL_LIRE = """
+            SELECT resultat FROM cle_idempotence
+            WHERE cle = %(cle)s AND operation = %(operation)s AND expire_le > CURRENT_TIMESTAMP
+        """
+
+    _SQL_ENREGISTRER = """
+            UPDATE cle_idempotence SET resultat = %(resultat)s::jsonb
+            WHERE cle = %(cle)s AND operation = %(operation)s
+        """
+
+    _SQL_PURGER = "DELETE FROM cle_idempotence WHERE expire_le <= CURRENT_TIMESTAMP"
+
+    @staticmethod
+    def _params(idempotence: CleIdempotenceModel, operation: str) -> Dict[str, Any]:
+        return {"cle": idempotence.cle, "operation": operation, "ttl": idempotence.ttl}
+
+    @staticmethod
+    def _params_resultat(idempotence: CleIdempotenceModel, operation: str, valeur: Any) -> Dict[str, Any]:
+        return {"cle": idempotence.cle, "operation": operation, "resultat": json.dumps({"valeur": valeur})}
+
+    # ---------- Dans la transaction de l'opération ----------
+    def rejouer_ou_prendre(
+        self, idempotence: CleIdempotenceModel, operation: str, curs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        None si la clé vient d'être prise (l'opération doit s'exécuter),
+        sinon le résultat enregistré, enveloppé : {"valeur": ...}.
+        """
+        params = self._params(idempotence, operation)
+        curs.execute(self._SQL_PRENDRE, params)
+        if curs.fetchone() is not None:
+            return None
+        curs.execute(self._SQL_LIRE, params)
+        r = curs.fetchone()
+        return r["resultat"] if r else {"valeur": None}
+
+    def enregistrer(self, idempotence: CleIdempotenceModel, operation: str, valeur: Any, curs) -> None:
+        """Attache le résultat (sérialisable en JSON) à la clé prise par rejouer_ou_prendre."""
+        curs.execute(self._SQL_ENREGISTRER, self._params_resultat(idempotence, operation, valeur))
+
+    # ---------- READ ----------
+    def lire(self, idempotence: CleIdempotenceModel, operation: str) -> Optional[Dict[str, Any]]:
+        """Résultat enregistré et encore valide pour la clé ({"valeur": ...}), sinon None."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_LIRE, self._params(idempotence, operation))
+                r = curs.fetchone()
+        return r["resultat"] if r and r["resultat"] is not None else None
+
+    # ---------- DELETE ----------
+    def purger(self) -> int:
+        """Supprime les clés expirées. Retourne leur nombre."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_PURGER)
+                return curs.rowcount
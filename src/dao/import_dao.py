@@ -0,0 +1,255 @@
+# dao/import_dao.py
+import io
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+import psycopg2
+
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.db_connection import DBConnection
+from model.import_models import ChargementModel, ErreurLigneModel
+
+# (numéro de ligne dans le fichier source, valeurs de la ligne validée)
+Ligne = Tuple[int, Dict[str, Any]]
+
+
+def _champ_csv(valeur: Any) -> str:
+    """Champ CSV pour COPY : \\N pour NULL, sinon valeur entre guillemets (jamais confondue avec NULL)."""
+    if valeur is None:
+        return "\\N"
+    if isinstance(valeur, bool):
+        return "t" if valeur else "f"
+    return '"' + str(valeur).replace('"', '""') + '"'
+
+
+def _message(exc: psycopg2.Error) -> str:
+    diag = getattr(exc, "diag", None)
+    return (diag.message_primary if diag is not None and diag.message_primary else str(exc)).strip()
+
+
+class ImportDao:
+    """
+    Chargement en masse (utils/import_donnees.py) : chaque lot est copié par
+    `COPY ... FROM STDIN` dans une table temporaire (supprimée au COMMIT), puis
+    fusionné dans la table cible en quelques requêtes ensemblistes.
+
+    - utilisateurs : upsert sur l'email (nom, prénom, téléphone mis à jour ; le mot
+      de passe et le rôle d'un compte existant ne sont jamais modifiés) ;
+    - evenements : upsert sur (titre, date_evenement) ;
+    - reservations : upsert sur (fk_utilisateur, fk_evenement), dans la limite de
+      la capacité de l'événement (mêmes compteurs que ReservationDao.reserver).
+
+    Les lignes qui violent une règle connue (utilisateur / événement introuvable,
+    événement complet) sont écartées avant la fusion et rapportées. Si la base
+    rejette malgré tout le lot (contrainte, donnée invalide), il est coupé en deux
+    et rechargé jusqu'à isoler la ou les lignes fautives : le reste du lot passe.
+    """
+
+    _COLONNES = {
+        "utilisateur": (
+            "ligne INT PRIMARY KEY, email VARCHAR(100), prenom VARCHAR(100), nom VARCHAR(50), "
+            "telephone VARCHAR(20), mot_de_passe VARCHAR(256), administrateur BOOLEAN",
+            ("email", "prenom", "nom", "telephone", "mot_de_passe", "administrateur"),
+        ),
+        "evenement": (
+            "ligne INT PRIMARY KEY, fk_utilisateur INT, titre VARCHAR(150), adresse VARCHAR(100), "
+            "ville VARCHAR(100), date_evenement DATE, description TEXT, capacite INT, "
+            "categorie VARCHAR(50), statut VARCHAR(50)",
+            ("fk_utilisateur", "titre", "adresse", "ville", "date_evenement", "description", "capacite",
+             "categorie", "statut"),
+        ),
+        "reservation": (
+            "ligne INT PRIMARY KEY, fk_utilisateur INT, fk_evenement INT, bus_aller BOOLEAN, "
+            "bus_retour BOOLEAN, adherent BOOLEAN, sam BOOLEAN, boisson BOOLEAN",
+            ("fk_utilisateur", "fk_evenement", "bus_aller", "bus_retour", "adherent", "sam", "boisson"),
+        ),
+    }
+
+    _SQL_EMAILS_EXISTANTS = "SELECT email FROM utilisateur WHERE email = ANY(%(emails)s)"
+
+    _SQL_FUSION_UTILISATEURS = """
+            INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur)
+            SELECT email, prenom, nom, telephone, mot_de_passe, administrateur
+            FROM import_utilisateur
+            ON CONFLICT (email) DO UPDATE SET
+                prenom = EXCLUDED.prenom,
+                nom = EXCLUDED.nom,
+                telephone = COALESCE(EXCLUDED.telephone, utilisateur.telephone)
+            RETURNING (xmax = 0) AS creee
+        """
+
+    _SQL_REJETS_EVENEMENTS = """
+            SELECT s.ligne, 'Créateur (fk_utilisateur) introuvable.' AS erreur
+            FROM import_evenement s
+            WHERE s.fk_utilisateur IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM utilisateur u WHERE u.id_utilisateur = s.fk_utilisateur)
+        """
+
+    # Les deux CTE voient le même instantané : une ligne met à jour OU insère
+    _SQL_FUSION_EVENEMENTS = """
+            WITH maj AS (
+                UPDATE evenement e SET
+                    fk_utilisateur = s.fk_utilisateur,
+                    adresse = s.adresse,
+                    ville = s.ville,
+                    description = s.description,
+                    capacite = s.capacite,
+                    categorie = s.categorie,
+                    statut = s.statut
+                FROM import_evenement s
+                WHERE e.titre = s.titre AND e.date_evenement = s.date_evenement
+                RETURNING 1
+            ),
+            ins AS (
+                INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement,
+                                       description, capacite, categorie, statut)
+                SELECT s.fk_utilisateur, s.titre, s.adresse, s.ville, s.date_evenement,
+                       s.description, s.capacite, s.categorie, s.statut
+                FROM import_evenement s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM evenement e
+                    WHERE e.titre = s.titre AND e.date_evenement = s.date_evenement
+                )
+                RETURNING 1
+            )
+            SELECT (SELECT COUNT(*) FROM ins) AS creees, (SELECT COUNT(*) FROM maj) AS mises_a_jour
+        """
+
+    # Verrou des événements concernés : même sérialisation (et même ordre de verrous) que reserver()
+    _SQL_VERROU_EVENEMENTS = """
+            SELECT id_evenement FROM evenement
+            WHERE id_evenement IN (SELECT fk_evenement FROM import_reservation)
+            ORDER BY id_evenement
+            FOR UPDATE
+        """
+
+    # Les nouvelles réservations d'un événement sont acceptées dans l'ordre du fichier
+    _SQL_REJETS_RESERVATIONS = """
+            SELECT ligne, erreur FROM (
+                SELECT s.ligne,
+                       CASE
+                           WHEN u.id_utilisateur IS NULL THEN 'Utilisateur introuvable.'
+                           WHEN e.id_evenement IS NULL THEN 'Événement introuvable.'
+                           WHEN r.id_reservation IS NULL
+                                AND COALESCE(c.nb_reservations, 0) + COUNT(*) FILTER (
+                                        WHERE u.id_utilisateur IS NOT NULL AND r.id_reservation IS NULL
+                                    ) OVER (PARTITION BY s.fk_evenement ORDER BY s.ligne) > e.capacite
+                           THEN 'Événement complet.'
+                       END AS erreur
+                FROM import_reservation s
+                LEFT JOIN utilisateur u ON u.id_utilisateur = s.fk_utilisateur
+                LEFT JOIN evenement e ON e.id_evenement = s.fk_evenement
+                LEFT JOIN compteur_evenement c ON c.id_evenement = s.fk_evenement
+                LEFT JOIN reservation r
+                       ON r.fk_utilisateur = s.fk_utilisateur AND r.fk_evenement = s.fk_evenement
+            ) t
+            WHERE erreur IS NOT NULL
+        """
+
+    _SQL_FUSION_RESERVATIONS = """
+            INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+            SELECT fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+            FROM import_reservation
+            ON CONFLICT (fk_utilisateur, fk_evenement) DO UPDATE SET
+                bus_aller = EXCLUDED.bus_aller,
+                bus_retour = EXCLUDED.bus_retour,
+                adherent = EXCLUDED.adherent,
+                sam = EXCLUDED.sam,
+                boisson = EXCLUDED.boisson
+            RETURNING (xmax = 0) AS creee
+        """
+
+    # ---------- Helpers ----------
+    def _copier(self, curs, table: str, lignes: Sequence[Ligne]) -> None:
+        """Crée la table temporaire import_<table> et y copie les lignes (un seul aller-retour)."""
+        definition, colonnes = self._COLONNES[table]
+        curs.execute(f"CREATE TEMP TABLE import_{table} ({definition}) ON COMMIT DROP")
+        tampon = io.StringIO()
+        for numero, valeurs in lignes:
+            tampon.write(",".join([str(numero)] + [_champ_csv(valeurs.get(c)) for c in colonnes]) + "\n")
+        tampon.seek(0)
+        curs.copy_expert(
+            f"COPY import_{table} (ligne, {', '.join(colonnes)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", tampon
+        )
+
+    @staticmethod
+    def _ecarter(curs, table: str, requete: str) -> List[ErreurLigneModel]:
+        """Retire de la table temporaire les lignes signalées par `requete` (ligne, erreur)."""
+        curs.execute(requete)
+        rejets = [ErreurLigneModel(ligne=r["ligne"], erreur=r["erreur"]) for r in curs.fetchall()]
+        if rejets:
+            curs.execute(f"DELETE FROM import_{table} WHERE ligne = ANY(%(lignes)s)",
+                         {"lignes": [r.ligne for r in rejets]})
+        return rejets
+
+    def _charger(self, lignes: Sequence[Ligne], fusion: Callable[[Any, Sequence[Ligne]], ChargementModel]) -> ChargementModel:
+        """Charge un lot dans une transaction ; s'il est rejeté par la base, le coupe en deux."""
+        if not lignes:
+            return ChargementModel()
+        try:
+            with DBConnection().getConnexion() as con:
+                with con.cursor() as curs:
+                    return fusion(curs, lignes)
+        except (psycopg2.DataError, psycopg2.IntegrityError) as exc:
+            if len(lignes) == 1:
+                return ChargementModel(erreurs=[ErreurLigneModel(ligne=lignes[0][0], erreur=_message(exc))])
+            milieu = len(lignes) // 2
+            gauche, droite = self._charger(lignes[:milieu], fusion), self._charger(lignes[milieu:], fusion)
+            return ChargementModel(
+                creees=gauche.creees + droite.creees,
+                mises_a_jour=gauche.mises_a_jour + droite.mises_a_jour,
+                erreurs=gauche.erreurs + droite.erreurs,
+            )
+
+    @staticmethod
+    def _compter(rows, erreurs: List[ErreurLigneModel]) -> ChargementModel:
+        creees = sum(1 for r in rows if r["creee"])
+        return ChargementModel(creees=creees, mises_a_jour=len(rows) - creees, erreurs=erreurs)
+
+    # ---------- READ ----------
+    def emails_existants(self, emails: Sequence[str]) -> Set[str]:
+        """Emails déjà en base parmi `emails` (leurs mots de passe ne seront pas hachés)."""
+        if not emails:
+            return set()
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_EMAILS_EXISTANTS, {"emails": list(emails)})
+                return {r["email"] for r in curs.fetchall()}
+
+    # ---------- CHARGEMENT ----------
+    def charger_utilisateurs(self, lignes: Sequence[Ligne]) -> ChargementModel:
+        """Upsert d'utilisateurs ; `mot_de_passe` est déjà haché (None pour un email existant)."""
+        def fusion(curs, lot):
+            self._copier(curs, "utilisateur", lot)
+            curs.execute(self._SQL_FUSION_UTILISATEURS)
+            return self._compter(curs.fetchall(), [])
+
+        return self._charger(lignes, fusion)
+
+    def charger_evenements(self, lignes: Sequence[Ligne]) -> ChargementModel:
+        """Upsert d'événements sur (titre, date_evenement)."""
+        def fusion(curs, lot):
+            self._copier(curs, "evenement", lot)
+            erreurs = self._ecarter(curs, "evenement", self._SQL_REJETS_EVENEMENTS)
+            # Empêche une création concurrente du même (titre, date) entre UPDATE et INSERT
+            curs.execute("LOCK TABLE evenement IN SHARE ROW EXCLUSIVE MODE")
+            curs.execute(self._SQL_FUSION_EVENEMENTS)
+            row = curs.fetchone()
+            return ChargementModel(creees=row["creees"], mises_a_jour=row["mises_a_jour"], erreurs=erreurs)
+
+        return self._charger(lignes, fusion)
+
+    def charger_reservations(self, lignes: Sequence[Ligne]) -> ChargementModel:
+        """
+        Upsert de réservations, sans dépasser la capacité des événements ; les places
+        de bus demandées sont attribuées dans la même transaction.
+        """
+        def fusion(curs, lot):
+            self._copier(curs, "reservation", lot)
+            curs.execute(self._SQL_VERROU_EVENEMENTS)
+            erreurs = self._ecarter(curs, "reservation", self._SQL_REJETS_RESERVATIONS)
+            curs.execute(self._SQL_FUSION_RESERVATIONS)
+            resultat = self._compter(curs.fetchall(), erreurs)
+            AffectationBusDao().repartir([v["fk_evenement"] for _, v in lot], curs)
+            return resultat
+
+        return self._charger(lignes, fusion)
@@ -0,0 +1,189 @@
+# dao/liste_attente_dao.py
+from typing import Any, Callable, Dict, List, Optional
+
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.db_connection import DBConnection
+from dao.email_outbox_dao import EmailOutboxDao
+from model.email_models import EmailModelIn
+from model.reservation_models import AttenteModelOut, PromotionModel, ReservationModelIn
+
+
+class ListeAttenteDao:
+    """
+    DAO de la liste d'attente des événements complets (table 'liste_attente', migration 006).
+
+    File FIFO par événement (ordre de id_attente). Ses écritures se font sous le
+    verrou de la ligne evenement, dans la transaction de la réservation ou de
+    l'annulation qui les déclenche (ReservationDao) :
+      - `inscrire` : la demande refusée faute de place rejoint la file ;
+      - `promouvoir` : les premières demandes deviennent des réservations, autant
+        qu'il y a de places libres. Une place libérée est donc attribuée dans la
+        transaction même qui la libère : personne n'a à la guetter.
+    Les requêtes sont partagées avec ReservationDaoAsync.
+    """
+
+    _COLONNES = """w.id_attente, w.fk_utilisateur, w.fk_evenement, w.bus_aller, w.bus_retour,
+                   w.adherent, w.sam, w.boisson, w.date_inscription"""
+
+    _SQL_INSCRIRE = """
+            INSERT INTO liste_attente (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+            VALUES (%(fk_utilisateur)s, %(fk_evenement)s, %(bus_aller)s, %(bus_retour)s,
+                    %(adherent)s, %(sam)s, %(boisson)s)
+            ON CONFLICT (fk_utilisateur, fk_evenement) DO NOTHING;
+        """
+
+    # Rang de la demande d'un utilisateur (0 s'il n'est pas dans la file)
+    _SQL_POSITION = """
+            SELECT COUNT(*) AS position
+            FROM liste_attente moi
+            JOIN liste_attente w
+              ON w.fk_evenement = moi.fk_evenement AND w.id_attente <= moi.id_attente
+            WHERE moi.fk_utilisateur = %(fk_utilisateur)s AND moi.fk_evenement = %(fk_evenement)s
+        """
+
+    _SQL_VERROU_EVENEMENT = "SELECT 1 FROM evenement WHERE id_evenement = %(id_evenement)s FOR UPDATE;"
+
+    # Les demandes en tête de file prennent les places libres (capacité - compteur).
+    # Une demande dont l'auteur a déjà une réservation (entrée périmée) ne prend
+    # pas de place : elle est retirée de la file à part.
+    _SQL_PROMOUVOIR = """
+            WITH libres AS (
+                SELECT GREATEST(e.capacite - COALESCE(c.nb_reservations, 0), 0) AS n
+                FROM evenement e
+                LEFT JOIN compteur_evenement c ON c.id_evenement = e.id_evenement
+                WHERE e.id_evenement = %(id_evenement)s
+            ),
+            perimees AS (
+                DELETE FROM liste_attente w
+                WHERE w.fk_evenement = %(id_evenement)s
+                  AND EXISTS (
+                      SELECT 1 FROM reservation r
+                      WHERE r.fk_utilisateur = w.fk_utilisateur AND r.fk_evenement = w.fk_evenement
+                  )
+            ),
+            suivants AS (
+                DELETE FROM liste_attente
+                WHERE id_attente IN (
+                    SELECT w.id_attente FROM liste_attente w
+                    WHERE w.fk_evenement = %(id_evenement)s
+                      AND NOT EXISTS (
+                          SELECT 1 FROM reservation r
+                          WHERE r.fk_utilisateur = w.fk_utilisateur AND r.fk_evenement = w.fk_evenement
+                      )
+                    ORDER BY w.id_attente
+                    LIMIT COALESCE((SELECT n FROM libres), 0)
+                )
+                RETURNING *
+            ),
+            promues AS (
+                INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+                SELECT fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+                FROM suivants
+                ORDER BY id_attente
+                ON CONFLICT (fk_utilisateur, fk_evenement) DO NOTHING
+                RETURNING id_reservation, fk_utilisateur, fk_evenement, bus_aller, bus_retour,
+                          adherent, sam, boisson, date_reservation
+            )
+            SELECT p.*, u.nom, u.prenom, u.email, u.telephone, e.titre, e.date_evenement
+            FROM promues p
+            JOIN utilisateur u ON u.id_utilisateur = p.fk_utilisateur
+            JOIN evenement e ON e.id_evenement = p.fk_evenement
+            ORDER BY p.id_reservation
+        """
+
+    _SQL_QUITTER = """
+            DELETE FROM liste_attente
+            WHERE fk_utilisateur = %(fk_utilisateur)s AND fk_evenement = %(fk_evenement)s
+        """
+
+    _SQL_FIND_BY_EVENT = f"""
+            SELECT {_COLONNES}, ROW_NUMBER() OVER (ORDER BY w.id_attente) AS position
+            FROM liste_attente w
+            WHERE w.fk_evenement = %(id_evenement)s
+            ORDER BY w.id_attente
+        """
+
+    _SQL_FIND_BY_USER = f"""
+            SELECT {_COLONNES},
+                   (SELECT COUNT(*) FROM liste_attente a
+                    WHERE a.fk_evenement = w.fk_evenement AND a.id_attente <= w.id_attente) AS position
+            FROM liste_attente w
+            WHERE w.fk_utilisateur = %(id_utilisateur)s
+            ORDER BY w.date_inscription DESC
+        """
+
+    @staticmethod
+    def _params_demande(reservation_in: ReservationModelIn) -> Dict[str, Any]:
+        return reservation_in.model_dump()
+
+    # ---------- ÉCRITURES (dans la transaction de l'appelant) ----------
+    def inscrire(self, reservation_in: ReservationModelIn, curs) -> int:
+        """
+        Ajoute la demande en fin de file (sans effet si elle y est déjà) et retourne son rang.
+        À appeler sous le verrou de l'événement, après un refus « complet ».
+        """
+        curs.execute(self._SQL_INSCRIRE + self._SQL_POSITION, self._params_demande(reservation_in))
+        return int(curs.fetchone()["position"])
+
+    def promouvoir(
+        self,
+        id_evenement: int,
+        curs=None,
+        email_promotion: Optional[Callable[[PromotionModel], EmailModelIn]] = None,
+    ) -> List[PromotionModel]:
+        """
+        Transforme en réservations les premières demandes de la file, dans la limite
+        des places libres, et retourne les réservations créées.
+
+        Avec `curs`, rejoint la transaction de l'appelant, qui tient déjà le verrou de
+        l'événement et se charge des places de bus et des e-mails (ReservationDao.delete).
+        Sans `curs` (capacité augmentée…), verrouille l'événement dans sa propre
+        transaction, y attribue les places de bus des réservations promues et dépose
+        `email_promotion(promue)` dans la boîte d'envoi pour chacune.
+        """
+        params = {"id_evenement": id_evenement}
+        if curs is not None:
+            curs.execute(self._SQL_PROMOUVOIR, params)
+            return [PromotionModel(**r) for r in curs.fetchall()]
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_VERROU_EVENEMENT + self._SQL_PROMOUVOIR, params)
+                promues = [PromotionModel(**r) for r in curs.fetchall()]
+                if any(p.bus_aller or p.bus_retour for p in promues):
+                    AffectationBusDao().repartir([id_evenement], curs)
+                if email_promotion is not None:
+                    for promue in promues:
+                        EmailOutboxDao().ajouter(email_promotion(promue), curs)
+                return promues
+
+    def quitter(self, id_utilisateur: int, id_evenement: int) -> bool:
+        """Retire la demande d'un utilisateur de la file ; False s'il n'y était pas."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_QUITTER, {"fk_utilisateur": id_utilisateur, "fk_evenement": id_evenement})
+                return curs.rowcount > 0
+
+    # ---------- READ ----------
+    def position(self, id_utilisateur: int, id_evenement: int) -> int:
+        """Rang de l'utilisateur dans la file de l'événement (0 s'il n'y est pas)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_POSITION, {"fk_utilisateur": id_utilisateur, "fk_evenement": id_evenement})
+                return int(curs.fetchone()["position"])
+
+    def find_by_event(self, id_evenement: int) -> List[AttenteModelOut]:
+        """File d'attente d'un événement, dans l'ordre de service."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
+                rows = curs.fetchall()
+        return [AttenteModelOut(**r) for r in rows]
+
+    def find_by_user(self, id_utilisateur: int) -> List[AttenteModelOut]:
+        """Demandes en attente d'un utilisateur, avec leur rang."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_USER, {"id_utilisateur": id_utilisateur})
+                rows = curs.fetchall()
+        return [AttenteModelOut(**r) for r in rows]
@@ -1,9 +1,12 @@
 # dao/participant_dao.py
 from typing import List, Optional
-import bcrypt
 
 from dao.db_connection import DBConnection
+from dao.utilisateur_dao import UtilisateurDao
 from model.participant_models import ParticipantModelIn, ParticipantModelOut
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
+from utils.securite import HachageMotDePasse
 
 
 class ParticipantDao:
@@ -15,21 +18,6 @@ class ParticipantDao:
       mot_de_passe (hash), administrateur BOOLEAN, date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     """
 
-    # ---------- Helpers mot de passe ----------
-    @staticmethod
-    def _hash_password(plain: str) -> str:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        return bcrypt.hashpw(plain, bcrypt.gensalt()).decode("utf-8")
-
-    @staticmethod
-    def _check_password(plain: str, hashed: str) -> bool:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        if isinstance(hashed, str):
-            hashed = hashed.encode("utf-8")
-        return bcrypt.checkpw(plain, hashed)
-
     # ---------- READ ----------
     def find_all(self, limit: int = 100, offset: int = 0) -> List[ParticipantModelOut]:
         """
@@ -64,6 +52,36 @@ class ParticipantDao:
             )
         return participants
 
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[ParticipantModelOut]:
+        """
+        Récupère une page de participants par clé (id_utilisateur) : le coût d'une page
+        ne dépend pas de sa profondeur, contrairement à OFFSET.
+        `curseur` est le jeton `curseur_suivant` de la page précédente.
+        """
+        where = ["administrateur = FALSE"]
+        params = {"limit": max(limit, 0) + 1}
+        if curseur:
+            (params["apres_id"],) = decoder_curseur(curseur, int)
+            where.append("id_utilisateur > %(apres_id)s")
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+        query = (
+            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+            "FROM utilisateur "
+            f"{where_clause}"
+            "ORDER BY id_utilisateur "
+            "LIMIT %(limit)s"
+        )
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        rows, suivant = decouper_page(rows, max(limit, 0), lambda r: (r["id_utilisateur"],))
+        elements = [ParticipantModelOut(**r) for r in rows]
+        return PageModel[ParticipantModelOut](elements=elements, curseur_suivant=suivant)
+
     def find_by_id(self, id_utilisateur: int) -> Optional[ParticipantModelOut]:
         """
         Récupère un participant par ID.
@@ -134,7 +152,7 @@ class ParticipantDao:
             "prenom": participant_in.prenom,
             "nom": participant_in.nom,
             "telephone": participant_in.telephone,
-            "mot_de_passe": self._hash_password(participant_in.mot_de_passe),
+            "mot_de_passe": HachageMotDePasse().hacher(participant_in.mot_de_passe),
         }
 
         with DBConnection().getConnexion() as con:
@@ -221,8 +239,9 @@ class ParticipantDao:
                 curs.execute(query, {"email": email})
                 r = curs.fetchone()
 
-        if r is None or not self._check_password(mot_de_passe, r["mot_de_passe"]):
+        if r is None or not HachageMotDePasse().verifier(mot_de_passe, r["mot_de_passe"]):
             return None
+        UtilisateurDao._rehacher_si_besoin(r["id_utilisateur"], mot_de_passe, r["mot_de_passe"])
 
         return ParticipantModelOut(
             id_utilisateur=r["id_utilisateur"],
@@ -242,7 +261,7 @@ class ParticipantDao:
             "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
             "WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
         )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": HachageMotDePasse().hacher(new_password), "id": id_utilisateur}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
@@ -1,7 +1,21 @@
 # src/dao/reservation_dao.py
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from dao.affectation_bus_dao import AffectationBusDao
 from dao.db_connection import DBConnection
-from model.reservation_models import ReservationModelOut, ReservationModelIn
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.idempotence_dao import IdempotenceDao
+from dao.liste_attente_dao import ListeAttenteDao
+from model.bus_models import AffectationBusModel
+from model.ecriture_models import EcritureModel
+from model.email_models import EmailModelIn
+from model.idempotence_models import CleIdempotenceModel
+from model.reservation_models import (
+    ReservationModelOut,
+    ReservationModelIn,
+    InscritModelOut,
+    PromotionModel,
+    ResultatReservationModel,
+)
 
 
 class ReservationDao:
@@ -20,28 +34,176 @@ class ReservationDao:
       boisson BOOLEAN DEFAULT FALSE
       -- ❌ plus de contrainte UNIQUE(fk_utilisateur)
       -- ✅ on gère la contrainte logique via exists_for_user_and_event()
+
+    Chaque écriture met à jour, par trigger, le compteur 'compteur_evenement'.
+    Les places de bus (bus_aller / bus_retour) sont attribuées ou libérées dans la
+    même transaction, sous le verrou de l'événement (AffectationBusDao.repartir).
+    De même, une place libérée revient à la liste d'attente (ListeAttenteDao.promouvoir).
+    Les écritures acceptent une clé d'idempotence (`idempotence`) : un nouvel essai
+    avec la même clé rend le résultat du premier sans rien réexécuter (IdempotenceDao).
+    Les requêtes SQL sont partagées avec ReservationDaoAsync (dao/asynchrone/).
     """
 
+    # Opérations des clés d'idempotence
+    OPERATION_RESERVER = "reserver"
+    OPERATION_MODIFIER = "modifier"
+    OPERATION_ANNULER = "annuler"
+
+    _COLONNES = """id_reservation, fk_utilisateur, fk_evenement, bus_aller, bus_retour,
+                   adherent, sam, boisson, date_reservation"""
+
+    _SQL_FIND_BY_USER = f"""
+            SELECT {_COLONNES}
+            FROM reservation
+            WHERE fk_utilisateur = %(id_utilisateur)s
+            ORDER BY date_reservation DESC
+        """
+
+    _SQL_FIND_BY_EVENT = f"""
+            SELECT {_COLONNES}
+            FROM reservation
+            WHERE fk_evenement = %(id_evenement)s
+            ORDER BY date_reservation DESC
+        """
+
+    _SQL_FIND_BY_ID = f"""
+            SELECT {_COLONNES}
+            FROM reservation
+            WHERE id_reservation = %(id)s
+        """
+
+    # Verrou de l'événement : instruction distincte de la suivante (voir reserver)
+    _SQL_VERROU_EVENEMENT = "SELECT 1 FROM evenement WHERE id_evenement = %(fk_evenement)s FOR UPDATE;"
+
+    _SQL_RESERVER = """
+            WITH evt AS (
+                SELECT e.id_evenement,
+                       e.capacite,
+                       COALESCE(c.nb_reservations, 0) AS nb_resa
+                FROM evenement e
+                LEFT JOIN compteur_evenement c ON c.id_evenement = e.id_evenement
+                WHERE e.id_evenement = %(fk_evenement)s
+            ),
+            ins AS (
+                INSERT INTO reservation (
+                    fk_utilisateur, fk_evenement,
+                    bus_aller, bus_retour,
+                    adherent, sam, boisson
+                )
+                SELECT %(fk_utilisateur)s, evt.id_evenement,
+                       %(bus_aller)s, %(bus_retour)s,
+                       %(adherent)s, %(sam)s, %(boisson)s
+                FROM evt
+                WHERE evt.nb_resa < evt.capacite
+                ON CONFLICT (fk_utilisateur, fk_evenement) DO NOTHING
+                RETURNING id_reservation, date_reservation
+            ),
+            -- Une place obtenue directement retire l'utilisateur de la liste d'attente
+            quitte AS (
+                DELETE FROM liste_attente
+                WHERE fk_utilisateur = %(fk_utilisateur)s AND fk_evenement = %(fk_evenement)s
+                  AND EXISTS (SELECT 1 FROM ins)
+            )
+            SELECT (SELECT id_reservation FROM ins) AS id_reservation,
+                   (SELECT date_reservation FROM ins) AS date_reservation,
+                   (SELECT capacite FROM evt) AS capacite,
+                   (SELECT nb_resa FROM evt) AS nb_resa,
+                   EXISTS (
+                       SELECT 1 FROM reservation
+                       WHERE fk_utilisateur = %(fk_utilisateur)s
+                         AND fk_evenement = %(fk_evenement)s
+                   ) AS doublon
+        """
+
+    # Verrou de l'événement d'une réservation existante (modification, annulation)
+    _SQL_VERROU_RESERVATION = """
+            SELECT 1 FROM evenement
+            WHERE id_evenement = (SELECT fk_evenement FROM reservation WHERE id_reservation = %(id)s)
+            FOR UPDATE;
+        """
+
+    _SQL_DELETE = """
+            DELETE FROM reservation WHERE id_reservation = %(id)s
+            RETURNING fk_evenement, (bus_aller OR bus_retour) AS bus
+        """
+
+    _SQL_COUNT_BY_EVENT = "SELECT nb_reservations AS c FROM compteur_evenement WHERE id_evenement = %(id)s"
+
+    _SQL_EXISTS = """
+            SELECT 1
+            FROM reservation
+            WHERE fk_utilisateur = %(id_user)s AND fk_evenement = %(id_event)s
+            LIMIT 1
+        """
+
+    # ---------- Helpers (partagés avec la version asynchrone) ----------
+    @staticmethod
+    def _params_reservation(reservation_in: ReservationModelIn) -> Dict[str, Any]:
+        return {
+            "fk_utilisateur": reservation_in.fk_utilisateur,
+            "fk_evenement": reservation_in.fk_evenement,
+            "bus_aller": reservation_in.bus_aller,
+            "bus_retour": reservation_in.bus_retour,
+            "adherent": reservation_in.adherent,
+            "sam": reservation_in.sam,
+            "boisson": reservation_in.boisson,
+        }
+
+    @staticmethod
+    def _resultat_reservation(
+        row: Dict[str, Any],
+        reservation_in: ReservationModelIn,
+        affectations: Optional[List[AffectationBusModel]] = None,
+        position: Optional[int] = None,
+    ) -> ResultatReservationModel:
+        """
+        Qualifie l'issue de _SQL_RESERVER (reservee / complet / doublon / evenement_introuvable),
+        ou en_attente si la demande refusée a rejoint la liste d'attente au rang `position`.
+        """
+        if row["capacite"] is None:
+            return ResultatReservationModel(statut="evenement_introuvable")
+
+        if row["id_reservation"] is not None:
+            return ResultatReservationModel(
+                statut="reservee",
+                reservation=ReservationModelOut(
+                    id_reservation=row["id_reservation"],
+                    date_reservation=row["date_reservation"],
+                    **reservation_in.model_dump(),
+                ),
+                places_restantes=row["capacite"] - row["nb_resa"] - 1,
+                affectations=[a for a in affectations or [] if a.fk_reservation == row["id_reservation"]],
+            )
+
+        places_restantes = max(0, row["capacite"] - row["nb_resa"])
+        if row["doublon"]:
+            return ResultatReservationModel(statut="doublon", places_restantes=places_restantes)
+        if position:
+            return ResultatReservationModel(statut="en_attente", places_restantes=0, position=position)
+        return ResultatReservationModel(statut="complet", places_restantes=places_restantes)
+
+    @staticmethod
+    def _refus_complet(row: Dict[str, Any]) -> bool:
+        """Vrai si _SQL_RESERVER a refusé la demande faute de place (ni doublon, ni événement absent)."""
+        return row["id_reservation"] is None and row["capacite"] is not None and not row["doublon"]
+
+    @staticmethod
+    def _suppression(row: Optional[Dict[str, Any]]) -> EcritureModel:
+        """Issue d'un _SQL_DELETE (RETURNING fk_evenement) : ligne absente -> 'introuvable'."""
+        if row is None:
+            return EcritureModel(statut="introuvable")
+        return EcritureModel(statut="ecrite", fk_evenement=row["fk_evenement"])
+
+    @staticmethod
+    def _demande_bus(reservations) -> bool:
+        return any(r.bus_aller or r.bus_retour for r in reservations)
+
     # ---------- READ ----------
     def find_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
         """Récupère toutes les réservations d’un utilisateur donné."""
-        query = """
-            SELECT r.id_reservation,
-                   r.fk_utilisateur,
-                   r.fk_evenement,
-                   r.bus_aller,
-                   r.bus_retour,
-                   r.adherent,
-                   r.sam,
-                   r.boisson,
-                   r.date_reservation
-            FROM reservation r
-            WHERE r.fk_utilisateur = %(id_utilisateur)s
-            ORDER BY r.date_reservation DESC
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id_utilisateur": id_utilisateur})
+                curs.execute(self._SQL_FIND_BY_USER, {"id_utilisateur": id_utilisateur})
                 rows = curs.fetchall()
 
         return [
@@ -51,49 +213,81 @@ class ReservationDao:
 
     def find_by_event(self, id_evenement: int) -> List[ReservationModelOut]:
         """Récupère toutes les réservations d’un événement donné."""
-        query = """
-            SELECT id_reservation,
-                   fk_utilisateur,
-                   fk_evenement,
-                   bus_aller,
-                   bus_retour,
-                   adherent,
-                   sam,
-                   boisson,
-                   date_reservation
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
+                rows = curs.fetchall()
+
+        return [ReservationModelOut(**r) for r in rows]
+
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[ReservationModelOut]:
+        """
+        Parcourt toutes les réservations (triées par id) en flux, via un curseur serveur :
+        destiné aux exports, la mémoire ne dépend pas de la taille de la table.
+        """
+        query = f"""
+            SELECT {self._COLONNES}
             FROM reservation
-            WHERE fk_evenement = %(id_evenement)s
-            ORDER BY date_reservation DESC
+            ORDER BY id_reservation
+        """
+        for r in DBConnection().iterer(query, itersize=itersize):
+            yield ReservationModelOut(**r)
+
+    def iter_by_event(self, id_evenement: int, itersize: Optional[int] = None) -> Iterator[ReservationModelOut]:
+        """Variante en flux de find_by_event (curseur serveur, même tri)."""
+        for r in DBConnection().iterer(self._SQL_FIND_BY_EVENT, {"id_evenement": id_evenement}, itersize=itersize):
+            yield ReservationModelOut(**r)
+
+    def find_by_event_with_users(self, id_evenement: int) -> List[InscritModelOut]:
+        """
+        Récupère les réservations d’un événement avec les coordonnées des inscrits,
+        en une seule requête (jointure sur utilisateur).
+        """
+        query = """
+            SELECT r.id_reservation,
+                   r.fk_utilisateur,
+                   r.fk_evenement,
+                   r.bus_aller,
+                   r.bus_retour,
+                   r.adherent,
+                   r.sam,
+                   r.boisson,
+                   r.date_reservation,
+                   u.nom,
+                   u.prenom,
+                   u.email,
+                   u.telephone
+            FROM reservation r
+            JOIN utilisateur u ON u.id_utilisateur = r.fk_utilisateur
+            WHERE r.fk_evenement = %(id_evenement)s
+            ORDER BY r.date_reservation DESC
         """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, {"id_evenement": id_evenement})
                 rows = curs.fetchall()
 
-        return [ReservationModelOut(**r) for r in rows]
+        return [InscritModelOut(**r) for r in rows]
 
     def find_by_id(self, id_reservation: int) -> Optional[ReservationModelOut]:
         """Récupère une réservation par son ID."""
-        query = """
-            SELECT id_reservation,
-                   fk_utilisateur,
-                   fk_evenement,
-                   bus_aller,
-                   bus_retour,
-                   adherent,
-                   sam,
-                   boisson,
-                   date_reservation
-            FROM reservation
-            WHERE id_reservation = %(id)s
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_reservation})
+                curs.execute(self._SQL_FIND_BY_ID, {"id": id_reservation})
                 r = curs.fetchone()
 
         return ReservationModelOut(**r) if r else None
 
+    def resultat_enregistre(
+        self, idempotence: CleIdempotenceModel, operation: str
+    ) -> Optional[Dict[str, Any]]:
+        """Résultat enregistré pour une clé d'idempotence encore valide ({"valeur": ...}), sinon None."""
+        return IdempotenceDao().lire(idempotence, operation)
+
+    def purger_idempotence(self) -> int:
+        """Supprime les clés d'idempotence expirées. Retourne leur nombre."""
+        return IdempotenceDao().purger()
+
     # ---------- CREATE ----------
     def create(self, reservation_in: ReservationModelIn) -> Optional[ReservationModelOut]:
         """Crée une nouvelle réservation (1 par utilisateur + événement)."""
@@ -109,15 +303,7 @@ class ReservationDao:
             )
             RETURNING id_reservation, date_reservation
         """
-        params = {
-            "fk_utilisateur": reservation_in.fk_utilisateur,
-            "fk_evenement": reservation_in.fk_evenement,
-            "bus_aller": reservation_in.bus_aller,
-            "bus_retour": reservation_in.bus_retour,
-            "adherent": reservation_in.adherent,
-            "sam": reservation_in.sam,
-            "boisson": reservation_in.boisson,
-        }
+        params = self._params_reservation(reservation_in)
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
@@ -142,6 +328,66 @@ class ReservationDao:
             date_reservation=row["date_reservation"],
         )
 
+    def reserver(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        liste_attente: bool = False,
+        idempotence: Optional[CleIdempotenceModel] = None,
+    ) -> ResultatReservationModel:
+        """
+        Réserve une place de façon atomique (sans surréservation possible).
+
+        Un seul aller-retour serveur, dans une seule transaction :
+          1. verrouille la ligne de l'événement (FOR UPDATE) : les réservations
+             concurrentes sur le même événement sont sérialisées ;
+          2. insère la réservation seulement s'il reste des places et si
+             l'utilisateur n'a pas déjà réservé (ON CONFLICT DO NOTHING),
+             puis renvoie de quoi qualifier l'issue.
+
+        Le verrou est posé par une instruction séparée : en READ COMMITTED, la
+        seconde instruction prend alors un instantané postérieur au verrou et voit
+        toutes les réservations déjà validées. Le nombre de places prises est lu
+        dans le compteur dénormalisé 'compteur_evenement' (tenu à jour par trigger).
+
+        Si le bus est demandé, la place dans le bus est attribuée dans la même
+        transaction (AffectationBusDao.repartir), ou la demande mise en attente.
+
+        Avec `liste_attente`, une demande refusée faute de place rejoint la liste
+        d'attente de l'événement, toujours sous le même verrou (statut en_attente).
+
+        `email` (confirmation) est déposé dans la boîte d'envoi, dans la même
+        transaction, seulement si la place est attribuée.
+
+        Avec `idempotence`, une clé déjà utilisée rend l'issue enregistrée au premier essai.
+        """
+        affectations = []
+        position = None
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                if idempotence is not None:
+                    deja = IdempotenceDao().rejouer_ou_prendre(idempotence, self.OPERATION_RESERVER, curs)
+                    if deja is not None:
+                        return ResultatReservationModel(**deja["valeur"])
+                curs.execute(
+                    self._SQL_VERROU_EVENEMENT + self._SQL_RESERVER,
+                    self._params_reservation(reservation_in),
+                )
+                row = curs.fetchone()
+                if row["id_reservation"] is not None and self._demande_bus([reservation_in]):
+                    affectations = AffectationBusDao().repartir([reservation_in.fk_evenement], curs)
+                if email is not None and row["id_reservation"] is not None:
+                    EmailOutboxDao().ajouter(email, curs)
+                if liste_attente and self._refus_complet(row):
+                    position = ListeAttenteDao().inscrire(reservation_in, curs)
+                resultat = self._resultat_reservation(row, reservation_in, affectations, position)
+                if idempotence is not None:
+                    IdempotenceDao().enregistrer(
+                        idempotence, self.OPERATION_RESERVER, resultat.model_dump(mode="json"), curs
+                    )
+
+        return resultat
+
     # ---------- UPDATE ----------
     def update_flags(
         self,
@@ -152,8 +398,16 @@ class ReservationDao:
         adherent: Optional[bool] = None,
         sam: Optional[bool] = None,
         boisson: Optional[bool] = None,
+        email: Optional[EmailModelIn] = None,
+        idempotence: Optional[CleIdempotenceModel] = None,
     ) -> Optional[ReservationModelOut]:
-        """Met à jour sélectivement les options de la réservation."""
+        """
+        Met à jour sélectivement les options de la réservation.
+        Un changement de bus_aller / bus_retour attribue ou libère la place de bus
+        dans la même transaction.
+        `email` est déposé dans la boîte d'envoi, dans la même transaction, si la mise à jour a lieu.
+        Avec `idempotence`, une clé déjà utilisée rend la réservation enregistrée au premier essai.
+        """
         fields = []
         params = {"id": id_reservation}
 
@@ -183,42 +437,84 @@ class ReservationDao:
             RETURNING id_reservation, fk_utilisateur, fk_evenement,
                       bus_aller, bus_retour, adherent, sam, boisson, date_reservation
         """
+        bus = bus_aller is not None or bus_retour is not None
+        if bus:
+            query = self._SQL_VERROU_RESERVATION + query
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
+                if idempotence is not None:
+                    deja = IdempotenceDao().rejouer_ou_prendre(idempotence, self.OPERATION_MODIFIER, curs)
+                    if deja is not None:
+                        return ReservationModelOut(**deja["valeur"]) if deja["valeur"] else None
                 curs.execute(query, params)
                 r = curs.fetchone()
+                if bus and r:
+                    AffectationBusDao().repartir([r["fk_evenement"]], curs)
+                if email is not None and r:
+                    EmailOutboxDao().ajouter(email, curs)
+                modifiee = ReservationModelOut(**r) if r else None
+                if idempotence is not None:
+                    valeur = modifiee.model_dump(mode="json") if modifiee else None
+                    IdempotenceDao().enregistrer(idempotence, self.OPERATION_MODIFIER, valeur, curs)
 
-        return ReservationModelOut(**r) if r else None
+        return modifiee
 
     # ---------- DELETE ----------
-    def delete(self, id_reservation: int) -> bool:
-        """Supprime une réservation par ID."""
-        query = "DELETE FROM reservation WHERE id_reservation = %(id)s"
+    def delete(
+        self,
+        id_reservation: int,
+        email: Optional[EmailModelIn] = None,
+        email_promotion: Optional[Callable[[PromotionModel], EmailModelIn]] = None,
+        idempotence: Optional[CleIdempotenceModel] = None,
+    ) -> EcritureModel:
+        """
+        Supprime une réservation par ID, dans une seule transaction et sous le verrou
+        de l'événement :
+          - la place libérée revient à la plus ancienne demande de la liste d'attente,
+            qui devient une réservation (ListeAttenteDao.promouvoir) ;
+          - les places de bus sont réattribuées (réservation supprimée ou promue).
+        `email` est déposé dans la boîte d'envoi si une ligne est supprimée ;
+        `email_promotion(promue)` construit celui de chaque réservation promue.
+        Avec `idempotence`, une clé déjà utilisée rend l'issue du premier essai.
+        Retourne l'issue typée : 'introuvable' sans lecture préalable, sinon
+        l'événement de la réservation supprimée.
+        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_reservation})
-                return curs.rowcount > 0
+                if idempotence is not None:
+                    deja = IdempotenceDao().rejouer_ou_prendre(idempotence, self.OPERATION_ANNULER, curs)
+                    if deja is not None:
+                        return EcritureModel(**deja["valeur"])
+                curs.execute(self._SQL_VERROU_RESERVATION + self._SQL_DELETE, {"id": id_reservation})
+                r = curs.fetchone()
+                issue = self._suppression(r)
+                if idempotence is not None:
+                    IdempotenceDao().enregistrer(idempotence, self.OPERATION_ANNULER, issue.model_dump(), curs)
+                if r is None:
+                    return issue
+                promues = ListeAttenteDao().promouvoir(r["fk_evenement"], curs)
+                if r["bus"] or self._demande_bus(promues):
+                    AffectationBusDao().repartir([r["fk_evenement"]], curs)
+                if email is not None:
+                    EmailOutboxDao().ajouter(email, curs)
+                if email_promotion is not None:
+                    for promue in promues:
+                        EmailOutboxDao().ajouter(email_promotion(promue), curs)
+                return issue
 
     # ---------- HELPERS / STATS ----------
     def count_by_event(self, id_evenement: int) -> int:
-        """Retourne le nombre de réservations pour un événement."""
-        query = "SELECT COUNT(*) AS c FROM reservation WHERE fk_evenement = %(id)s"
+        """Retourne le nombre de réservations pour un événement (compteur dénormalisé)."""
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self._SQL_COUNT_BY_EVENT, {"id": id_evenement})
                 r = curs.fetchone()
                 return int(r["c"]) if r else 0
 
     def exists_for_user_and_event(self, id_utilisateur: int, id_evenement: int) -> bool:
         """Vérifie si un utilisateur a déjà réservé un événement précis."""
-        query = """
-            SELECT 1
-            FROM reservation
-            WHERE fk_utilisateur = %(id_user)s AND fk_evenement = %(id_event)s
-            LIMIT 1
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id_user": id_utilisateur, "id_event": id_evenement})
+                curs.execute(self._SQL_EXISTS, {"id_user": id_utilisateur, "id_event": id_evenement})
                 return curs.fetchone() is not None
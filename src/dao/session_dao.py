@@ -0,0 +1,177 @@
+# dao/session_dao.py
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from dao.db_connection import DBConnection
+from model.session_models import SessionModel
+from utils.singleton import Singleton
+
+
+class SessionDao:
+    """
+    DAO des sessions authentifiées (table 'session_utilisateur', migration 004).
+
+    `lire_et_prolonger` valide une session en un aller-retour, par clé primaire,
+    et repousse son expiration de `duree` secondes (expiration glissante). Pour ne
+    pas écrire à chaque action, l'expiration n'est repoussée que si elle a déjà
+    avancé de `_PAS_PROLONGATION` secondes.
+
+    Les requêtes SQL sont partagées avec SessionDaoAsync (dao/asynchrone/).
+    """
+
+    _PAS_PROLONGATION = 60
+
+    _COLONNES = "id_session, fk_utilisateur, administrateur, date_creation, expire_le"
+
+    _SQL_CREER = f"""
+            INSERT INTO session_utilisateur (id_session, fk_utilisateur, administrateur, expire_le)
+            VALUES (%(id_session)s, %(fk_utilisateur)s, %(administrateur)s,
+                    CURRENT_TIMESTAMP + %(duree)s * INTERVAL '1 second')
+            RETURNING {_COLONNES}
+        """
+
+    _SQL_LIRE_ET_PROLONGER = f"""
+            WITH s AS (
+                SELECT {_COLONNES}
+                FROM session_utilisateur
+                WHERE id_session = %(id_session)s
+                  AND expire_le > CURRENT_TIMESTAMP
+            ),
+            prolongee AS (
+                UPDATE session_utilisateur u
+                SET expire_le = CURRENT_TIMESTAMP + %(duree)s * INTERVAL '1 second'
+                FROM s
+                WHERE u.id_session = s.id_session
+                  AND s.expire_le < CURRENT_TIMESTAMP + (%(duree)s - %(pas)s) * INTERVAL '1 second'
+                RETURNING u.expire_le
+            )
+            SELECT s.id_session, s.fk_utilisateur, s.administrateur, s.date_creation,
+                   COALESCE((SELECT expire_le FROM prolongee), s.expire_le) AS expire_le
+            FROM s
+        """
+
+    _SQL_SUPPRIMER = "DELETE FROM session_utilisateur WHERE id_session = %(id_session)s"
+
+    _SQL_SUPPRIMER_UTILISATEUR = "DELETE FROM session_utilisateur WHERE fk_utilisateur = %(fk_utilisateur)s"
+
+    _SQL_PURGER = "DELETE FROM session_utilisateur WHERE expire_le <= CURRENT_TIMESTAMP"
+
+    @classmethod
+    def _params_lecture(cls, id_session: str, duree: int) -> Dict[str, Any]:
+        return {"id_session": id_session, "duree": duree, "pas": min(cls._PAS_PROLONGATION, duree // 2)}
+
+    # ---------- CREATE ----------
+    def creer(self, id_session: str, fk_utilisateur: int, administrateur: bool, duree: int) -> SessionModel:
+        """Enregistre une session valable `duree` secondes."""
+        params = {
+            "id_session": id_session,
+            "fk_utilisateur": fk_utilisateur,
+            "administrateur": administrateur,
+            "duree": duree,
+        }
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_CREER, params)
+                return SessionModel(**curs.fetchone())
+
+    # ---------- READ ----------
+    def lire_et_prolonger(self, id_session: str, duree: int) -> Optional[SessionModel]:
+        """Session encore valide (expiration repoussée de `duree` secondes), sinon None."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_LIRE_ET_PROLONGER, self._params_lecture(id_session, duree))
+                r = curs.fetchone()
+        return SessionModel(**r) if r else None
+
+    # ---------- DELETE ----------
+    def supprimer(self, id_session: str) -> bool:
+        """Ferme une session (déconnexion)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_SUPPRIMER, {"id_session": id_session})
+                return curs.rowcount > 0
+
+    def supprimer_par_utilisateur(self, fk_utilisateur: int) -> int:
+        """Ferme toutes les sessions d'un utilisateur. Retourne leur nombre."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_SUPPRIMER_UTILISATEUR, {"fk_utilisateur": fk_utilisateur})
+                return curs.rowcount
+
+    def purger(self) -> int:
+        """Supprime les sessions expirées. Retourne leur nombre."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_PURGER)
+                return curs.rowcount
+
+
+class SessionMemoireDao(metaclass=Singleton):
+    """
+    Même interface que SessionDao, dans un dictionnaire du processus : validation
+    en O(1) sans aller-retour réseau, mais les sessions ne sont connues que du
+    processus qui les a ouvertes (un seul worker) et disparaissent à son arrêt.
+
+    Les sessions expirées sont retirées à la lecture, et toutes à la fois quand
+    le nombre de sessions a doublé depuis le dernier ménage.
+    """
+
+    def __init__(self, horloge: Callable[[], float] = time.time):
+        self.horloge = horloge
+        self.__sessions: Dict[str, SessionModel] = {}
+        self.__verrou = threading.Lock()
+        self.__prochain_menage = 1024
+
+    def _maintenant(self) -> datetime:
+        return datetime.fromtimestamp(self.horloge())
+
+    def _echeance(self, duree: int) -> datetime:
+        return datetime.fromtimestamp(self.horloge() + duree)
+
+    def creer(self, id_session: str, fk_utilisateur: int, administrateur: bool, duree: int) -> SessionModel:
+        session = SessionModel(
+            id_session=id_session,
+            fk_utilisateur=fk_utilisateur,
+            administrateur=administrateur,
+            date_creation=self._maintenant(),
+            expire_le=self._echeance(duree),
+        )
+        with self.__verrou:
+            self.__sessions[id_session] = session
+            menage = len(self.__sessions) >= self.__prochain_menage
+        if menage:
+            self.purger()
+        return session.model_copy()
+
+    def lire_et_prolonger(self, id_session: str, duree: int) -> Optional[SessionModel]:
+        with self.__verrou:
+            session = self.__sessions.get(id_session)
+            if session is None:
+                return None
+            if session.expire_le <= self._maintenant():
+                del self.__sessions[id_session]
+                return None
+            session.expire_le = self._echeance(duree)
+            return session.model_copy()
+
+    def supprimer(self, id_session: str) -> bool:
+        with self.__verrou:
+            return self.__sessions.pop(id_session, None) is not None
+
+    def supprimer_par_utilisateur(self, fk_utilisateur: int) -> int:
+        with self.__verrou:
+            ids = [i for i, s in self.__sessions.items() if s.fk_utilisateur == fk_utilisateur]
+            for i in ids:
+                del self.__sessions[i]
+        return len(ids)
+
+    def purger(self) -> int:
+        maintenant = self._maintenant()
+        with self.__verrou:
+            ids = [i for i, s in self.__sessions.items() if s.expire_le <= maintenant]
+            for i in ids:
+                del self.__sessions[i]
+            self.__prochain_menage = max(1024, 2 * len(self.__sessions))
+        return len(ids)
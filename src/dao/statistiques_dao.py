@@ -0,0 +1,81 @@
+# dao/statistiques_dao.py
+from typing import List, Optional
+
+from dao.db_connection import DBConnection
+from model.statistiques_models import StatistiquesEvenementModel
+
+
+class StatistiquesDao:
+    """
+    DAO de lecture des statistiques d'inscription (tableau de bord admin).
+
+    Tous les compteurs (par événement et total global) sont calculés par une
+    seule requête groupée : agrégats `FILTER (WHERE ...)` sur la table
+    reservation, puis GROUPING SETS pour obtenir la ligne de total.
+    """
+
+    def statistiques(self, limit: Optional[int] = None) -> List[StatistiquesEvenementModel]:
+        """
+        Retourne une ligne par événement (triées par date) suivie de la ligne de total
+        (id_evenement à None). `limit` borne le nombre d'événements pris en compte.
+        """
+        query = """
+            WITH evt AS (
+                SELECT id_evenement, titre, date_evenement, capacite
+                FROM evenement
+                ORDER BY date_evenement ASC, id_evenement ASC
+                LIMIT %(limit)s
+            ),
+            resa AS (
+                SELECT r.fk_evenement,
+                       COUNT(*) AS inscrits,
+                       COUNT(*) FILTER (WHERE r.bus_aller) AS bus_aller,
+                       COUNT(*) FILTER (WHERE r.bus_retour) AS bus_retour,
+                       COUNT(*) FILTER (WHERE r.adherent) AS adherent,
+                       COUNT(*) FILTER (WHERE r.sam) AS sam,
+                       COUNT(*) FILTER (WHERE r.boisson) AS boisson
+                FROM reservation r
+                JOIN evt ON evt.id_evenement = r.fk_evenement
+                GROUP BY r.fk_evenement
+            )
+            SELECT evt.id_evenement,
+                   MAX(evt.titre) AS titre,
+                   MAX(evt.date_evenement) AS date_evenement,
+                   SUM(evt.capacite) AS capacite,
+                   SUM(COALESCE(resa.inscrits, 0)) AS inscrits,
+                   SUM(GREATEST(evt.capacite - COALESCE(resa.inscrits, 0), 0)) AS restantes,
+                   COALESCE(ROUND(100.0 * SUM(COALESCE(resa.inscrits, 0))
+                                  / NULLIF(SUM(evt.capacite), 0), 1), 0) AS taux,
+                   SUM(COALESCE(resa.bus_aller, 0)) AS bus_aller,
+                   SUM(COALESCE(resa.bus_retour, 0)) AS bus_retour,
+                   SUM(COALESCE(resa.adherent, 0)) AS adherent,
+                   SUM(COALESCE(resa.sam, 0)) AS sam,
+                   SUM(COALESCE(resa.boisson, 0)) AS boisson
+            FROM evt
+            LEFT JOIN resa ON resa.fk_evenement = evt.id_evenement
+            GROUP BY GROUPING SETS ((evt.id_evenement), ())
+            ORDER BY GROUPING(evt.id_evenement),
+                     MAX(evt.date_evenement) ASC, evt.id_evenement ASC
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(query, {"limit": limit})
+                rows = curs.fetchall()
+
+        return [
+            StatistiquesEvenementModel(
+                id_evenement=r["id_evenement"],
+                titre=r["titre"] if r["id_evenement"] is not None else None,
+                date_evenement=r["date_evenement"] if r["id_evenement"] is not None else None,
+                capacite=r["capacite"] or 0,
+                inscrits=r["inscrits"] or 0,
+                restantes=r["restantes"] or 0,
+                taux=float(r["taux"]),
+                bus_aller=r["bus_aller"] or 0,
+                bus_retour=r["bus_retour"] or 0,
+                adherent=r["adherent"] or 0,
+                sam=r["sam"] or 0,
+                boisson=r["boisson"] or 0,
+            )
+            for r in rows
+        ]
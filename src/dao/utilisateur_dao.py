@@ -1,9 +1,13 @@
 # dao/utilisateur_dao.py
-from typing import List, Optional
-import bcrypt
+from typing import Iterator, List, Optional
 
 from dao.db_connection import DBConnection
+from dao.email_outbox_dao import EmailOutboxDao
+from model.email_models import EmailModelIn
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from model.pagination_models import PageModel
+from utils.pagination import decoder_curseur, decouper_page
+from utils.securite import HachageMotDePasse
 
 
 class UtilisateurDao:
@@ -13,22 +17,44 @@ class UtilisateurDao:
       id_utilisateur SERIAL PK
       nom, prenom, telephone, email (UNIQUE)
       mot_de_passe (hash), administrateur BOOLEAN, date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+
+    Les requêtes SQL sont partagées avec UtilisateurDaoAsync (dao/asynchrone/).
     """
 
+    _COLONNES = "id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+
+    _SQL_FIND_BY_ID = f"SELECT {_COLONNES}FROM utilisateur WHERE id_utilisateur = %(id)s"
+
+    _SQL_FIND_BY_EMAIL = f"SELECT {_COLONNES}FROM utilisateur WHERE email = %(email)s"
+
+    _SQL_CREATE = (
+        "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
+        "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, %(administrateur)s) "
+        "RETURNING id_utilisateur, date_creation"
+    )
+
+    _SQL_AUTHENTICATE = f"SELECT {_COLONNES}, mot_de_passe FROM utilisateur WHERE email = %(email)s"
+
+    # Compare-and-set : ne remplace que le hash vérifié (pas un changement concurrent)
+    _SQL_REHACHER = (
+        "UPDATE utilisateur SET mot_de_passe = %(nouveau)s "
+        "WHERE id_utilisateur = %(id)s AND mot_de_passe = %(ancien)s"
+    )
+
     # ---------- Helpers mot de passe ----------
-    @staticmethod
-    def _hash_password(plain: str) -> str:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        return bcrypt.hashpw(plain, bcrypt.gensalt()).decode("utf-8")
-
-    @staticmethod
-    def _check_password(plain: str, hashed: str) -> bool:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        if isinstance(hashed, str):
-            hashed = hashed.encode("utf-8")
-        return bcrypt.checkpw(plain, hashed)
+    @classmethod
+    def _rehacher_si_besoin(cls, id_utilisateur: int, mot_de_passe: str, hache: str) -> None:
+        """
+        Après une connexion réussie, refait le hash s'il n'est pas au coût configuré
+        (BCRYPT_COUT) : le changement de coût s'applique au fil des connexions.
+        """
+        hachage = HachageMotDePasse()
+        if not hachage.a_rehacher(hache):
+            return
+        params = {"nouveau": hachage.hacher(mot_de_passe), "id": id_utilisateur, "ancien": hache}
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(cls._SQL_REHACHER, params)
 
     # ---------- READ ----------
     def find_all(self, limit: int = 100, offset: int = 0) -> List[UtilisateurModelOut]:
@@ -63,18 +89,56 @@ class UtilisateurDao:
             )
         return users
 
-    def find_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[UtilisateurModelOut]:
         """
-        Récupère un utilisateur par son ID.
+        Récupère une page d'utilisateurs par clé (id_utilisateur) : le coût d'une page
+        ne dépend pas de sa profondeur, contrairement à OFFSET.
+        `curseur` est le jeton `curseur_suivant` de la page précédente.
         """
+        where = []
+        params = {"limit": max(limit, 0) + 1}
+        if curseur:
+            (params["apres_id"],) = decoder_curseur(curseur, int)
+            where.append("id_utilisateur > %(apres_id)s")
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
         query = (
             "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
             "FROM utilisateur "
-            "WHERE id_utilisateur = %(id)s"
+            f"{where_clause}"
+            "ORDER BY id_utilisateur "
+            "LIMIT %(limit)s"
         )
+
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        rows, suivant = decouper_page(rows, max(limit, 0), lambda r: (r["id_utilisateur"],))
+        elements = [UtilisateurModelOut(**r) for r in rows]
+        return PageModel[UtilisateurModelOut](elements=elements, curseur_suivant=suivant)
+
+    def iter_all(self, itersize: Optional[int] = None) -> Iterator[UtilisateurModelOut]:
+        """
+        Parcourt tous les utilisateurs (triés par id) en flux, via un curseur serveur :
+        destiné aux exports, la mémoire ne dépend pas de la taille de la table.
+        """
+        query = (
+            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+            "FROM utilisateur "
+            "ORDER BY id_utilisateur"
+        )
+        for r in DBConnection().iterer(query, itersize=itersize):
+            yield UtilisateurModelOut(**r)
+
+    def find_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
+        """
+        Récupère un utilisateur par son ID.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self._SQL_FIND_BY_ID, {"id": id_utilisateur})
                 r = curs.fetchone()
 
         if r is None:
@@ -94,14 +158,9 @@ class UtilisateurDao:
         """
         Récupère un utilisateur par son email.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self._SQL_FIND_BY_EMAIL, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
@@ -118,29 +177,27 @@ class UtilisateurDao:
         )
 
     # ---------- CREATE ----------
-    def create(self, user_in: UtilisateurModelIn) -> UtilisateurModelOut:
+    def create(self, user_in: UtilisateurModelIn, email: Optional[EmailModelIn] = None) -> UtilisateurModelOut:
         """
         Crée un nouvel utilisateur (hash le mot de passe).
         Laisse la BDD remplir date_creation (DEFAULT CURRENT_TIMESTAMP).
+        `email` (bienvenue) est déposé dans la boîte d'envoi, dans la même transaction.
         """
-        query = (
-            "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
-            "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, %(administrateur)s) "
-            "RETURNING id_utilisateur, date_creation"
-        )
         params = {
             "email": user_in.email,
             "prenom": user_in.prenom,
             "nom": user_in.nom,
             "telephone": user_in.telephone,
-            "mot_de_passe": self._hash_password(user_in.mot_de_passe),
+            "mot_de_passe": HachageMotDePasse().hacher(user_in.mot_de_passe),
             "administrateur": getattr(user_in, "administrateur", False),
         }
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self._SQL_CREATE, params)
                 row = curs.fetchone()
+                if email is not None:
+                    EmailOutboxDao().ajouter(email, curs)
 
         return UtilisateurModelOut(
             id_utilisateur=row["id_utilisateur"],
@@ -213,21 +270,17 @@ class UtilisateurDao:
         """
         Vérifie email/mot de passe et retourne l'utilisateur si OK.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self._SQL_AUTHENTICATE, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        if not self._check_password(mot_de_passe, r["mot_de_passe"]):
+        if not HachageMotDePasse().verifier(mot_de_passe, r["mot_de_passe"]):
             return None
+        self._rehacher_si_besoin(r["id_utilisateur"], mot_de_passe, r["mot_de_passe"])
 
         return UtilisateurModelOut(
             id_utilisateur=r["id_utilisateur"],
@@ -247,7 +300,7 @@ class UtilisateurDao:
             "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
             "WHERE id_utilisateur = %(id)s"
         )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": HachageMotDePasse().hacher(new_password), "id": id_utilisateur}
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, params)
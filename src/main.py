@@ -1,13 +1,19 @@
 import logging
+import os
 import dotenv
 
 
+from service.outbox_email_service import OutboxEmailService
+from service.reservation_service import ReservationService
+from service.session_service import SessionService
 from utils.log_init import initialiser_logs
+from utils.metriques import RegistreMetriques
 from view.accueil.accueil_vue import AccueilVue
 
 """
 Point d'entrée de l'application : charge la configuration, initialise les logs,
-puis exécute la boucle principale d'affichage et de navigation entre les vues.
+lance l'envoi des e-mails en arrière-plan, puis exécute la boucle principale
+d'affichage et de navigation entre les vues.
 Gère les erreurs et assure un arrêt propre du programme.
 """
 
@@ -16,6 +22,14 @@ if __name__ == "__main__":
     dotenv.load_dotenv(override=True)
     initialiser_logs("Application")
 
+    # La boucle d'envoi purge aussi les clés d'idempotence et les sessions expirées
+    outbox = OutboxEmailService(entretien=[ReservationService().purger_cles_idempotence, SessionService().purger])
+    outbox.demarrer()
+
+    # Export Prometheus facultatif ; sinon les métriques restent consultables depuis le menu admin
+    if os.getenv("METRIQUES_PORT"):
+        RegistreMetriques().servir(int(os.getenv("METRIQUES_PORT")))
+
     vue_courante = AccueilVue("Bienvenue")
     nb_erreurs = 0
 
@@ -31,6 +45,7 @@ if __name__ == "__main__":
             nb_erreurs += 1
             vue_courante = AccueilVue("Une erreur est survenue, retour au menu principal")
 
+    outbox.arreter()
     print("----------------------------------")
     print("Au revoir")
     logging.info("Fin de l'application")
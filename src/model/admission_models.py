@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class EtatFileModel(BaseModel):
+    """
+    État d'une file d'admission (seau à jetons) à l'instant `maj` (secondes) :
+    les tickets 1..admis_jusqu_a sont admis, admis_jusqu_a+1..dernier_ticket attendent.
+    """
+    nom: str
+    dernier_ticket: int = 0
+    admis_jusqu_a: int = 0
+    jetons: float
+    maj: float
+
+
+class TicketAdmissionModel(BaseModel):
+    """
+    Place d'un client dans une file d'admission.
+    - admis : le client peut réserver
+    - position : rang dans la file (0 une fois admis)
+    - attente_estimee : secondes avant l'admission, au débit de la file
+    """
+    file: str
+    ticket: int
+    admis: bool
+    position: int
+    attente_estimee: float
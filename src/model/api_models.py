@@ -0,0 +1,36 @@
+from datetime import datetime
+from pydantic import BaseModel, EmailStr
+
+from model.utilisateur_models import UtilisateurModelOut
+
+
+class ConnexionModelIn(BaseModel):
+    """Identifiants envoyés à POST /connexion."""
+    email: EmailStr
+    mot_de_passe: str
+
+
+class JetonModelOut(BaseModel):
+    """
+    Jeton de session renvoyé après authentification,
+    à repasser dans l'en-tête `Authorization: Bearer <jeton>`.
+    `expire_le` est repoussé à chaque requête authentifiée (expiration glissante).
+    """
+    jeton: str
+    expire_le: datetime
+    utilisateur: UtilisateurModelOut
+
+
+class DemandeReservationModelIn(BaseModel):
+    """
+    Corps de POST /reservations : l'utilisateur est celui du jeton,
+    il n'est donc pas transmis par le client.
+    `liste_attente` : si l'événement est complet, rejoindre sa liste d'attente.
+    """
+    fk_evenement: int
+    bus_aller: bool = False
+    bus_retour: bool = False
+    adherent: bool = False
+    sam: bool = False
+    boisson: bool = False
+    liste_attente: bool = False
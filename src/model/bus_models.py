@@ -24,3 +24,12 @@ class BusModelOut(BaseModel):
     nombre_places: int
     direction: Literal["aller", "retour"]
     description: str
+
+
+class AffectationBusModel(BaseModel):
+    """
+    Place attribuée à une réservation dans un bus, pour un sens (table affectation_bus).
+    """
+    fk_reservation: int
+    direction: Literal["aller", "retour"]
+    fk_bus: int
@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Literal, Optional
+
+
+class EcritureModel(BaseModel):
+    """
+    Issue typée d'une écriture faite en une seule instruction (UPDATE / DELETE ... RETURNING),
+    sans lecture préalable de la ligne visée :
+      - statut : 'ecrite', ou 'introuvable' si aucune ligne ne porte l'identifiant ;
+      - ligne : la ligne écrite (None pour une suppression) ;
+      - fk_evenement : événement de la ligne AVANT l'écriture, renvoyé par la même
+        instruction, pour les effets de bord du service (cache des places,
+        répartition des bus de l'événement quitté).
+    """
+    # Autorise aussi des objets métier non pydantic (ex : CreneauBus)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    statut: Literal["ecrite", "introuvable"]
+    ligne: Optional[Any] = None
+    fk_evenement: Optional[int] = None
+
+    @property
+    def ecrite(self) -> bool:
+        return self.statut == "ecrite"
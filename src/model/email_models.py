@@ -0,0 +1,50 @@
+from datetime import datetime
+from pydantic import BaseModel, EmailStr, constr
+from typing import List, Optional, Literal
+
+
+class EmailModelIn(BaseModel):
+    """
+    E-mail à déposer dans la boîte d'envoi (table email_outbox).
+    """
+    destinataire: EmailStr
+    sujet: constr(max_length=255)
+    contenu: str
+
+
+class EmailOutboxModelOut(BaseModel):
+    """
+    E-mail de la boîte d'envoi, avec son état d'envoi.
+    """
+    id_email: int
+    destinataire: str
+    sujet: str
+    contenu: str
+    statut: Literal["en_attente", "envoye", "abandonne"]
+    tentatives: int
+    prochaine_tentative: datetime
+    derniere_erreur: Optional[str] = None
+    date_creation: datetime
+    date_envoi: Optional[datetime] = None
+
+
+class StatutDestinataireModel(BaseModel):
+    """
+    Issue de l'envoi pour un destinataire d'une notification groupée.
+    """
+    email: str
+    statut: Literal["envoye", "echec"]
+    detail: Optional[str] = None
+
+
+class RapportNotificationModel(BaseModel):
+    """
+    Rapport d'une notification groupée : statut par destinataire et débit.
+    """
+    nb_destinataires: int
+    nb_envoyes: int
+    nb_echecs: int
+    nb_requetes: int
+    duree: float
+    debit: float  # e-mails envoyés par seconde
+    destinataires: List[StatutDestinataireModel]
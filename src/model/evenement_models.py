@@ -46,3 +46,11 @@ class EvenementModelOut(BaseModel):
         "pas encore finalisé"
     ]
     date_creation: datetime
+
+
+class EvenementModifieModel(EvenementModelOut):
+    """
+    Événement tel que renvoyé par une mise à jour, avec sa capacité d'avant
+    l'écriture (lue par la même instruction).
+    """
+    capacite_precedente: int
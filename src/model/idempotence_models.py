@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class CleIdempotenceModel(BaseModel):
+    """
+    Clé d'idempotence d'une écriture : un nouvel essai avec la même clé rend le
+    résultat enregistré au premier, pendant `ttl` secondes. La clé doit être propre
+    au client (l'API la préfixe de l'id de l'utilisateur).
+    """
+    cle: str = Field(..., min_length=1, max_length=160)
+    ttl: int = Field(86400, gt=0)
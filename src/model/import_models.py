@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import List, Literal
+
+
+class ErreurLigneModel(BaseModel):
+    """
+    Ligne rejetée par un import en masse (numéro de ligne du fichier source).
+    """
+    ligne: int
+    erreur: str
+
+
+class ChargementModel(BaseModel):
+    """
+    Issue du chargement d'un lot de lignes valides (ImportDao).
+    """
+    creees: int = 0
+    mises_a_jour: int = 0
+    erreurs: List[ErreurLigneModel] = []
+
+
+class RapportImportModel(BaseModel):
+    """
+    Rapport d'un import en masse : lignes lues, chargées, rejetées, et débit.
+    """
+    table: Literal["utilisateurs", "evenements", "reservations"]
+    lues: int
+    creees: int
+    mises_a_jour: int
+    erreurs: List[ErreurLigneModel]
+    duree: float
+    debit: float  # lignes lues par seconde
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PageModel(BaseModel, Generic[T]):
+    """
+    Page d'une liste paginée par clé (keyset).
+    `curseur_suivant` est un jeton opaque à repasser pour obtenir la page suivante ;
+    il vaut None sur la dernière page.
+    """
+    # Autorise aussi des objets métier non pydantic (ex : CreneauBus)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    elements: List[T]
+    curseur_suivant: Optional[str] = None
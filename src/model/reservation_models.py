@@ -1,5 +1,8 @@
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, Field
+from typing import List, Optional, Literal
+
+from model.bus_models import AffectationBusModel
 
 
 class ReservationModelIn(BaseModel):
@@ -29,3 +32,59 @@ class ReservationModelOut(BaseModel):
     sam: bool
     boisson: bool
     date_reservation: datetime = Field(..., description="Horodatage automatique de la réservation")
+
+
+class InscritModelOut(ReservationModelOut):
+    """
+    Réservation enrichie des coordonnées de l'utilisateur (liste des inscrits).
+    """
+    nom: str
+    prenom: str
+    email: str
+    telephone: Optional[str] = None
+
+
+class ResultatReservationModel(BaseModel):
+    """
+    Issue typée d'une tentative de réservation atomique.
+    - reservee : la place est attribuée, `reservation` est renseignée
+    - complet : plus aucune place sur l'événement
+    - doublon : l'utilisateur a déjà une réservation pour cet événement
+    - evenement_introuvable : l'événement n'existe pas
+    - en_attente : l'événement est complet, la demande est inscrite en liste
+      d'attente au rang `position` (réservation demandée avec liste_attente)
+
+    `affectations` : places de bus obtenues (aller / retour) ; un sens demandé
+    absent de la liste est en attente d'une place.
+    """
+    statut: Literal["reservee", "complet", "doublon", "evenement_introuvable", "en_attente"]
+    reservation: Optional[ReservationModelOut] = None
+    places_restantes: Optional[int] = None
+    affectations: List[AffectationBusModel] = Field(default_factory=list)
+    position: Optional[int] = None
+
+
+class AttenteModelOut(BaseModel):
+    """
+    Demande en liste d'attente d'un événement complet (table liste_attente),
+    avec son rang dans la file (1 = prochaine servie).
+    """
+    id_attente: int
+    fk_utilisateur: int
+    fk_evenement: int
+    bus_aller: bool
+    bus_retour: bool
+    adherent: bool
+    sam: bool
+    boisson: bool
+    date_inscription: datetime
+    position: int
+
+
+class PromotionModel(InscritModelOut):
+    """
+    Réservation créée depuis la liste d'attente quand une place s'est libérée,
+    avec de quoi prévenir l'inscrit (coordonnées, événement).
+    """
+    titre: str
+    date_evenement: date
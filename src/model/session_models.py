@@ -0,0 +1,14 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class SessionModel(BaseModel):
+    """
+    Session ouverte après une authentification réussie (table session_utilisateur,
+    ou stockage en mémoire). `expire_le` est repoussé à chaque usage.
+    """
+    id_session: str
+    fk_utilisateur: int
+    administrateur: bool = False
+    date_creation: datetime
+    expire_le: datetime
@@ -0,0 +1,30 @@
+from datetime import date
+from pydantic import BaseModel
+from typing import Optional, List
+
+
+class StatistiquesEvenementModel(BaseModel):
+    """
+    Ligne compacte de statistiques d'inscription.
+    Pour la ligne de total global, id_evenement / titre / date_evenement valent None.
+    """
+    id_evenement: Optional[int] = None
+    titre: Optional[str] = None
+    date_evenement: Optional[date] = None
+    capacite: int
+    inscrits: int
+    restantes: int
+    taux: float
+    bus_aller: int
+    bus_retour: int
+    adherent: int
+    sam: int
+    boisson: int
+
+
+class StatistiquesGlobalesModel(BaseModel):
+    """
+    Statistiques du tableau de bord admin : une ligne par événement + le total.
+    """
+    evenements: List[StatistiquesEvenementModel]
+    total: StatistiquesEvenementModel
@@ -3,6 +3,8 @@ from typing import List, Optional
 
 from dao.administrateur_dao import AdministrateurDao
 from model.utilisateur_models import AdministrateurModelOut, AdministrateurModelIn
+from model.pagination_models import PageModel
+from service.session_service import SessionService
 
 
 class AdministrateurService:
@@ -11,13 +13,19 @@ class AdministrateurService:
     Contient la logique métier, les validations et appelle le DAO.
     """
 
-    def __init__(self):
+    def __init__(self, sessions: Optional[SessionService] = None):
         self.dao = AdministrateurDao()
+        self.sessions = sessions or SessionService()
 
     # ---------- READ ----------
     def get_all_admins(self, limit: int = 100, offset: int = 0) -> List[AdministrateurModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_admins_page(
+        self, limit: int = 100, curseur: Optional[str] = None
+    ) -> PageModel[AdministrateurModelOut]:
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_admin_by_id(self, id_utilisateur: int) -> Optional[AdministrateurModelOut]:
         admin = self.dao.find_by_id(id_utilisateur)
         if not admin:
@@ -41,18 +49,18 @@ class AdministrateurService:
 
     # ---------- UPDATE ----------
     def update_admin(self, admin_out: AdministrateurModelOut) -> AdministrateurModelOut:
-        # Vérifie que l’administrateur existe avant de le mettre à jour
-        existing = self.dao.find_by_id(admin_out.id_utilisateur)
-        if not existing:
+        # L'UPDATE ne vise que les administrateurs : None si l'id n'en désigne aucun
+        updated = self.dao.update(admin_out)
+        if not updated:
             raise ValueError("Impossible de mettre à jour : administrateur introuvable.")
-        return self.dao.update(admin_out)
+        return updated
 
     # ---------- DELETE ----------
     def delete_admin(self, id_utilisateur: int) -> bool:
-        existing = self.dao.find_by_id(id_utilisateur)
-        if not existing:
+        if not self.dao.delete(id_utilisateur):
             raise ValueError("Impossible de supprimer : administrateur introuvable.")
-        return self.dao.delete(id_utilisateur)
+        self.sessions.fermer_toutes(id_utilisateur)
+        return True
 
     # ---------- AUTH ----------
     def authenticate_admin(self, email: str, mot_de_passe: str) -> Optional[AdministrateurModelOut]:
@@ -62,7 +70,7 @@ class AdministrateurService:
         return admin
 
     def change_admin_password(self, id_utilisateur: int, new_password: str) -> bool:
-        existing = self.dao.find_by_id(id_utilisateur)
-        if not existing:
+        if not self.dao.change_password(id_utilisateur, new_password):
             raise ValueError("Administrateur introuvable pour mise à jour du mot de passe.")
-        return self.dao.change_password(id_utilisateur, new_password)
+        self.sessions.fermer_toutes(id_utilisateur)
+        return True
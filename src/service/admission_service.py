@@ -0,0 +1,176 @@
+# service/admission_service.py
+import os
+from typing import Optional, Tuple
+
+from dao.admission_dao import AdmissionDao, AdmissionMemoireDao
+from dao.asynchrone.admission_dao import AdmissionDaoAsync, AdmissionMemoireDaoAsync
+from model.admission_models import EtatFileModel, TicketAdmissionModel
+from utils.metriques import RegistreMetriques
+
+FILE_RESERVATIONS = "reservations"
+
+_ENTREES = RegistreMetriques().compteur(
+    "bde_admission_entrees_total", "Tickets distribués par la file d'admission.", ("file",)
+)
+_CONTROLES = RegistreMetriques().compteur(
+    "bde_admission_controles_total",
+    "Contrôles d'admission avant réservation, par issue (admis, refuse).",
+    ("issue",),
+)
+_EN_FILE = RegistreMetriques().jauge(
+    "bde_admission_en_file", "Clients en attente dans la file d'admission (dernière lecture).", ("file",)
+)
+
+
+def _stockage() -> str:
+    """Stockage des files : 'memoire' (défaut, un seul processus) ou 'postgres' (partagé entre workers)."""
+    stockage = os.getenv("ADMISSION_STOCKAGE", "memoire")
+    if stockage not in ("postgres", "memoire"):
+        raise ValueError(f"ADMISSION_STOCKAGE inconnu : {stockage}")
+    return stockage
+
+
+class AdmissionService:
+    """
+    File d'admission (salle d'attente virtuelle) devant les réservations, pour les
+    ouvertures de billetterie : chaque client prend un ticket, et les tickets sont
+    admis dans l'ordre au débit d'un seau à jetons, réglé sur ce que la base absorbe.
+
+    - ADMISSION_DEBIT : admissions par seconde (0, défaut : pas de file, tout le
+      monde est admis) ;
+    - ADMISSION_RAFALE : admissions d'un coup après un creux (défaut : 2 × débit) ;
+    - ADMISSION_VALIDITE : durée de vie d'un ticket en secondes (défaut 3600),
+      après quoi le client reprend un ticket en fin de file ;
+    - ADMISSION_STOCKAGE : 'memoire' ou 'postgres' (plusieurs workers).
+
+    Le client est identifié par `cle` (id utilisateur) : reprendre un ticket rend
+    le même tant qu'il est valide.
+    """
+
+    def __init__(
+        self,
+        dao=None,
+        debit: Optional[float] = None,
+        rafale: Optional[float] = None,
+        validite: Optional[float] = None,
+    ):
+        self.dao = dao or (AdmissionDao() if _stockage() == "postgres" else AdmissionMemoireDao())
+        self.debit, self.rafale, self.validite = self._reglages(debit, rafale, validite)
+
+    @property
+    def active(self) -> bool:
+        return self.debit > 0
+
+    # ---------- Helpers (partagés avec la version asynchrone) ----------
+
+    @staticmethod
+    def _reglages(
+        debit: Optional[float], rafale: Optional[float], validite: Optional[float]
+    ) -> Tuple[float, float, float]:
+        """(débit, rafale, validité) : valeurs passées, sinon variables d'environnement."""
+        debit = debit if debit is not None else float(os.getenv("ADMISSION_DEBIT", "0"))
+        rafale = rafale if rafale is not None else float(os.getenv("ADMISSION_RAFALE", 2 * debit))
+        validite = validite if validite is not None else float(os.getenv("ADMISSION_VALIDITE", "3600"))
+        if debit > 0 and rafale < 1:
+            raise ValueError("ADMISSION_RAFALE doit permettre au moins une admission.")
+        return debit, rafale, validite
+
+    @staticmethod
+    def _ticket(file: str, place: Tuple[int, EtatFileModel], debit: float) -> TicketAdmissionModel:
+        """Place d'un client (ticket, état de la file) : rang et attente estimée au débit de la file."""
+        ticket, etat = place
+        position = max(ticket - etat.admis_jusqu_a, 0)
+        _EN_FILE.fixer(etat.dernier_ticket - etat.admis_jusqu_a, file=file)
+        return TicketAdmissionModel(
+            file=file,
+            ticket=ticket,
+            admis=position == 0,
+            position=position,
+            attente_estimee=max(position - etat.jetons, 0.0) / debit if position else 0.0,
+        )
+
+    @staticmethod
+    def _sans_file(file: str) -> TicketAdmissionModel:
+        return TicketAdmissionModel(file=file, ticket=0, admis=True, position=0, attente_estimee=0.0)
+
+    @staticmethod
+    def controler(ticket: Optional[TicketAdmissionModel]) -> TicketAdmissionModel:
+        """Lève ValueError si la place lue par `statut` n'est pas (encore) admise."""
+        if ticket is None:
+            _CONTROLES.inc(issue="refuse")
+            raise ValueError("Prenez d'abord un ticket dans la file d'attente.")
+        if not ticket.admis:
+            _CONTROLES.inc(issue="refuse")
+            raise ValueError(
+                f"Vous êtes en file d'attente (rang {ticket.position}, "
+                f"environ {ticket.attente_estimee:.0f} s)."
+            )
+        _CONTROLES.inc(issue="admis")
+        return ticket
+
+    # ---------- API ----------
+
+    def entrer(self, cle: str, file: str = FILE_RESERVATIONS) -> TicketAdmissionModel:
+        """Prend (ou reprend) un ticket dans la file et retourne la place du client."""
+        if not self.active:
+            return self._sans_file(file)
+        _ENTREES.inc(file=file)
+        place = self.dao.entrer(file, str(cle), self.debit, self.rafale, self.validite)
+        return self._ticket(file, place, self.debit)
+
+    def statut(self, cle: str, file: str = FILE_RESERVATIONS) -> Optional[TicketAdmissionModel]:
+        """Place actuelle du client, ou None s'il n'a pas de ticket valide."""
+        if not self.active:
+            return self._sans_file(file)
+        place = self.dao.consulter(file, str(cle), self.debit, self.rafale, self.validite)
+        return self._ticket(file, place, self.debit) if place else None
+
+    def verifier_admis(self, cle: str, file: str = FILE_RESERVATIONS) -> TicketAdmissionModel:
+        """Contrôle avant réservation : ValueError tant que le client n'est pas admis."""
+        return self.controler(self.statut(cle, file))
+
+    def vider(self, file: str = FILE_RESERVATIONS) -> bool:
+        """Ferme la file (fin de l'ouverture) : tous les tickets sont oubliés."""
+        return self.dao.vider(file)
+
+
+class AdmissionServiceAsync:
+    """
+    Pendant asyncio d'AdmissionService (mêmes réglages et règles), au-dessus
+    d'AdmissionDaoAsync (ou AdmissionMemoireDaoAsync).
+    """
+
+    def __init__(
+        self,
+        dao=None,
+        debit: Optional[float] = None,
+        rafale: Optional[float] = None,
+        validite: Optional[float] = None,
+    ):
+        self.dao = dao or (AdmissionDaoAsync() if _stockage() == "postgres" else AdmissionMemoireDaoAsync())
+        self.debit, self.rafale, self.validite = AdmissionService._reglages(debit, rafale, validite)
+
+    @property
+    def active(self) -> bool:
+        return self.debit > 0
+
+    controler = staticmethod(AdmissionService.controler)
+
+    async def entrer(self, cle: str, file: str = FILE_RESERVATIONS) -> TicketAdmissionModel:
+        if not self.active:
+            return AdmissionService._sans_file(file)
+        _ENTREES.inc(file=file)
+        place = await self.dao.entrer(file, str(cle), self.debit, self.rafale, self.validite)
+        return AdmissionService._ticket(file, place, self.debit)
+
+    async def statut(self, cle: str, file: str = FILE_RESERVATIONS) -> Optional[TicketAdmissionModel]:
+        if not self.active:
+            return AdmissionService._sans_file(file)
+        place = await self.dao.consulter(file, str(cle), self.debit, self.rafale, self.validite)
+        return AdmissionService._ticket(file, place, self.debit) if place else None
+
+    async def verifier_admis(self, cle: str, file: str = FILE_RESERVATIONS) -> TicketAdmissionModel:
+        return self.controler(await self.statut(cle, file))
+
+    async def vider(self, file: str = FILE_RESERVATIONS) -> bool:
+        return await self.dao.vider(file)
@@ -1,17 +1,27 @@
 # service/bus_service.py
-from typing import List, Optional
-from dao.bus_dao import CreneauBusDao
-from model.creneau_bus import CreneauBus
+from typing import Dict, List, Optional
+from business_object.CreneauBus import CreneauBus
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.creneau_bus_dao import CreneauBusDao
+from model.bus_models import AffectationBusModel
 
 
 class CreneauBusService:
     """
     Service pour la gestion des créneaux de bus (table `bus`).
     Contient la logique métier et délègue les opérations au DAO.
+
+    Ajouter, agrandir, réduire, déplacer ou supprimer un bus redistribue les places
+    de l'événement concerné (AffectationBusDao.repartir) : les demandes en attente
+    sont servies, et un bus réduit rend ses dernières places.
     """
 
-    def __init__(self):
-        self.dao = CreneauBusDao()
+    def __init__(self, dao: Optional[CreneauBusDao] = None, affectations: Optional[AffectationBusDao] = None):
+        self.dao = dao or CreneauBusDao()
+        self.affectations = affectations or AffectationBusDao()
+
+    def _repartir(self, *evenements: Optional[int]) -> None:
+        self.affectations.repartir([e for e in evenements if e is not None])
 
     # ---------- CREATE ----------
     def create_bus(self, bus: CreneauBus) -> CreneauBus:
@@ -28,7 +38,8 @@ class CreneauBusService:
         created = self.dao.create(bus)
         if not created:
             raise ValueError("Erreur lors de la création du bus.")
-        return created
+        self._repartir(created.fk_evenement)
+        return self.dao.find_by_id(created.id_bus) or created
 
     # ---------- READ ----------
     def get_all_buses(self, limit: int = 100, offset: int = 0) -> List[CreneauBus]:
@@ -43,9 +54,17 @@ class CreneauBusService:
         return bus
 
     def get_buses_by_event(self, id_evenement: int) -> List[CreneauBus]:
-        """Retourne tous les bus liés à un événement."""
+        """Retourne tous les bus liés à un événement, avec leurs inscrits (1 requête)."""
         return self.dao.find_by_event(id_evenement)
 
+    def get_affectations(self, id_reservation: int) -> List[AffectationBusModel]:
+        """Places de bus obtenues par une réservation (aller, retour)."""
+        return self.affectations.find_by_reservation(id_reservation)
+
+    def get_demandes_en_attente(self, id_evenement: int) -> Dict[str, int]:
+        """Demandes de bus sans place pour un événement, par sens."""
+        return self.affectations.en_attente(id_evenement)
+
     def get_bus_by_description(self, description: str) -> CreneauBus:
         """Retourne un bus par sa description."""
         bus = self.dao.find_by_description(description)
@@ -55,41 +74,51 @@ class CreneauBusService:
 
     # ---------- UPDATE ----------
     def update_bus(self, bus: CreneauBus) -> CreneauBus:
-        """Met à jour un bus existant (tous champs)."""
-        existing = self.dao.find_by_id(bus.id_bus)
-        if not existing:
-            raise ValueError("Impossible de mettre à jour : bus introuvable.")
+        """
+        Met à jour un bus existant (tous champs), sans lecture préalable : la mise à
+        jour renvoie aussi l'événement quitté, dont les places sont redistribuées.
+        Le bus n'est relu que si l'écriture échoue, pour expliquer l'échec.
+        """
         if bus.nombre_places <= 0:
             raise ValueError("Le nombre de places doit être supérieur à zéro.")
-        if bus.description != existing.description and self.dao.exists_description(bus.description):
-            raise ValueError(f"Un autre bus utilise déjà la description '{bus.description}'.")
 
-        updated = self.dao.update(bus)
-        if not updated:
+        issue = self.dao.update(bus)
+        if issue is None:
+            existing = self.dao.find_by_id(bus.id_bus)
+            if existing and bus.description != existing.description and self.dao.exists_description(bus.description):
+                raise ValueError(f"Un autre bus utilise déjà la description '{bus.description}'.")
             raise ValueError("Erreur lors de la mise à jour du bus.")
-        return updated
+        if not issue.ecrite:
+            raise ValueError("Impossible de mettre à jour : bus introuvable.")
+        updated = issue.ligne
+        self._repartir(issue.fk_evenement, updated.fk_evenement)
+        return self.dao.find_by_id(updated.id_bus) or updated
 
     def update_places(self, id_bus: int, nombre_places: int) -> CreneauBus:
-        """Met à jour uniquement le nombre de places."""
+        """Met à jour uniquement le nombre de places (UPDATE ... RETURNING, sans lecture préalable)."""
         if nombre_places <= 0:
             raise ValueError("Le nombre de places doit être supérieur à zéro.")
-        existing = self.dao.find_by_id(id_bus)
-        if not existing:
-            raise ValueError("Bus introuvable pour mise à jour du nombre de places.")
         updated = self.dao.update_places(id_bus, nombre_places)
         if not updated:
-            raise ValueError("Erreur lors de la mise à jour du nombre de places.")
-        return updated
+            raise ValueError("Bus introuvable pour mise à jour du nombre de places.")
+        self._repartir(updated.fk_evenement)
+        return self.dao.find_by_id(id_bus) or updated
 
     # ---------- DELETE ----------
     def delete_bus(self, id_bus: int) -> bool:
         """Supprime un bus par son ID."""
-        existing = self.dao.find_by_id(id_bus)
-        if not existing:
+        issue = self.dao.delete(id_bus)
+        if not issue.ecrite:
             raise ValueError("Impossible de supprimer : bus introuvable.")
-        return self.dao.delete(id_bus)
+        # Les passagers du bus supprimé sont replacés dans les autres bus du même sens
+        self._repartir(issue.fk_evenement)
+        return True
 
     # ---------- HELPERS ----------
     def count_buses_for_event(self, id_evenement: int) -> int:
         """Retourne le nombre de bus pour un événement donné."""
         return self.dao.count_for_event(id_evenement)
+
+    def repartir(self, id_evenement: int) -> List[AffectationBusModel]:
+        """Redistribue les places de bus d'un événement ; retourne les places attribuées."""
+        return self.affectations.repartir([id_evenement])
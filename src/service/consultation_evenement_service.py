@@ -3,7 +3,44 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 
 from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.asynchrone.consultation_evenement_dao import ConsultationEvenementDaoAsync
 from model.evenement_models import EvenementModelOut
+from model.pagination_models import PageModel
+from utils.cache import CacheCatalogue, CacheTTL
+from utils.metriques import RegistreMetriques, mesurer
+
+_CONSULTATIONS = RegistreMetriques().histogramme(
+    "bde_consultations_duree_secondes",
+    "Lectures du catalogue d'événements (cache compris), par méthode et issue ; _count donne le débit.",
+    ("methode", "issue"),
+)
+RegistreMetriques().jauge(
+    "bde_cache_catalogue",
+    "Compteurs du cache du catalogue (succes, echecs, evictions, ..., taille).",
+    ("compteur",),
+    fonction=lambda: {(nom,): v for nom, v in CacheCatalogue().statistiques().items() if nom != "taux_succes"},
+)
+
+
+def _normaliser(**filtres: Any) -> Dict[str, Any]:
+    """
+    Filtres d'une lecture, normalisés une seule fois pour la clé de cache ET la requête :
+    chaînes nettoyées (vide = absent), ville en minuscules (la recherche par ville est
+    insensible à la casse ; catégorie et statut restent en égalité stricte).
+    """
+    normalises = {}
+    for nom, valeur in filtres.items():
+        if isinstance(valeur, str):
+            valeur = valeur.strip() or None
+            if valeur and nom == "ville":
+                valeur = valeur.lower()
+        normalises[nom] = valeur
+    return normalises
+
+
+def _cle(methode: str, filtres: Dict[str, Any]) -> tuple:
+    """Clé de cache d'une lecture : méthode et filtres normalisés, triés par nom."""
+    return (methode, tuple(sorted(filtres.items())))
 
 
 class ConsultationEvenementService:
@@ -11,12 +48,17 @@ class ConsultationEvenementService:
     Service de lecture seule pour la consultation des événements.
     Fournit une couche métier au-dessus du DAO pour filtrer, valider
     et présenter les données de manière sécurisée.
+
+    Les lectures passent par le cache du catalogue (CacheCatalogue), invalidé
+    par les écritures d'EvenementService et de ReservationService.
     """
 
-    def __init__(self):
-        self.dao = ConsultationEvenementDao()
+    def __init__(self, dao: Optional[ConsultationEvenementDao] = None, cache: Optional[CacheTTL] = None):
+        self.dao = dao or ConsultationEvenementDao()
+        self.cache = cache if cache is not None else CacheCatalogue()
 
     # ---------- LISTES SIMPLES ----------
+    @mesurer(_CONSULTATIONS)
     def lister_tous(
         self,
         limit: int = 100,
@@ -25,8 +67,13 @@ class ConsultationEvenementService:
     ) -> List[EvenementModelOut]:
         """Liste paginée de tous les événements (triés)."""
         self._validate_order_by(order_by)
-        return self.dao.lister_tous(limit=limit, offset=offset, order_by=order_by)
+        filtres = _normaliser(limit=limit, offset=offset, order_by=order_by)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_tous", filtres),
+            lambda: self.dao.lister_tous(**filtres),
+        )
 
+    @mesurer(_CONSULTATIONS)
     def lister_disponibles(
         self,
         limit: int = 100,
@@ -34,9 +81,14 @@ class ConsultationEvenementService:
         a_partir_du: Optional[date] = None,
     ) -> List[EvenementModelOut]:
         """Liste des événements disponibles (optionnellement à partir d'une date donnée)."""
-        return self.dao.lister_disponibles(limit=limit, offset=offset, a_partir_du=a_partir_du)
+        filtres = _normaliser(limit=limit, offset=offset, a_partir_du=a_partir_du)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_disponibles", filtres),
+            lambda: self.dao.lister_disponibles(**filtres),
+        )
 
     # ---------- RECHERCHE MULTI-FILTRES ----------
+    @mesurer(_CONSULTATIONS)
     def rechercher(
         self,
         ville: Optional[str] = None,
@@ -48,20 +100,13 @@ class ConsultationEvenementService:
         offset: int = 0,
     ) -> List[EvenementModelOut]:
         """Recherche d'événements selon différents filtres facultatifs."""
-        # Validation simple des bornes temporelles
-        if date_min and date_max and date_min > date_max:
-            raise ValueError("La date minimale ne peut pas être postérieure à la date maximale.")
-        return self.dao.rechercher(
-            ville=ville,
-            categorie=categorie,
-            statut=statut,
-            date_min=date_min,
-            date_max=date_max,
-            limit=limit,
-            offset=offset,
-        )
+        self._valider_dates(date_min, date_max)
+        filtres = _normaliser(ville=ville, categorie=categorie, statut=statut,
+                              date_min=date_min, date_max=date_max, limit=limit, offset=offset)
+        return self.cache.lire_ou_calculer(_cle("rechercher", filtres), lambda: self.dao.rechercher(**filtres))
 
     # ---------- LISTE AVEC PLACES RESTANTES ----------
+    @mesurer(_CONSULTATIONS)
     def lister_avec_places_restantes(
         self,
         limit: int = 100,
@@ -73,14 +118,99 @@ class ConsultationEvenementService:
         Liste les événements en y ajoutant la capacité restante
         (calculée à partir du nombre de réservations).
         """
-        return self.dao.lister_avec_places_restantes(
-            limit=limit,
-            offset=offset,
-            seulement_disponibles=seulement_disponibles,
-            a_partir_du=a_partir_du,
+        filtres = _normaliser(limit=limit, offset=offset, seulement_disponibles=seulement_disponibles,
+                              a_partir_du=a_partir_du)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_avec_places_restantes", filtres),
+            lambda: self.dao.lister_avec_places_restantes(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+
+    # ---------- PAGINATION PAR CURSEUR ----------
+    @mesurer(_CONSULTATIONS)
+    def lister_tous_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        """Page de tous les événements ; repasser `curseur_suivant` pour la page suivante."""
+        filtres = _normaliser(limit=limit, curseur=curseur)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_tous_page", filtres),
+            lambda: self.dao.lister_tous_page(**filtres),
         )
 
+    @mesurer(_CONSULTATIONS)
+    def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[EvenementModelOut]:
+        """Page des événements disponibles."""
+        filtres = _normaliser(limit=limit, curseur=curseur, a_partir_du=a_partir_du)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_disponibles_page", filtres),
+            lambda: self.dao.lister_disponibles_page(**filtres),
+        )
+
+    @mesurer(_CONSULTATIONS)
+    def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageModel[EvenementModelOut]:
+        """Page de résultats de recherche (mêmes filtres que rechercher)."""
+        self._valider_dates(date_min, date_max)
+        filtres = _normaliser(ville=ville, categorie=categorie, statut=statut,
+                              date_min=date_min, date_max=date_max, limit=limit, curseur=curseur)
+        return self.cache.lire_ou_calculer(
+            _cle("rechercher_page", filtres), lambda: self.dao.rechercher_page(**filtres)
+        )
+
+    @mesurer(_CONSULTATIONS)
+    def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[Dict[str, Any]]:
+        """Page des événements avec leurs places restantes."""
+        filtres = _normaliser(limit=limit, curseur=curseur, seulement_disponibles=seulement_disponibles,
+                              a_partir_du=a_partir_du)
+        return self.cache.lire_ou_calculer(
+            _cle("lister_avec_places_restantes_page", filtres),
+            lambda: self.dao.lister_avec_places_restantes_page(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+
+    @mesurer(_CONSULTATIONS)
+    def get_evenement_avec_places_restantes(self, id_evenement: int) -> Dict[str, Any]:
+        """Retourne un événement et ses places restantes, ou lève une erreur s'il n'existe pas."""
+        filtres = _normaliser(id_evenement=id_evenement)
+        evenement = self.cache.lire_ou_calculer(
+            _cle("trouver_avec_places_restantes", filtres),
+            lambda: self.dao.trouver_avec_places_restantes(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+        if not evenement:
+            raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
+        return evenement
+
+    # ---------- CACHE ----------
+    def statistiques_cache(self) -> Dict[str, Any]:
+        """Compteurs du cache du catalogue (succès, échecs, taux_succes, taille, ...)."""
+        return self.cache.statistiques()
+
     # ---------- VALIDATION INTERNE ----------
+    @staticmethod
+    def _valider_dates(date_min: Optional[date], date_max: Optional[date]) -> None:
+        """Validation simple des bornes temporelles d'une recherche."""
+        if date_min and date_max and date_min > date_max:
+            raise ValueError("La date minimale ne peut pas être postérieure à la date maximale.")
+
     def _validate_order_by(self, order_by: str) -> None:
         """Valide le champ de tri pour éviter les injections SQL."""
         champs_valides = {
@@ -97,3 +227,119 @@ class ConsultationEvenementService:
             # Vérifie que les noms de colonnes appartiennent à la liste blanche
             if token.lower() not in {"asc", "desc"} and token not in champs_valides:
                 raise ValueError(f"Champ de tri invalide : {token}")
+
+
+class ConsultationEvenementServiceAsync:
+    """
+    Pendant asyncio de ConsultationEvenementService (listes paginées par curseur),
+    au-dessus de ConsultationEvenementDaoAsync. Partage le cache du catalogue
+    (et ses clés) avec le service synchrone.
+    """
+
+    def __init__(self, dao: Optional[ConsultationEvenementDaoAsync] = None, cache: Optional[CacheTTL] = None):
+        self.dao = dao or ConsultationEvenementDaoAsync()
+        self.cache = cache if cache is not None else CacheCatalogue()
+
+    async def _lire_ou_calculer(self, cle: tuple, calcul, etiquettes=None):
+        trouve, valeur = self.cache.lire(cle)
+        if not trouve:
+            generation = self.cache.generation()
+            valeur = await calcul()
+            self.cache.ecrire(cle, valeur, etiquettes(valeur) if etiquettes else (), generation)
+        return valeur
+
+    @mesurer(_CONSULTATIONS)
+    async def lister_tous_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        filtres = _normaliser(limit=limit, curseur=curseur)
+        return await self._lire_ou_calculer(
+            _cle("lister_tous_page", filtres),
+            lambda: self.dao.lister_tous_page(**filtres),
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def lister_disponibles(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        a_partir_du: Optional[date] = None,
+    ) -> List[EvenementModelOut]:
+        filtres = _normaliser(limit=limit, offset=offset, a_partir_du=a_partir_du)
+        return await self._lire_ou_calculer(
+            _cle("lister_disponibles", filtres),
+            lambda: self.dao.lister_disponibles(**filtres),
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[EvenementModelOut]:
+        filtres = _normaliser(limit=limit, curseur=curseur, a_partir_du=a_partir_du)
+        return await self._lire_ou_calculer(
+            _cle("lister_disponibles_page", filtres),
+            lambda: self.dao.lister_disponibles_page(**filtres),
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageModel[EvenementModelOut]:
+        ConsultationEvenementService._valider_dates(date_min, date_max)
+        filtres = _normaliser(ville=ville, categorie=categorie, statut=statut,
+                              date_min=date_min, date_max=date_max, limit=limit, curseur=curseur)
+        return await self._lire_ou_calculer(
+            _cle("rechercher_page", filtres), lambda: self.dao.rechercher_page(**filtres)
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def lister_avec_places_restantes(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        filtres = _normaliser(limit=limit, offset=offset, seulement_disponibles=seulement_disponibles,
+                              a_partir_du=a_partir_du)
+        return await self._lire_ou_calculer(
+            _cle("lister_avec_places_restantes", filtres),
+            lambda: self.dao.lister_avec_places_restantes(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageModel[Dict[str, Any]]:
+        filtres = _normaliser(limit=limit, curseur=curseur, seulement_disponibles=seulement_disponibles,
+                              a_partir_du=a_partir_du)
+        return await self._lire_ou_calculer(
+            _cle("lister_avec_places_restantes_page", filtres),
+            lambda: self.dao.lister_avec_places_restantes_page(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+
+    @mesurer(_CONSULTATIONS)
+    async def get_evenement_avec_places_restantes(self, id_evenement: int) -> Dict[str, Any]:
+        filtres = _normaliser(id_evenement=id_evenement)
+        evenement = await self._lire_ou_calculer(
+            _cle("trouver_avec_places_restantes", filtres),
+            lambda: self.dao.trouver_avec_places_restantes(**filtres),
+            CacheCatalogue.etiquettes_places,
+        )
+        if not evenement:
+            raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
+        return evenement
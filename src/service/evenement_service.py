@@ -1,7 +1,11 @@
 # src/service/evenement_service.py
 from typing import List, Optional
 from dao.evenement_dao import EvenementDao
+from dao.asynchrone.evenement_dao import EvenementDaoAsync
 from model.evenement_models import EvenementModelIn, EvenementModelOut
+from model.pagination_models import PageModel
+from service.reservation_service import ReservationService, ReservationServiceAsync
+from utils.cache import CacheCatalogue
 
 
 class EvenementService:
@@ -10,14 +14,31 @@ class EvenementService:
     Contient la logique métier au-dessus du DAO.
     """
 
-    def __init__(self):
-        self.dao = EvenementDao()
+    def __init__(self, dao: Optional[EvenementDao] = None, reservations: Optional[ReservationService] = None):
+        self.dao = dao or EvenementDao()
+        self.reservations = reservations or ReservationService()
+        # Toute écriture peut faire entrer ou sortir l'événement de n'importe quelle liste
+        self.cache = CacheCatalogue()
+
+    @staticmethod
+    def _valider_creation(evenement_in: EvenementModelIn) -> None:
+        """Validation minimale d'un nouvel événement (partagée avec EvenementServiceAsync)."""
+        if not evenement_in.titre or evenement_in.titre.strip() == "":
+            raise ValueError("Le titre de l'événement est obligatoire.")
+        if not evenement_in.date_evenement:
+            raise ValueError("La date de l'événement est obligatoire.")
+        if evenement_in.capacite is None or evenement_in.capacite <= 0:
+            raise ValueError("La capacité doit être un entier positif obligatoire.")
 
     # ---------- READ ----------
     def get_all_events(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
         """Récupère tous les événements (paginés)."""
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_events_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        """Récupère une page d'événements (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_event_by_id(self, id_evenement: int) -> EvenementModelOut:
         """Récupère un événement par son ID, ou lève une erreur s’il n’existe pas."""
         event = self.dao.find_by_id(id_evenement)
@@ -40,31 +61,80 @@ class EvenementService:
     # ---------- CREATE ----------
     def create_event(self, evenement_in: EvenementModelIn) -> EvenementModelOut:
         """Crée un nouvel événement, avec validation minimale."""
-        if not evenement_in.titre or evenement_in.titre.strip() == "":
-            raise ValueError("Le titre de l'événement est obligatoire.")
-        if not evenement_in.date_evenement:
-            raise ValueError("La date de l'événement est obligatoire.")
-        if evenement_in.capacite is None or evenement_in.capacite <= 0:
-            raise ValueError("La capacité doit être un entier positif obligatoire.")
-            
-        return self.dao.create(evenement_in)
+        self._valider_creation(evenement_in)
+        created = self.dao.create(evenement_in)
+        self.cache.vider()
+        return created
 
     # ---------- UPDATE ----------
     def update_event(self, evenement_out: EvenementModelOut) -> EvenementModelOut:
-        """Met à jour un événement existant."""
-        existing = self.dao.find_by_id(evenement_out.id_evenement)
-        if not existing:
-            raise ValueError("Impossible de mettre à jour : événement introuvable.")
-
+        """
+        Met à jour un événement existant. Une capacité augmentée profite d'abord
+        à la liste d'attente de l'événement. La mise à jour renvoie elle-même la
+        capacité précédente : pas de lecture préalable.
+        """
         updated = self.dao.update(evenement_out)
         if not updated:
-            raise ValueError("Erreur lors de la mise à jour de l'événement.")
+            raise ValueError("Impossible de mettre à jour : événement introuvable.")
+        self.cache.vider()
+        if updated.capacite > updated.capacite_precedente:
+            self.reservations.promouvoir_liste_attente(updated.id_evenement)
         return updated
 
     # ---------- DELETE ----------
     def delete_event(self, id_evenement: int) -> bool:
-        """Supprime un événement existant."""
-        existing = self.dao.find_by_id(id_evenement)
-        if not existing:
+        """Supprime un événement existant (une seule instruction, rowcount)."""
+        if not self.dao.delete(id_evenement):
+            raise ValueError("Impossible de supprimer : événement introuvable.")
+        self.cache.vider()
+        return True
+
+
+class EvenementServiceAsync:
+    """
+    Pendant asyncio d'EvenementService (mêmes règles métier), au-dessus d'EvenementDaoAsync.
+    """
+
+    def __init__(
+        self, dao: Optional[EvenementDaoAsync] = None, reservations: Optional[ReservationServiceAsync] = None
+    ):
+        self.dao = dao or EvenementDaoAsync()
+        self.reservations = reservations or ReservationServiceAsync()
+        self.cache = CacheCatalogue()
+
+    # ---------- READ ----------
+    async def get_all_events(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
+        return await self.dao.find_all(limit=limit, offset=offset)
+
+    async def get_events_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[EvenementModelOut]:
+        return await self.dao.find_page(limit=limit, curseur=curseur)
+
+    async def get_event_by_id(self, id_evenement: int) -> EvenementModelOut:
+        event = await self.dao.find_by_id(id_evenement)
+        if not event:
+            raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
+        return event
+
+    # ---------- CREATE ----------
+    async def create_event(self, evenement_in: EvenementModelIn) -> EvenementModelOut:
+        EvenementService._valider_creation(evenement_in)
+        created = await self.dao.create(evenement_in)
+        self.cache.vider()
+        return created
+
+    # ---------- UPDATE ----------
+    async def update_event(self, evenement_out: EvenementModelOut) -> EvenementModelOut:
+        updated = await self.dao.update(evenement_out)
+        if not updated:
+            raise ValueError("Impossible de mettre à jour : événement introuvable.")
+        self.cache.vider()
+        if updated.capacite > updated.capacite_precedente:
+            await self.reservations.promouvoir_liste_attente(updated.id_evenement)
+        return updated
+
+    # ---------- DELETE ----------
+    async def delete_event(self, id_evenement: int) -> bool:
+        if not await self.dao.delete(id_evenement):
             raise ValueError("Impossible de supprimer : événement introuvable.")
-        return self.dao.delete(id_evenement)
+        self.cache.vider()
+        return True
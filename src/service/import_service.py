@@ -0,0 +1,161 @@
+# service/import_service.py
+import csv
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from dao.import_dao import ImportDao, Ligne
+from model.evenement_models import EvenementModelIn
+from model.import_models import ChargementModel, ErreurLigneModel, RapportImportModel
+from model.reservation_models import ReservationModelIn
+from model.utilisateur_models import UtilisateurModelIn
+from utils.securite import HachageMotDePasse
+
+# Ligne lue : (numéro, valeurs brutes), ou erreur de lecture (JSON invalide)
+LigneLue = Union[Tuple[int, Dict[str, Any]], ErreurLigneModel]
+
+# table -> (modèle de validation, clé d'unicité dans le fichier et en base)
+_TABLES: Dict[str, Tuple[Type[BaseModel], Callable[[Dict[str, Any]], tuple]]] = {
+    "utilisateurs": (UtilisateurModelIn, lambda v: (v["email"],)),
+    "evenements": (EvenementModelIn, lambda v: (v["titre"], v["date_evenement"])),
+    "reservations": (ReservationModelIn, lambda v: (v["fk_utilisateur"], v["fk_evenement"])),
+}
+
+
+def lire_csv(fichier: TextIO) -> Iterator[LigneLue]:
+    """Lignes d'un CSV avec en-tête ; une cellule vide vaut None (champ absent)."""
+    lecteur = csv.DictReader(fichier)
+    for valeurs in lecteur:
+        yield lecteur.line_num, {k: (v if v != "" else None) for k, v in valeurs.items() if k}
+
+
+def lire_jsonl(fichier: TextIO) -> Iterator[LigneLue]:
+    """Lignes d'un fichier JSON Lines (un objet par ligne, lignes vides ignorées)."""
+    for numero, texte in enumerate(fichier, start=1):
+        if not texte.strip():
+            continue
+        try:
+            valeurs = json.loads(texte)
+        except json.JSONDecodeError as exc:
+            yield ErreurLigneModel(ligne=numero, erreur=f"JSON invalide : {exc.msg}.")
+            continue
+        if not isinstance(valeurs, dict):
+            yield ErreurLigneModel(ligne=numero, erreur="Objet JSON attendu.")
+            continue
+        yield numero, valeurs
+
+
+def _resume_validation(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'ligne'} : {e['msg']}" for e in exc.errors())
+
+
+class ImportService:
+    """
+    Import en masse d'utilisateurs, d'événements ou de réservations depuis un
+    CSV ou un JSON Lines (utils/import_donnees.py).
+
+    Chaque ligne est validée par le modèle d'entrée de sa table
+    (UtilisateurModelIn, EvenementModelIn, ReservationModelIn) ; les lignes valides
+    sont chargées par lots de IMPORT_LOT (5000) via COPY (ImportDao), les mots de
+    passe d'un lot étant hachés en parallèle (HachageMotDePasse.hacher_plusieurs).
+
+    Une ligne invalide, en double dans le fichier, ou refusée par la base est
+    rapportée avec son numéro, sans interrompre l'import.
+    """
+
+    TABLES = tuple(_TABLES)
+
+    def __init__(
+        self,
+        dao: Optional[ImportDao] = None,
+        hachage: Optional[HachageMotDePasse] = None,
+        taille_lot: Optional[int] = None,
+    ):
+        self.dao = dao or ImportDao()
+        self.hachage = hachage or HachageMotDePasse()
+        self.taille_lot = taille_lot or int(os.getenv("IMPORT_LOT", "5000"))
+
+    # ---------- Lecture ----------
+    @staticmethod
+    def lire(fichier: TextIO, format_entree: str) -> Iterator[LigneLue]:
+        """Lignes d'un fichier 'csv' ou 'jsonl'."""
+        if format_entree == "csv":
+            return lire_csv(fichier)
+        if format_entree == "jsonl":
+            return lire_jsonl(fichier)
+        raise ValueError(f"Format inconnu : {format_entree} (csv ou jsonl).")
+
+    # ---------- Chargement ----------
+    def _charger_lot(self, table: str, lot: List[Ligne]) -> ChargementModel:
+        if table == "evenements":
+            return self.dao.charger_evenements(lot)
+        if table == "reservations":
+            return self.dao.charger_reservations(lot)
+
+        # Un compte existant garde son mot de passe : inutile de payer son bcrypt
+        existants = self.dao.emails_existants([v["email"] for _, v in lot])
+        nouveaux = [v for _, v in lot if v["email"] not in existants]
+        for valeurs, hache in zip(nouveaux, self.hachage.hacher_plusieurs([v["mot_de_passe"] for v in nouveaux])):
+            valeurs["mot_de_passe"] = hache
+        for _, valeurs in lot:
+            if valeurs["email"] in existants:
+                valeurs["mot_de_passe"] = None
+        return self.dao.charger_utilisateurs(lot)
+
+    def importer(self, table: str, lignes: Iterable[LigneLue]) -> RapportImportModel:
+        """
+        Valide et charge les lignes (lues par `lire`), lot par lot.
+        Retourne le rapport : lignes lues, créées, mises à jour, erreurs par ligne et débit.
+        """
+        if table not in _TABLES:
+            raise ValueError(f"Table inconnue : {table} ({', '.join(self.TABLES)}).")
+        modele, cle = _TABLES[table]
+
+        debut = time.perf_counter()
+        lues, creees, mises_a_jour = 0, 0, 0
+        erreurs: List[ErreurLigneModel] = []
+        vues: Dict[tuple, int] = {}
+        lot: List[Ligne] = []
+
+        def charger():
+            nonlocal creees, mises_a_jour
+            resultat = self._charger_lot(table, lot)
+            creees += resultat.creees
+            mises_a_jour += resultat.mises_a_jour
+            erreurs.extend(resultat.erreurs)
+            lot.clear()
+
+        for ligne in lignes:
+            lues += 1
+            if isinstance(ligne, ErreurLigneModel):
+                erreurs.append(ligne)
+                continue
+            numero, brutes = ligne
+            try:
+                valeurs = modele.model_validate(brutes).model_dump()
+            except ValidationError as exc:
+                erreurs.append(ErreurLigneModel(ligne=numero, erreur=_resume_validation(exc)))
+                continue
+            premiere = vues.setdefault(cle(valeurs), numero)
+            if premiere != numero:
+                erreurs.append(ErreurLigneModel(ligne=numero, erreur=f"Doublon de la ligne {premiere}."))
+                continue
+            lot.append((numero, valeurs))
+            if len(lot) >= self.taille_lot:
+                charger()
+        if lot:
+            charger()
+
+        duree = time.perf_counter() - debut
+        return RapportImportModel(
+            table=table,
+            lues=lues,
+            creees=creees,
+            mises_a_jour=mises_a_jour,
+            erreurs=sorted(erreurs, key=lambda e: e.ligne),
+            duree=duree,
+            debit=lues / duree if duree > 0 else 0.0,
+        )
@@ -0,0 +1,126 @@
+# service/notification_service.py
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from dao.reservation_dao import ReservationDao
+from model.email_models import RapportNotificationModel, StatutDestinataireModel
+from service.outbox_email_service import OutboxEmailService
+from utils.api_brevo import send_batch_brevo
+
+
+class NotificationService:
+    """
+    Notifications groupées aux inscrits d'un événement (annulation, changement de bus...).
+
+    Les inscrits sont lus en une requête, puis découpés en lots envoyés chacun en
+    un seul appel Brevo (`messageVersions`), `concurrence` lots à la fois, sur la
+    session HTTP partagée (keep-alive). Un lot en échec temporaire est retenté
+    (`tentatives` au plus) ; le rapport donne le statut de chaque destinataire.
+
+    BREVO_LOT (100 par défaut, 1000 au plus) et BREVO_CONCURRENCE (4 par défaut).
+    """
+
+    def __init__(
+        self,
+        dao: Optional[ReservationDao] = None,
+        envoyer_lot: Callable[[Sequence[Dict[str, str]], str, str], Tuple[int, str]] = send_batch_brevo,
+        taille_lot: Optional[int] = None,
+        concurrence: Optional[int] = None,
+        tentatives: int = 3,
+    ):
+        self.dao = dao or ReservationDao()
+        self.envoyer_lot = envoyer_lot
+        self.taille_lot = min(taille_lot or int(os.getenv("BREVO_LOT", "100")), 1000)
+        self.concurrence = concurrence or int(os.getenv("BREVO_CONCURRENCE", "4"))
+        self.tentatives = tentatives
+
+    def notifier_evenement(
+        self,
+        id_evenement: int,
+        sujet: str,
+        contenu: str,
+        seulement: Optional[str] = None,
+    ) -> RapportNotificationModel:
+        """
+        Envoie `sujet` / `contenu` à tous les inscrits de l'événement.
+        `seulement` ('bus_aller' ou 'bus_retour') restreint aux inscrits de ce bus.
+        `contenu` peut utiliser {{ params.prenom }} et {{ params.nom }}.
+        """
+        return self.envoyer(self.destinataires_evenement(id_evenement, seulement), sujet, contenu)
+
+    def destinataires_evenement(self, id_evenement: int, seulement: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Inscrits de l'événement (une requête), sans doublon d'adresse.
+        À lire avant de supprimer l'événement, dont les réservations partent en cascade.
+        """
+        if seulement not in (None, "bus_aller", "bus_retour"):
+            raise ValueError(f"Filtre de destinataires inconnu : {seulement}")
+
+        destinataires: Dict[str, Dict[str, str]] = {}
+        for i in self.dao.find_by_event_with_users(id_evenement):
+            if seulement is None or getattr(i, seulement):
+                destinataires.setdefault(i.email.lower(), {"email": i.email, "nom": i.nom, "prenom": i.prenom})
+        return list(destinataires.values())
+
+    def envoyer(self, destinataires: List[Dict[str, str]], sujet: str, contenu: str) -> RapportNotificationModel:
+        """Envoie par lots concurrents et retourne le rapport par destinataire."""
+        if not sujet or not sujet.strip() or not contenu or not contenu.strip():
+            raise ValueError("Le sujet et le contenu de la notification sont obligatoires.")
+
+        lots = [destinataires[i:i + self.taille_lot] for i in range(0, len(destinataires), self.taille_lot)]
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrence, len(lots)))) as executor:
+            resultats = list(executor.map(lambda lot: self._envoyer_lot(lot, sujet, contenu), lots))
+        duree = time.perf_counter() - t0
+
+        statuts = [s for statuts_lot, _ in resultats for s in statuts_lot]
+        nb_envoyes = sum(s.statut == "envoye" for s in statuts)
+        return RapportNotificationModel(
+            nb_destinataires=len(statuts),
+            nb_envoyes=nb_envoyes,
+            nb_echecs=len(statuts) - nb_envoyes,
+            nb_requetes=sum(n for _, n in resultats),
+            duree=duree,
+            debit=nb_envoyes / duree if duree > 0 else 0.0,
+            destinataires=statuts,
+        )
+
+    def _envoyer_lot(
+        self, lot: List[Dict[str, str]], sujet: str, contenu: str
+    ) -> Tuple[List[StatutDestinataireModel], int]:
+        """Envoie un lot (avec nouvelles tentatives). Retourne (statuts, nombre de requêtes)."""
+        detail = ""
+        for essai in range(1, self.tentatives + 1):
+            try:
+                code, texte = self.envoyer_lot(lot, sujet, contenu)
+            except Exception as exc:
+                code, texte, issue = None, f"{type(exc).__name__} : {exc}", "temporaire"
+            else:
+                issue = OutboxEmailService.classifier(code)
+
+            if issue == "envoye":
+                identifiants = self._identifiants_messages(texte, len(lot))
+                return [
+                    StatutDestinataireModel(email=d["email"], statut="envoye", detail=identifiant)
+                    for d, identifiant in zip(lot, identifiants)
+                ], essai
+
+            detail = texte if code is None else f"HTTP {code} : {str(texte)[:300]}"
+            if issue == "definitif":
+                break
+            if essai < self.tentatives:
+                time.sleep(0.5 * 2 ** (essai - 1))
+
+        return [StatutDestinataireModel(email=d["email"], statut="echec", detail=detail) for d in lot], essai
+
+    @staticmethod
+    def _identifiants_messages(texte: str, n: int) -> List[Optional[str]]:
+        """Identifiants Brevo des messages (`messageIds`, dans l'ordre des destinataires), si présents."""
+        try:
+            identifiants = json.loads(texte).get("messageIds") or []
+        except (ValueError, AttributeError):
+            identifiants = []
+        return (list(identifiants) + [None] * n)[:n]
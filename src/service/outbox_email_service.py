@@ -0,0 +1,169 @@
+# service/outbox_email_service.py
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from dao.email_outbox_dao import EmailOutboxDao
+from model.email_models import EmailOutboxModelOut
+from utils.api_brevo import send_email_brevo
+from utils.metriques import RegistreMetriques
+
+_ISSUES = RegistreMetriques().compteur(
+    "bde_emails_outbox_total", "E-mails traités par la boîte d'envoi, par issue (envoye, replanifie, abandonne).",
+    ("issue",),
+)
+
+
+class OutboxEmailService:
+    """
+    Vide la boîte d'envoi des e-mails (table email_outbox) : les vues et services
+    y déposent les e-mails dans la transaction de l'action, ce service les envoie
+    en arrière-plan. L'utilisateur n'attend donc jamais Brevo, et une panne de
+    Brevo ne bloque pas les réservations : les e-mails attendent dans la table.
+
+    - lots : `taille_lot` e-mails pris en une requête (SKIP LOCKED : plusieurs
+      processus peuvent tourner en parallèle), envoyés par `nb_workers` threads ;
+    - échec temporaire (réseau, HTTP 408 / 429 / 5xx) : nouvelle tentative après
+      un délai exponentiel (delai_base * 2^(n-1), plafonné à delai_max, avec aléa) ;
+    - échec définitif (autre 4xx) ou `max_tentatives` atteint : lettre morte
+      (statut 'abandonne'), à consulter et relancer via utils/worker_emails.py ;
+    - entretien : la boucle de fond lance aussi, toutes les `intervalle_entretien`
+      secondes, les tâches de `entretien` (purges des lignes expirées, ...).
+
+    Paramètres par défaut (variables d'environnement) : OUTBOX_WORKERS (4),
+    OUTBOX_LOT (20), OUTBOX_MAX_TENTATIVES (8), OUTBOX_DELAI_BASE (5 s),
+    OUTBOX_DELAI_MAX (3600 s), OUTBOX_BAIL (300 s), OUTBOX_ENTRETIEN (3600 s).
+    """
+
+    def __init__(
+        self,
+        dao: Optional[EmailOutboxDao] = None,
+        envoyer: Callable[[str, str, str], Tuple[int, str]] = send_email_brevo,
+        nb_workers: Optional[int] = None,
+        taille_lot: Optional[int] = None,
+        max_tentatives: Optional[int] = None,
+        delai_base: Optional[float] = None,
+        delai_max: Optional[float] = None,
+        entretien: Sequence[Callable[[], int]] = (),
+    ):
+        self.dao = dao or EmailOutboxDao()
+        self.envoyer = envoyer
+        self.nb_workers = nb_workers or int(os.getenv("OUTBOX_WORKERS", "4"))
+        self.taille_lot = taille_lot or int(os.getenv("OUTBOX_LOT", "20"))
+        self.max_tentatives = max_tentatives or int(os.getenv("OUTBOX_MAX_TENTATIVES", "8"))
+        self.delai_base = delai_base if delai_base is not None else float(os.getenv("OUTBOX_DELAI_BASE", "5"))
+        self.delai_max = delai_max if delai_max is not None else float(os.getenv("OUTBOX_DELAI_MAX", "3600"))
+        self.bail = float(os.getenv("OUTBOX_BAIL", "300"))
+        self.entretien = list(entretien)
+        self.intervalle_entretien = float(os.getenv("OUTBOX_ENTRETIEN", "3600"))
+        self._executor = ThreadPoolExecutor(max_workers=self.nb_workers, thread_name_prefix="outbox")
+        self._arret = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- Règles d'envoi ----------
+    @staticmethod
+    def classifier(code_http: int) -> str:
+        """'envoye', 'temporaire' (à retenter) ou 'definitif' (inutile de retenter)."""
+        if 200 <= code_http < 300:
+            return "envoye"
+        if code_http in (408, 429) or code_http >= 500 or code_http < 400:
+            return "temporaire"
+        return "definitif"
+
+    def delai_avant(self, tentatives: int) -> float:
+        """Délai avant la tentative suivante : exponentiel plafonné, la moitié tirée au hasard."""
+        delai = min(self.delai_max, self.delai_base * 2 ** max(tentatives - 1, 0))
+        return delai / 2 + random.random() * delai / 2
+
+    def _envoyer_un(self, email: EmailOutboxModelOut) -> Tuple[str, str]:
+        try:
+            code, texte = self.envoyer(email.destinataire, email.sujet, email.contenu)
+        except Exception as exc:
+            return "temporaire", f"{type(exc).__name__} : {exc}"
+        return self.classifier(code), f"HTTP {code} : {str(texte)[:500]}"
+
+    # ---------- Traitement ----------
+    def traiter_lot(self) -> Dict[str, int]:
+        """
+        Prend un lot, l'envoie en parallèle et enregistre les issues.
+        Retourne le nombre d'e-mails envoyés / replanifiés / abandonnés.
+        """
+        lot = self.dao.reserver_lot(self.taille_lot, self.bail)
+        issues: Counter = Counter()
+        if not lot:
+            return dict(issues)
+
+        envoyes = []
+        for email, (statut, detail) in zip(lot, self._executor.map(self._envoyer_un, lot)):
+            if statut == "envoye":
+                envoyes.append(email.id_email)
+            elif statut == "temporaire" and email.tentatives < self.max_tentatives:
+                self.dao.replanifier(email.id_email, detail, self.delai_avant(email.tentatives))
+                issues["replanifie"] += 1
+            else:
+                logging.warning(f"E-mail {email.id_email} abandonné après {email.tentatives} tentative(s) : {detail}")
+                self.dao.abandonner(email.id_email, detail)
+                issues["abandonne"] += 1
+
+        issues["envoye"] = self.dao.marquer_envoyes(envoyes)
+        for issue, nombre in issues.items():
+            _ISSUES.inc(nombre, issue=issue)
+        return dict(issues)
+
+    def vider(self) -> Dict[str, int]:
+        """Traite des lots jusqu'à ce qu'il n'y ait plus rien d'envoyable maintenant."""
+        total: Counter = Counter()
+        while True:
+            issues = self.traiter_lot()
+            if not issues:
+                return dict(total)
+            total.update(issues)
+
+    def entretenir(self) -> int:
+        """Lance chaque tâche d'entretien ; l'échec de l'une n'empêche pas les autres. Retourne le total supprimé."""
+        total = 0
+        for tache in self.entretien:
+            try:
+                total += tache()
+            except Exception as exc:
+                logging.exception(exc)
+        return total
+
+    # ---------- Arrière-plan ----------
+    def demarrer(self, intervalle: float = 2.0) -> threading.Thread:
+        """
+        Lance la boucle d'envoi dans un thread de fond (attente `intervalle` s quand la file est vide),
+        avec les tâches d'entretien dès le démarrage puis toutes les `intervalle_entretien` s.
+        """
+
+        def boucle():
+            prochain_entretien = time.monotonic()
+            while not self._arret.is_set():
+                if self.entretien and time.monotonic() >= prochain_entretien:
+                    self.entretenir()
+                    prochain_entretien = time.monotonic() + self.intervalle_entretien
+                try:
+                    issues = self.traiter_lot()
+                except Exception as exc:
+                    logging.exception(exc)
+                    issues = {}
+                if not issues:
+                    self._arret.wait(intervalle)
+
+        self._arret.clear()
+        self._thread = threading.Thread(target=boucle, name="outbox-email", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def arreter(self, attente: float = 10.0) -> None:
+        """Arrête la boucle (après le lot en cours) et les workers."""
+        self._arret.set()
+        if self._thread is not None:
+            self._thread.join(attente)
+            self._thread = None
+        self._executor.shutdown(wait=False)
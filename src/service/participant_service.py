@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from dao.participant_dao import ParticipantDao
 from model.participant_models import ParticipantModelIn, ParticipantModelOut
+from model.pagination_models import PageModel
 
 
 class ParticipantService:
@@ -18,6 +19,11 @@ class ParticipantService:
     def get_all_participants(self, limit: int = 100, offset: int = 0) -> List[ParticipantModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_participants_page(
+        self, limit: int = 100, curseur: Optional[str] = None
+    ) -> PageModel[ParticipantModelOut]:
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_participant_by_id(self, id_utilisateur: int) -> ParticipantModelOut:
         participant = self.dao.find_by_id(id_utilisateur)
         if not participant:
@@ -40,17 +46,16 @@ class ParticipantService:
 
     # ---------- UPDATE ----------
     def update_participant(self, participant_out: ParticipantModelOut) -> ParticipantModelOut:
-        existing = self.dao.find_by_id(participant_out.id_utilisateur)
-        if not existing:
+        updated = self.dao.update(participant_out)
+        if not updated:
             raise ValueError("Impossible de mettre à jour : participant introuvable.")
-        return self.dao.update(participant_out)
+        return updated
 
     # ---------- DELETE ----------
     def delete_participant(self, id_utilisateur: int) -> bool:
-        existing = self.dao.find_by_id(id_utilisateur)
-        if not existing:
+        if not self.dao.delete(id_utilisateur):
             raise ValueError("Impossible de supprimer : participant introuvable.")
-        return self.dao.delete(id_utilisateur)
+        return True
 
     # ---------- AUTH ----------
     def authenticate_participant(self, email: str, mot_de_passe: str) -> ParticipantModelOut:
@@ -60,7 +65,6 @@ class ParticipantService:
         return participant
 
     def change_participant_password(self, id_utilisateur: int, new_password: str) -> bool:
-        existing = self.dao.find_by_id(id_utilisateur)
-        if not existing:
+        if not self.dao.change_password(id_utilisateur, new_password):
             raise ValueError("Participant introuvable pour mise à jour du mot de passe.")
-        return self.dao.change_password(id_utilisateur, new_password)
+        return True
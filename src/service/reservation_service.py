@@ -1,17 +1,135 @@
 # src/service/reservation_service.py
+import os
+import time
 from typing import List, Optional
+from dao.liste_attente_dao import ListeAttenteDao
 from dao.reservation_dao import ReservationDao
-from model.reservation_models import ReservationModelIn, ReservationModelOut
+from dao.asynchrone.reservation_dao import ReservationDaoAsync
+from model.ecriture_models import EcritureModel
+from model.email_models import EmailModelIn
+from model.idempotence_models import CleIdempotenceModel
+from model.reservation_models import (
+    AttenteModelOut,
+    ReservationModelIn,
+    ReservationModelOut,
+    InscritModelOut,
+    PromotionModel,
+    ResultatReservationModel,
+)
+from utils.cache import CacheCatalogue
+from utils.metriques import RegistreMetriques
+
+_RESERVATIONS = RegistreMetriques().compteur(
+    "bde_reservations_total",
+    "Tentatives de réservation par issue (reservee, complet, doublon, evenement_introuvable, en_attente).",
+    ("statut",),
+)
+_PROMOTIONS = RegistreMetriques().compteur(
+    "bde_liste_attente_promotions_total",
+    "Demandes de la liste d'attente devenues réservations (place libérée ou capacité augmentée).",
+)
+_DUREE_RESERVATION = RegistreMetriques().histogramme(
+    "bde_reservation_duree_secondes", "Durée d'une tentative de réservation (aller-retour base compris)."
+)
+_VERIFICATIONS_DOUBLON = RegistreMetriques().compteur(
+    "bde_reservations_verifications_doublon_total",
+    "Vérifications « déjà réservé ? » avant réservation, par résultat (deja_reserve, libre).",
+    ("resultat",),
+)
+
+
+def _idempotence(cle: Optional[str]) -> Optional[CleIdempotenceModel]:
+    """Clé d'idempotence d'une écriture, valable IDEMPOTENCE_TTL secondes (86400 par défaut)."""
+    if not cle:
+        return None
+    return CleIdempotenceModel(cle=cle, ttl=int(os.getenv("IDEMPOTENCE_TTL", "86400")))
 
 
 class ReservationService:
     """
     Service pour la gestion des réservations.
     Contient la logique métier et la coordination avec le DAO.
+
+    Réserver, modifier et annuler acceptent une clé d'idempotence (`cle_idempotence`,
+    propre au client) : un client qui renvoie sa requête après un délai dépassé
+    obtient le résultat du premier essai, sans que l'opération soit rejouée ni
+    vérifiée à nouveau (pas de « réservation introuvable » sur une annulation
+    renvoyée). Clé et résultat sont écrits dans la transaction de l'opération.
     """
 
-    def __init__(self):
-        self.dao = ReservationDao()
+    def __init__(self, dao: Optional[ReservationDao] = None, liste_attente: Optional[ListeAttenteDao] = None):
+        self.dao = dao or ReservationDao()
+        self.liste_attente = liste_attente or ListeAttenteDao()
+        self.cache = CacheCatalogue()
+
+    @staticmethod
+    def _invalider_places(cache: CacheCatalogue, resultat: ResultatReservationModel, id_evenement: int) -> None:
+        """
+        Une réservation change les places restantes de son événement ; un refus « complet »
+        (ou une mise en liste d'attente) révèle des places en cache périmées
+        (réservations d'un autre processus).
+        """
+        if resultat.statut in ("reservee", "complet", "en_attente"):
+            cache.invalider_places(id_evenement)
+
+    @staticmethod
+    def _email_promotion(promue: PromotionModel) -> EmailModelIn:
+        """
+        E-mail de la réservation obtenue depuis la liste d'attente (partagé avec
+        ReservationServiceAsync) ; compte aussi la promotion. Appelé par le DAO,
+        dans la transaction qui crée la réservation.
+        """
+        _PROMOTIONS.inc()
+        return EmailModelIn(
+            destinataire=promue.email,
+            sujet="Une place s'est libérée — BDE Ensai",
+            contenu=(
+                f"Bonjour {promue.prenom} {promue.nom},\n\n"
+                f"Une place s'est libérée pour l’événement « {promue.titre} » du {promue.date_evenement} : "
+                f"votre demande en liste d'attente est devenue la réservation #{promue.id_reservation}.\n\n"
+                f"Options :\n"
+                f" - Bus aller : {'Oui' if promue.bus_aller else 'Non'}\n"
+                f" - Bus retour : {'Oui' if promue.bus_retour else 'Non'}\n"
+                f" - Adhérent : {'Oui' if promue.adherent else 'Non'}\n"
+                f" - SAM : {'Oui' if promue.sam else 'Non'}\n"
+                f" - Boisson : {'Oui' if promue.boisson else 'Non'}\n\n"
+                "Si vous ne souhaitez plus participer, vous pouvez annuler cette réservation.\n\n"
+                "— L’équipe du BDE Ensai"
+            ),
+        )
+
+    @staticmethod
+    def _compter(resultat: ResultatReservationModel, duree: float) -> None:
+        """Métriques d'une tentative de réservation (partagé avec ReservationServiceAsync)."""
+        _RESERVATIONS.inc(statut=resultat.statut)
+        _DUREE_RESERVATION.observer(duree)
+
+    @staticmethod
+    def _compter_verification(deja_reserve: bool) -> bool:
+        _VERIFICATIONS_DOUBLON.inc(resultat="deja_reserve" if deja_reserve else "libre")
+        return deja_reserve
+
+    @staticmethod
+    def _verifier_resultat(
+        resultat: ResultatReservationModel, reservation_in: ReservationModelIn
+    ) -> ReservationModelOut:
+        """Traduit l'issue d'une réservation en erreur métier (partagé avec ReservationServiceAsync)."""
+        if resultat.statut == "doublon":
+            raise ValueError("Vous avez déjà réservé une place pour cet événement.")
+        if resultat.statut == "complet":
+            raise ValueError("L'événement est complet.")
+        if resultat.statut == "evenement_introuvable":
+            raise ValueError(f"Aucun événement trouvé avec l'id {reservation_in.fk_evenement}.")
+        if resultat.statut == "en_attente":
+            raise ValueError(f"L'événement est complet : vous êtes en liste d'attente (rang {resultat.position}).")
+        return resultat.reservation
+
+    @staticmethod
+    def _verifier_suppression(issue: EcritureModel) -> bool:
+        """Lève ValueError si l'annulation n'a trouvé aucune réservation (partagé avec ReservationServiceAsync)."""
+        if not issue.ecrite:
+            raise ValueError("Impossible de supprimer : réservation introuvable.")
+        return True
 
     # ---------- READ ----------
     def get_reservations_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
@@ -22,6 +140,10 @@ class ReservationService:
         """Récupère toutes les réservations d'un événement."""
         return self.dao.find_by_event(id_evenement)
 
+    def get_inscrits_by_event(self, id_evenement: int) -> List[InscritModelOut]:
+        """Récupère les réservations d'un événement avec les coordonnées des inscrits (1 requête)."""
+        return self.dao.find_by_event_with_users(id_evenement)
+
     def get_reservation_by_id(self, id_reservation: int) -> ReservationModelOut:
         """Récupère une réservation par son ID."""
         reservation = self.dao.find_by_id(id_reservation)
@@ -30,25 +152,44 @@ class ReservationService:
         return reservation
 
     # ---------- CREATE ----------
-    def create_reservation(self, reservation_in: ReservationModelIn) -> ReservationModelOut:
+    def reserver(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        liste_attente: bool = False,
+        cle_idempotence: Optional[str] = None,
+    ) -> ResultatReservationModel:
+        """
+        Tente de réserver une place et renvoie l'issue typée
+        (reservee / complet / doublon / evenement_introuvable / en_attente) sans lever d'exception.
+        La vérification des places et l'insertion sont atomiques côté base.
+        `email` (confirmation) part via la boîte d'envoi si la place est attribuée.
+        Avec `liste_attente`, un événement complet inscrit la demande en liste d'attente.
+        """
+        t0 = time.perf_counter()
+        resultat = self.dao.reserver(
+            reservation_in, email=email, liste_attente=liste_attente, idempotence=_idempotence(cle_idempotence)
+        )
+        self._compter(resultat, time.perf_counter() - t0)
+        self._invalider_places(self.cache, resultat, reservation_in.fk_evenement)
+        return resultat
+
+    def create_reservation(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        cle_idempotence: Optional[str] = None,
+    ) -> ReservationModelOut:
         """
         Crée une nouvelle réservation.
 
         Règle métier :
         Un utilisateur ne peut pas réserver deux fois le même événement,
-        mais peut réserver plusieurs événements différents.
+        mais peut réserver plusieurs événements différents, dans la limite
+        de la capacité de l'événement.
         """
-        # Vérifie s’il existe déjà une réservation pour cet utilisateur + cet événement
-        existing_reservations = self.dao.find_by_user(reservation_in.fk_utilisateur)
-        for r in existing_reservations:
-            if r.fk_evenement == reservation_in.fk_evenement:
-                raise ValueError("Vous avez déjà réservé une place pour cet événement.")
-
-        # Si OK → création
-        reservation = self.dao.create(reservation_in)
-        if not reservation:
-            raise ValueError("Échec de la création de la réservation (erreur base de données).")
-        return reservation
+        resultat = self.reserver(reservation_in, email=email, cle_idempotence=cle_idempotence)
+        return self._verifier_resultat(resultat, reservation_in)
 
     # ---------- UPDATE ----------
     def update_reservation_flags(
@@ -60,12 +201,13 @@ class ReservationService:
         adherent: Optional[bool] = None,
         sam: Optional[bool] = None,
         boisson: Optional[bool] = None,
+        email: Optional[EmailModelIn] = None,
+        cle_idempotence: Optional[str] = None,
     ) -> ReservationModelOut:
-        """Met à jour les options (flags) d'une réservation existante."""
-        existing = self.dao.find_by_id(id_reservation)
-        if not existing:
-            raise ValueError("Impossible de mettre à jour : réservation introuvable.")
-
+        """
+        Met à jour les options (flags) d'une réservation existante (`email` : notification).
+        Une seule écriture (UPDATE ... RETURNING) : pas de lecture préalable.
+        """
         updated = self.dao.update_flags(
             id_reservation,
             bus_aller=bus_aller,
@@ -73,18 +215,75 @@ class ReservationService:
             adherent=adherent,
             sam=sam,
             boisson=boisson,
+            email=email,
+            idempotence=_idempotence(cle_idempotence),
         )
         if not updated:
-            raise ValueError("Erreur lors de la mise à jour de la réservation.")
+            raise ValueError("Impossible de mettre à jour : réservation introuvable.")
         return updated
 
     # ---------- DELETE ----------
-    def delete_reservation(self, id_reservation: int) -> bool:
-        """Supprime une réservation existante."""
-        existing = self.dao.find_by_id(id_reservation)
-        if not existing:
-            raise ValueError("Impossible de supprimer : réservation introuvable.")
-        return self.dao.delete(id_reservation)
+    def delete_reservation(
+        self, id_reservation: int, email: Optional[EmailModelIn] = None, cle_idempotence: Optional[str] = None
+    ) -> bool:
+        """
+        Supprime une réservation existante (`email` : confirmation d'annulation).
+        La place libérée revient, dans la même transaction, à la plus ancienne demande
+        de la liste d'attente, prévenue par e-mail.
+        Pas de lecture préalable : le DELETE ... RETURNING dit si la réservation
+        existait, et de quel événement invalider les places en cache.
+        """
+        issue = self.dao.delete(
+            id_reservation,
+            email=email,
+            email_promotion=self._email_promotion,
+            idempotence=_idempotence(cle_idempotence),
+        )
+        if issue.ecrite:
+            self.cache.invalider_places(issue.fk_evenement)
+        return self._verifier_suppression(issue)
+
+    def annulation_enregistree(self, cle_idempotence: Optional[str]) -> Optional[bool]:
+        """Issue d'une annulation déjà faite avec cette clé, ou None (clé inconnue, expirée ou absente)."""
+        idempotence = _idempotence(cle_idempotence)
+        if idempotence is None:
+            return None
+        deja = self.dao.resultat_enregistre(idempotence, ReservationDao.OPERATION_ANNULER)
+        return EcritureModel(**deja["valeur"]).ecrite if deja is not None else None
+
+    # ---------- LISTE D'ATTENTE ----------
+    def get_liste_attente(self, id_evenement: int) -> List[AttenteModelOut]:
+        """Liste d'attente d'un événement, dans l'ordre de service."""
+        return self.liste_attente.find_by_event(id_evenement)
+
+    def get_attentes_by_user(self, id_utilisateur: int) -> List[AttenteModelOut]:
+        """Demandes en liste d'attente d'un utilisateur, avec leur rang."""
+        return self.liste_attente.find_by_user(id_utilisateur)
+
+    def position_liste_attente(self, id_utilisateur: int, id_evenement: int) -> int:
+        """Rang de l'utilisateur dans la liste d'attente (0 s'il n'y est pas)."""
+        return self.liste_attente.position(id_utilisateur, id_evenement)
+
+    def quitter_liste_attente(self, id_utilisateur: int, id_evenement: int) -> bool:
+        """Retire l'utilisateur de la liste d'attente de l'événement."""
+        if not self.liste_attente.quitter(id_utilisateur, id_evenement):
+            raise ValueError("Aucune demande en liste d'attente pour cet événement.")
+        return True
+
+    def promouvoir_liste_attente(self, id_evenement: int) -> List[PromotionModel]:
+        """
+        Attribue les places libres de l'événement aux demandes en attente (après une
+        hausse de capacité, par exemple), avec leurs places de bus et leurs e-mails,
+        dans une seule transaction.
+        """
+        promues = self.liste_attente.promouvoir(id_evenement, email_promotion=self._email_promotion)
+        if promues:
+            self.cache.invalider_places(id_evenement)
+        return promues
+
+    def purger_cles_idempotence(self) -> int:
+        """Supprime les clés d'idempotence expirées (tâche de maintenance). Retourne leur nombre."""
+        return self.dao.purger_idempotence()
 
     # ---------- HELPERS / STATS ----------
     def count_reservations_for_event(self, id_evenement: int) -> int:
@@ -93,5 +292,90 @@ class ReservationService:
 
     def user_has_reservation_for_event(self, id_utilisateur: int, id_evenement: int) -> bool:
         """Retourne True si l'utilisateur a déjà réservé ce même événement."""
-        reservations = self.dao.find_by_user(id_utilisateur)
-        return any(r.fk_evenement == id_evenement for r in reservations)
+        return self._compter_verification(self.dao.exists_for_user_and_event(id_utilisateur, id_evenement))
+
+
+class ReservationServiceAsync:
+    """
+    Pendant asyncio de ReservationService (mêmes règles métier), au-dessus de
+    ReservationDaoAsync, pour un front-end servant des requêtes concurrentes.
+    """
+
+    def __init__(self, dao: Optional[ReservationDaoAsync] = None):
+        self.dao = dao or ReservationDaoAsync()
+        self.cache = CacheCatalogue()
+
+    # ---------- READ ----------
+    async def get_reservations_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
+        return await self.dao.find_by_user(id_utilisateur)
+
+    async def get_reservations_by_event(self, id_evenement: int) -> List[ReservationModelOut]:
+        return await self.dao.find_by_event(id_evenement)
+
+    async def get_reservation_by_id(self, id_reservation: int) -> ReservationModelOut:
+        reservation = await self.dao.find_by_id(id_reservation)
+        if not reservation:
+            raise ValueError(f"Aucune réservation trouvée avec l'id {id_reservation}.")
+        return reservation
+
+    # ---------- CREATE ----------
+    async def reserver(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        liste_attente: bool = False,
+        cle_idempotence: Optional[str] = None,
+    ) -> ResultatReservationModel:
+        t0 = time.perf_counter()
+        resultat = await self.dao.reserver(
+            reservation_in, email=email, liste_attente=liste_attente, idempotence=_idempotence(cle_idempotence)
+        )
+        ReservationService._compter(resultat, time.perf_counter() - t0)
+        ReservationService._invalider_places(self.cache, resultat, reservation_in.fk_evenement)
+        return resultat
+
+    async def create_reservation(
+        self,
+        reservation_in: ReservationModelIn,
+        email: Optional[EmailModelIn] = None,
+        cle_idempotence: Optional[str] = None,
+    ) -> ReservationModelOut:
+        resultat = await self.reserver(reservation_in, email=email, cle_idempotence=cle_idempotence)
+        return ReservationService._verifier_resultat(resultat, reservation_in)
+
+    # ---------- DELETE ----------
+    async def delete_reservation(
+        self, id_reservation: int, email: Optional[EmailModelIn] = None, cle_idempotence: Optional[str] = None
+    ) -> bool:
+        issue = await self.dao.delete(
+            id_reservation,
+            email=email,
+            email_promotion=ReservationService._email_promotion,
+            idempotence=_idempotence(cle_idempotence),
+        )
+        if issue.ecrite:
+            self.cache.invalider_places(issue.fk_evenement)
+        return ReservationService._verifier_suppression(issue)
+
+    async def annulation_enregistree(self, cle_idempotence: Optional[str]) -> Optional[bool]:
+        idempotence = _idempotence(cle_idempotence)
+        if idempotence is None:
+            return None
+        deja = await self.dao.resultat_enregistre(idempotence, ReservationDao.OPERATION_ANNULER)
+        return EcritureModel(**deja["valeur"]).ecrite if deja is not None else None
+
+    # ---------- LISTE D'ATTENTE ----------
+    async def promouvoir_liste_attente(self, id_evenement: int) -> List[PromotionModel]:
+        promues = await self.dao.promouvoir(id_evenement, email_promotion=ReservationService._email_promotion)
+        if promues:
+            self.cache.invalider_places(id_evenement)
+        return promues
+
+    # ---------- HELPERS / STATS ----------
+    async def count_reservations_for_event(self, id_evenement: int) -> int:
+        return await self.dao.count_by_event(id_evenement)
+
+    async def user_has_reservation_for_event(self, id_utilisateur: int, id_evenement: int) -> bool:
+        return ReservationService._compter_verification(
+            await self.dao.exists_for_user_and_event(id_utilisateur, id_evenement)
+        )
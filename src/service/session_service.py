@@ -0,0 +1,114 @@
+# service/session_service.py
+import os
+import secrets
+from typing import Optional, Tuple
+
+from dao.asynchrone.session_dao import SessionDaoAsync, SessionMemoireDaoAsync
+from dao.session_dao import SessionDao, SessionMemoireDao
+from model.session_models import SessionModel
+from model.utilisateur_models import UtilisateurModelOut
+from utils.jetons import signer_jeton, verifier_jeton
+
+
+def _stockage() -> str:
+    """Stockage des sessions : 'postgres' (défaut, partagé entre workers) ou 'memoire'."""
+    stockage = os.getenv("SESSION_STOCKAGE", "postgres")
+    if stockage not in ("postgres", "memoire"):
+        raise ValueError(f"SESSION_STOCKAGE inconnu : {stockage}")
+    return stockage
+
+
+class SessionService:
+    """
+    Sessions authentifiées : après UN contrôle bcrypt réussi (authenticate_user),
+    `ouvrir` enregistre une session et remet un jeton signé ne contenant que son
+    identifiant. Chaque action suivante est validée par `valider` : signature
+    HMAC, puis lecture par clé (dictionnaire ou clé primaire), au lieu d'un bcrypt.
+
+    Deux expirations :
+    - glissante (API_SESSION_DUREE, 3600 s) : repoussée à chaque usage,
+      la session tombe après cette durée d'inactivité ;
+    - absolue (API_SESSION_DUREE_MAX, 86400 s) : portée par le jeton signé.
+
+    Une session fermée (déconnexion, suppression du compte) est refusée
+    immédiatement, même si son jeton n'a pas expiré.
+    """
+
+    def __init__(self, dao=None, duree: Optional[int] = None, duree_max: Optional[int] = None):
+        self.dao = dao or (SessionMemoireDao() if _stockage() == "memoire" else SessionDao())
+        self.duree = duree or int(os.getenv("API_SESSION_DUREE", "3600"))
+        self.duree_max = duree_max or int(os.getenv("API_SESSION_DUREE_MAX", "86400"))
+
+    # ---------- Helpers (partagés avec la version asynchrone) ----------
+
+    @staticmethod
+    def _nouvel_identifiant() -> str:
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def _identifiant(jeton: str) -> str:
+        """Identifiant de session d'un jeton dont la signature et l'échéance absolue sont valides."""
+        id_session = verifier_jeton(jeton).get("sid")
+        if not id_session:
+            raise ValueError("Jeton de session invalide.")
+        return id_session
+
+    @staticmethod
+    def _verifier_session(session: Optional[SessionModel]) -> SessionModel:
+        if session is None:
+            raise ValueError("Session expirée ou fermée.")
+        return session
+
+    # ---------- API ----------
+
+    def ouvrir(self, utilisateur: UtilisateurModelOut) -> Tuple[str, SessionModel]:
+        """Ouvre une session pour un utilisateur authentifié. Retourne (jeton, session)."""
+        id_session = self._nouvel_identifiant()
+        session = self.dao.creer(id_session, utilisateur.id_utilisateur, utilisateur.administrateur, self.duree)
+        return signer_jeton({"sid": id_session}, self.duree_max), session
+
+    def valider(self, jeton: str) -> SessionModel:
+        """Session du jeton (expiration repoussée), ou ValueError."""
+        return self._verifier_session(self.dao.lire_et_prolonger(self._identifiant(jeton), self.duree))
+
+    def fermer(self, jeton: str) -> bool:
+        """Ferme la session du jeton (déconnexion)."""
+        return self.dao.supprimer(self._identifiant(jeton))
+
+    def fermer_toutes(self, id_utilisateur: int) -> int:
+        """Ferme toutes les sessions d'un utilisateur (changement de mot de passe, ...)."""
+        return self.dao.supprimer_par_utilisateur(id_utilisateur)
+
+    def purger(self) -> int:
+        """Supprime les sessions expirées."""
+        return self.dao.purger()
+
+
+class SessionServiceAsync:
+    """
+    Pendant asyncio de SessionService, au-dessus de SessionDaoAsync
+    (ou SessionMemoireDaoAsync), avec les mêmes règles.
+    """
+
+    def __init__(self, dao=None, duree: Optional[int] = None, duree_max: Optional[int] = None):
+        self.dao = dao or (SessionMemoireDaoAsync() if _stockage() == "memoire" else SessionDaoAsync())
+        self.duree = duree or int(os.getenv("API_SESSION_DUREE", "3600"))
+        self.duree_max = duree_max or int(os.getenv("API_SESSION_DUREE_MAX", "86400"))
+
+    async def ouvrir(self, utilisateur: UtilisateurModelOut) -> Tuple[str, SessionModel]:
+        id_session = SessionService._nouvel_identifiant()
+        session = await self.dao.creer(id_session, utilisateur.id_utilisateur, utilisateur.administrateur, self.duree)
+        return signer_jeton({"sid": id_session}, self.duree_max), session
+
+    async def valider(self, jeton: str) -> SessionModel:
+        id_session = SessionService._identifiant(jeton)
+        return SessionService._verifier_session(await self.dao.lire_et_prolonger(id_session, self.duree))
+
+    async def fermer(self, jeton: str) -> bool:
+        return await self.dao.supprimer(SessionService._identifiant(jeton))
+
+    async def fermer_toutes(self, id_utilisateur: int) -> int:
+        return await self.dao.supprimer_par_utilisateur(id_utilisateur)
+
+    async def purger(self) -> int:
+        return await self.dao.purger()
@@ -0,0 +1,27 @@
+# service/statistiques_service.py
+from typing import Optional
+
+from dao.statistiques_dao import StatistiquesDao
+from model.statistiques_models import StatistiquesGlobalesModel
+
+
+class StatistiquesService:
+    """
+    Service de statistiques d'inscription pour le tableau de bord admin.
+    Un seul aller-retour base, quel que soit le nombre d'événements.
+    """
+
+    def __init__(self):
+        self.dao = StatistiquesDao()
+
+    def statistiques_globales(self, limit: Optional[int] = None) -> StatistiquesGlobalesModel:
+        """
+        Retourne les statistiques par événement et le total global.
+        `limit` borne le nombre d'événements (None = tous).
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("La limite doit être un entier positif.")
+
+        lignes = self.dao.statistiques(limit=limit)
+        # La ligne de total (GROUPING SETS) est toujours renvoyée en dernier
+        return StatistiquesGlobalesModel(evenements=lignes[:-1], total=lignes[-1])
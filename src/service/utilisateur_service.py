@@ -2,7 +2,11 @@
 from typing import List, Optional
 
 from dao.utilisateur_dao import UtilisateurDao
+from dao.asynchrone.utilisateur_dao import UtilisateurDaoAsync
+from model.email_models import EmailModelIn
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from model.pagination_models import PageModel
+from service.session_service import SessionService
 from view.session import Session
 
 
@@ -12,13 +16,17 @@ class UtilisateurService:
     Contient la logique métier au-dessus du DAO.
     """
 
-    def __init__(self):
-        self.dao = UtilisateurDao()
+    def __init__(self, dao: Optional[UtilisateurDao] = None, sessions: Optional[SessionService] = None):
+        self.dao = dao or UtilisateurDao()
+        self.sessions = sessions or SessionService()
 
     # ---------- READ ----------
     def get_all_users(self, limit: int = 100, offset: int = 0) -> List[UtilisateurModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_users_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageModel[UtilisateurModelOut]:
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_user_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
         user = self.dao.find_by_id(id_utilisateur)
         if not user:
@@ -29,25 +37,28 @@ class UtilisateurService:
         return self.dao.find_by_email(email)
 
     # ---------- CREATE ----------
-    def create_user(self, user_in: UtilisateurModelIn) -> UtilisateurModelOut:
+    def create_user(self, user_in: UtilisateurModelIn, email: Optional[EmailModelIn] = None) -> UtilisateurModelOut:
         # Vérifie si l’email existe déjà
         existing = self.dao.find_by_email(user_in.email)
         if existing:
             raise ValueError(f"L'email '{user_in.email}' est déjà utilisé.")
 
-        return self.dao.create(user_in)
+        return self.dao.create(user_in, email=email)
 
     # ---------- UPDATE ----------
     def update_user(self, user_out: UtilisateurModelOut) -> UtilisateurModelOut:
-        if not self.dao.find_by_id(user_out.id_utilisateur):
+        updated = self.dao.update(user_out)
+        if not updated:
             raise ValueError("Impossible de mettre à jour : utilisateur introuvable.")
-        return self.dao.update(user_out)
+        return updated
 
     # ---------- DELETE ----------
     def delete_user(self, id_utilisateur: int) -> bool:
-        if not self.dao.find_by_id(id_utilisateur):
+        if not self.dao.delete(id_utilisateur):
             raise ValueError("Impossible de supprimer : utilisateur introuvable.")
-        return self.dao.delete(id_utilisateur)
+        # La cascade ne couvre que le stockage postgres : on ferme aussi les sessions en mémoire
+        self.sessions.fermer_toutes(id_utilisateur)
+        return True
 
     # ---------- AUTH ----------
     def authenticate_user(self, email: str, password: str) -> Optional[UtilisateurModelOut]:
@@ -57,9 +68,11 @@ class UtilisateurService:
         return user
 
     def change_user_password(self, id_utilisateur: int, new_password: str) -> bool:
-        if not self.dao.find_by_id(id_utilisateur):
+        if not self.dao.change_password(id_utilisateur, new_password):
             raise ValueError("Utilisateur introuvable pour mise à jour du mot de passe.")
-        return self.dao.change_password(id_utilisateur, new_password)
+        # Un mot de passe changé (ex : compromis) révoque les sessions ouvertes avec l'ancien
+        self.sessions.fermer_toutes(id_utilisateur)
+        return True
 
     # ---------- SESSION ----------
     def deconnexion(self) -> bool:
@@ -70,3 +83,33 @@ class UtilisateurService:
     def get_current_user(self) -> Optional[UtilisateurModelOut]:
         """Renvoie l'utilisateur actuellement connecté, ou None."""
         return Session().utilisateur
+
+
+class UtilisateurServiceAsync:
+    """
+    Pendant asyncio d'UtilisateurService (lecture, inscription, authentification),
+    au-dessus d'UtilisateurDaoAsync. Pas de Session : l'appelant gère l'identité.
+    """
+
+    def __init__(self, dao: Optional[UtilisateurDaoAsync] = None):
+        self.dao = dao or UtilisateurDaoAsync()
+
+    async def get_user_by_id(self, id_utilisateur: int) -> UtilisateurModelOut:
+        user = await self.dao.find_by_id(id_utilisateur)
+        if not user:
+            raise ValueError(f"Aucun utilisateur trouvé avec l'id {id_utilisateur}")
+        return user
+
+    async def get_user_by_email(self, email: str) -> Optional[UtilisateurModelOut]:
+        return await self.dao.find_by_email(email)
+
+    async def create_user(self, user_in: UtilisateurModelIn, email: Optional[EmailModelIn] = None) -> UtilisateurModelOut:
+        if await self.dao.find_by_email(user_in.email):
+            raise ValueError(f"L'email '{user_in.email}' est déjà utilisé.")
+        return await self.dao.create(user_in, email=email)
+
+    async def authenticate_user(self, email: str, password: str) -> UtilisateurModelOut:
+        user = await self.dao.authenticate(email, password)
+        if not user:
+            raise ValueError("Email ou mot de passe incorrect.")
+        return user
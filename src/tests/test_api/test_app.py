@@ -0,0 +1,264 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from api import app as api
+from dao.admission_dao import AdmissionMemoireDao
+from dao.asynchrone.admission_dao import AdmissionMemoireDaoAsync
+from model.reservation_models import ReservationModelOut, ResultatReservationModel
+from dao.asynchrone.session_dao import SessionMemoireDaoAsync
+from dao.session_dao import SessionMemoireDao
+from model.utilisateur_models import UtilisateurModelOut
+from service.admission_service import AdmissionServiceAsync
+from service.session_service import SessionService, SessionServiceAsync
+from utils.jetons import signer_jeton
+from utils.singleton import Singleton
+
+ALICE = UtilisateurModelOut(
+    id_utilisateur=1, nom="Martin", prenom="Alice", email="alice@exemple.fr",
+    administrateur=False, date_creation=datetime(2025, 1, 1),
+)
+
+
+class FauxUtilisateurService:
+    async def authenticate_user(self, email, password):
+        if email == ALICE.email and password == "bon":
+            return ALICE
+        raise ValueError("Email ou mot de passe incorrect.")
+
+
+class FauxReservationService:
+    def __init__(self):
+        self.supprimees = []
+        self.cles = {}
+
+    async def reserver(self, reservation_in, liste_attente=False, cle_idempotence=None):
+        if reservation_in.fk_evenement == 99 and liste_attente:
+            return ResultatReservationModel(statut="en_attente", places_restantes=0, position=3)
+        if reservation_in.fk_evenement == 99:
+            return ResultatReservationModel(statut="complet", places_restantes=0)
+        return ResultatReservationModel(
+            statut="reservee",
+            places_restantes=4,
+            reservation=ReservationModelOut(
+                id_reservation=10, date_reservation=datetime(2025, 1, 2), **reservation_in.model_dump()
+            ),
+        )
+
+    async def get_reservation_by_id(self, id_reservation):
+        if id_reservation == 404:
+            raise ValueError("Aucune réservation trouvée.")
+        return ReservationModelOut(
+            id_reservation=id_reservation, fk_utilisateur=2 if id_reservation == 20 else 1, fk_evenement=1,
+            bus_aller=False, bus_retour=False, adherent=False, sam=False, boisson=False,
+            date_reservation=datetime(2025, 1, 2),
+        )
+
+    async def get_reservations_by_user(self, id_utilisateur):
+        return []
+
+    async def delete_reservation(self, id_reservation, cle_idempotence=None):
+        self.supprimees.append(id_reservation)
+        if cle_idempotence:
+            self.cles[cle_idempotence] = True
+        return True
+
+    async def annulation_enregistree(self, cle_idempotence):
+        return self.cles.get(cle_idempotence)
+
+
+@pytest.fixture
+def client():
+    reservations = FauxReservationService()
+    api.app.dependency_overrides[api.utilisateur_service] = FauxUtilisateurService
+    api.app.dependency_overrides[api.reservation_service] = lambda: reservations
+    api.app.dependency_overrides[api.session_service] = lambda: SessionServiceAsync(dao=SessionMemoireDaoAsync())
+    with patch.dict(os.environ, {"API_SECRET": "secret-de-test"}):
+        yield TestClient(api.app), reservations
+    api.app.dependency_overrides.clear()
+
+
+def entetes(id_utilisateur=1, admin=False):
+    """En-tête d'une session ouverte (stockage en mémoire) pour cet utilisateur."""
+    utilisateur = ALICE.model_copy(update={"id_utilisateur": id_utilisateur, "administrateur": admin})
+    jeton, _ = SessionService(dao=SessionMemoireDao()).ouvrir(utilisateur)
+    return {"Authorization": f"Bearer {jeton}"}
+
+
+def test_connexion_renvoie_un_jeton(client):
+    """Des identifiants valides donnent un jeton utilisable sur les routes protégées"""
+
+    # GIVEN
+    http, _ = client
+
+    # WHEN
+    reponse = http.post("/connexion", json={"email": "alice@exemple.fr", "mot_de_passe": "bon"})
+    refus = http.post("/connexion", json={"email": "alice@exemple.fr", "mot_de_passe": "faux"})
+
+    # THEN
+    assert reponse.status_code == 200
+    assert reponse.json()["utilisateur"]["id_utilisateur"] == 1
+    assert http.get("/reservations", headers={"Authorization": f"Bearer {reponse.json()['jeton']}"}).status_code == 200
+    assert refus.status_code == 401
+
+
+def test_deconnexion_ferme_la_session(client):
+    """Après DELETE /connexion, le jeton (encore signé et non expiré) est refusé"""
+
+    # GIVEN
+    http, _ = client
+    en_tete = entetes(3)
+    sans_session = {"Authorization": f"Bearer {signer_jeton({'id': 3, 'admin': True}, 60)}"}
+
+    # WHEN
+    avant = http.get("/reservations", headers=en_tete)
+    deconnexion = http.delete("/connexion", headers=en_tete)
+    apres = http.get("/reservations", headers=en_tete)
+
+    # THEN
+    assert avant.status_code == 200
+    assert deconnexion.status_code == 204
+    assert apres.status_code == 401
+    assert http.get("/reservations", headers=sans_session).status_code == 401
+
+
+def test_reserver_pour_l_utilisateur_du_jeton(client):
+    """La réservation est faite au nom du porteur du jeton ; complet donne 409"""
+
+    # GIVEN
+    http, _ = client
+
+    # WHEN
+    reponse = http.post("/reservations", json={"fk_evenement": 1, "boisson": True}, headers=entetes(7))
+    complet = http.post("/reservations", json={"fk_evenement": 99}, headers=entetes(7))
+    anonyme = http.post("/reservations", json={"fk_evenement": 1})
+
+    # THEN
+    assert reponse.status_code == 201
+    assert reponse.json()["reservation"]["fk_utilisateur"] == 7
+    assert reponse.json()["reservation"]["boisson"] is True
+    assert complet.status_code == 409
+    assert complet.json()["statut"] == "complet"
+    assert anonyme.status_code == 401
+
+
+def test_reserver_en_liste_d_attente(client):
+    """Sur un événement complet, la demande avec liste_attente est acceptée (202) avec son rang"""
+
+    # GIVEN
+    http, _ = client
+
+    # WHEN
+    reponse = http.post("/reservations", json={"fk_evenement": 99, "liste_attente": True}, headers=entetes(7))
+
+    # THEN
+    assert reponse.status_code == 202
+    assert reponse.json()["statut"] == "en_attente"
+    assert reponse.json()["position"] == 3
+
+
+def test_file_d_admission_avant_reservation(client):
+    """File active : le premier est admis, le suivant attend (202 puis 429 avec Retry-After)"""
+
+    # GIVEN
+    http, _ = client
+    with patch.dict(Singleton._instances):
+        Singleton._instances.pop(AdmissionMemoireDao, None)
+        file = AdmissionServiceAsync(
+            dao=AdmissionMemoireDaoAsync(AdmissionMemoireDao(horloge=lambda: 0.0)), debit=0.5, rafale=1
+        )
+        api.app.dependency_overrides[api.admission_service] = lambda: file
+
+        # WHEN
+        sans_ticket = http.post("/reservations", json={"fk_evenement": 1}, headers=entetes(1))
+        premier = http.post("/file-attente", headers=entetes(1))
+        second = http.post("/file-attente", headers=entetes(2))
+        place = http.get("/file-attente", headers=entetes(2))
+        admis = http.post("/reservations", json={"fk_evenement": 1}, headers=entetes(1))
+        refuse = http.post("/reservations", json={"fk_evenement": 1}, headers=entetes(2))
+
+    # THEN
+    assert sans_ticket.status_code == 429
+    assert premier.status_code == 200 and premier.json()["admis"] is True
+    assert second.status_code == 202
+    assert second.json()["position"] == 1
+    assert second.headers["Retry-After"] == "2"
+    assert place.json()["ticket"] == 2
+    assert admis.status_code == 201
+    assert refuse.status_code == 429
+    assert refuse.headers["Retry-After"] == "2"
+
+
+def test_annuler_seulement_ses_reservations(client):
+    """On n'annule que ses propres réservations, sauf administrateur"""
+
+    # GIVEN
+    http, reservations = client
+
+    # WHEN
+    a_moi = http.delete("/reservations/10", headers=entetes(1))
+    a_autrui = http.delete("/reservations/20", headers=entetes(1))
+    par_admin = http.delete("/reservations/20", headers=entetes(1, admin=True))
+    inconnue = http.delete("/reservations/404", headers=entetes(1))
+
+    # THEN
+    assert a_moi.status_code == 204
+    assert a_autrui.status_code == 403
+    assert par_admin.status_code == 204
+    assert inconnue.status_code == 404
+    assert reservations.supprimees == [10, 20]
+
+
+def test_annulation_renvoyee_avec_la_meme_cle(client):
+    """Une annulation renvoyée avec la même Idempotency-Key rend 204, même réservation disparue"""
+
+    # GIVEN
+    http, reservations = client
+    en_tete = {**entetes(1), "Idempotency-Key": "annulation-1"}
+    http.delete("/reservations/10", headers=en_tete)
+    reservations.cles["1:annulation-2"] = True
+
+    # WHEN
+    rejouee = http.delete("/reservations/404", headers={**entetes(1), "Idempotency-Key": "annulation-2"})
+    autre_utilisateur = http.delete("/reservations/404", headers={**entetes(2), "Idempotency-Key": "annulation-2"})
+    trop_longue = http.delete("/reservations/10", headers={**entetes(1), "Idempotency-Key": "x" * 129})
+
+    # THEN
+    assert reservations.cles == {"1:annulation-1": True, "1:annulation-2": True}
+    assert rejouee.status_code == 204
+    assert autre_utilisateur.status_code == 404
+    assert trop_longue.status_code == 400
+    assert reservations.supprimees == [10]
+
+
+def test_statistiques_reservees_aux_admins(client):
+    """Un jeton non administrateur ne donne pas accès aux statistiques"""
+
+    # GIVEN
+    http, _ = client
+
+    # WHEN
+    reponse = http.get("/statistiques", headers=entetes(1, admin=False))
+
+    # THEN
+    assert reponse.status_code == 403
+
+
+def test_metriques_prometheus(client):
+    """/metrics expose les métriques du processus au format texte Prometheus"""
+
+    # GIVEN
+    http, _ = client
+
+    # WHEN
+    reponse = http.get("/metrics")
+
+    # THEN
+    assert reponse.status_code == 200
+    assert reponse.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE bde_reservations_total counter" in reponse.text
+    assert "# TYPE bde_consultations_duree_secondes histogram" in reponse.text
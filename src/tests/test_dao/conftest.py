@@ -0,0 +1,126 @@
+import os
+import uuid
+from datetime import date
+
+import pytest
+
+from unittest.mock import patch
+
+from psycopg2.extras import RealDictCursor
+
+from utils.reset_database import ResetDatabase
+from utils.singleton import Singleton
+
+from dao.db_connection import DBConnection
+from dao.evenement_dao import EvenementDao
+from model.evenement_models import EvenementModelIn
+
+# Le schéma a-t-il reçu des écritures validées (test marqué sans_rollback) ?
+_etat = {"modifie": False}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "sans_rollback: le test valide réellement ses écritures (schéma reconstruit pour les suivants)"
+    )
+    config.addinivalue_line("markers", "sans_base: le test n'utilise pas le schéma de test")
+
+
+def _schema_du_worker() -> str:
+    """Un schéma par worker pytest-xdist (gw0, gw1...), projet_test_dao sans xdist."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"projet_test_dao_{worker}" if worker else "projet_test_dao"
+
+
+def _oublier_connexions():
+    """Ferme le pool synchrone : le prochain DBConnection() se connecte avec le search_path courant."""
+    instance = Singleton._instances.pop(DBConnection, None)
+    if instance is not None:
+        instance.fermer()
+
+
+@pytest.fixture(scope="session")
+def schema_de_test():
+    """
+    Schéma de test du worker, construit une fois puis réutilisé d'une session à
+    l'autre tant que les scripts SQL n'ont pas changé (ResetDatabase.preparer).
+    """
+    schema = _schema_du_worker()
+    with patch.dict(os.environ, {"POSTGRES_SCHEMA": schema}):
+        _oublier_connexions()
+        ResetDatabase().preparer(schema)
+        yield schema
+        _oublier_connexions()
+
+
+@pytest.fixture(autouse=True)
+def transaction_annulee(request):
+    """
+    Chaque test DAO s'exécute dans une transaction annulée à la fin : il voit le
+    jeu de données de pop_db_test.sql et ses propres écritures, sans rien laisser
+    aux suivants.
+    """
+    if request.node.get_closest_marker("sans_base"):
+        yield
+        return
+
+    schema = request.getfixturevalue("schema_de_test")
+    if request.node.get_closest_marker("sans_rollback"):
+        ResetDatabase().marquer_modifie(schema)
+        _etat["modifie"] = True
+        yield
+        return
+
+    if _etat["modifie"]:
+        ResetDatabase().preparer(schema)
+        _etat["modifie"] = False
+    with DBConnection().transaction_de_test():
+        yield
+
+
+@pytest.fixture
+def aller_retours():
+    """
+    Requêtes envoyées au serveur pendant le test, une par execute (un execute à
+    plusieurs instructions compte pour un aller-retour). Garde-fou contre les
+    lectures préalables qui doublent le coût d'une écriture.
+    """
+    executees = []
+    original = RealDictCursor.execute
+
+    def espion(self, query, vars=None):
+        executees.append(query)
+        return original(self, query, vars)
+
+    with patch.object(RealDictCursor, "execute", espion):
+        yield executees
+
+
+@pytest.fixture
+def utilisateurs():
+    """Fabrique : crée n utilisateurs (sans bcrypt) et retourne leurs ids, triés."""
+
+    def creer(n):
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(
+                    "INSERT INTO utilisateur (nom, prenom, email, mot_de_passe) "
+                    "SELECT 'Dao', 'Test', %(prefixe)s || i || '@exemple.fr', 'x' FROM generate_series(1, %(n)s) i "
+                    "RETURNING id_utilisateur",
+                    {"prefixe": uuid.uuid4().hex[:8], "n": n},
+                )
+                return sorted(r["id_utilisateur"] for r in curs.fetchall())
+
+    return creer
+
+
+@pytest.fixture
+def evenement():
+    """Fabrique : crée un événement de la capacité donnée et retourne son id."""
+
+    def creer(capacite=1):
+        return EvenementDao().create(
+            EvenementModelIn(titre="Test DAO", date_evenement=date(2030, 1, 1), capacite=capacite)
+        ).id_evenement
+
+    return creer
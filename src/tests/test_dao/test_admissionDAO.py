@@ -0,0 +1,56 @@
+import uuid
+
+from dao.admission_dao import AdmissionDao
+
+
+def file():
+    return f"test-{uuid.uuid4().hex[:8]}"
+
+
+def test_entrer_distribue_les_tickets_dans_l_ordre():
+    """Premier arrivé admis (seau plein), suivant en attente au débit ; même clé, même ticket"""
+
+    # GIVEN
+    nom = file()
+
+    # WHEN
+    t1, _ = AdmissionDao().entrer(nom, "alice", debit=0.001, rafale=1, validite=3600)
+    t2, etat = AdmissionDao().entrer(nom, "bob", debit=0.001, rafale=1, validite=3600)
+    repris, _ = AdmissionDao().entrer(nom, "bob", debit=0.001, rafale=1, validite=3600)
+
+    # THEN
+    assert (t1, t2, repris) == (1, 2, 2)
+    assert (etat.dernier_ticket, etat.admis_jusqu_a) == (2, 1)
+
+
+def test_consulter_sans_ecrire():
+    """La place se lit sans ticket écrit ; l'état projeté admet au débit"""
+
+    # GIVEN
+    nom = file()
+    AdmissionDao().entrer(nom, "alice", debit=1000, rafale=1, validite=3600)
+    AdmissionDao().entrer(nom, "bob", debit=1000, rafale=1, validite=3600)
+
+    # WHEN
+    ticket, etat = AdmissionDao().consulter(nom, "bob", debit=1000, rafale=1, validite=3600)
+    inconnu = AdmissionDao().consulter(nom, "charlie", debit=1000, rafale=1, validite=3600)
+
+    # THEN
+    assert ticket == 2
+    assert etat.admis_jusqu_a == 2
+    assert inconnu is None
+
+
+def test_vider_la_file():
+    """Vider la file oublie tous ses tickets"""
+
+    # GIVEN
+    nom = file()
+    AdmissionDao().entrer(nom, "alice", debit=1, rafale=1, validite=3600)
+
+    # WHEN
+    videe = AdmissionDao().vider(nom)
+
+    # THEN
+    assert videe is True
+    assert AdmissionDao().consulter(nom, "alice", debit=1, rafale=1, validite=3600) is None
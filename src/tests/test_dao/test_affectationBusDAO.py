@@ -0,0 +1,134 @@
+import threading
+import uuid
+from datetime import date
+
+import pytest
+
+from business_object.CreneauBus import CreneauBus
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn
+
+
+def evenement_avec_bus(*places, direction="aller", capacite=100):
+    """Événement et ses bus (un par nombre de places), dans le sens donné."""
+    evenement = EvenementDao().create(
+        EvenementModelIn(titre="Bus", date_evenement=date(2030, 1, 1), capacite=capacite)
+    )
+    bus = [
+        CreneauBusDao().create(CreneauBus(
+            f"Bus {uuid.uuid4().hex[:8]}", n, direction=direction, fk_evenement=evenement.id_evenement
+        ))
+        for n in places
+    ]
+    return evenement.id_evenement, [b.id_bus for b in bus]
+
+
+def test_bus_remplis_dans_l_ordre_sans_depasser(utilisateurs):
+    """Les demandes remplissent les bus par ordre d'id ; au-delà, elles restent en attente"""
+
+    # GIVEN
+    id_evenement, (bus1, bus2) = evenement_avec_bus(2, 1)
+    ids = utilisateurs(4)
+
+    # WHEN
+    resultats = [
+        ReservationDao().reserver(ReservationModelIn(fk_utilisateur=u, fk_evenement=id_evenement, bus_aller=True))
+        for u in ids
+    ]
+
+    # THEN
+    assert [[a.fk_bus for a in r.affectations] for r in resultats] == [[bus1], [bus1], [bus2], []]
+    assert all(r.statut == "reservee" for r in resultats)
+    assert [(b.id_bus, b.inscrits, b.estComplet()) for b in CreneauBusDao().find_by_event(id_evenement)] == [
+        (bus1, 2, True), (bus2, 1, True)
+    ]
+    assert AffectationBusDao().en_attente(id_evenement) == {"aller": 1, "retour": 0}
+
+
+def test_annulation_libere_la_place_pour_l_attente(utilisateurs):
+    """Une annulation donne sa place à la plus ancienne demande en attente"""
+
+    # GIVEN
+    id_evenement, (bus,) = evenement_avec_bus(1)
+    premier, second = (
+        ReservationDao().reserver(ReservationModelIn(fk_utilisateur=u, fk_evenement=id_evenement, bus_aller=True))
+        for u in utilisateurs(2)
+    )
+
+    # WHEN
+    ReservationDao().delete(premier.reservation.id_reservation)
+
+    # THEN
+    assert second.affectations == []
+    assert [a.fk_bus for a in AffectationBusDao().find_by_reservation(second.reservation.id_reservation)] == [bus]
+
+
+def test_modification_des_options_bus(utilisateurs):
+    """Retirer le bus libère la place ; le redemander la reprend s'il en reste"""
+
+    # GIVEN
+    id_evenement, (bus,) = evenement_avec_bus(1)
+    (u,) = utilisateurs(1)
+    resa = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=u, fk_evenement=id_evenement, bus_aller=True)
+    ).reservation
+
+    # WHEN
+    ReservationDao().update_flags(resa.id_reservation, bus_aller=False)
+    sans_bus = AffectationBusDao().find_by_reservation(resa.id_reservation)
+    ReservationDao().update_flags(resa.id_reservation, bus_aller=True)
+
+    # THEN
+    assert sans_bus == []
+    assert [a.fk_bus for a in AffectationBusDao().find_by_reservation(resa.id_reservation)] == [bus]
+
+
+def test_reduction_et_ajout_de_bus(utilisateurs):
+    """Un bus réduit rend ses dernières places, un bus ajouté sert les demandes en attente"""
+
+    # GIVEN
+    id_evenement, (bus,) = evenement_avec_bus(3)
+    resas = [
+        ReservationDao().reserver(ReservationModelIn(fk_utilisateur=u, fk_evenement=id_evenement, bus_aller=True))
+        for u in utilisateurs(3)
+    ]
+
+    # WHEN
+    CreneauBusDao().update_places(bus, 2)
+    AffectationBusDao().repartir([id_evenement])
+    attente = AffectationBusDao().en_attente(id_evenement)
+    renfort = CreneauBusDao().create(CreneauBus(f"Bus {uuid.uuid4().hex[:8]}", 1, fk_evenement=id_evenement)).id_bus
+    places = AffectationBusDao().repartir([id_evenement])
+
+    # THEN
+    assert attente == {"aller": 1, "retour": 0}
+    assert [(a.fk_reservation, a.fk_bus) for a in places] == [(resas[2].reservation.id_reservation, renfort)]
+
+
+@pytest.mark.sans_rollback
+def test_reservations_concurrentes_sans_surreservation(utilisateurs):
+    """Des réservations simultanées n'attribuent jamais plus de places que le bus n'en a"""
+
+    # GIVEN
+    id_evenement, (bus,) = evenement_avec_bus(5, capacite=50)
+    ids = utilisateurs(20)
+    depart = threading.Barrier(len(ids))
+
+    def reserver(u):
+        depart.wait()
+        ReservationDao().reserver(ReservationModelIn(fk_utilisateur=u, fk_evenement=id_evenement, bus_aller=True))
+
+    # WHEN
+    threads = [threading.Thread(target=reserver, args=(u,)) for u in ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # THEN
+    assert CreneauBusDao().find_by_id(bus).inscrits == 5
+    assert AffectationBusDao().en_attente(id_evenement) == {"aller": 15, "retour": 0}
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from dao.asynchrone.db_connection import DBConnectionAsync
+from dao.asynchrone.consultation_evenement_dao import ConsultationEvenementDaoAsync
+from dao.asynchrone.evenement_dao import EvenementDaoAsync
+from dao.asynchrone.reservation_dao import ReservationDaoAsync
+from dao.asynchrone.utilisateur_dao import UtilisateurDaoAsync
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.evenement_dao import EvenementDao
+from dao.liste_attente_dao import ListeAttenteDao
+from dao.reservation_dao import ReservationDao
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn
+from service.evenement_service import EvenementServiceAsync
+from service.reservation_service import ReservationServiceAsync
+
+# Le pool asynchrone valide ses écritures pour de bon : pas de transaction annulée
+pytestmark = pytest.mark.sans_rollback
+
+
+def executer(coroutine):
+    """Exécute une coroutine dans sa propre boucle, puis ferme le pool asynchrone."""
+    async def avec_fermeture():
+        try:
+            return await coroutine
+        finally:
+            await DBConnectionAsync().fermer()
+
+    return asyncio.run(avec_fermeture())
+
+
+def test_find_by_id_identique_au_dao_synchrone():
+    """Les DAO asynchrones renvoient les mêmes modèles que les DAO synchrones"""
+
+    # GIVEN
+    id_evenement = 1
+
+    # WHEN
+    evenement = executer(EvenementDaoAsync().find_by_id(id_evenement))
+    reservations = executer(ReservationDaoAsync().find_by_event(id_evenement))
+
+    # THEN
+    assert evenement == EvenementDao().find_by_id(id_evenement)
+    assert reservations == ReservationDao().find_by_event(id_evenement)
+
+
+def test_lister_avec_places_restantes_page():
+    """La pagination par curseur asynchrone suit le même ordre que la synchrone"""
+
+    # GIVEN
+    page_sync = ConsultationEvenementDao().lister_avec_places_restantes_page(limit=2, seulement_disponibles=False)
+
+    # WHEN
+    page = executer(ConsultationEvenementDaoAsync().lister_avec_places_restantes_page(
+        limit=2, seulement_disponibles=False
+    ))
+
+    # THEN
+    assert page.elements == page_sync.elements
+    assert page.curseur_suivant == page_sync.curseur_suivant
+
+
+def test_reserver_concurrent_sans_surreservation():
+    """Des réservations concurrentes sur la boucle ne dépassent pas la capacité"""
+
+    # GIVEN
+    evenement = EvenementDao().create(
+        EvenementModelIn(titre="Async complet", date_evenement=date(2030, 1, 1), capacite=2)
+    )
+    utilisateurs = [1, 2, 3, 4]
+
+    async def reserver_tous():
+        service = ReservationServiceAsync()
+        return await asyncio.gather(*(
+            service.reserver(ReservationModelIn(fk_utilisateur=u, fk_evenement=evenement.id_evenement))
+            for u in utilisateurs
+        ))
+
+    # WHEN
+    resultats = executer(reserver_tous())
+
+    # THEN
+    statuts = sorted(r.statut for r in resultats)
+    assert statuts == ["complet", "complet", "reservee", "reservee"]
+    assert ReservationDao().count_by_event(evenement.id_evenement) == 2
+    EvenementDao().delete(evenement.id_evenement)
+
+
+def test_hausse_de_capacite_promeut_la_liste_d_attente():
+    """Une capacité augmentée par le service asynchrone profite à la liste d'attente"""
+
+    # GIVEN
+    evenement = EvenementDao().create(
+        EvenementModelIn(titre="Async attente", date_evenement=date(2030, 1, 1), capacite=1)
+    )
+    for u in (1, 2):
+        ReservationDao().reserver(
+            ReservationModelIn(fk_utilisateur=u, fk_evenement=evenement.id_evenement), liste_attente=True
+        )
+
+    # WHEN
+    executer(EvenementServiceAsync().update_event(evenement.model_copy(update={"capacite": 2})))
+
+    # THEN
+    assert ReservationDao().count_by_event(evenement.id_evenement) == 2
+    assert ListeAttenteDao().find_by_event(evenement.id_evenement) == []
+    EvenementDao().delete(evenement.id_evenement)
+
+
+def test_find_by_email_inconnu():
+    """Un email inconnu renvoie None"""
+
+    # GIVEN
+    email = "inconnu.async@exemple.fr"
+
+    # WHEN
+    utilisateur = executer(UtilisateurDaoAsync().find_by_email(email))
+
+    # THEN
+    assert utilisateur is None
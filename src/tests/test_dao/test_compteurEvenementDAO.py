@@ -0,0 +1,41 @@
+from dao.db_connection import DBConnection
+from dao.compteur_evenement_dao import CompteurEvenementDao
+from dao.reservation_dao import ReservationDao
+from model.reservation_models import ReservationModelIn
+
+
+def test_compteur_maintenu_par_trigger():
+    """Le compteur suit les créations et suppressions de réservations"""
+
+    # GIVEN
+    dao = CompteurEvenementDao()
+    avant = dao.find_by_event(1)["nb_reservations"]
+
+    # WHEN
+    resa = ReservationDao().create(ReservationModelIn(fk_utilisateur=2, fk_evenement=1, bus_aller=True))
+    pendant = dao.find_by_event(1)
+    ReservationDao().delete(resa.id_reservation)
+    apres = dao.find_by_event(1)["nb_reservations"]
+
+    # THEN
+    assert pendant["nb_reservations"] == avant + 1
+    assert apres == avant
+
+
+def test_detecter_et_reparer_derive():
+    """Une dérive du compteur est détectée puis réparée"""
+
+    # GIVEN
+    dao = CompteurEvenementDao()
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("UPDATE compteur_evenement SET nb_reservations = 99 WHERE id_evenement = 2")
+
+    # WHEN
+    derives = dao.find_derives()
+    corriges = dao.reparer()
+
+    # THEN
+    assert [d["id_evenement"] for d in derives] == [2]
+    assert corriges == [2]
+    assert dao.find_derives() == []
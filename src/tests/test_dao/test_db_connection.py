@@ -0,0 +1,234 @@
+import re
+import threading
+
+import pytest
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+from dao.db_connection import PoolConnexions, ConnexionEmpruntee, PointDeSauvegarde
+
+# Connexions factices : aucun besoin du schéma de test
+pytestmark = pytest.mark.sans_base
+
+
+class FauxCurseur:
+    def __init__(self, con):
+        self.con = con
+
+    def execute(self, requete, params=None):
+        # Les noms de points de sauvegarde sont numérotés : on les normalise
+        self.con.ordres.append(re.sub(r"test_\d+", "sp", requete))
+        if requete.startswith("ROLLBACK TO"):
+            self.con.statut = extensions.TRANSACTION_STATUS_INTRANS
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FausseConnexion:
+    """Connexion factice : suffisante pour tester la mécanique du pool sans PostgreSQL."""
+
+    def __init__(self):
+        self.closed = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.statut = extensions.TRANSACTION_STATUS_IDLE
+        self.ordres = []
+
+    def cursor(self, cursor_factory=None):
+        return FauxCurseur(self)
+
+    def get_transaction_status(self):
+        return self.statut
+
+    def commit(self):
+        self.commits += 1
+        self.statut = extensions.TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.statut = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+def test_emprunt_reutilise_la_connexion():
+    """Une connexion rendue est réutilisée au prochain emprunt"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=1, max_size=2)
+
+    # WHEN
+    with ConnexionEmpruntee(pool) as con1:
+        pass
+    with ConnexionEmpruntee(pool) as con2:
+        pass
+
+    # THEN
+    assert con1 is con2
+    assert con1.commits == 2
+    assert pool.nb_ouvertes == 1
+
+
+def test_rollback_en_cas_d_exception():
+    """Une exception dans le bloc `with` annule la transaction et rend la connexion"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=1, max_size=1)
+
+    # WHEN
+    with pytest.raises(RuntimeError):
+        with ConnexionEmpruntee(pool) as con:
+            raise RuntimeError("échec SQL")
+
+    # THEN
+    assert con.rollbacks == 1
+    assert pool.nb_libres == 1
+
+
+def test_timeout_quand_le_pool_est_plein():
+    """Au-delà de max_size, l'emprunt échoue après le timeout"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=0, max_size=1, timeout=0.05)
+    pool.emprunter()
+
+    # WHEN / THEN
+    with pytest.raises(PoolError):
+        pool.emprunter()
+
+
+def test_recyclage_apres_max_uses():
+    """Une connexion est fermée puis remplacée après max_uses emprunts"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=1, max_size=1, max_uses=2)
+
+    # WHEN
+    premieres = []
+    for _ in range(3):
+        with ConnexionEmpruntee(pool) as con:
+            premieres.append(con)
+
+    # THEN
+    assert premieres[0] is premieres[1]
+    assert premieres[2] is not premieres[0]
+    assert premieres[0].closed
+
+
+def test_connexion_fermee_ecartee_a_l_emprunt():
+    """Le contrôle de santé écarte une connexion fermée côté serveur"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=1, max_size=1)
+    morte = pool.emprunter()
+    pool.restituer(morte)
+    morte.closed = 1
+
+    # WHEN
+    con = pool.emprunter()
+
+    # THEN
+    assert con is not morte
+    assert pool.nb_ouvertes == 1
+
+
+def test_controle_de_sante_hors_du_verrou():
+    """Un SELECT 1 qui tarde pendant un emprunt ne bloque pas les restitutions des autres threads"""
+
+    # GIVEN
+    ping, reponse = threading.Event(), threading.Event()
+
+    class CurseurLent(FauxCurseur):
+        def execute(self, requete, params=None):
+            if requete == "SELECT 1":
+                ping.set()
+                reponse.wait(5)
+            super().execute(requete, params)
+
+    class ConnexionLente(FausseConnexion):
+        def cursor(self, cursor_factory=None):
+            return CurseurLent(self)
+
+    pool = PoolConnexions(ConnexionLente, min_size=0, max_size=2, ping_apres=0)
+    libre, autre = pool.emprunter(), pool.emprunter()
+    pool.restituer(libre)
+    empruntee = []
+    emprunt = threading.Thread(target=lambda: empruntee.append(pool.emprunter()))
+    emprunt.start()
+    ping.wait(5)
+
+    # WHEN
+    restitution = threading.Thread(target=pool.restituer, args=(autre,))
+    restitution.start()
+    restitution.join(1)
+    bloquee = restitution.is_alive()
+    reponse.set()
+    emprunt.join()
+
+    # THEN
+    assert not bloquee
+    assert empruntee == [libre]
+    assert pool.nb_libres == 1
+
+
+def test_emprunts_concurrents_bornes():
+    """Plusieurs threads ne dépassent jamais max_size connexions ouvertes"""
+
+    # GIVEN
+    pool = PoolConnexions(FausseConnexion, min_size=0, max_size=3, timeout=5)
+    maximum = []
+
+    def travail():
+        for _ in range(50):
+            with ConnexionEmpruntee(pool):
+                maximum.append(pool.nb_ouvertes)
+
+    # WHEN
+    threads = [threading.Thread(target=travail) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # THEN
+    assert max(maximum) <= 3
+    assert pool.nb_libres == pool.nb_ouvertes
+
+
+def test_point_de_sauvegarde():
+    """Pendant une transaction de test, commit et rollback des DAO s'arrêtent au SAVEPOINT"""
+
+    # GIVEN
+    con = FausseConnexion()
+    verrou = threading.RLock()
+
+    # WHEN
+    with PointDeSauvegarde(con, verrou) as sp:
+        sp.commit()
+    with pytest.raises(RuntimeError):
+        with PointDeSauvegarde(con, verrou):
+            raise RuntimeError("échec SQL")
+    with PointDeSauvegarde(con, verrou):
+        con.statut = extensions.TRANSACTION_STATUS_INERROR  # erreur SQL interceptée par le DAO
+
+    # THEN
+    assert con.ordres == [
+        "SAVEPOINT sp", "RELEASE SAVEPOINT sp", "SAVEPOINT sp", "RELEASE SAVEPOINT sp",
+        "SAVEPOINT sp", "ROLLBACK TO SAVEPOINT sp", "RELEASE SAVEPOINT sp",
+        "SAVEPOINT sp", "ROLLBACK TO SAVEPOINT sp", "RELEASE SAVEPOINT sp",
+    ]
+    assert (con.commits, con.rollbacks) == (0, 0)
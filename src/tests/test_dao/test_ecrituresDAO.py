@@ -0,0 +1,136 @@
+import uuid
+
+import pytest
+
+from business_object.CreneauBus import CreneauBus
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from dao.utilisateur_dao import UtilisateurDao
+from model.reservation_models import ReservationModelIn
+from model.utilisateur_models import UtilisateurModelIn
+from service.bus_service import CreneauBusService
+from service.evenement_service import EvenementService
+from service.reservation_service import ReservationService
+from service.utilisateur_service import UtilisateurService
+
+INCONNU = 999_999
+
+
+def utilisateur():
+    return UtilisateurDao().create(
+        UtilisateurModelIn(
+            email=f"{uuid.uuid4().hex[:8]}@exemple.fr", prenom="Ecriture", nom="Test", mot_de_passe="secret123"
+        )
+    )
+
+
+def test_ecritures_utilisateur_en_un_aller_retour(aller_retours):
+    """Modifier, changer le mot de passe, supprimer : une requête chacun, introuvable compris"""
+
+    # GIVEN
+    service = UtilisateurService()
+    cree = utilisateur()
+    avant = len(aller_retours)
+
+    # WHEN
+    service.update_user(cree.model_copy(update={"prenom": "Modifié"}))
+    service.change_user_password(cree.id_utilisateur, "nouveau123")
+    service.delete_user(cree.id_utilisateur)
+    with pytest.raises(ValueError, match="introuvable"):
+        service.delete_user(cree.id_utilisateur)
+
+    # THEN
+    assert len(aller_retours) == avant + 6  # + fermeture des sessions après mot de passe et suppression
+    assert UtilisateurDao._SQL_FIND_BY_ID not in aller_retours
+
+
+def test_modification_d_evenement_sans_lecture_prealable(aller_retours, evenement):
+    """La capacité précédente revient avec la mise à jour : la liste d'attente n'est servie que si elle augmente"""
+
+    # GIVEN
+    service = EvenementService()
+    cree = EvenementDao().find_by_id(evenement(capacite=2))
+    avant = len(aller_retours)
+
+    # WHEN
+    reduit = service.update_event(cree.model_copy(update={"capacite": 1}))
+    requetes_sans_hausse = len(aller_retours) - avant
+    with pytest.raises(ValueError, match="introuvable"):
+        service.update_event(cree.model_copy(update={"id_evenement": INCONNU}))
+    service.delete_event(cree.id_evenement)
+
+    # THEN
+    assert (reduit.capacite, reduit.capacite_precedente) == (1, 2)
+    assert requetes_sans_hausse == 1
+    assert len(aller_retours) == avant + 3
+
+
+def test_hausse_de_capacite_rend_la_capacite_precedente(evenement):
+    """La mise à jour verrouille puis lit l'ancienne ligne dans la même instruction : capacité d'avant comprise"""
+
+    # GIVEN
+    cree = EvenementDao().find_by_id(evenement(capacite=2))
+
+    # WHEN
+    modifie = EvenementDao().update(cree.model_copy(update={"capacite": 5}))
+
+    # THEN
+    assert (modifie.capacite, modifie.capacite_precedente) == (5, 2)
+    assert EvenementDao().find_by_id(cree.id_evenement).capacite == 5
+
+
+def test_bus_deplace_rend_l_evenement_precedent(evenement):
+    """Un bus changé d'événement rend celui qu'il quitte, pour y redistribuer les places"""
+
+    # GIVEN
+    depart, arrivee = evenement(), evenement()
+    bus = CreneauBusDao().create(CreneauBus(f"Bus {uuid.uuid4().hex[:8]}", 2, fk_evenement=depart))
+
+    # WHEN
+    bus.fk_evenement = arrivee
+    issue = CreneauBusDao().update(bus)
+
+    # THEN
+    assert issue.ecrite
+    assert (issue.ligne.fk_evenement, issue.fk_evenement) == (arrivee, depart)
+
+
+def test_annulation_sans_lecture_prealable(aller_retours, evenement):
+    """L'annulation ne relit pas la réservation ; introuvable est une issue typée, pas un find_by_id"""
+
+    # GIVEN
+    service = ReservationService()
+    id_reservation = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=utilisateur().id_utilisateur, fk_evenement=evenement())
+    ).reservation.id_reservation
+    avant = len(aller_retours)
+
+    # WHEN
+    service.delete_reservation(id_reservation)
+    requetes_annulation = len(aller_retours) - avant
+    with pytest.raises(ValueError, match="introuvable"):
+        service.delete_reservation(id_reservation)
+    issue = ReservationDao().delete(id_reservation)
+
+    # THEN
+    assert requetes_annulation == 2  # verrou + DELETE, puis promotion de la liste d'attente
+    assert len(aller_retours) == avant + 4
+    assert issue.statut == "introuvable"
+    assert ReservationDao._SQL_FIND_BY_ID not in aller_retours
+
+
+def test_bus_introuvable_en_un_aller_retour(aller_retours):
+    """Un bus inconnu est signalé par l'écriture elle-même"""
+
+    # GIVEN
+    service = CreneauBusService()
+
+    # WHEN
+    with pytest.raises(ValueError, match="introuvable"):
+        service.update_places(INCONNU, 10)
+    with pytest.raises(ValueError, match="introuvable"):
+        service.delete_bus(INCONNU)
+
+    # THEN
+    assert len(aller_retours) == 2
@@ -0,0 +1,71 @@
+from datetime import date
+
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from model.email_models import EmailModelIn
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn
+
+
+def email(destinataire="outbox@exemple.fr"):
+    return EmailModelIn(destinataire=destinataire, sujet="Sujet", contenu="Texte")
+
+
+def test_lot_pris_une_seule_fois():
+    """Un e-mail pris dans un lot n'est plus visible des autres workers pendant le bail"""
+
+    # GIVEN
+    id_email = EmailOutboxDao().ajouter(email())
+
+    # WHEN
+    premier = EmailOutboxDao().reserver_lot(limit=100)
+    second = EmailOutboxDao().reserver_lot(limit=100)
+
+    # THEN
+    assert id_email in [e.id_email for e in premier]
+    assert id_email not in [e.id_email for e in second]
+    assert EmailOutboxDao().find_by_id(id_email).tentatives == 1
+    EmailOutboxDao().marquer_envoyes([e.id_email for e in premier])
+    assert EmailOutboxDao().find_by_id(id_email).statut == "envoye"
+
+
+def test_lettre_morte_et_relance():
+    """Un e-mail abandonné est listé puis peut être remis en file"""
+
+    # GIVEN
+    id_email = EmailOutboxDao().ajouter(email())
+
+    # WHEN
+    EmailOutboxDao().abandonner(id_email, "HTTP 400")
+    abandonnes = [e.id_email for e in EmailOutboxDao().find_abandonnes()]
+    relance = EmailOutboxDao().relancer(id_email)
+
+    # THEN
+    assert id_email in abandonnes
+    assert relance is True
+    e = EmailOutboxDao().find_by_id(id_email)
+    assert (e.statut, e.tentatives) == ("en_attente", 0)
+
+
+def test_email_de_reservation_dans_la_meme_transaction():
+    """L'e-mail n'est déposé que si la réservation est effectivement créée"""
+
+    # GIVEN
+    evenement = EvenementDao().create(
+        EvenementModelIn(titre="Outbox", date_evenement=date(2030, 1, 1), capacite=1)
+    )
+    avant = EmailOutboxDao().compter_par_statut()["en_attente"]
+
+    # WHEN
+    reservee = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=1, fk_evenement=evenement.id_evenement), email=email("a@exemple.fr")
+    )
+    complet = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=2, fk_evenement=evenement.id_evenement), email=email("b@exemple.fr")
+    )
+
+    # THEN
+    assert (reservee.statut, complet.statut) == ("reservee", "complet")
+    assert EmailOutboxDao().compter_par_statut()["en_attente"] == avant + 1
+    EvenementDao().delete(evenement.id_evenement)
@@ -1,24 +1,9 @@
-import os
 from datetime import datetime
 
-import pytest
-
-from unittest.mock import patch
-
-from utils.reset_database import ResetDatabase
-
 from dao.evenement_dao import EvenementDao
 from model.evenement_models import EvenementModelIn, EvenementModelOut
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Initialisation des données de test"""
-    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
-        ResetDatabase().lancer(test_dao=True)
-        yield
-
-
 def test_find_all():
     """ Récupère la liste des événements"""
 
@@ -34,6 +19,25 @@ def test_find_all():
     assert len(evenements) >= 2
 
 
+def test_find_page():
+    """ Parcourt les événements page par page avec le curseur"""
+
+    # GIVEN
+    dao = EvenementDao()
+    tous = [e.id_evenement for e in dao.find_all()]
+
+    # WHEN
+    vus = []
+    page = dao.find_page(limit=1)
+    vus += [e.id_evenement for e in page.elements]
+    while page.curseur_suivant:
+        page = dao.find_page(limit=1, curseur=page.curseur_suivant)
+        vus += [e.id_evenement for e in page.elements]
+
+    # THEN
+    assert vus == sorted(tous)
+
+
 def test_find_by_id():
     """Récupère l'événement par l'identifiant """
 
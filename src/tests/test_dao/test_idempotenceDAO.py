@@ -0,0 +1,80 @@
+import uuid
+
+from dao.db_connection import DBConnection
+from dao.reservation_dao import ReservationDao
+from model.idempotence_models import CleIdempotenceModel
+from model.reservation_models import ReservationModelIn
+
+
+def cle(ttl=86400):
+    return CleIdempotenceModel(cle=uuid.uuid4().hex, ttl=ttl)
+
+
+def test_reservation_renvoyee_avec_la_meme_cle(utilisateurs, evenement):
+    """Le nouvel essai rend la même réservation, sans « doublon » ni place consommée"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=2)
+    (id_utilisateur,) = utilisateurs(1)
+    demande = ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=id_evenement)
+    idempotence = cle()
+
+    # WHEN
+    premier = ReservationDao().reserver(demande, idempotence=idempotence)
+    rejoue = ReservationDao().reserver(demande, idempotence=idempotence)
+    sans_cle = ReservationDao().reserver(demande)
+
+    # THEN
+    assert premier.statut == rejoue.statut == "reservee"
+    assert rejoue.reservation.id_reservation == premier.reservation.id_reservation
+    assert sans_cle.statut == "doublon"
+    assert ReservationDao().count_by_event(id_evenement) == 1
+
+
+def test_modification_et_annulation_renvoyees(utilisateurs, evenement):
+    """Modifier puis annuler avec une clé : les nouveaux essais rendent l'issue enregistrée"""
+
+    # GIVEN
+    (id_utilisateur,) = utilisateurs(1)
+    demande = ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=evenement())
+    id_reservation = ReservationDao().reserver(demande).reservation.id_reservation
+    modification, annulation = cle(), cle()
+
+    # WHEN
+    modifiee = ReservationDao().update_flags(id_reservation, boisson=True, idempotence=modification)
+    ReservationDao().update_flags(id_reservation, boisson=False)
+    modification_rejouee = ReservationDao().update_flags(id_reservation, boisson=True, idempotence=modification)
+    supprimee = ReservationDao().delete(id_reservation, idempotence=annulation)
+    annulation_rejouee = ReservationDao().delete(id_reservation, idempotence=annulation)
+
+    # THEN
+    assert modifiee.boisson is True
+    assert modification_rejouee == modifiee
+    assert supprimee.ecrite
+    assert annulation_rejouee == supprimee
+    assert ReservationDao().delete(id_reservation).statut == "introuvable"
+
+
+def test_cle_expiree_rejoue_l_operation(utilisateurs, evenement):
+    """Passé son TTL, la clé est reprise et l'opération s'exécute de nouveau ; la purge l'efface"""
+
+    # GIVEN
+    (id_utilisateur,) = utilisateurs(1)
+    demande = ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=evenement())
+    idempotence = cle()
+    ReservationDao().reserver(demande, idempotence=idempotence)
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "UPDATE cle_idempotence SET expire_le = CURRENT_TIMESTAMP - INTERVAL '1 second' WHERE cle = %(cle)s",
+                {"cle": idempotence.cle},
+            )
+
+    # WHEN
+    lu = ReservationDao().resultat_enregistre(idempotence, ReservationDao.OPERATION_RESERVER)
+    rejoue = ReservationDao().reserver(demande, idempotence=idempotence)
+
+    # THEN
+    assert lu is None
+    assert rejoue.statut == "doublon"
+    assert ReservationDao().purger_idempotence() >= 0
@@ -0,0 +1,70 @@
+from dao.db_connection import DBConnection
+from dao.import_dao import ImportDao
+from dao.utilisateur_dao import UtilisateurDao
+
+
+def utilisateur(email, nom="Import", telephone=None):
+    return {"email": email, "prenom": "Test", "nom": nom, "telephone": telephone,
+            "mot_de_passe": "$2b$04$hashfictif", "administrateur": False}
+
+
+def test_charger_utilisateurs_upsert():
+    """Les nouveaux comptes sont créés, les existants mis à jour sans toucher au mot de passe"""
+
+    # GIVEN
+    dao = ImportDao()
+    dao.charger_utilisateurs([(2, utilisateur("import.a@exemple.fr"))])
+
+    # WHEN
+    resultat = dao.charger_utilisateurs([
+        (2, {**utilisateur("import.a@exemple.fr", nom="Renommé"), "mot_de_passe": None}),
+        (3, utilisateur("import.b@exemple.fr", telephone="0611223344")),
+    ])
+
+    # THEN
+    assert (resultat.creees, resultat.mises_a_jour, resultat.erreurs) == (1, 1, [])
+    assert UtilisateurDao().find_by_email("import.a@exemple.fr").nom == "Renommé"
+    assert "import.a@exemple.fr" in dao.emails_existants(["import.a@exemple.fr", "inconnu@exemple.fr"])
+
+
+def test_ligne_refusee_par_la_base_isolee():
+    """Une ligne rejetée par la base (NOT NULL) est isolée, le reste du lot est chargé"""
+
+    # GIVEN
+    lignes = [(n, utilisateur(f"import.lot{n}@exemple.fr")) for n in range(2, 10)]
+    lignes[5] = (7, {**utilisateur("import.lot7@exemple.fr"), "mot_de_passe": None})
+
+    # WHEN
+    resultat = ImportDao().charger_utilisateurs(lignes)
+
+    # THEN
+    assert resultat.creees == 7
+    assert [e.ligne for e in resultat.erreurs] == [7]
+    assert "mot_de_passe" in resultat.erreurs[0].erreur
+
+
+def test_charger_reservations_respecte_la_capacite():
+    """Au-delà de la capacité, les réservations suivantes (ordre du fichier) sont refusées"""
+
+    # GIVEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "INSERT INTO evenement (titre, date_evenement, capacite, statut) "
+                "VALUES ('Import capacité', '2031-01-01', 2, 'disponible en ligne') RETURNING id_evenement"
+            )
+            id_evenement = curs.fetchone()["id_evenement"]
+            curs.execute("SELECT id_utilisateur FROM utilisateur ORDER BY id_utilisateur LIMIT 3")
+            ids = [r["id_utilisateur"] for r in curs.fetchall()]
+    lignes = [(n, {"fk_utilisateur": u, "fk_evenement": id_evenement, "bus_aller": True, "bus_retour": False,
+                   "adherent": False, "sam": False, "boisson": False}) for n, u in enumerate(ids, start=2)]
+    lignes.append((9, {**lignes[0][1], "fk_utilisateur": 999999}))
+
+    # WHEN
+    resultat = ImportDao().charger_reservations(lignes)
+
+    # THEN
+    assert resultat.creees == 2
+    assert [(e.ligne, e.erreur) for e in resultat.erreurs] == [
+        (4, "Événement complet."), (9, "Utilisateur introuvable."),
+    ]
@@ -0,0 +1,160 @@
+import os
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+
+from unittest.mock import patch
+from psycopg2.extras import RealDictCursor
+
+from utils.migrations import Migrations
+
+from dao.db_connection import DBConnection
+from dao.administrateur_dao import AdministrateurDao
+from dao.compteur_evenement_dao import CompteurEvenementDao
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.participant_dao import ParticipantDao
+from dao.reservation_dao import ReservationDao
+from dao.session_dao import SessionDao
+from dao.statistiques_dao import StatistiquesDao
+from dao.utilisateur_dao import UtilisateurDao
+
+# Tables dont un parcours séquentiel trahit un index manquant
+TABLES = {"utilisateur", "evenement", "reservation", "bus", "compteur_evenement", "email_outbox",
+          "session_utilisateur"}
+
+APPELS_DAO = {
+    "evenements disponibles": lambda: ConsultationEvenementDao().lister_disponibles(a_partir_du=date(2000, 1, 1)),
+    "evenements avec places": lambda: ConsultationEvenementDao().lister_avec_places_restantes(),
+    "evenements page": lambda: ConsultationEvenementDao().lister_tous_page(limit=2),
+    "recherche statut et dates": lambda: ConsultationEvenementDao().rechercher(
+        statut="disponible en ligne", date_min=date(2000, 1, 1)
+    ),
+    "reservations par evenement": lambda: ReservationDao().find_by_event(1),
+    "inscrits par evenement": lambda: ReservationDao().find_by_event_with_users(1),
+    "reservations par utilisateur": lambda: ReservationDao().find_by_user(1),
+    "administrateurs": lambda: AdministrateurDao().find_all(),
+    "participants": lambda: ParticipantDao().find_all(),
+    "utilisateur par email": lambda: UtilisateurDao().find_by_email("inconnu@exemple.fr"),
+    "statistiques": lambda: StatistiquesDao().statistiques(),
+    "derive des compteurs": lambda: CompteurEvenementDao().find_derives(),
+    "file d'envoi des e-mails": lambda: EmailOutboxDao().reserver_lot(limit=0),
+    "lettres mortes": lambda: EmailOutboxDao().find_abandonnes(),
+    "validation de session": lambda: SessionDao().lire_et_prolonger("inconnue", 600),
+}
+
+# Index que le plan doit citer (Index Scan, Index Only Scan ou Bitmap Index Scan) :
+# l'absence de Seq Scan ne suffit pas, un autre index pouvant servir par défaut
+INDEX_ATTENDUS = {
+    "evenements disponibles": "idx_evenement_disponible_date_id",
+    "evenements page": "idx_evenement_date_id",
+    "reservations par evenement": "idx_reservation_evenement",
+    "inscrits par evenement": "idx_reservation_evenement",
+    "administrateurs": "idx_utilisateur_administrateur",
+    "utilisateur par email": "utilisateur_email_key",
+    "file d'envoi des e-mails": "idx_email_outbox_a_envoyer",
+    "lettres mortes": "idx_email_outbox_abandonne",
+    "validation de session": "session_utilisateur_pkey",
+}
+
+
+@contextmanager
+def requetes_executees():
+    """Enregistre les requêtes (et paramètres) exécutées par les DAO."""
+    executees = []
+    original = RealDictCursor.execute
+
+    def espion(self, query, vars=None):
+        executees.append((query, vars))
+        return original(self, query, vars)
+
+    with patch.object(RealDictCursor, "execute", espion):
+        yield executees
+
+
+def plan(query, params):
+    """
+    Plan d'exécution JSON de la requête, parcours séquentiels désactivés :
+    le planificateur n'en choisit alors un que si aucun index n'est utilisable.
+    """
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SET LOCAL enable_seqscan = off")
+            curs.execute("EXPLAIN (FORMAT JSON) " + query, params)
+            return curs.fetchone()["QUERY PLAN"][0]["Plan"]
+
+
+def parcours_sequentiels(noeud):
+    """Tables lues par Seq Scan dans un plan (récursif)."""
+    tables = []
+    if noeud.get("Node Type") == "Seq Scan" and noeud.get("Relation Name") in TABLES:
+        tables.append(noeud["Relation Name"])
+    for enfant in noeud.get("Plans", []):
+        tables += parcours_sequentiels(enfant)
+    return tables
+
+
+def index_utilises(noeud):
+    """Noms des index lus dans un plan (récursif)."""
+    index = {noeud["Index Name"]} if "Index Name" in noeud else set()
+    for enfant in noeud.get("Plans", []):
+        index |= index_utilises(enfant)
+    return index
+
+
+@pytest.mark.parametrize("nom", list(APPELS_DAO))
+def test_requete_dao_utilise_un_index(nom):
+    """Chaque requête de lecture des DAO est servie par un index"""
+
+    # GIVEN
+    with requetes_executees() as executees:
+        APPELS_DAO[nom]()
+    assert executees
+
+    # WHEN
+    plans = [plan(q, p) for q, p in executees]
+    sequentiels = [parcours_sequentiels(p) for p in plans]
+    index = set().union(*(index_utilises(p) for p in plans))
+
+    # THEN
+    assert all(not s for s in sequentiels), f"{nom} : Seq Scan sur {sequentiels}"
+    if nom in INDEX_ATTENDUS:
+        assert INDEX_ATTENDUS[nom] in index, f"{nom} : {INDEX_ATTENDUS[nom]} absent du plan ({index})"
+
+
+def test_recherche_par_ville_utilise_le_trigramme():
+    """La recherche ILIKE '%ville%' est servie par l'index trigramme"""
+
+    # GIVEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "SELECT 1 FROM pg_indexes "
+                "WHERE indexname = 'idx_evenement_ville_trgm' AND schemaname = current_schema()"
+            )
+            if curs.fetchone() is None:
+                pytest.skip("pg_trgm indisponible sur ce serveur")
+
+    with requetes_executees() as executees:
+        ConsultationEvenementDao().rechercher(ville="renn")
+
+    # WHEN
+    index = index_utilises(plan(*executees[0]))
+
+    # THEN
+    assert "idx_evenement_ville_trgm" in index
+
+
+def test_migrations_idempotentes():
+    """Rejouer les migrations sur un schéma à jour n'applique rien"""
+
+    # GIVEN
+    schema = os.environ["POSTGRES_SCHEMA"]
+
+    # WHEN
+    nouvelles = Migrations().appliquer(schema)
+
+    # THEN
+    assert nouvelles == []
+    assert set(Migrations().appliquees(schema)) == {v for v, _, _ in Migrations().lister()}
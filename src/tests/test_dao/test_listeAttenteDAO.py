@@ -0,0 +1,144 @@
+import uuid
+
+from business_object.CreneauBus import CreneauBus
+from dao.affectation_bus_dao import AffectationBusDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.db_connection import DBConnection
+from dao.email_outbox_dao import EmailOutboxDao
+from dao.evenement_dao import EvenementDao
+from dao.liste_attente_dao import ListeAttenteDao
+from dao.reservation_dao import ReservationDao
+from model.email_models import EmailModelIn
+from model.reservation_models import ReservationModelIn
+
+
+def demande(id_utilisateur, id_evenement, **options):
+    return ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=id_evenement, **options)
+
+
+def email_promotion(promue):
+    return EmailModelIn(destinataire=promue.email, sujet=f"Promotion #{promue.id_reservation}", contenu="Place libérée")
+
+
+def test_inscription_en_liste_d_attente(utilisateurs, evenement):
+    """Sur un événement complet, la demande rejoint la file à la suite ; sans l'option, refus « complet »"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=1)
+    premier, second, troisieme, quatrieme = utilisateurs(4)
+    ReservationDao().reserver(demande(premier, id_evenement))
+
+    # WHEN
+    r2 = ReservationDao().reserver(demande(second, id_evenement), liste_attente=True)
+    r3 = ReservationDao().reserver(demande(troisieme, id_evenement), liste_attente=True)
+    encore = ReservationDao().reserver(demande(second, id_evenement), liste_attente=True)
+    refus = ReservationDao().reserver(demande(quatrieme, id_evenement))
+
+    # THEN
+    assert (r2.statut, r2.position) == ("en_attente", 1)
+    assert (r3.statut, r3.position) == ("en_attente", 2)
+    assert (encore.statut, encore.position) == ("en_attente", 1)
+    assert refus.statut == "complet"
+    assert [(a.fk_utilisateur, a.position) for a in ListeAttenteDao().find_by_event(id_evenement)] == [
+        (second, 1), (troisieme, 2)
+    ]
+    assert ListeAttenteDao().position(quatrieme, id_evenement) == 0
+
+
+def test_annulation_promeut_le_premier_de_la_file(utilisateurs, evenement):
+    """L'annulation attribue la place au plus ancien en attente, avec son e-mail, dans la même transaction"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=1)
+    titulaire, second, troisieme = utilisateurs(3)
+    resa = ReservationDao().reserver(demande(titulaire, id_evenement)).reservation
+    ReservationDao().reserver(demande(second, id_evenement, boisson=True), liste_attente=True)
+    ReservationDao().reserver(demande(troisieme, id_evenement), liste_attente=True)
+    emails_avant = EmailOutboxDao().compter_par_statut()["en_attente"]
+
+    # WHEN
+    supprimee = ReservationDao().delete(resa.id_reservation, email_promotion=email_promotion)
+
+    # THEN
+    assert supprimee.ecrite
+    inscrits = ReservationDao().find_by_event(id_evenement)
+    assert [(r.fk_utilisateur, r.boisson) for r in inscrits] == [(second, True)]
+    assert ReservationDao().count_by_event(id_evenement) == 1
+    assert ListeAttenteDao().position(troisieme, id_evenement) == 1
+    assert ListeAttenteDao().position(second, id_evenement) == 0
+    assert EmailOutboxDao().compter_par_statut()["en_attente"] == emails_avant + 1
+
+
+def test_promotion_avec_place_de_bus(utilisateurs, evenement):
+    """La réservation promue reçoit la place de bus libérée par l'annulation"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=1)
+    bus = CreneauBusDao().create(
+        CreneauBus(f"Bus {uuid.uuid4().hex[:8]}", 1, direction="aller", fk_evenement=id_evenement)
+    ).id_bus
+    titulaire, second = utilisateurs(2)
+    resa = ReservationDao().reserver(demande(titulaire, id_evenement, bus_aller=True)).reservation
+    ReservationDao().reserver(demande(second, id_evenement, bus_aller=True), liste_attente=True)
+
+    # WHEN
+    ReservationDao().delete(resa.id_reservation)
+
+    # THEN
+    (promue,) = ReservationDao().find_by_event(id_evenement)
+    assert promue.fk_utilisateur == second
+    assert [a.fk_bus for a in AffectationBusDao().find_by_reservation(promue.id_reservation)] == [bus]
+
+
+def test_promotion_apres_hausse_de_capacite_et_depart_de_la_file(utilisateurs, evenement):
+    """Une capacité augmentée sert la file dans l'ordre ; une demande retirée n'est pas servie"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=1)
+    titulaire, second, troisieme, quatrieme = utilisateurs(4)
+    ReservationDao().reserver(demande(titulaire, id_evenement))
+    for u in (second, troisieme, quatrieme):
+        ReservationDao().reserver(demande(u, id_evenement), liste_attente=True)
+    evt = EvenementDao().find_by_id(id_evenement)
+
+    # WHEN
+    quitte = ListeAttenteDao().quitter(second, id_evenement)
+    EvenementDao().update(evt.model_copy(update={"capacite": 2}))
+    promues = ListeAttenteDao().promouvoir(id_evenement, email_promotion=email_promotion)
+
+    # THEN
+    assert quitte is True
+    assert ListeAttenteDao().quitter(second, id_evenement) is False
+    assert [p.fk_utilisateur for p in promues] == [troisieme]
+    assert promues[0].titre == "Attente"
+    assert [(a.fk_utilisateur, a.position) for a in ListeAttenteDao().find_by_event(id_evenement)] == [
+        (quatrieme, 1)
+    ]
+
+
+def test_entree_perimee_ne_prend_pas_de_place(utilisateurs, evenement):
+    """Une réservation directe retire de la file ; une entrée périmée en tête est retirée sans garder la place"""
+
+    # GIVEN
+    id_evenement = evenement(capacite=1)
+    titulaire, second, troisieme, quatrieme = utilisateurs(4)
+    ReservationDao().reserver(demande(titulaire, id_evenement))
+    for u in (second, troisieme, quatrieme):
+        ReservationDao().reserver(demande(u, id_evenement), liste_attente=True)
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            # Places ajoutées sans promotion, puis réservation hors ReservationDao : entrée périmée en tête
+            curs.execute("UPDATE evenement SET capacite = 4 WHERE id_evenement = %(id)s", {"id": id_evenement})
+            curs.execute(
+                "INSERT INTO reservation (fk_utilisateur, fk_evenement) VALUES (%(u)s, %(e)s)",
+                {"u": second, "e": id_evenement},
+            )
+
+    # WHEN
+    directe = ReservationDao().reserver(demande(quatrieme, id_evenement))
+    promues = ListeAttenteDao().promouvoir(id_evenement)
+
+    # THEN
+    assert directe.statut == "reservee"
+    assert [p.fk_utilisateur for p in promues] == [troisieme]
+    assert ListeAttenteDao().find_by_event(id_evenement) == []
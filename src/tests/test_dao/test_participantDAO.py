@@ -1,26 +1,12 @@
-import os
 import uuid
 from datetime import datetime
 
-import pytest
-
-from unittest.mock import patch
-
-from utils.reset_database import ResetDatabase
 from utils.securite import hash_password
 
 from dao.participant_dao import ParticipantDao
 from model.participant_models import ParticipantModelOut, ParticipantModelIn
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Initialisation des données de test"""
-    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
-        ResetDatabase().lancer(test_dao=True)
-        yield
-
-
 def test_find_all():
     """ Récupère la liste des participants """
 
@@ -0,0 +1,48 @@
+import logging
+
+from unittest.mock import patch
+
+from utils.profilage_sql import ProfilageRequetes
+
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+
+
+def test_requetes_des_dao_chronometrees():
+    """Chaque requête d'un DAO est enregistrée avec sa méthode appelante et son nombre de lignes"""
+
+    # GIVEN
+    profilage = ProfilageRequetes()
+    profilage.vider()
+
+    # WHEN
+    for _ in range(3):
+        EvenementDao().find_by_id(1)
+
+    # THEN
+    lignes = [r for r in profilage.rapport() if "EvenementDao.find_by_id" in r["appelants"]]
+    assert len(lignes) == 1
+    assert lignes[0]["appels"] == 3
+    assert lignes[0]["lignes_moyennes"] == 1
+    assert "FROM evenement WHERE id_evenement = ?" in lignes[0]["empreinte"]
+
+
+def test_requete_lente_journalisee_avec_son_plan(caplog):
+    """Une requête au-dessus du seuil est journalisée avec son plan, sans casser la transaction"""
+
+    # GIVEN
+    profilage = ProfilageRequetes()
+    profilage.vider()
+    caplog.set_level(logging.WARNING, logger="utils.profilage_sql")
+
+    # WHEN
+    with patch.object(profilage, "seuil_lent", 0.0):
+        inscrits = ReservationDao().find_by_event_with_users(1)
+        evenement = EvenementDao().find_by_id(1)
+
+    # THEN
+    assert isinstance(inscrits, list)
+    assert evenement is not None
+    assert "Requête lente" in caplog.text
+    assert "Plan :" in caplog.text
+    assert "ReservationDao.find_by_event_with_users" in caplog.text
@@ -1,24 +1,9 @@
-import os
-from datetime import datetime
-
-
-import pytest
-
-from unittest.mock import patch
-
-from utils.reset_database import ResetDatabase
+from datetime import datetime, date
 
 from dao.reservation_dao import ReservationDao
 from dao.evenement_dao import EvenementDao
-from model.reservation_models import ReservationModelIn, ReservationModelOut
-
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Initialisation des données de test"""
-    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
-        ResetDatabase().lancer(test_dao=True)
-        yield
+from model.reservation_models import ReservationModelIn, ReservationModelOut, InscritModelOut
+from model.evenement_models import EvenementModelIn
 
 
 def test_find_by_user():
@@ -42,6 +27,37 @@ def test_find_by_event():
 # Mohamed tu peux faire cette fonction si tu veux essayer
 
 
+def test_iter_by_event():
+    """Le parcours en flux renvoie les mêmes réservations que find_by_event"""
+
+    # GIVEN
+    id_evenement = 1
+    attendues = [r.id_reservation for r in ReservationDao().find_by_event(id_evenement)]
+
+    # WHEN
+    lues = [r.id_reservation for r in ReservationDao().iter_by_event(id_evenement, itersize=1)]
+
+    # THEN
+    assert lues == attendues
+
+
+def test_find_by_event_with_users():
+    """Récupère les inscrits d'un événement avec leurs coordonnées, en une requête"""
+
+    # GIVEN
+    id_evenement = 1
+
+    # WHEN
+    inscrits = ReservationDao().find_by_event_with_users(id_evenement)
+
+    # THEN
+    assert len(inscrits) >= 1
+    for i in inscrits:
+        assert isinstance(i, InscritModelOut)
+        assert i.fk_evenement == id_evenement
+        assert i.email
+
+
 def test_find_by_id():
     """Récupère la réservation par son identifiant"""
 
@@ -106,3 +122,51 @@ def test_delete():
 
     # THEN
     assert suppression_ok
+
+
+def test_reserver_ok():
+    """Réservation atomique d'une place disponible"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=3, fk_evenement=2, bus_aller=True)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == "reservee"
+    assert resultat.reservation is not None
+    assert resultat.reservation.fk_evenement == 2
+
+
+def test_reserver_doublon():
+    """Un utilisateur ne peut pas réserver deux fois le même événement"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=2, fk_evenement=2)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == "doublon"
+    assert resultat.reservation is None
+
+
+def test_reserver_complet():
+    """Aucune réservation au-delà de la capacité de l'événement"""
+
+    # GIVEN
+    evenement = EvenementDao().create(
+        EvenementModelIn(titre="Soirée complète", date_evenement=date(2030, 1, 1), capacite=1)
+    )
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=evenement.id_evenement))
+
+    # WHEN
+    resultat = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=2, fk_evenement=evenement.id_evenement)
+    )
+
+    # THEN
+    assert resultat.statut == "complet"
+    assert ReservationDao().count_by_event(evenement.id_evenement) == 1
@@ -0,0 +1,68 @@
+import uuid
+
+from dao.db_connection import DBConnection
+from dao.session_dao import SessionDao
+
+
+def vieillir(id_session, secondes):
+    """Avance artificiellement l'expiration d'une session de `secondes` secondes."""
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "UPDATE session_utilisateur SET expire_le = expire_le - %(s)s * INTERVAL '1 second' "
+                "WHERE id_session = %(id)s",
+                {"s": secondes, "id": id_session},
+            )
+
+
+def test_creer_puis_lire():
+    """Une session créée est relue par son identifiant"""
+
+    # GIVEN
+    id_session = uuid.uuid4().hex
+
+    # WHEN
+    creee = SessionDao().creer(id_session, 1, False, 600)
+    lue = SessionDao().lire_et_prolonger(id_session, 600)
+
+    # THEN
+    assert lue.fk_utilisateur == 1
+    assert lue.expire_le == creee.expire_le  # trop récente pour être repoussée
+
+
+def test_expiration_glissante():
+    """Une session utilisée est repoussée ; une session expirée n'est plus lue"""
+
+    # GIVEN
+    active, expiree = uuid.uuid4().hex, uuid.uuid4().hex
+    SessionDao().creer(active, 1, False, 600)
+    SessionDao().creer(expiree, 1, False, 600)
+    vieillir(active, 300)
+    vieillir(expiree, 601)
+    avant = SessionDao().creer(uuid.uuid4().hex, 1, False, 600).expire_le
+
+    # WHEN
+    prolongee = SessionDao().lire_et_prolonger(active, 600)
+
+    # THEN
+    assert prolongee.expire_le >= avant
+    assert SessionDao().lire_et_prolonger(expiree, 600) is None
+    assert SessionDao().purger() >= 1
+
+
+def test_fermer_les_sessions():
+    """Déconnexion d'une session, puis de toutes celles d'un utilisateur"""
+
+    # GIVEN
+    ids = [uuid.uuid4().hex for _ in range(3)]
+    for i in ids:
+        SessionDao().creer(i, 2, False, 600)
+
+    # WHEN
+    fermee = SessionDao().supprimer(ids[0])
+    toutes = SessionDao().supprimer_par_utilisateur(2)
+
+    # THEN
+    assert fermee
+    assert toutes >= 2
+    assert all(SessionDao().lire_et_prolonger(i, 600) is None for i in ids)
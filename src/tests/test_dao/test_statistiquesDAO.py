@@ -0,0 +1,32 @@
+from dao.statistiques_dao import StatistiquesDao
+from model.statistiques_models import StatistiquesEvenementModel
+
+
+def test_statistiques():
+    """Une ligne par événement puis la ligne de total, en une requête"""
+
+    # GIVEN
+
+    # WHEN
+    lignes = StatistiquesDao().statistiques()
+
+    # THEN
+    assert all(isinstance(ligne, StatistiquesEvenementModel) for ligne in lignes)
+    par_evenement, total = lignes[:-1], lignes[-1]
+    assert total.id_evenement is None
+    assert total.inscrits == sum(ligne.inscrits for ligne in par_evenement)
+    assert total.capacite == sum(ligne.capacite for ligne in par_evenement)
+    assert total.sam == sum(ligne.sam for ligne in par_evenement)
+
+
+def test_statistiques_limit():
+    """Le paramètre limit borne le nombre d'événements"""
+
+    # GIVEN
+    limit = 2
+
+    # WHEN
+    lignes = StatistiquesDao().statistiques(limit=limit)
+
+    # THEN
+    assert len(lignes) == limit + 1
@@ -1,27 +1,16 @@
-import os
 import uuid
 from datetime import datetime
 
-import pytest
-
 from unittest.mock import patch
 
-from utils.reset_database import ResetDatabase
-from utils.securite import hash_password
+from utils.securite import HachageMotDePasse, cout_du_hash, hash_password
 
+from dao.db_connection import DBConnection
 from dao.utilisateur_dao import UtilisateurDao
 from business_object.Utilisateur import Utilisateur
 from model.utilisateur_models import UtilisateurModelOut, UtilisateurModelIn
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
-    """Initialisation des données de test"""
-    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
-        ResetDatabase().lancer(test_dao=True)
-        yield
-
-
 def test_find_all():
     """ Récupère la liste des utilisateurs """
 
@@ -37,6 +26,19 @@ def test_find_all():
     assert len(utilisateurs) >= 2
 
 
+def test_iter_all():
+    """Le parcours en flux renvoie tous les utilisateurs, triés par id"""
+
+    # GIVEN
+    attendus = [u.id_utilisateur for u in UtilisateurDao().find_all(limit=10_000)]
+
+    # WHEN
+    lus = [u.id_utilisateur for u in UtilisateurDao().iter_all(itersize=2)]
+
+    # THEN
+    assert lus == attendus
+
+
 def test_find_by_id():
     """Recherche par id d'un utilisateur existant"""
 
@@ -132,3 +134,26 @@ def test_authentificate():
 
     # THEN
     assert isinstance(utilisateur, Utilisateur)
+
+
+def test_authenticate_rehache_au_cout_configure():
+    """Une connexion réussie refait un hash dont le coût n'est plus celui configuré"""
+
+    # GIVEN
+    email = f"rehash.{uuid.uuid4().hex[:8]}@example.com"
+    UtilisateurDao().create(UtilisateurModelIn(
+        email=email, prenom="Re", nom="Hash", telephone=None, mot_de_passe="Mdp-rehash-1", administrateur=False
+    ))
+    hachage = HachageMotDePasse()
+
+    # WHEN
+    with patch.object(hachage, "cout", 5):
+        utilisateur = UtilisateurDao().authenticate(email, "Mdp-rehash-1")
+        deuxieme = UtilisateurDao().authenticate(email, "Mdp-rehash-1")
+
+    # THEN
+    assert utilisateur is not None and deuxieme is not None
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SELECT mot_de_passe FROM utilisateur WHERE email = %(email)s", {"email": email})
+            assert cout_du_hash(curs.fetchone()["mot_de_passe"]) == 5
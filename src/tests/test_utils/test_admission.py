@@ -0,0 +1,102 @@
+import pytest
+
+from unittest.mock import patch
+
+from dao.admission_dao import AdmissionMemoireDao
+from service.admission_service import AdmissionService
+from utils.singleton import Singleton
+
+
+class Horloge:
+    def __init__(self):
+        self.t = 1_000.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def horloge():
+    return Horloge()
+
+
+@pytest.fixture
+def dao(horloge):
+    """Stockage en mémoire dédié au test, à l'horloge contrôlée."""
+    with patch.dict(Singleton._instances):
+        Singleton._instances.pop(AdmissionMemoireDao, None)
+        yield AdmissionMemoireDao(horloge=horloge)
+
+
+def test_rafale_puis_debit(dao, horloge):
+    """Les `rafale` premiers entrent aussitôt, les suivants au débit, dans l'ordre d'arrivée"""
+
+    # GIVEN
+    service = AdmissionService(dao=dao, debit=2, rafale=3)
+
+    # WHEN
+    tickets = [service.entrer(f"u{i}") for i in range(6)]
+    horloge.t += 1
+    apres_une_seconde = [service.statut(f"u{i}").admis for i in range(6)]
+
+    # THEN
+    assert [t.ticket for t in tickets] == [1, 2, 3, 4, 5, 6]
+    assert [t.admis for t in tickets] == [True, True, True, False, False, False]
+    assert [t.position for t in tickets[3:]] == [1, 2, 3]
+    assert [t.attente_estimee for t in tickets[3:]] == [0.5, 1.0, 1.5]
+    assert apres_une_seconde == [True, True, True, True, True, False]
+
+
+def test_ticket_repris_a_l_identique_puis_expire(dao, horloge):
+    """Reprendre un ticket rend la même place ; passé la validité, le client repart en fin de file"""
+
+    # GIVEN
+    service = AdmissionService(dao=dao, debit=1, rafale=1, validite=60)
+    service.entrer("alice")
+    premier = service.entrer("bob")
+
+    # WHEN
+    repris = service.entrer("bob")
+    horloge.t += 61
+    expire = service.statut("bob")
+    nouveau = service.entrer("bob")
+
+    # THEN
+    assert repris.ticket == premier.ticket == 2
+    assert expire is None
+    assert nouveau.ticket == 3
+
+
+def test_creux_plafonne_a_la_rafale(dao, horloge):
+    """Après un long creux, une arrivée massive n'admet pas plus de `rafale` clients d'un coup"""
+
+    # GIVEN
+    service = AdmissionService(dao=dao, debit=10, rafale=5)
+    service.entrer("premier")
+
+    # WHEN
+    horloge.t += 3600
+    tickets = [service.entrer(f"u{i}") for i in range(20)]
+
+    # THEN
+    assert sum(t.admis for t in tickets) == 5
+    assert tickets[-1].position == 15
+
+
+def test_controle_avant_reservation(dao):
+    """Sans ticket ou avant son tour, le contrôle refuse ; sans débit configuré, tout le monde passe"""
+
+    # GIVEN
+    service = AdmissionService(dao=dao, debit=1, rafale=1)
+    service.entrer("alice")
+    service.entrer("bob")
+
+    # WHEN / THEN
+    assert service.verifier_admis("alice").admis
+    with pytest.raises(ValueError, match="rang 1"):
+        service.verifier_admis("bob")
+    with pytest.raises(ValueError, match="ticket"):
+        service.verifier_admis("charlie")
+    assert AdmissionService(dao=dao, debit=0).verifier_admis("charlie").admis
+    assert service.vider() is True
+    assert service.statut("alice") is None
@@ -0,0 +1,152 @@
+from datetime import date
+
+from model.reservation_models import ReservationModelIn, ResultatReservationModel
+from service.consultation_evenement_service import ConsultationEvenementService
+from service.reservation_service import ReservationService
+from utils.cache import CacheCatalogue, CacheTTL
+
+
+class Horloge:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+class FauxConsultationDao:
+    def __init__(self):
+        self.appels = 0
+
+    def rechercher(self, **filtres):
+        self.appels += 1
+        return [filtres["ville"]]
+
+    def lister_avec_places_restantes(self, **filtres):
+        self.appels += 1
+        return [{"id_evenement": 1, "places_restantes": 5}, {"id_evenement": 2, "places_restantes": 3}]
+
+
+class FauxReservationDao:
+    def reserver(self, reservation_in, email=None, liste_attente=False, idempotence=None):
+        statut = "reservee" if reservation_in.fk_utilisateur == 2 else "doublon"
+        return ResultatReservationModel(statut=statut, places_restantes=2)
+
+
+def test_ttl_et_lru():
+    """Une entrée expire après le TTL ; au-delà de la taille, la moins récemment lue est évincée"""
+
+    # GIVEN
+    horloge = Horloge()
+    cache = CacheTTL(taille_max=2, ttl=10, horloge=horloge)
+    cache.ecrire("a", 1)
+    cache.ecrire("b", 2)
+
+    # WHEN
+    cache.lire("a")
+    cache.ecrire("c", 3)
+    horloge.t = 5
+    b, c_frais = cache.lire("b"), cache.lire("c")
+    horloge.t = 10
+    c_expire = cache.lire("c")
+
+    # THEN
+    assert b == (False, None)
+    assert c_frais == (True, 3)
+    assert c_expire == (False, None)
+    stats = cache.statistiques()
+    assert (stats["evictions"], stats["expirations"], stats["succes"], stats["echecs"]) == (1, 1, 2, 2)
+    assert stats["taux_succes"] == 0.5
+
+
+def test_invalider_par_etiquette():
+    """Seules les entrées portant l'étiquette invalidée disparaissent"""
+
+    # GIVEN
+    cache = CacheTTL()
+    cache.ecrire("liste 1", [1, 2], etiquettes=[("places", 1), ("places", 2)])
+    cache.ecrire("liste 2", [3], etiquettes=[("places", 3)])
+
+    # WHEN
+    n = cache.invalider(("places", 2))
+
+    # THEN
+    assert n == 1
+    assert cache.lire("liste 1") == (False, None)
+    assert cache.lire("liste 2") == (True, [3])
+
+
+def test_invalidation_pendant_le_calcul():
+    """Un résultat calculé pendant une invalidation de son étiquette n'est pas mémorisé"""
+
+    # GIVEN
+    cache = CacheTTL()
+
+    def calcul_pendant_une_reservation():
+        cache.invalider(("places", 1))
+        return [{"id_evenement": 1, "places_restantes": 5}]
+
+    # WHEN
+    perime = cache.lire_ou_calculer("liste", calcul_pendant_une_reservation, CacheCatalogue.etiquettes_places)
+    frais = cache.lire_ou_calculer("autre", lambda: [{"id_evenement": 2}], CacheCatalogue.etiquettes_places)
+
+    # THEN
+    assert perime == [{"id_evenement": 1, "places_restantes": 5}]
+    assert cache.lire("liste") == (False, None)
+    assert cache.lire("autre") == (True, [{"id_evenement": 2}])
+
+
+def test_service_cle_normalisee():
+    """Deux recherches équivalentes (casse, espaces) ne touchent la base qu'une fois"""
+
+    # GIVEN
+    dao = FauxConsultationDao()
+    service = ConsultationEvenementService(dao=dao, cache=CacheTTL())
+
+    # WHEN
+    service.rechercher(ville="Rennes", date_min=date(2030, 1, 1))
+    service.rechercher(ville="  rennes ", date_min=date(2030, 1, 1))
+    service.rechercher(ville="Brest")
+
+    # THEN
+    assert dao.appels == 2
+    assert service.statistiques_cache()["succes"] == 1
+
+
+def test_service_requete_et_cle_memes_filtres():
+    """Le DAO reçoit les filtres normalisés qui ont servi de clé : pas de résultat mis en cache sous une autre clé"""
+
+    # GIVEN
+    dao = FauxConsultationDao()
+    service = ConsultationEvenementService(dao=dao, cache=CacheTTL())
+
+    # WHEN
+    vide = service.rechercher(ville="   ")
+    rennes = service.rechercher(ville="  Rennes ")
+
+    # THEN
+    assert vide == [None]
+    assert rennes == ["rennes"]
+
+
+def test_reservation_invalide_les_places_de_l_evenement():
+    """Une réservation invalide les listes contenant son événement, pas les autres"""
+
+    # GIVEN
+    CacheCatalogue().vider()
+    dao = FauxConsultationDao()
+    consultation = ConsultationEvenementService(dao=dao)
+    consultation.lister_avec_places_restantes()
+    consultation.rechercher(ville="Rennes")
+    reservations = ReservationService(dao=FauxReservationDao())
+
+    # WHEN
+    reservations.reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=2))  # doublon : rien ne change
+    consultation.lister_avec_places_restantes()
+    reservations.reserver(ReservationModelIn(fk_utilisateur=2, fk_evenement=2))
+    consultation.lister_avec_places_restantes()
+    consultation.rechercher(ville="Rennes")
+
+    # THEN
+    assert dao.appels == 3
+    CacheCatalogue().vider()
@@ -0,0 +1,48 @@
+import io
+import json
+from datetime import datetime
+
+from model.reservation_models import ReservationModelOut
+from utils.export import ecrire_csv, ecrire_json
+
+
+def _reservations(n):
+    for i in range(1, n + 1):
+        yield ReservationModelOut(
+            id_reservation=i, fk_utilisateur=1, fk_evenement=2,
+            bus_aller=True, bus_retour=False, adherent=False, sam=False, boisson=True,
+            date_reservation=datetime(2030, 1, 1),
+        )
+
+
+def test_ecrire_json():
+    """Le tableau JSON écrit en flux est valide, vide ou non"""
+
+    # GIVEN
+    sortie, vide = io.StringIO(), io.StringIO()
+
+    # WHEN
+    n = ecrire_json(_reservations(3), sortie)
+    ecrire_json(_reservations(0), vide)
+
+    # THEN
+    assert n == 3
+    assert [r["id_reservation"] for r in json.loads(sortie.getvalue())] == [1, 2, 3]
+    assert json.loads(vide.getvalue()) == []
+
+
+def test_ecrire_csv():
+    """Une ligne d'en-tête puis une ligne par élément"""
+
+    # GIVEN
+    sortie = io.StringIO()
+    colonnes = list(ReservationModelOut.model_fields)
+
+    # WHEN
+    n = ecrire_csv(colonnes, _reservations(2), sortie)
+
+    # THEN
+    lignes = sortie.getvalue().splitlines()
+    assert n == 2
+    assert lignes[0].split(",") == colonnes
+    assert len(lignes) == 3
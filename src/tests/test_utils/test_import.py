@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+from dao.import_dao import _champ_csv
+from model.import_models import ChargementModel, ErreurLigneModel
+from service.import_service import ImportService
+
+
+class FauxHachage:
+    def __init__(self):
+        self.haches = []
+
+    def hacher_plusieurs(self, mots_de_passe):
+        self.haches.extend(mots_de_passe)
+        return [f"hash:{mdp}" for mdp in mots_de_passe]
+
+
+class FauxImportDao:
+    def __init__(self, existants=()):
+        self.existants = set(existants)
+        self.lots = []
+
+    def emails_existants(self, emails):
+        return self.existants & set(emails)
+
+    def charger_utilisateurs(self, lignes):
+        self.lots.append([(n, dict(v)) for n, v in lignes])
+        existants = sum(1 for _, v in lignes if v["email"] in self.existants)
+        return ChargementModel(creees=len(lignes) - existants, mises_a_jour=existants)
+
+    def charger_reservations(self, lignes):
+        self.lots.append(list(lignes))
+        complets = [n for n, v in lignes if v["fk_evenement"] == 99]
+        return ChargementModel(
+            creees=len(lignes) - len(complets),
+            erreurs=[ErreurLigneModel(ligne=n, erreur="Événement complet.") for n in complets],
+        )
+
+
+CSV_UTILISATEURS = """nom,prenom,telephone,email,mot_de_passe
+Martin,Alice,,alice@exemple.fr,mdpAlice
+Durand,Bob,0600000000,bob@exemple.fr,mdpBob
+Petit,Zoé,,pas-un-email,mdpZoe
+Martin,Alice,,alice@exemple.fr,autre
+Leroy,Chloé,,chloe@exemple.fr,mdpChloe
+"""
+
+
+def test_import_utilisateurs_valide_deduplique_et_hache():
+    """Lignes invalides et doublons rapportés ; seuls les nouveaux comptes sont hachés"""
+
+    # GIVEN
+    dao, hachage = FauxImportDao(existants={"bob@exemple.fr"}), FauxHachage()
+    service = ImportService(dao=dao, hachage=hachage, taille_lot=2)
+
+    # WHEN
+    rapport = service.importer("utilisateurs", service.lire(io.StringIO(CSV_UTILISATEURS), "csv"))
+
+    # THEN
+    assert (rapport.lues, rapport.creees, rapport.mises_a_jour) == (5, 2, 1)
+    assert [e.ligne for e in rapport.erreurs] == [4, 5]
+    assert "email" in rapport.erreurs[0].erreur
+    assert rapport.erreurs[1].erreur == "Doublon de la ligne 2."
+    assert sorted(hachage.haches) == ["mdpAlice", "mdpChloe"]
+    assert [len(lot) for lot in dao.lots] == [2, 1]
+    bob = dao.lots[0][1][1]
+    assert bob["mot_de_passe"] is None and bob["telephone"] == "0600000000"
+    assert dao.lots[0][0][1]["mot_de_passe"] == "hash:mdpAlice"
+
+
+def test_import_reservations_jsonl_erreurs_par_ligne():
+    """JSON invalide, validation et refus de la base sont rapportés sans interrompre l'import"""
+
+    # GIVEN
+    texte = "\n".join([
+        '{"fk_utilisateur": 1, "fk_evenement": 2, "bus_aller": true}',
+        '{"fk_utilisateur": 1, "fk_evenement": 2}',
+        '{"fk_utilisateur": "x", "fk_evenement": 3}',
+        "",
+        "{pas du json",
+        '{"fk_utilisateur": 2, "fk_evenement": 99}',
+        '{"fk_utilisateur": 3, "fk_evenement": 2}',
+    ])
+    service = ImportService(dao=FauxImportDao(), hachage=FauxHachage())
+
+    # WHEN
+    rapport = service.importer("reservations", service.lire(io.StringIO(texte), "jsonl"))
+
+    # THEN
+    assert rapport.lues == 6
+    assert rapport.creees == 2
+    assert [(e.ligne, e.erreur.split(" ")[0]) for e in rapport.erreurs] == [
+        (2, "Doublon"), (3, "fk_utilisateur"), (5, "JSON"), (6, "Événement"),
+    ]
+    assert rapport.debit > 0
+
+
+def test_table_et_format_inconnus():
+    """Table ou format inconnus : ValueError"""
+
+    # GIVEN
+    service = ImportService(dao=FauxImportDao(), hachage=FauxHachage())
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        service.importer("bus", [])
+    with pytest.raises(ValueError):
+        service.lire(io.StringIO(""), "xml")
+
+
+def test_champ_csv_pour_copy():
+    """NULL, booléens et guillemets sont encodés sans ambiguïté pour COPY"""
+
+    # GIVEN / WHEN / THEN
+    assert _champ_csv(None) == "\\N"
+    assert _champ_csv(True) == "t"
+    assert _champ_csv('Soirée "Gala"') == '"Soirée ""Gala"""'
+    assert _champ_csv("\\N") == '"\\N"'
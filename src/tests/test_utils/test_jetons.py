@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.jetons import signer_jeton, verifier_jeton
+
+
+@pytest.fixture(autouse=True)
+def secret():
+    with patch.dict(os.environ, {"API_SECRET": "secret-de-test"}):
+        yield
+
+
+def test_jeton_aller_retour():
+    """Un jeton signé se relit avec son contenu et son expiration"""
+
+    # GIVEN
+    contenu = {"id": 3, "admin": False}
+
+    # WHEN
+    jeton = signer_jeton(contenu, duree=60, maintenant=1000)
+
+    # THEN
+    assert verifier_jeton(jeton, maintenant=1059) == {"id": 3, "admin": False, "exp": 1060}
+
+
+def test_jeton_expire():
+    """Un jeton expiré est refusé"""
+
+    # GIVEN
+    jeton = signer_jeton({"id": 3}, duree=60, maintenant=1000)
+
+    # WHEN / THEN
+    with pytest.raises(ValueError, match="expiré"):
+        verifier_jeton(jeton, maintenant=1060)
+
+
+def test_jeton_falsifie():
+    """Modifier le contenu (ex : s'attribuer le rôle admin) invalide la signature"""
+
+    # GIVEN
+    jeton = signer_jeton({"id": 3, "admin": False}, duree=60)
+    _, signature = jeton.split(".")
+    faux = signer_jeton({"id": 3, "admin": True}, duree=60).split(".")[0] + "." + signature
+
+    # WHEN / THEN
+    with pytest.raises(ValueError, match="invalide"):
+        verifier_jeton(faux)
+    with pytest.raises(ValueError, match="invalide"):
+        verifier_jeton("nimporte-quoi")
+
+
+def test_jeton_autre_secret():
+    """Un jeton signé avec un autre secret est refusé"""
+
+    # GIVEN
+    jeton = signer_jeton({"id": 3}, duree=60)
+
+    # WHEN / THEN
+    with patch.dict(os.environ, {"API_SECRET": "autre"}):
+        with pytest.raises(ValueError, match="invalide"):
+            verifier_jeton(jeton)
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from utils.histogramme import Histogramme
+from utils.log_decorator import durees_appels, log
+
+
+class Espion:
+    """Argument qui compte ses mises en forme."""
+
+    def __init__(self):
+        self.formatages = 0
+
+    def __str__(self):
+        self.formatages += 1
+        return "espion"
+
+
+class Service:
+    @log
+    def connecter(self, email, mot_de_passe):
+        return "ok"
+
+    @log(niveau=logging.DEBUG)
+    def detail(self, valeur):
+        return valeur
+
+    @log(echantillon=0)
+    def chaud(self, valeur):
+        return valeur
+
+    @log
+    def imbrique(self, n):
+        return self.imbrique(n - 1) if n else 0
+
+    @log
+    def echoue(self):
+        raise KeyError("x")
+
+    @log
+    async def attendre(self, n):
+        await asyncio.sleep(0.01)
+        return self.imbrique(n)
+
+
+def indentations(caplog):
+    return [len(r.getMessage()) - len(r.getMessage().lstrip(" ")) for r in caplog.records if "DEBUT" in r.getMessage()]
+
+
+def test_mots_de_passe_masques(caplog):
+    """Les paramètres sont tracés, sauf les mots de passe"""
+
+    # GIVEN
+    caplog.set_level(logging.INFO, logger=__name__)
+
+    # WHEN
+    Service().connecter("a@b.fr", mot_de_passe="secret")
+    Service().connecter("a@b.fr", "secret")
+
+    # THEN
+    assert "a@b.fr" in caplog.text
+    assert "secret" not in caplog.text
+    assert "Service.connecter" in caplog.text
+
+
+def test_rien_n_est_formate_sous_le_niveau(caplog):
+    """Sous le niveau du logger (ou hors échantillon), aucun argument n'est mis en forme"""
+
+    # GIVEN
+    caplog.set_level(logging.INFO, logger=__name__)
+    espion = Espion()
+
+    # WHEN
+    Service().detail(espion)
+    Service().chaud(espion)
+
+    # THEN
+    assert espion.formatages == 0
+    assert caplog.records == []
+    assert durees_appels()["Service.chaud"]["nombre"] >= 1
+
+
+def test_indentation_par_thread_et_par_tache(caplog):
+    """La profondeur d'appel est propre à chaque thread et à chaque tâche asyncio"""
+
+    # GIVEN
+    caplog.set_level(logging.INFO, logger=__name__)
+
+    async def deux_taches():
+        await asyncio.gather(Service().attendre(1), Service().attendre(1))
+
+    # WHEN
+    threads = [threading.Thread(target=Service().imbrique, args=(2,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    asyncio.run(deux_taches())
+
+    # THEN
+    assert max(indentations(caplog)) <= 4 * 3
+    assert sorted(indentations(caplog)).count(4) == 6  # 4 threads + 2 tâches : chacun part de 1
+
+
+def test_exception_propagee_et_indentation_restauree(caplog):
+    """Une exception remonte telle quelle et ne décale pas les traces suivantes"""
+
+    # GIVEN
+    caplog.set_level(logging.INFO, logger=__name__)
+
+    # WHEN
+    with pytest.raises(KeyError):
+        Service().echoue()
+    Service().imbrique(0)
+
+    # THEN
+    assert "ECHEC (KeyError)" in caplog.text
+    assert indentations(caplog) == [4, 4]
+
+
+def test_quantiles_histogramme():
+    """Les quantiles sont estimés dans le bon compartiment, le maximum est exact"""
+
+    # GIVEN
+    h = Histogramme(bornes=[1, 2, 5, 10])
+
+    # WHEN
+    for v in [0.5] * 90 + [4] * 9 + [20]:
+        h.observer(v)
+
+    # THEN
+    resume = h.resume()
+    assert resume["nombre"] == 100
+    assert 0 < resume["p50"] <= 1
+    assert 2 < resume["p95"] <= 5
+    assert resume["max"] == 20
+    assert h.compartiments()[-1] == (float("inf"), 100)
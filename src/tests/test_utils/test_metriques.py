@@ -0,0 +1,130 @@
+import urllib.request
+
+import pytest
+
+from model.reservation_models import ReservationModelIn, ResultatReservationModel
+from service.reservation_service import ReservationService
+from utils.metriques import RegistreMetriques, _Famille, mesurer
+
+
+class FauxReservationDao:
+    def reserver(self, reservation_in, email=None, liste_attente=False, idempotence=None):
+        if reservation_in.fk_evenement == 99:
+            return ResultatReservationModel(statut="complet", places_restantes=0)
+        return ResultatReservationModel(statut="doublon", places_restantes=3)
+
+    def exists_for_user_and_event(self, id_utilisateur, id_evenement):
+        return id_evenement == 1
+
+
+def demande(id_evenement):
+    return ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evenement)
+
+
+def test_exposition_compteur_et_histogramme():
+    """Compteurs étiquetés et histogrammes cumulés au format texte Prometheus"""
+
+    # GIVEN
+    registre = RegistreMetriques()
+    compteur = registre.compteur("test_appels_total", "Appels de test.", ("statut",))
+    histogramme = registre.histogramme("test_duree_secondes", "Durées de test.", bornes=(0.1, 1.0))
+
+    # WHEN
+    compteur.inc(statut="ok")
+    compteur.inc(2, statut='a"b')
+    for duree in (0.05, 0.5, 3.0):
+        histogramme.observer(duree)
+    texte = registre.exposition()
+
+    # THEN
+    assert "# TYPE test_appels_total counter" in texte
+    assert 'test_appels_total{statut="ok"} 1' in texte
+    assert 'test_appels_total{statut="a\\"b"} 2' in texte
+    assert 'test_duree_secondes_bucket{le="0.1"} 1' in texte
+    assert 'test_duree_secondes_bucket{le="1"} 2' in texte
+    assert 'test_duree_secondes_bucket{le="+Inf"} 3' in texte
+    assert "test_duree_secondes_sum 3.55" in texte
+    assert "test_duree_secondes_count 3" in texte
+    with pytest.raises(ValueError):
+        compteur.inc(autre="x")
+    with pytest.raises(ValueError):
+        registre.jauge("test_appels_total", "Même nom, autre type.")
+
+
+def test_famille_sans_echantillons_refusee():
+    """Une famille qui n'implémente pas `echantillons` échoue dès sa création, pas à l'export"""
+
+    # GIVEN
+    class Incomplete(_Famille):
+        type = "gauge"
+
+    # WHEN / THEN
+    with pytest.raises(TypeError):
+        Incomplete("bde_test_incomplete", "Famille sans échantillons.")
+
+
+def test_mesurer_compte_les_issues():
+    """mesurer chronomètre chaque appel, étiqueté par méthode et issue"""
+
+    # GIVEN
+    histogramme = RegistreMetriques().histogramme("test_mesurer_secondes", "Test.", ("methode", "issue"))
+
+    @mesurer(histogramme)
+    def lire(ok):
+        if not ok:
+            raise ValueError("échec")
+        return 1
+
+    # WHEN
+    lire(True)
+    lire(True)
+    with pytest.raises(ValueError):
+        lire(False)
+
+    # THEN
+    assert histogramme.resume(methode="lire", issue="ok")["nombre"] == 2
+    assert histogramme.resume(methode="lire", issue="erreur")["nombre"] == 1
+
+
+def test_reservations_comptees_par_issue():
+    """Les refus « complet » et les doublons sont comptés à part"""
+
+    # GIVEN
+    service = ReservationService(dao=FauxReservationDao())
+    registre = RegistreMetriques()
+    reservations = registre.compteur("bde_reservations_total", "", ("statut",))
+    verifications = registre.compteur("bde_reservations_verifications_doublon_total", "", ("resultat",))
+    complets, doublons = reservations.valeur(statut="complet"), reservations.valeur(statut="doublon")
+    deja = verifications.valeur(resultat="deja_reserve")
+
+    # WHEN
+    service.reserver(demande(99))
+    service.reserver(demande(2))
+    service.user_has_reservation_for_event(1, 1)
+
+    # THEN
+    assert reservations.valeur(statut="complet") == complets + 1
+    assert reservations.valeur(statut="doublon") == doublons + 1
+    assert verifications.valeur(resultat="deja_reserve") == deja + 1
+
+
+def test_servir_en_http():
+    """servir expose /metrics sans FastAPI (CLI, workers)"""
+
+    # GIVEN
+    registre = RegistreMetriques()
+    registre.jauge("test_file_attente", "Test.", fonction=lambda: 7)
+    serveur = registre.servir(0, hote="127.0.0.1")
+
+    # WHEN
+    try:
+        url = f"http://127.0.0.1:{serveur.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as reponse:
+            texte = reponse.read().decode()
+            type_contenu = reponse.headers["Content-Type"]
+    finally:
+        serveur.shutdown()
+
+    # THEN
+    assert type_contenu.startswith("text/plain; version=0.0.4")
+    assert "test_file_attente 7" in texte
@@ -0,0 +1,140 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unittest.mock import patch
+
+from model.reservation_models import InscritModelOut
+from service.notification_service import NotificationService
+from utils import api_brevo
+
+
+class FauxBrevo(BaseHTTPRequestHandler):
+    """Faux Brevo : 503 une fois pour 'panne@', 400 pour 'invalide@', 201 sinon."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    lots = []
+    connexions = set()
+    pannes = set()
+
+    def do_POST(self):
+        corps = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        emails = [v["to"][0]["email"] for v in corps["messageVersions"]]
+        FauxBrevo.lots.append(emails)
+        FauxBrevo.connexions.add(self.client_address)
+
+        code = 201
+        if "invalide@exemple.fr" in emails:
+            code = 400
+        elif "panne@exemple.fr" in emails and "panne" not in FauxBrevo.pannes:
+            FauxBrevo.pannes.add("panne")
+            code = 503
+
+        reponse = json.dumps({"messageIds": [f"<{e}>" for e in emails]} if code == 201 else {}).encode()
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(reponse)))
+        self.end_headers()
+        self.wfile.write(reponse)
+
+    def log_message(self, *args):
+        pass
+
+
+class FausseReservationDao:
+    def __init__(self, inscrits):
+        self.inscrits = inscrits
+
+    def find_by_event_with_users(self, id_evenement):
+        return self.inscrits
+
+
+def inscrit(i, email, bus_aller=False):
+    return InscritModelOut(
+        id_reservation=i, fk_utilisateur=i, fk_evenement=1, bus_aller=bus_aller, bus_retour=False,
+        adherent=False, sam=False, boisson=False, date_reservation=datetime.now(),
+        nom=f"Nom{i}", prenom=f"Prenom{i}", email=email, telephone=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def faux_brevo():
+    serveur = ThreadingHTTPServer(("127.0.0.1", 0), FauxBrevo)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    FauxBrevo.lots, FauxBrevo.connexions, FauxBrevo.pannes = [], set(), set()
+    environnement = {
+        "BREVO_URL": f"http://127.0.0.1:{serveur.server_port}/v3/smtp/email",
+        "TOKEN_BREVO": "jeton-de-test",
+        "EMAIL_BREVO": "bde@exemple.fr",
+    }
+    with patch.dict("os.environ", environnement), patch.object(api_brevo, "_session", None):
+        yield
+    serveur.shutdown()
+    serveur.server_close()
+
+
+def test_envoi_par_lots_sur_une_session():
+    """250 inscrits, lots de 100 : 3 requêtes, sur des connexions réutilisées"""
+
+    # GIVEN
+    dao = FausseReservationDao([inscrit(i, f"u{i}@exemple.fr") for i in range(250)])
+    service = NotificationService(dao=dao, taille_lot=100, concurrence=1)
+
+    # WHEN
+    rapport = service.notifier_evenement(1, "Changement d'horaire", "Bonjour {{ params.prenom }}")
+
+    # THEN
+    assert rapport.nb_destinataires == rapport.nb_envoyes == 250
+    assert rapport.nb_requetes == 3
+    assert sorted(len(lot) for lot in FauxBrevo.lots) == [50, 100, 100]
+    assert len(FauxBrevo.connexions) == 1
+    assert rapport.destinataires[0].detail == "<u0@exemple.fr>"
+
+
+def test_doublons_et_filtre_bus():
+    """Une adresse n'est notifiée qu'une fois ; 'bus_aller' restreint aux inscrits du bus"""
+
+    # GIVEN
+    dao = FausseReservationDao([
+        inscrit(1, "a@exemple.fr", bus_aller=True),
+        inscrit(2, "A@exemple.fr", bus_aller=True),
+        inscrit(3, "b@exemple.fr"),
+    ])
+
+    # WHEN
+    rapport = NotificationService(dao=dao).notifier_evenement(1, "Bus", "Départ 18h", seulement="bus_aller")
+
+    # THEN
+    assert [d.email for d in rapport.destinataires] == ["a@exemple.fr"]
+
+
+def test_echec_temporaire_retente_echec_definitif_non():
+    """Un lot en 503 est renvoyé ; un lot refusé (400) est marqué en échec sans nouvel essai"""
+
+    # GIVEN
+    dao = FausseReservationDao([inscrit(1, "panne@exemple.fr"), inscrit(2, "invalide@exemple.fr")])
+    service = NotificationService(dao=dao, taille_lot=1, concurrence=2)
+
+    # WHEN
+    with patch("service.notification_service.time.sleep"):
+        rapport = service.notifier_evenement(1, "Sujet", "Texte")
+
+    # THEN
+    statuts = {d.email: d.statut for d in rapport.destinataires}
+    assert statuts == {"panne@exemple.fr": "envoye", "invalide@exemple.fr": "echec"}
+    assert rapport.nb_requetes == 3
+    assert FauxBrevo.lots.count(["invalide@exemple.fr"]) == 1
+
+
+def test_sujet_obligatoire():
+    """Un sujet vide est refusé avant tout envoi"""
+
+    # GIVEN
+    service = NotificationService(dao=FausseReservationDao([inscrit(1, "a@exemple.fr")]))
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        service.notifier_evenement(1, "  ", "Texte")
+    assert FauxBrevo.lots == []
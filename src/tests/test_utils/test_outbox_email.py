@@ -0,0 +1,175 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unittest.mock import patch
+
+from model.email_models import EmailOutboxModelOut
+from service.outbox_email_service import OutboxEmailService
+
+# Réponse du faux Brevo selon le destinataire
+REPONSES = {"ok@exemple.fr": 201, "panne@exemple.fr": 503, "invalide@exemple.fr": 400}
+
+
+class FauxBrevo(BaseHTTPRequestHandler):
+    recus = []
+
+    def do_POST(self):
+        corps = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        destinataire = corps["to"][0]["email"]
+        FauxBrevo.recus.append(destinataire)
+        if destinataire == "lent@exemple.fr":
+            time.sleep(1)
+        self.send_response(REPONSES.get(destinataire, 201))
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class FausseOutboxDao:
+    """Boîte d'envoi en mémoire, mêmes méthodes qu'EmailOutboxDao."""
+
+    def __init__(self, destinataires, tentatives=0):
+        self.emails = {
+            i: EmailOutboxModelOut(
+                id_email=i, destinataire=d, sujet="Sujet", contenu="Texte", statut="en_attente",
+                tentatives=tentatives, prochaine_tentative=datetime.now(), date_creation=datetime.now(),
+            )
+            for i, d in enumerate(destinataires, start=1)
+        }
+        self.delais = {}
+        self.disponibles = set(self.emails)
+
+    def reserver_lot(self, limit, bail):
+        lot = sorted(self.disponibles)[:limit]
+        self.disponibles -= set(lot)
+        for i in lot:
+            self.emails[i].tentatives += 1
+        return [self.emails[i].model_copy() for i in lot]
+
+    def marquer_envoyes(self, ids):
+        for i in ids:
+            self.emails[i].statut = "envoye"
+        return len(ids)
+
+    def replanifier(self, id_email, erreur, delai):
+        self.emails[id_email].derniere_erreur = erreur
+        self.delais[id_email] = delai
+        return True
+
+    def abandonner(self, id_email, erreur):
+        self.emails[id_email].statut = "abandonne"
+        self.emails[id_email].derniere_erreur = erreur
+        return True
+
+
+@pytest.fixture(scope="module")
+def faux_brevo():
+    serveur = ThreadingHTTPServer(("127.0.0.1", 0), FauxBrevo)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    environnement = {
+        "BREVO_URL": f"http://127.0.0.1:{serveur.server_port}/v3/smtp/email",
+        "BREVO_TIMEOUT": "0.3",
+        "TOKEN_BREVO": "jeton-de-test",
+        "EMAIL_BREVO": "bde@exemple.fr",
+    }
+    with patch.dict(os.environ, environnement):
+        yield serveur
+    serveur.shutdown()
+
+
+def test_traiter_lot_selon_la_reponse(faux_brevo):
+    """Succès envoyé, panne ou délai dépassé replanifiés, adresse refusée en lettre morte"""
+
+    # GIVEN
+    dao = FausseOutboxDao(["ok@exemple.fr", "panne@exemple.fr", "invalide@exemple.fr", "lent@exemple.fr"])
+    service = OutboxEmailService(dao=dao, nb_workers=4, taille_lot=10)
+
+    # WHEN
+    issues = service.traiter_lot()
+    service.arreter()
+
+    # THEN
+    assert issues == {"envoye": 1, "replanifie": 2, "abandonne": 1}
+    assert [e.statut for e in dao.emails.values()] == ["envoye", "en_attente", "abandonne", "en_attente"]
+    assert "HTTP 503" in dao.emails[2].derniere_erreur
+    assert "Timeout" in dao.emails[4].derniere_erreur
+
+
+def test_lettre_morte_apres_max_tentatives(faux_brevo):
+    """La dernière tentative autorisée en échec temporaire part en lettre morte"""
+
+    # GIVEN
+    dao = FausseOutboxDao(["panne@exemple.fr"], tentatives=2)
+    service = OutboxEmailService(dao=dao, max_tentatives=3)
+
+    # WHEN
+    issues = service.traiter_lot()
+    service.arreter()
+
+    # THEN
+    assert issues == {"envoye": 0, "abandonne": 1}
+    assert dao.emails[1].statut == "abandonne"
+
+
+def test_delai_exponentiel_plafonne():
+    """Le délai double à chaque tentative, dans [d/2, d], et reste sous le plafond"""
+
+    # GIVEN
+    service = OutboxEmailService(dao=FausseOutboxDao([]), delai_base=5, delai_max=60)
+
+    # WHEN
+    delais = [service.delai_avant(n) for n in range(1, 8)]
+    service.arreter()
+
+    # THEN
+    plafonds = [5, 10, 20, 40, 60, 60, 60]
+    assert all(p / 2 <= d <= p for d, p in zip(delais, plafonds))
+
+
+def test_vider_en_plusieurs_lots(faux_brevo):
+    """vider() enchaîne les lots jusqu'à épuisement de la file"""
+
+    # GIVEN
+    dao = FausseOutboxDao(["ok@exemple.fr"] * 7)
+    service = OutboxEmailService(dao=dao, taille_lot=3)
+
+    # WHEN
+    total = service.vider()
+    service.arreter()
+
+    # THEN
+    assert total == {"envoye": 7}
+
+
+def test_boucle_lance_l_entretien():
+    """La boucle de fond lance les tâches d'entretien ; une tâche en échec n'arrête ni les autres ni la boucle"""
+
+    # GIVEN
+    purges = threading.Event()
+
+    def purge_en_echec():
+        raise RuntimeError("base indisponible")
+
+    def purge():
+        purges.set()
+        return 3
+
+    service = OutboxEmailService(dao=FausseOutboxDao([]), entretien=[purge_en_echec, purge])
+
+    # WHEN
+    total = service.entretenir()
+    service.demarrer(intervalle=0.01)
+    lancee = purges.wait(2)
+    service.arreter()
+
+    # THEN
+    assert total == 3
+    assert lancee
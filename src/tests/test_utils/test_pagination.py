@@ -0,0 +1,62 @@
+from datetime import date
+
+import pytest
+
+from utils.pagination import encoder_curseur, decoder_curseur, decouper_page
+
+
+def test_curseur_aller_retour():
+    """Un curseur décodé redonne la clé encodée"""
+
+    # GIVEN
+    cle = (date(2030, 5, 17), 42)
+
+    # WHEN
+    curseur = encoder_curseur(*cle)
+
+    # THEN
+    assert decoder_curseur(curseur, date.fromisoformat, int) == cle
+
+
+def test_curseur_invalide():
+    """Un jeton corrompu ou de mauvaise arité lève ValueError"""
+
+    # GIVEN
+    curseur = encoder_curseur(1, 2)
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        decoder_curseur("pas-un-curseur", int)
+    with pytest.raises(ValueError):
+        decoder_curseur(curseur, int)
+
+
+def test_decouper_page():
+    """La ligne en trop signale une page suivante, dont le curseur est le dernier élément gardé"""
+
+    # GIVEN
+    rows = [{"id": i} for i in range(1, 5)]
+
+    # WHEN
+    page, suivant = decouper_page(rows, 3, lambda r: (r["id"],))
+    derniere, fin = decouper_page(rows[3:], 3, lambda r: (r["id"],))
+
+    # THEN
+    assert [r["id"] for r in page] == [1, 2, 3]
+    assert decoder_curseur(suivant, int) == (3,)
+    assert [r["id"] for r in derniere] == [4]
+    assert fin is None
+
+
+def test_decouper_page_limite_nulle():
+    """Une limite nulle (ex : limit négatif ramené à 0) donne une page vide, sans IndexError"""
+
+    # GIVEN
+    rows = [{"id": 1}]
+
+    # WHEN
+    page, suivant = decouper_page(rows, 0, lambda r: (r["id"],))
+
+    # THEN
+    assert page == []
+    assert suivant is None
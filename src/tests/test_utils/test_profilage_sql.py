@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.profilage_sql import A_EXPLIQUER, LENTE, ProfilageRequetes, empreinte, est_explicable
+from utils.singleton import Singleton
+
+
+@pytest.fixture
+def profilage():
+    """Profileur dédié au test (seuil de lenteur : 100 ms)."""
+    environnement = {"PROFILAGE_SEUIL_LENT_MS": "100", "PROFILAGE_FENETRE": "100", "PROFILAGE_RAPPORT_SORTIE": "0"}
+    with patch.dict(Singleton._instances), patch.dict(os.environ, environnement):
+        Singleton._instances.pop(ProfilageRequetes, None)
+        yield ProfilageRequetes()
+
+
+def appel_depuis_un_dao(fonction, *args):
+    """Exécute `fonction` depuis une méthode d'un module dao.* (comme le ferait un DAO)."""
+    espace = {"__name__": "dao.faux_dao", "fonction": fonction}
+    exec("class FauxDao:\n    def lire(self, *a):\n        return fonction(*a)\n", espace)
+    return espace["FauxDao"]().lire(*args)
+
+
+def test_empreinte_ignore_les_valeurs():
+    """Deux exécutions d'une même requête avec des valeurs différentes ont la même empreinte"""
+
+    # GIVEN
+    a = "SELECT * FROM evenement  -- liste\n WHERE id_evenement = 12 AND ville = 'Rennes'"
+    b = "select * FROM evenement WHERE id_evenement = %(id)s AND ville = 'Bruz'"
+
+    # WHEN / THEN
+    assert empreinte(a) == "SELECT * FROM evenement WHERE id_evenement = ? AND ville = ?"
+    assert empreinte(b).lower() == empreinte(a).lower()
+    assert empreinte("DELETE FROM t WHERE id IN (%s, %s, %s)") == "DELETE FROM t WHERE id IN (?)"
+    assert est_explicable("  WITH x AS (SELECT 1) SELECT * FROM x")
+    assert not est_explicable("CREATE TABLE t (a INT); INSERT INTO t VALUES (1)")
+
+
+def test_statistiques_par_empreinte_et_appelant(profilage):
+    """Les durées sont agrégées par empreinte, avec p50/p95/p99 et la méthode DAO appelante"""
+
+    # GIVEN
+    durees = [0.001 * i for i in range(1, 101)]
+
+    # WHEN
+    for i, d in enumerate(durees):
+        appel_depuis_un_dao(profilage.enregistrer, f"SELECT * FROM evenement WHERE id_evenement = {i}", d, 1)
+    profilage.enregistrer("SELECT 1", 0.0, 1)
+
+    # THEN
+    premiere = profilage.rapport()[0]
+    assert premiere["appels"] == 100
+    assert premiere["p50_ms"] == pytest.approx(51, abs=1)
+    assert premiere["p99_ms"] == pytest.approx(100, abs=1)
+    assert premiere["appelants"] == ["FauxDao.lire"]
+    assert profilage.rapport()[1]["appelants"] == ["hors DAO"]
+    assert "FauxDao.lire" in profilage.rapport_texte()
+
+
+def test_plan_des_requetes_lentes_une_fois_par_minute(profilage):
+    """Au-dessus du seuil, le plan est demandé une fois, puis la requête est seulement signalée lente"""
+
+    # GIVEN
+    requete = "SELECT * FROM reservation WHERE fk_evenement = %(id)s"
+
+    # WHEN
+    issues = [profilage.enregistrer(requete, d, 0) for d in (0.05, 0.5, 0.5)]
+    erreur = profilage.enregistrer(requete, 0.5, -1, erreur=True)
+
+    # THEN
+    assert issues == [None, A_EXPLIQUER, LENTE]
+    assert erreur is None
+    assert profilage.rapport()[0]["erreurs"] == 1
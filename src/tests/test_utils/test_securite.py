@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.securite import HachageMotDePasse, cout_du_hash, hash_password
+from utils.singleton import Singleton
+
+
+def nouveau_hachage(processus):
+    """Instance dédiée au test (coût minimal : on teste la mécanique, pas la résistance)."""
+    with patch.dict(Singleton._instances):
+        Singleton._instances.pop(HachageMotDePasse, None)
+        return HachageMotDePasse(processus=processus, cout=4)
+
+
+@pytest.fixture(scope="module")
+def hachage():
+    h = nouveau_hachage(processus=2)
+    yield h
+    h.fermer()
+
+
+def test_hacher_puis_verifier_dans_le_pool(hachage):
+    """Le hash calculé dans un processus du pool se vérifie, au coût configuré"""
+
+    # GIVEN
+    mot_de_passe = "Mdp-été-2025"
+
+    # WHEN
+    hache = hachage.hacher(mot_de_passe)
+
+    # THEN
+    assert cout_du_hash(hache) == 4
+    assert hachage.verifier(mot_de_passe, hache)
+    assert not hachage.verifier("mauvais", hache)
+
+
+def test_verifications_concurrentes_async(hachage):
+    """La version asyncio répartit les vérifications sur le pool sans bloquer la boucle"""
+
+    # GIVEN
+    hache = hachage.hacher("secret")
+
+    async def rafale():
+        return await asyncio.gather(*[hachage.verifier_async(m, hache) for m in ["secret", "autre"] * 4])
+
+    # WHEN
+    resultats = asyncio.run(rafale())
+
+    # THEN
+    assert resultats == [True, False] * 4
+
+
+def test_a_rehacher_selon_le_cout(hachage):
+    """Un hash d'un autre coût (ou illisible) est à refaire"""
+
+    # GIVEN
+    ancien = hash_password("secret", rounds=5)
+
+    # WHEN / THEN
+    assert hachage.a_rehacher(ancien)
+    assert not hachage.a_rehacher(hachage.hacher("secret"))
+    assert hachage.a_rehacher("pas-un-hash-bcrypt")
+
+
+def test_sans_pool_et_cout_par_defaut():
+    """BCRYPT_PROCESSUS=0 calcule dans le thread appelant ; BCRYPT_COUT fixe le coût par défaut"""
+
+    # GIVEN
+    with patch.dict("os.environ", {"BCRYPT_COUT": "4"}):
+        h = nouveau_hachage(processus=0)
+        hache_defaut = hash_password("secret")
+
+    # WHEN
+    hache = h.hacher("secret")
+
+    # THEN
+    assert cout_du_hash(hache_defaut) == 4
+    assert h.verifier("secret", hache)
+    assert h._executor() is None
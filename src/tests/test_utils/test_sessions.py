@@ -0,0 +1,135 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from unittest.mock import patch
+
+from dao.session_dao import SessionMemoireDao
+from model.utilisateur_models import UtilisateurModelOut
+from service.session_service import SessionService
+from service.utilisateur_service import UtilisateurService
+from utils.singleton import Singleton
+
+BOB = UtilisateurModelOut(
+    id_utilisateur=2, nom="Durand", prenom="Bob", email="bob@exemple.fr", administrateur=True,
+    date_creation=datetime(2025, 1, 1),
+)
+
+
+class FauxUtilisateurDao:
+    """Écritures toujours réussies, sans base."""
+
+    def change_password(self, id_utilisateur, mot_de_passe):
+        return True
+
+    def delete(self, id_utilisateur):
+        return True
+
+
+class Horloge:
+    def __init__(self):
+        self.t = 1_000_000.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def horloge():
+    return Horloge()
+
+
+@pytest.fixture
+def service(horloge):
+    """Service sur un stockage en mémoire dédié au test, à l'horloge contrôlée."""
+    with patch.dict(Singleton._instances), patch.dict(os.environ, {"API_SECRET": "secret-de-test"}):
+        Singleton._instances.pop(SessionMemoireDao, None)
+        yield SessionService(dao=SessionMemoireDao(horloge=horloge), duree=600, duree_max=3600)
+
+
+def test_valider_sans_rien_recalculer(service):
+    """Le jeton remis à l'ouverture désigne la session de l'utilisateur authentifié"""
+
+    # GIVEN
+    jeton, ouverte = service.ouvrir(BOB)
+
+    # WHEN
+    session = service.valider(jeton)
+
+    # THEN
+    assert session.id_session == ouverte.id_session
+    assert session.fk_utilisateur == 2 and session.administrateur
+
+
+def test_expiration_glissante(service, horloge):
+    """Chaque usage repousse l'expiration ; sans activité pendant `duree`, la session tombe"""
+
+    # GIVEN
+    jeton, _ = service.ouvrir(BOB)
+
+    # WHEN
+    for _ in range(5):
+        horloge.t += 500
+        service.valider(jeton)
+    horloge.t += 601
+
+    # THEN
+    with pytest.raises(ValueError, match="expirée"):
+        service.valider(jeton)
+
+
+def test_jeton_altere_ou_session_fermee(service):
+    """Un jeton modifié, ou d'une session fermée, est refusé"""
+
+    # GIVEN
+    jeton, _ = service.ouvrir(BOB)
+    autre, _ = service.ouvrir(BOB)
+    charge, signature = jeton.split(".")
+
+    # WHEN
+    service.fermer(jeton)
+    fermees = service.fermer_toutes(BOB.id_utilisateur)
+
+    # THEN
+    with pytest.raises(ValueError, match="invalide"):
+        service.valider(f"{charge}x.{signature}")
+    with pytest.raises(ValueError):
+        service.valider(jeton)
+    with pytest.raises(ValueError):
+        service.valider(autre)
+    assert fermees == 1
+
+
+def test_purger_les_sessions_expirees(service, horloge):
+    """purger retire les sessions expirées et garde les autres"""
+
+    # GIVEN
+    service.ouvrir(BOB)
+    horloge.t += 601
+    jeton, _ = service.ouvrir(BOB)
+
+    # WHEN
+    purgees = service.purger()
+
+    # THEN
+    assert purgees == 1
+    assert service.valider(jeton).fk_utilisateur == 2
+
+
+def test_mot_de_passe_change_ou_compte_supprime_ferme_les_sessions(service):
+    """Changer le mot de passe ou supprimer le compte révoque les jetons déjà remis"""
+
+    # GIVEN
+    utilisateurs = UtilisateurService(dao=FauxUtilisateurDao(), sessions=service)
+    avant_changement, _ = service.ouvrir(BOB)
+
+    # WHEN
+    utilisateurs.change_user_password(BOB.id_utilisateur, "nouveau123")
+    avant_suppression, _ = service.ouvrir(BOB)
+    utilisateurs.delete_user(BOB.id_utilisateur)
+
+    # THEN
+    for jeton in (avant_changement, avant_suppression):
+        with pytest.raises(ValueError, match="fermée"):
+            service.valider(jeton)
@@ -1,15 +1,79 @@
 import requests
 import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+from utils.metriques import RegistreMetriques
 
-def send_email_brevo(to_email, subject, message_text):
-    url = "https://api.brevo.com/v3/smtp/email"
-    headers = {
+_session: Optional[requests.Session] = None
+_verrou_session = threading.Lock()
+
+
+def session_brevo() -> requests.Session:
+    """
+    Session HTTP partagée (keep-alive) : les appels successifs à Brevo réutilisent
+    les connexions TCP + TLS déjà ouvertes au lieu d'en négocier une par e-mail.
+    BREVO_CONNEXIONS (10 par défaut) borne le nombre de connexions gardées ouvertes.
+    """
+    global _session
+    if _session is None:
+        with _verrou_session:
+            if _session is None:
+                taille = int(os.getenv("BREVO_CONNEXIONS", "10"))
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=taille))
+                session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=taille))
+                _session = session
+    return _session
+
+
+_DUREE_APPELS = RegistreMetriques().histogramme(
+    "bde_brevo_duree_secondes", "Durée des appels à l'API Brevo, par type d'appel (unitaire, lot).", ("appel",)
+)
+_REPONSES = RegistreMetriques().compteur(
+    "bde_brevo_reponses_total", "Réponses de Brevo par type d'appel et classe de code HTTP (2xx, 4xx, 5xx, erreur).",
+    ("appel", "code"),
+)
+
+
+def _poster(appel: str, data: Dict, timeout: Optional[float]):
+    """POST vers Brevo, chronométré ; 'erreur' compte les appels sans réponse (réseau, timeout)."""
+    t0 = time.perf_counter()
+    code = "erreur"
+    try:
+        response = session_brevo().post(_url(), headers=_entetes(), json=data, timeout=_timeout(timeout))
+        code = f"{response.status_code // 100}xx"
+        return response.status_code, response.text
+    finally:
+        _DUREE_APPELS.observer(time.perf_counter() - t0, appel=appel)
+        _REPONSES.inc(appel=appel, code=code)
+
+
+def _url() -> str:
+    return os.getenv("BREVO_URL", "https://api.brevo.com/v3/smtp/email")
+
+
+def _entetes() -> Dict[str, str]:
+    return {
         "accept": "application/json",
         "api-key": os.environ["TOKEN_BREVO"],
         "content-type": "application/json"
     }
+
+
+def _timeout(timeout: Optional[float]) -> float:
+    return float(os.getenv("BREVO_TIMEOUT", "10")) if timeout is None else timeout
+
+
+def send_email_brevo(to_email, subject, message_text, timeout=None):
+    """
+    Envoie un e-mail via l'API Brevo et retourne (code HTTP, corps de la réponse).
+    Lève requests.RequestException si Brevo ne répond pas dans `timeout` secondes
+    (BREVO_TIMEOUT, 10 par défaut). BREVO_URL permet de viser un serveur de test.
+    """
     data = {
         "sender": {"name": "no_reply BDE Ensai", "email": os.environ["EMAIL_BREVO"]},
         "to": [{"email": to_email, "name": "Destinataire"}],
@@ -17,8 +81,33 @@ def send_email_brevo(to_email, subject, message_text):
         "textContent": message_text
     }
 
-    response = requests.post(url, headers=headers, json=data)
-    return response.status_code, response.text
+    return _poster("unitaire", data, timeout)
+
+
+def send_batch_brevo(destinataires: Sequence[Dict[str, str]], subject, message_text, timeout=None):
+    """
+    Envoie un e-mail individuel à chaque destinataire en un seul appel
+    (`messageVersions` de Brevo, 1000 versions au plus par appel).
+
+    Chaque destinataire est un dict {"email", "nom", "prenom"} ; `message_text`
+    peut utiliser {{ params.prenom }} et {{ params.nom }}.
+    Retourne (code HTTP, corps de la réponse).
+    """
+    versions: List[Dict] = [
+        {
+            "to": [{"email": d["email"], "name": f"{d.get('prenom', '')} {d.get('nom', '')}".strip() or "Destinataire"}],
+            "params": {"prenom": d.get("prenom", ""), "nom": d.get("nom", "")},
+        }
+        for d in destinataires
+    ]
+    data = {
+        "sender": {"name": "no_reply BDE Ensai", "email": os.environ["EMAIL_BREVO"]},
+        "subject": subject,
+        "textContent": message_text,
+        "messageVersions": versions,
+    }
+
+    return _poster("lot", data, timeout)
 
 
 if __name__ == "__main__":
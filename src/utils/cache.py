@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from utils.singleton import Singleton
+
+_ABSENT = object()
+
+
+class CacheTTL:
+    """
+    Cache clé -> valeur borné en taille (éviction LRU) et en âge (TTL), sûr entre threads.
+
+    Chaque entrée peut porter des étiquettes (ex : "evenement:12") : `invalider`
+    supprime d'un coup toutes les entrées qui en portent une. Chaque invalidation
+    avance une génération : un résultat calculé avant une invalidation de l'une de
+    ses étiquettes (ou avant `vider`) n'est pas mémorisé. Les compteurs
+    (succès, échecs, évictions, ...) sont exposés par `statistiques()`.
+
+    Les valeurs sont partagées entre appelants : elles ne doivent pas être modifiées.
+    """
+
+    def __init__(self, taille_max: int = 256, ttl: float = 30.0, horloge: Callable[[], float] = time.monotonic):
+        self.taille_max = taille_max
+        self.ttl = ttl
+        self._horloge = horloge
+        self._verrou = threading.Lock()
+        # cle -> (expiration, valeur, etiquettes)
+        self._entrees: "OrderedDict[Hashable, Tuple[float, Any, frozenset]]" = OrderedDict()
+        self._par_etiquette: Dict[Hashable, Set[Hashable]] = {}
+        # Génération courante, génération du dernier `vider` et de la dernière invalidation par étiquette
+        self._generation = 0
+        self._vide_a = 0
+        self._invalidee_a: Dict[Hashable, int] = {}
+        self._compteurs = dict.fromkeys(("succes", "echecs", "evictions", "expirations", "invalidations"), 0)
+
+    # ---------- Lecture / écriture ----------
+
+    def lire(self, cle: Hashable) -> Tuple[bool, Any]:
+        """Retourne (True, valeur) si la clé est en cache et fraîche, (False, None) sinon."""
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None and entree[0] <= self._horloge():
+                self._retirer(cle)
+                self._compteurs["expirations"] += 1
+                entree = None
+            if entree is None:
+                self._compteurs["echecs"] += 1
+                return False, None
+            self._entrees.move_to_end(cle)
+            self._compteurs["succes"] += 1
+            return True, entree[1]
+
+    def generation(self) -> int:
+        """Génération courante, à relever avant un calcul puis à passer à `ecrire`."""
+        with self._verrou:
+            return self._generation
+
+    def ecrire(
+        self,
+        cle: Hashable,
+        valeur: Any,
+        etiquettes: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Mémorise `valeur`. Avec `generation` (relevée avant le calcul), n'écrit rien si le
+        cache a été vidé ou l'une des étiquettes invalidée depuis : la valeur est peut-être
+        déjà périmée. Retourne True si la valeur a été mémorisée.
+        """
+        etiquettes = frozenset(etiquettes)
+        with self._verrou:
+            if generation is not None and (
+                self._vide_a > generation
+                or any(self._invalidee_a.get(e, 0) > generation for e in etiquettes)
+            ):
+                return False
+            if cle in self._entrees:
+                self._retirer(cle)
+            self._entrees[cle] = (self._horloge() + self.ttl, valeur, etiquettes)
+            for etiquette in etiquettes:
+                self._par_etiquette.setdefault(etiquette, set()).add(cle)
+            while len(self._entrees) > self.taille_max:
+                self._retirer(next(iter(self._entrees)))
+                self._compteurs["evictions"] += 1
+            return True
+
+    def lire_ou_calculer(
+        self,
+        cle: Hashable,
+        calcul: Callable[[], Any],
+        etiquettes: Optional[Callable[[Any], Iterable[Hashable]]] = None,
+    ) -> Any:
+        """
+        Lecture à travers le cache : en cas d'échec, appelle `calcul()` (hors verrou)
+        et mémorise le résultat, étiqueté par `etiquettes(valeur)`, sauf si une
+        invalidation concernée a eu lieu pendant le calcul.
+        """
+        trouve, valeur = self.lire(cle)
+        if trouve:
+            return valeur
+        generation = self.generation()
+        valeur = calcul()
+        self.ecrire(cle, valeur, etiquettes(valeur) if etiquettes else (), generation)
+        return valeur
+
+    # ---------- Invalidation ----------
+
+    def invalider(self, *etiquettes: Hashable) -> int:
+        """Supprime les entrées portant l'une des étiquettes. Retourne le nombre d'entrées supprimées."""
+        with self._verrou:
+            self._generation += 1
+            cles = set()
+            for etiquette in etiquettes:
+                self._invalidee_a[etiquette] = self._generation
+                cles |= self._par_etiquette.get(etiquette, set())
+            for cle in cles:
+                self._retirer(cle)
+            self._compteurs["invalidations"] += len(cles)
+            return len(cles)
+
+    def vider(self) -> int:
+        """Supprime toutes les entrées (les compteurs sont conservés)."""
+        with self._verrou:
+            self._generation += 1
+            self._vide_a = self._generation
+            # Un `vider` couvre toutes les invalidations antérieures
+            self._invalidee_a.clear()
+            n = len(self._entrees)
+            self._entrees.clear()
+            self._par_etiquette.clear()
+            self._compteurs["invalidations"] += n
+            return n
+
+    def _retirer(self, cle: Hashable) -> None:
+        _, _, etiquettes = self._entrees.pop(cle)
+        for etiquette in etiquettes:
+            cles = self._par_etiquette.get(etiquette)
+            if cles is not None:
+                cles.discard(cle)
+                if not cles:
+                    del self._par_etiquette[etiquette]
+
+    # ---------- Compteurs ----------
+
+    def statistiques(self) -> Dict[str, Any]:
+        """Compteurs du cache, avec le taux de succès (0 à 1) et la taille courante."""
+        with self._verrou:
+            stats = dict(self._compteurs)
+            lectures = stats["succes"] + stats["echecs"]
+            stats["taux_succes"] = stats["succes"] / lectures if lectures else 0.0
+            stats["taille"] = len(self._entrees)
+            return stats
+
+
+class CacheCatalogue(CacheTTL, metaclass=Singleton):
+    """
+    Cache unique (par processus) des lectures du catalogue d'événements, partagé par
+    ConsultationEvenementService et invalidé par les écritures d'EvenementService et
+    de ReservationService.
+
+    Chaque processus a le sien : entre workers, seule l'expiration (TTL) propage
+    les écritures des autres.
+
+    CACHE_CATALOGUE_TTL (secondes, 30 par défaut ; 0 désactive le cache)
+    CACHE_CATALOGUE_TAILLE (entrées, 256 par défaut)
+    """
+
+    def __init__(self):
+        super().__init__(
+            taille_max=int(os.getenv("CACHE_CATALOGUE_TAILLE", "256")),
+            ttl=float(os.getenv("CACHE_CATALOGUE_TTL", "30")),
+        )
+
+    @staticmethod
+    def etiquettes_places(resultat: Any) -> Set[Hashable]:
+        """
+        Étiquettes d'un résultat « avec places restantes » (liste, page ou événement seul) :
+        une par événement présent, pour n'invalider que ces entrées lors d'une réservation.
+        """
+        if resultat is None:
+            return set()
+        lignes = getattr(resultat, "elements", resultat)
+        if isinstance(lignes, dict):
+            lignes = [lignes]
+        return {("places", ligne["id_evenement"]) for ligne in lignes}
+
+    def invalider_places(self, id_evenement: int) -> int:
+        """Une réservation ou une annulation ne change que les places restantes de son événement."""
+        return self.invalider(("places", id_evenement))
@@ -0,0 +1,99 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import csv
+import json
+from typing import Iterable, Optional, TextIO
+
+import dotenv
+from pydantic import BaseModel
+
+
+def _sources(table: str, id_evenement: Optional[int], itersize: Optional[int]):
+    """Retourne (colonnes, flux de modèles) pour la table demandée."""
+    from dao.evenement_dao import EvenementDao
+    from dao.reservation_dao import ReservationDao
+    from dao.utilisateur_dao import UtilisateurDao
+    from model.evenement_models import EvenementModelOut
+    from model.reservation_models import ReservationModelOut
+    from model.utilisateur_models import UtilisateurModelOut
+
+    if table == "utilisateurs":
+        return list(UtilisateurModelOut.model_fields), UtilisateurDao().iter_all(itersize)
+    if table == "evenements":
+        return list(EvenementModelOut.model_fields), EvenementDao().iter_all(itersize)
+    if id_evenement is not None:
+        return list(ReservationModelOut.model_fields), ReservationDao().iter_by_event(id_evenement, itersize)
+    return list(ReservationModelOut.model_fields), ReservationDao().iter_all(itersize)
+
+
+def ecrire_csv(colonnes, elements: Iterable[BaseModel], sortie: TextIO) -> int:
+    """Écrit les éléments au fil de l'eau au format CSV. Retourne le nombre de lignes."""
+    writer = csv.DictWriter(sortie, fieldnames=colonnes)
+    writer.writeheader()
+    n = 0
+    for element in elements:
+        writer.writerow(element.model_dump(mode="json"))
+        n += 1
+    return n
+
+
+def ecrire_json(elements: Iterable[BaseModel], sortie: TextIO) -> int:
+    """
+    Écrit un tableau JSON élément par élément (jamais entièrement en mémoire).
+    Retourne le nombre d'éléments.
+    """
+    n = 0
+    sortie.write("[")
+    for element in elements:
+        sortie.write(",\n" if n else "\n")
+        sortie.write(element.model_dump_json())
+        n += 1
+    sortie.write("\n]\n" if n else "]\n")
+    return n
+
+
+def exporter(
+    table: str,
+    format_sortie: str = "csv",
+    sortie: TextIO = sys.stdout,
+    id_evenement: Optional[int] = None,
+    itersize: Optional[int] = None,
+) -> int:
+    """
+    Exporte une table (utilisateurs, evenements, reservations) en CSV ou JSON,
+    en flux : la mémoire utilisée ne dépend pas du nombre de lignes.
+    Retourne le nombre de lignes exportées.
+    """
+    colonnes, elements = _sources(table, id_evenement, itersize)
+    if format_sortie == "json":
+        return ecrire_json(elements, sortie)
+    return ecrire_csv(colonnes, elements, sortie)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export en flux (CSV/JSON) des données de l'application.")
+    parser.add_argument("table", choices=["utilisateurs", "evenements", "reservations"])
+    parser.add_argument("-f", "--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("-o", "--sortie", default=None, help="Fichier de sortie (défaut : sortie standard).")
+    parser.add_argument("-e", "--evenement", type=int, default=None,
+                        help="Réservations d'un seul événement.")
+    parser.add_argument("--itersize", type=int, default=None,
+                        help="Lignes lues par aller-retour (défaut : POSTGRES_ITERSIZE).")
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8", newline="") as f:
+            nb = exporter(args.table, args.format, f, args.evenement, args.itersize)
+    else:
+        nb = exporter(args.table, args.format, sys.stdout, args.evenement, args.itersize)
+    print(f"{nb} ligne(s) exportée(s).", file=sys.stderr)
+
+# Exemple :
+# python src/utils/export.py reservations -f csv -o reservations.csv
+# python src/utils/export.py utilisateurs -f json > utilisateurs.json
@@ -0,0 +1,91 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bornes supérieures des compartiments, en secondes (échelle 1 - 2,5 - 5, de 0,1 ms à 10 s)
+BORNES_DUREES: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0,
+)
+
+
+class Histogramme:
+    """
+    Histogramme à compartiments fixes (durées en secondes par défaut).
+
+    `observer` coûte une recherche dichotomique et une incrémentation : il peut être
+    appelé à chaque requête. Les quantiles (p50, p95, p99...) sont estimés par
+    interpolation dans le compartiment qui les contient, la précision est donc
+    celle des bornes ; le maximum est exact.
+    """
+
+    def __init__(self, bornes: Optional[Sequence[float]] = None):
+        self.bornes: Tuple[float, ...] = tuple(bornes or BORNES_DUREES)
+        self.__comptes: List[int] = [0] * (len(self.bornes) + 1)  # dernier : au-delà de la dernière borne
+        self.__total = 0.0
+        self.__max = 0.0
+        self.__verrou = threading.Lock()
+
+    def observer(self, valeur: float) -> None:
+        i = bisect_left(self.bornes, valeur)
+        with self.__verrou:
+            self.__comptes[i] += 1
+            self.__total += valeur
+            if valeur > self.__max:
+                self.__max = valeur
+
+    def vider(self) -> None:
+        with self.__verrou:
+            self.__comptes = [0] * (len(self.bornes) + 1)
+            self.__total = 0.0
+            self.__max = 0.0
+
+    @property
+    def nombre(self) -> int:
+        return sum(self.__comptes)
+
+    def compartiments(self) -> List[Tuple[float, int]]:
+        """(borne supérieure, effectif cumulé) ; la dernière borne est +inf (format Prometheus)."""
+        with self.__verrou:
+            comptes = list(self.__comptes)
+        cumul, resultat = 0, []
+        for borne, n in zip(self.bornes + (float("inf"),), comptes):
+            cumul += n
+            resultat.append((borne, cumul))
+        return resultat
+
+    def quantile(self, q: float) -> float:
+        """Estimation du quantile q (0 < q <= 1), 0 si l'histogramme est vide."""
+        with self.__verrou:
+            comptes, maximum = list(self.__comptes), self.__max
+        n = sum(comptes)
+        if n == 0:
+            return 0.0
+        rang = q * n
+        cumul = 0
+        for i, effectif in enumerate(comptes):
+            if effectif and cumul + effectif >= rang:
+                if i == len(self.bornes):
+                    return maximum
+                bas = self.bornes[i - 1] if i else 0.0
+                haut = min(self.bornes[i], maximum)
+                return bas + (haut - bas) * (rang - cumul) / effectif
+            cumul += effectif
+        return maximum
+
+    def resume(self) -> Dict[str, float]:
+        """nombre, total, moyenne, p50, p95, p99 et max."""
+        with self.__verrou:
+            n, total, maximum = sum(self.__comptes), self.__total, self.__max
+        return {
+            "nombre": n,
+            "total": total,
+            "moyenne": total / n if n else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": maximum,
+        }
@@ -0,0 +1,51 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+
+import dotenv
+
+from model.import_models import RapportImportModel
+
+
+def format_du_fichier(chemin: str) -> str:
+    """'jsonl' pour .jsonl / .ndjson, 'csv' sinon."""
+    return "jsonl" if chemin.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def afficher_rapport(rapport: RapportImportModel, max_erreurs: int = 20) -> None:
+    print(
+        f"{rapport.lues} ligne(s) lue(s) en {rapport.duree:.2f} s ({rapport.debit:.0f} lignes/s) : "
+        f"{rapport.creees} créée(s), {rapport.mises_a_jour} mise(s) à jour, {len(rapport.erreurs)} en erreur."
+    )
+    for erreur in rapport.erreurs[:max_erreurs]:
+        print(f"  ligne {erreur.ligne:>6} : {erreur.erreur}")
+    if len(rapport.erreurs) > max_erreurs:
+        print(f"  ... et {len(rapport.erreurs) - max_erreurs} autre(s).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import en masse (CSV / JSON Lines) par COPY, avec upsert.")
+    parser.add_argument("table", choices=["utilisateurs", "evenements", "reservations"])
+    parser.add_argument("fichier", help="Fichier CSV (avec en-tête) ou JSON Lines.")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], default=None,
+                        help="Format du fichier (défaut : d'après l'extension).")
+    parser.add_argument("--lot", type=int, default=None, help="Lignes par COPY (défaut : IMPORT_LOT ou 5000).")
+    parser.add_argument("--erreurs", type=int, default=20, help="Nombre d'erreurs affichées.")
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+    from service.import_service import ImportService
+
+    service = ImportService(taille_lot=args.lot)
+    with open(args.fichier, encoding="utf-8", newline="") as f:
+        rapport = service.importer(args.table, service.lire(f, args.format or format_du_fichier(args.fichier)))
+    afficher_rapport(rapport, args.erreurs)
+    sys.exit(1 if rapport.erreurs else 0)
+
+# Exemple :
+# python src/utils/import_donnees.py utilisateurs promo_2026.csv
+# python src/utils/import_donnees.py reservations reservations.jsonl --lot 2000
@@ -0,0 +1,55 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+
+def _secret() -> bytes:
+    """Clé de signature, identique pour tous les processus (workers) qui servent l'API."""
+    secret = os.getenv("API_SECRET")
+    if not secret:
+        raise ValueError("La variable d'environnement API_SECRET n'est pas définie.")
+    return secret.encode("utf-8")
+
+
+def _b64(donnees: bytes) -> str:
+    return base64.urlsafe_b64encode(donnees).decode("ascii").rstrip("=")
+
+
+def _b64_decode(texte: str) -> bytes:
+    return base64.urlsafe_b64decode(texte + "=" * (-len(texte) % 4))
+
+
+def signer_jeton(contenu: Dict[str, Any], duree: int, maintenant: Optional[float] = None) -> str:
+    """
+    Produit un jeton `contenu.signature` (base64 url-safe, HMAC-SHA256) valable `duree` secondes.
+    Le jeton se suffit à lui-même : n'importe quel worker le vérifie sans état partagé.
+    """
+    maintenant = time.time() if maintenant is None else maintenant
+    charge = _b64(json.dumps({**contenu, "exp": int(maintenant) + duree}).encode("utf-8"))
+    signature = _b64(hmac.new(_secret(), charge.encode("ascii"), hashlib.sha256).digest())
+    return f"{charge}.{signature}"
+
+
+def verifier_jeton(jeton: str, maintenant: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Vérifie la signature et l'expiration d'un jeton produit par signer_jeton.
+    Retourne son contenu (avec `exp`), ou lève ValueError.
+    """
+    cle = _secret()
+    try:
+        charge, signature = jeton.split(".")
+        attendue = _b64(hmac.new(cle, charge.encode("ascii"), hashlib.sha256).digest())
+        if not hmac.compare_digest(signature, attendue):
+            raise ValueError
+        contenu = json.loads(_b64_decode(charge))
+    except Exception:
+        raise ValueError("Jeton de session invalide.") from None
+
+    maintenant = time.time() if maintenant is None else maintenant
+    if contenu.get("exp", 0) <= maintenant:
+        raise ValueError("Jeton de session expiré.")
+    return contenu
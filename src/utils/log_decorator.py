@@ -1,83 +1,142 @@
-import logging.config
-import numbers
-
+import contextvars
+import inspect
+import logging
+import os
+import random
+import time
 from functools import wraps
+from typing import Dict, Optional
+
+from utils.histogramme import Histogramme
+
+# Profondeur d'appel propre à chaque thread et à chaque tâche asyncio
+_profondeur: contextvars.ContextVar[int] = contextvars.ContextVar("log_profondeur", default=0)
+
+# Durées des appels décorés, par "Classe.methode"
+_durees: Dict[str, Histogramme] = {}
+
+MOTS_DE_PASSE = {"password", "passwd", "pwd", "pass", "mot_de_passe", "mdp", "new_password"}
+
+
+class _Arguments:
+    """Paramètres d'un appel, mis en forme seulement si la ligne de log est écrite."""
+
+    __slots__ = ("noms", "args", "kwargs")
+
+    def __init__(self, noms, args, kwargs):
+        self.noms, self.args, self.kwargs = noms, args, kwargs
 
+    def __str__(self):
+        noms = self.noms + [""] * (len(self.args) - len(self.noms))  # *args
+        valeurs = [
+            "*****" if nom in MOTS_DE_PASSE else repr(v) if isinstance(v, str) else str(v)
+            for nom, v in zip(noms, self.args)
+        ]
+        valeurs += [f"{k}=*****" if k in MOTS_DE_PASSE else f"{k}={v!r}" for k, v in self.kwargs.items()]
+        return "(" + ", ".join(valeurs) + ")"
 
-class LogIndetation:
-    """Pour indenter les logs lorsque l'on rentre dans une nouvelle méthode"""
 
-    current_indentation = 0
+class _Sortie:
+    """Valeur retournée, tronquée (3 éléments, 50 caractères), mise en forme à la demande."""
 
-    @classmethod
-    def increase_indentation(cls):
-        """Ajouter une indentation"""
-        cls.current_indentation += 1
+    __slots__ = ("resultat",)
 
-    @classmethod
-    def decrease_indentation(cls):
-        """Retirer une indentation"""
-        cls.current_indentation -= 1
+    def __init__(self, resultat):
+        self.resultat = resultat
 
-    @classmethod
-    def get_indentation(cls):
-        """Obtenir l'indentation"""
-        return "    " * cls.current_indentation
+    def __str__(self):
+        r = self.resultat
+        if isinstance(r, list):
+            return f"{[str(x) for x in r[:3]]} ... ({len(r)} elements)"
+        if isinstance(r, dict):
+            return f"{[(str(k), str(v)) for k, v in list(r.items())[:3]]} ... ({len(r)} elements)"
+        if isinstance(r, str) and len(r) > 50:
+            return f"{r[:50]} ... ({len(r)} caracteres)"
+        return str(r)
 
 
-def log(func):
+def durees_appels() -> Dict[str, Dict[str, float]]:
+    """Résumé (nombre, moyenne, p50, p95, p99, max, en secondes) des durées de chaque fonction décorée."""
+    return {nom: h.resume() for nom, h in sorted(_durees.items()) if h.nombre}
+
+
+def log(func=None, *, niveau: int = logging.INFO, echantillon: Optional[float] = None):
     """Création d'un décorateur nommé log
     Lorsque ce décorateur est appliqué à une méthode, cela affichera dans les logs :
-    - l'appel de cette méthode avec les valeurs de paramètres
+    - l'appel de cette méthode avec les valeurs de paramètres (mots de passe masqués)
     - la sortie retournée par cette méthode
+    et la durée de chaque appel est enregistrée (voir durees_appels()).
+
+    `@log` ou `@log(niveau=logging.DEBUG, echantillon=0.01)` :
+    - rien n'est mis en forme si le logger du module de la fonction n'écrit pas
+      à ce niveau (réglage par logger dans logging_config.yml) ;
+    - `echantillon` : proportion des appels tracés (LOG_ECHANTILLON, 1 par défaut),
+      pour garder des traces sur un chemin très sollicité ;
+    - l'indentation suit la profondeur d'appel de chaque thread / tâche asyncio.
     """
+    if func is None:
+        return lambda f: log(f, niveau=niveau, echantillon=echantillon)
+
+    logger = logging.getLogger(func.__module__)
+    nom = func.__qualname__
+    noms = list(inspect.signature(func).parameters)
+    if noms and noms[0] in ("self", "cls"):
+        noms = noms[1:]
+        debut_args = 1
+    else:
+        debut_args = 0
+    taux = float(os.getenv("LOG_ECHANTILLON", "1")) if echantillon is None else echantillon
+    histogramme = _durees.setdefault(nom, Histogramme())
+
+    def tracer() -> bool:
+        return logger.isEnabledFor(niveau) and (taux >= 1 or random.random() < taux)
+
+    def debut(args, kwargs):
+        profondeur = _profondeur.get() + 1
+        jeton = _profondeur.set(profondeur)
+        indentation = "    " * profondeur
+        logger.log(niveau, "%s%s%s - DEBUT", indentation, nom, _Arguments(noms, args[debut_args:], kwargs))
+        return jeton, indentation
+
+    def fin(jeton, indentation, resultat, erreur):
+        if erreur is None:
+            logger.log(niveau, "%s%s - FIN", indentation, nom)
+            logger.log(niveau, "%s   └─> Sortie : %s", indentation, _Sortie(resultat))
+        else:
+            logger.log(niveau, "%s%s - ECHEC (%s)", indentation, nom, type(erreur).__name__)
+        _profondeur.reset(jeton)
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper_async(*args, **kwargs):
+            trace = debut(args, kwargs) if tracer() else None
+            resultat, erreur, t0 = None, None, time.perf_counter()
+            try:
+                resultat = await func(*args, **kwargs)
+                return resultat
+            except BaseException as exc:
+                erreur = exc
+                raise
+            finally:
+                histogramme.observer(time.perf_counter() - t0)
+                if trace:
+                    fin(*trace, resultat, erreur)
+
+        return wrapper_async
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(__name__)
-
-        LogIndetation.increase_indentation()
-        indentation = LogIndetation.get_indentation()
-
-        # Recuperation des parametres de la methode
-        class_name = args[0].__class__.__name__ if args else ""
-        method_name = func.__name__
-        args_list = list(
-            [str(arg) if not isinstance(arg, numbers.Number) else arg for arg in args[1:]]
-            + list(kwargs.values())
-        )
-
-        # pour cacher les mots de passe
-        param_names = func.__code__.co_varnames[1 : func.__code__.co_argcount]
-        for i, v in enumerate(param_names):
-            if v in ["password", "passwd", "pwd", "pass", "mot_de_passe", "mdp"]:
-                args_list[i] = "*****"
-
-        # Transforme en tuple pour avoir un affichage avec des parentheses
-        args_list = tuple(args_list)
-
-        # Affichage dans le fichier de log
-        logger.info(f"{indentation}{class_name}.{method_name}{args_list} - DEBUT")
-        result = func(*args, **kwargs)
-        logger.info(f"{indentation}{class_name}.{method_name}{args_list} - FIN")
-
-        # Reduction de l affichage de la sortie si trop longue
-        if isinstance(result, list):
-            result_str = str([str(item) for item in result[:3]])
-            result_str += " ... (" + str(len(result)) + " elements)"
-        elif isinstance(result, dict):
-            result_str = [(str(k), str(v)) for k, v in result.items()][:3]
-            result_str += " ... (" + str(len(result)) + " elements)"
-        elif isinstance(result, str) and len(result) > 50:
-            result_str = result[:50]
-            result_str += " ... (" + str(len(result)) + " caracteres)"
-        else:
-            result_str = str(result)
-
-        logger.info(f"{indentation}   └─> Sortie : {result_str}")
-
-        LogIndetation.decrease_indentation()
-
-        return result
-
-    return wrapper
\ No newline at end of file
+        trace = debut(args, kwargs) if tracer() else None
+        resultat, erreur, t0 = None, None, time.perf_counter()
+        try:
+            resultat = func(*args, **kwargs)
+            return resultat
+        except BaseException as exc:
+            erreur = exc
+            raise
+        finally:
+            histogramme.observer(time.perf_counter() - t0)
+            if trace:
+                fin(*trace, resultat, erreur)
+
+    return wrapper
@@ -0,0 +1,314 @@
+import inspect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from utils.histogramme import Histogramme
+from utils.singleton import Singleton
+
+TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+Echantillon = Tuple[str, Dict[str, str], float]  # (suffixe, étiquettes, valeur)
+
+
+def _nombre(valeur: float) -> str:
+    if math.isinf(valeur):
+        return "+Inf" if valeur > 0 else "-Inf"
+    return repr(float(valeur)) if not float(valeur).is_integer() else str(int(valeur))
+
+
+def _echapper(valeur: str) -> str:
+    return str(valeur).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquettes_texte(etiquettes: Dict[str, str]) -> str:
+    if not etiquettes:
+        return ""
+    return "{" + ",".join(f'{nom}="{_echapper(v)}"' for nom, v in etiquettes.items()) + "}"
+
+
+class _Famille(ABC):
+    """Métrique nommée, déclinée par combinaison de valeurs de ses étiquettes."""
+
+    type = ""
+
+    def __init__(self, nom: str, aide: str, etiquettes: Sequence[str] = ()):
+        self.nom = nom
+        self.aide = aide
+        self.etiquettes: Tuple[str, ...] = tuple(etiquettes)
+        self._verrou = threading.Lock()
+
+    def _cle(self, valeurs: Dict[str, Any]) -> Tuple[str, ...]:
+        if len(valeurs) != len(self.etiquettes) or any(nom not in valeurs for nom in self.etiquettes):
+            raise ValueError(f"{self.nom} attend les étiquettes {self.etiquettes}, reçu {tuple(valeurs)}.")
+        return tuple(str(valeurs[nom]) for nom in self.etiquettes)
+
+    @abstractmethod
+    def echantillons(self) -> List[Echantillon]:
+        """Échantillons exposés : (suffixe, étiquettes, valeur)."""
+        pass
+
+    def exposition(self) -> List[str]:
+        lignes = [f"# HELP {self.nom} {self.aide}", f"# TYPE {self.nom} {self.type}"]
+        for suffixe, etiquettes, valeur in self.echantillons():
+            lignes.append(f"{self.nom}{suffixe}{_etiquettes_texte(etiquettes)} {_nombre(valeur)}")
+        return lignes
+
+
+class Compteur(_Famille):
+    """Valeur qui ne fait que croître (événements, erreurs...) : on en lit le débit."""
+
+    type = "counter"
+
+    def __init__(self, nom: str, aide: str, etiquettes: Sequence[str] = ()):
+        super().__init__(nom, aide, etiquettes)
+        self.__valeurs: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, valeur: float = 1, **etiquettes: Any) -> None:
+        if valeur < 0:
+            raise ValueError("Un compteur ne peut pas décroître.")
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            self.__valeurs[cle] = self.__valeurs.get(cle, 0) + valeur
+
+    def valeur(self, **etiquettes: Any) -> float:
+        return self.__valeurs.get(self._cle(etiquettes), 0)
+
+    def echantillons(self) -> List[Echantillon]:
+        with self._verrou:
+            valeurs = sorted(self.__valeurs.items())
+        return [("", dict(zip(self.etiquettes, cle)), v) for cle, v in valeurs]
+
+
+class Jauge(_Famille):
+    """
+    Valeur instantanée (connexions ouvertes, file d'attente...), fixée par `fixer`
+    ou lue au moment de l'export par `fonction` : elle retourne un nombre, ou un
+    dict {(valeurs des étiquettes): nombre}.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        nom: str,
+        aide: str,
+        etiquettes: Sequence[str] = (),
+        fonction: Optional[Callable[[], Union[float, Dict[Tuple[str, ...], float]]]] = None,
+    ):
+        super().__init__(nom, aide, etiquettes)
+        self.fonction = fonction
+        self.__valeurs: Dict[Tuple[str, ...], float] = {}
+
+    def fixer(self, valeur: float, **etiquettes: Any) -> None:
+        cle = self._cle(etiquettes)
+        with self._verrou:
+            self.__valeurs[cle] = valeur
+
+    def echantillons(self) -> List[Echantillon]:
+        with self._verrou:
+            valeurs = dict(self.__valeurs)
+        if self.fonction is not None:
+            try:
+                lues = self.fonction()
+            except Exception:
+                lues = {}
+            valeurs.update(lues if isinstance(lues, dict) else {(): lues})
+        return [("", dict(zip(self.etiquettes, map(str, cle))), v) for cle, v in sorted(valeurs.items())]
+
+
+class HistogrammeMetrique(_Famille):
+    """Distribution de durées (secondes), un Histogramme par combinaison d'étiquettes."""
+
+    type = "histogram"
+
+    def __init__(self, nom: str, aide: str, etiquettes: Sequence[str] = (), bornes: Optional[Sequence[float]] = None):
+        super().__init__(nom, aide, etiquettes)
+        self.bornes = bornes
+        self.__histogrammes: Dict[Tuple[str, ...], Histogramme] = {}
+
+    def _histogramme(self, etiquettes: Dict[str, Any]) -> Histogramme:
+        cle = self._cle(etiquettes)
+        histogramme = self.__histogrammes.get(cle)
+        if histogramme is None:
+            with self._verrou:
+                histogramme = self.__histogrammes.setdefault(cle, Histogramme(self.bornes))
+        return histogramme
+
+    def observer(self, valeur: float, **etiquettes: Any) -> None:
+        self._histogramme(etiquettes).observer(valeur)
+
+    @contextmanager
+    def chronometrer(self, **etiquettes: Any) -> Iterator[None]:
+        """`with histogramme.chronometrer(...)` : observe la durée du bloc, même s'il lève."""
+        histogramme = self._histogramme(etiquettes)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogramme.observer(time.perf_counter() - t0)
+
+    def resume(self, **etiquettes: Any) -> Dict[str, float]:
+        return self._histogramme(etiquettes).resume()
+
+    def echantillons(self) -> List[Echantillon]:
+        with self._verrou:
+            histogrammes = sorted(self.__histogrammes.items())
+        resultat: List[Echantillon] = []
+        for cle, histogramme in histogrammes:
+            etiquettes = dict(zip(self.etiquettes, cle))
+            compartiments = histogramme.compartiments()
+            for borne, cumul in compartiments:
+                resultat.append(("_bucket", {**etiquettes, "le": _nombre(borne)}, cumul))
+            resultat.append(("_sum", etiquettes, histogramme.resume()["total"]))
+            resultat.append(("_count", etiquettes, compartiments[-1][1]))
+        return resultat
+
+    def resumes(self) -> List[Tuple[Dict[str, str], Dict[str, float]]]:
+        with self._verrou:
+            histogrammes = sorted(self.__histogrammes.items())
+        return [(dict(zip(self.etiquettes, cle)), h.resume()) for cle, h in histogrammes]
+
+
+class RegistreMetriques(metaclass=Singleton):
+    """
+    Registre des métriques du processus (réservations, consultation du catalogue,
+    e-mails, pool de connexions), sans dépendance externe.
+
+    Les modules déclarent leurs métriques au chargement (`compteur`, `jauge`,
+    `histogramme` retournent la métrique existante si le nom est déjà pris) ;
+    un incrément coûte un verrou et une addition.
+
+    Lecture :
+    - `exposition()` : format texte Prometheus (route /metrics de l'API, ou
+      `servir(port)` pour un processus sans serveur web, cf. METRIQUES_PORT) ;
+    - `texte()` : tableau lisible, affiché dans le menu administrateur du CLI.
+    """
+
+    def __init__(self):
+        self.__familles: Dict[str, _Famille] = {}
+        self.__verrou = threading.Lock()
+
+    def _declarer(self, classe, nom: str, aide: str, etiquettes: Sequence[str], **options) -> Any:
+        with self.__verrou:
+            famille = self.__familles.get(nom)
+            if famille is None:
+                famille = self.__familles[nom] = classe(nom, aide, etiquettes, **options)
+            elif type(famille) is not classe or famille.etiquettes != tuple(etiquettes):
+                raise ValueError(f"Métrique {nom} déjà déclarée avec un autre type ou d'autres étiquettes.")
+            return famille
+
+    def compteur(self, nom: str, aide: str, etiquettes: Sequence[str] = ()) -> Compteur:
+        return self._declarer(Compteur, nom, aide, etiquettes)
+
+    def jauge(self, nom: str, aide: str, etiquettes: Sequence[str] = (), fonction=None) -> Jauge:
+        """Déclare une jauge ; `fonction` remplace celle d'une déclaration précédente."""
+        jauge = self._declarer(Jauge, nom, aide, etiquettes)
+        if fonction is not None:
+            jauge.fonction = fonction
+        return jauge
+
+    def histogramme(
+        self, nom: str, aide: str, etiquettes: Sequence[str] = (), bornes: Optional[Sequence[float]] = None
+    ) -> HistogrammeMetrique:
+        return self._declarer(HistogrammeMetrique, nom, aide, etiquettes, bornes=bornes)
+
+    def familles(self) -> List[_Famille]:
+        with self.__verrou:
+            return [self.__familles[nom] for nom in sorted(self.__familles)]
+
+    # ---------- Export ----------
+
+    def exposition(self) -> str:
+        """Toutes les métriques au format texte Prometheus (version 0.0.4)."""
+        lignes: List[str] = []
+        for famille in self.familles():
+            lignes.extend(famille.exposition())
+        return "\n".join(lignes) + "\n"
+
+    def texte(self) -> str:
+        """Vue lisible : valeur des compteurs et jauges, nombre / p50 / p95 / p99 / max des histogrammes (ms)."""
+        lignes: List[str] = []
+        for famille in self.familles():
+            if isinstance(famille, HistogrammeMetrique):
+                for etiquettes, r in famille.resumes():
+                    if r["nombre"]:
+                        lignes.append(
+                            f"{famille.nom}{_etiquettes_texte(etiquettes)}  n={r['nombre']}  "
+                            f"p50={r['p50'] * 1000:.1f} p95={r['p95'] * 1000:.1f} "
+                            f"p99={r['p99'] * 1000:.1f} max={r['max'] * 1000:.1f} ms"
+                        )
+            else:
+                for _, etiquettes, valeur in famille.echantillons():
+                    lignes.append(f"{famille.nom}{_etiquettes_texte(etiquettes)}  {_nombre(valeur)}")
+        return "\n".join(lignes) if lignes else "Aucune métrique enregistrée."
+
+    def servir(self, port: int, hote: str = "0.0.0.0") -> ThreadingHTTPServer:
+        """
+        Sert `exposition()` sur http://hote:port/metrics depuis un thread de fond
+        (processus sans FastAPI, ex. le CLI). `shutdown()` sur le serveur retourné l'arrête.
+        """
+        registre = self
+
+        class Gestionnaire(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corps = registre.exposition().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", TYPE_PROMETHEUS)
+                self.send_header("Content-Length", str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+
+            def log_message(self, format, *args):
+                pass
+
+        serveur = ThreadingHTTPServer((hote, port), Gestionnaire)
+        serveur.daemon_threads = True
+        threading.Thread(target=serveur.serve_forever, name="metriques-http", daemon=True).start()
+        return serveur
+
+
+def mesurer(histogramme: HistogrammeMetrique):
+    """
+    Décorateur : observe dans `histogramme` la durée de chaque appel, étiquetée
+    par `methode` (nom de la fonction) et `issue` ('ok' ou 'erreur').
+    Fonctionne sur les fonctions synchrones et les coroutines.
+    """
+
+    def decorateur(func):
+        methode = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper_async(*args, **kwargs):
+                t0, issue = time.perf_counter(), "erreur"
+                try:
+                    resultat = await func(*args, **kwargs)
+                    issue = "ok"
+                    return resultat
+                finally:
+                    histogramme.observer(time.perf_counter() - t0, methode=methode, issue=issue)
+
+            return wrapper_async
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            t0, issue = time.perf_counter(), "erreur"
+            try:
+                resultat = func(*args, **kwargs)
+                issue = "ok"
+                return resultat
+            finally:
+                histogramme.observer(time.perf_counter() - t0, methode=methode, issue=issue)
+
+        return wrapper
+
+    return decorateur
@@ -0,0 +1,135 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import hashlib
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+import dotenv
+
+from dao.db_connection import DBConnection
+
+DOSSIER_MIGRATIONS = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "data", "migrations")
+)
+
+
+class Migrations:
+    """
+    Migrations versionnées du schéma : fichiers `data/migrations/NNN_nom.sql`,
+    appliqués dans l'ordre et une seule fois par schéma.
+
+    Les versions appliquées sont tracées dans la table `schema_migration` du schéma.
+    Chaque migration s'exécute dans sa propre transaction, sous un verrou consultatif
+    propre au schéma : deux déploiements simultanés ne l'appliquent pas deux fois.
+    """
+
+    _MOTIF = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+    def __init__(self, dossier: str = DOSSIER_MIGRATIONS):
+        self.dossier = dossier
+
+    def lister(self) -> List[Tuple[str, str, str]]:
+        """Retourne les migrations disponibles, triées : [(version, nom, sql), ...]."""
+        migrations = []
+        for fichier in os.listdir(self.dossier):
+            correspondance = self._MOTIF.match(fichier)
+            if not correspondance:
+                continue
+            with open(os.path.join(self.dossier, fichier), encoding="utf-8") as f:
+                migrations.append((correspondance.group(1), correspondance.group(2), f.read()))
+        return sorted(migrations, key=lambda m: int(m[0]))
+
+    @staticmethod
+    def _somme_controle(sql: str) -> str:
+        return hashlib.sha256(sql.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _preparer(curs, schema: str) -> None:
+        """Cible le schéma pour la transaction courante et sérialise les migrations."""
+        curs.execute(f"SET LOCAL search_path TO {schema};")
+        curs.execute("SELECT pg_advisory_xact_lock(hashtext(%(cle)s))", {"cle": f"migrations:{schema}"})
+        curs.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migration (
+                version VARCHAR(10) PRIMARY KEY,
+                nom VARCHAR(100) NOT NULL,
+                somme_controle CHAR(64) NOT NULL,
+                date_application TIMESTAMP DEFAULT NOW()
+            )
+            """
+        )
+
+    def appliquees(self, schema: Optional[str] = None) -> Dict[str, str]:
+        """Retourne {version: somme_controle} des migrations déjà appliquées au schéma."""
+        schema = schema or os.getenv("POSTGRES_SCHEMA")
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                self._preparer(curs, schema)
+                curs.execute("SELECT version, somme_controle FROM schema_migration")
+                return {r["version"]: r["somme_controle"] for r in curs.fetchall()}
+
+    def appliquer(self, schema: Optional[str] = None) -> List[str]:
+        """
+        Applique au schéma (par défaut POSTGRES_SCHEMA) les migrations manquantes.
+        Retourne les versions appliquées par cet appel.
+        """
+        schema = schema or os.getenv("POSTGRES_SCHEMA")
+        nouvelles = []
+
+        for version, nom, sql in self.lister():
+            somme = self._somme_controle(sql)
+            with DBConnection().getConnexion() as con:
+                with con.cursor() as curs:
+                    self._preparer(curs, schema)
+                    curs.execute(
+                        "SELECT somme_controle FROM schema_migration WHERE version = %(version)s",
+                        {"version": version},
+                    )
+                    deja = curs.fetchone()
+                    if deja:
+                        if deja["somme_controle"] != somme:
+                            logging.warning(
+                                f"Migration {version}_{nom} modifiée depuis son application sur {schema} "
+                                "(créer une nouvelle migration plutôt que d'éditer l'ancienne)."
+                            )
+                        continue
+
+                    curs.execute(sql)
+                    curs.execute(
+                        "INSERT INTO schema_migration (version, nom, somme_controle) "
+                        "VALUES (%(version)s, %(nom)s, %(somme)s)",
+                        {"version": version, "nom": nom, "somme": somme},
+                    )
+            logging.info(f"Migration {version}_{nom} appliquée sur {schema}")
+            nouvelles.append(version)
+
+        return nouvelles
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Applique les migrations versionnées de data/migrations/.")
+    parser.add_argument("--schema", default=None, help="Schéma cible (défaut : POSTGRES_SCHEMA).")
+    parser.add_argument("--statut", action="store_true", help="Affiche l'état sans rien appliquer.")
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+    migrations = Migrations()
+    schema = args.schema or os.getenv("POSTGRES_SCHEMA")
+
+    if args.statut:
+        deja = migrations.appliquees(schema)
+        for version, nom, _ in migrations.lister():
+            print(f"  {version}_{nom} : {'appliquée' if version in deja else 'en attente'}")
+    else:
+        appliquees = migrations.appliquer(schema)
+        print(f"{len(appliquees)} migration(s) appliquée(s) sur {schema}.")
+
+# Exemple :
+# python src/utils/migrations.py --statut
+# python src/utils/migrations.py --schema projet_dao
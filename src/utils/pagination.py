@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+def encoder_curseur(*valeurs: Any) -> str:
+    """
+    Encode la clé de tri du dernier élément d'une page en jeton opaque (base64 url-safe).
+    Les dates sont sérialisées au format ISO.
+    """
+    brut = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in valeurs]
+    return base64.urlsafe_b64encode(json.dumps(brut).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decoder_curseur(curseur: str, *types: Callable[[Any], Any]) -> Tuple:
+    """
+    Décode un jeton produit par encoder_curseur.
+    `types` convertit chaque composante (ex : date.fromisoformat, int).
+    Lève ValueError si le jeton est invalide.
+    """
+    try:
+        rembourrage = "=" * (-len(curseur) % 4)
+        brut = json.loads(base64.urlsafe_b64decode(curseur + rembourrage).decode("utf-8"))
+        if not isinstance(brut, list) or len(brut) != len(types):
+            raise ValueError
+        return tuple(t(v) for t, v in zip(types, brut))
+    except Exception:
+        raise ValueError("Curseur de pagination invalide.") from None
+
+
+def decouper_page(
+    rows: Sequence[Any],
+    limit: int,
+    cle: Callable[[Any], Tuple],
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    `rows` a été lu avec LIMIT limit + 1 : s'il y a une ligne de trop, il existe
+    une page suivante, dont le curseur est la clé du dernier élément conservé.
+    Une page de taille nulle est vide et sans suite.
+    """
+    if limit < 1:
+        return [], None
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encoder_curseur(*cle(rows[-1]))
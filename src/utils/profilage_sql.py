@@ -0,0 +1,202 @@
+import atexit
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from utils.singleton import Singleton
+
+logger = logging.getLogger(__name__)
+
+_RE_COMMENTAIRES = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_RE_CHAINES = re.compile(r"'(?:[^']|'')*'")
+_RE_PARAMETRES = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_RE_NOMBRES = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_LISTES = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_RE_ESPACES = re.compile(r"\s+")
+_RE_EXPLICABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.I)
+
+# Modules dont les frames ne désignent pas l'appelant
+_MODULES_CONNEXION = {"dao.db_connection", "dao.asynchrone.db_connection"}
+
+# Issues de ProfilageRequetes.enregistrer
+LENTE = "lente"
+A_EXPLIQUER = "a_expliquer"
+
+
+def empreinte(query: str) -> str:
+    """
+    Forme normalisée d'une requête : commentaires retirés, littéraux et paramètres
+    remplacés par ?, listes (?, ?, ...) réduites, espaces compactés. Les exécutions
+    d'une même requête avec des valeurs différentes partagent ainsi leurs statistiques.
+    """
+    texte = _RE_COMMENTAIRES.sub(" ", query)
+    texte = _RE_CHAINES.sub("?", texte)
+    texte = _RE_PARAMETRES.sub("?", texte)
+    texte = _RE_NOMBRES.sub("?", texte)
+    texte = _RE_LISTES.sub("(?)", texte)
+    return _RE_ESPACES.sub(" ", texte).strip()
+
+
+def est_explicable(query: str) -> bool:
+    """Une seule instruction SELECT / WITH / INSERT / UPDATE / DELETE (EXPLAIN sans exécution)."""
+    return bool(_RE_EXPLICABLE.match(query)) and ";" not in query.strip().rstrip(";")
+
+
+def appelant_dao() -> str:
+    """Méthode du DAO (module dao.*) à l'origine de la requête, ex. 'ReservationDao.reserver'."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("dao.") and module not in _MODULES_CONNEXION:
+            return getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+        frame = frame.f_back
+    return "hors DAO"
+
+
+class _StatistiquesRequete:
+    __slots__ = ("appels", "erreurs", "duree_totale", "duree_max", "lignes", "durees", "appelants", "dernier_plan")
+
+    def __init__(self, fenetre: int):
+        self.appels = 0
+        self.erreurs = 0
+        self.duree_totale = 0.0
+        self.duree_max = 0.0
+        self.lignes = 0
+        self.durees: Deque[float] = deque(maxlen=fenetre)
+        self.appelants: Counter = Counter()
+        self.dernier_plan = float("-inf")
+
+
+class ProfilageRequetes(metaclass=Singleton):
+    """
+    Chronométrage de toutes les requêtes SQL du processus, alimenté par les curseurs
+    de DBConnection et DBConnectionAsync.
+
+    Pour chaque empreinte de requête : nombre d'appels, erreurs, durée totale et
+    maximale, lignes, méthodes DAO appelantes, et p50/p95/p99 glissants sur les
+    PROFILAGE_FENETRE (1000) dernières exécutions.
+
+    Une requête plus lente que PROFILAGE_SEUIL_LENT_MS (200 ms) est journalisée
+    (WARNING) avec son plan EXPLAIN, au plus une fois par minute et par empreinte.
+
+    PROFILAGE_SQL=0 désactive le profilage (curseurs psycopg d'origine, coût nul).
+    Le rapport est journalisé à la sortie du processus (PROFILAGE_RAPPORT_SORTIE=0
+    pour l'éviter) et consultable depuis le menu administrateur.
+    """
+
+    INTERVALLE_PLANS = 60.0
+
+    def __init__(self):
+        self.actif = os.getenv("PROFILAGE_SQL", "1") != "0"
+        self.seuil_lent = float(os.getenv("PROFILAGE_SEUIL_LENT_MS", "200")) / 1000
+        self.fenetre = int(os.getenv("PROFILAGE_FENETRE", "1000"))
+        self.__stats: Dict[str, _StatistiquesRequete] = {}
+        self.__empreintes: Dict[str, str] = {}
+        self.__verrou = threading.Lock()
+        if self.actif and os.getenv("PROFILAGE_RAPPORT_SORTIE", "1") != "0":
+            atexit.register(self._rapport_sortie)
+
+    def empreinte(self, query: str) -> str:
+        """empreinte(), mémorisée : les requêtes des DAO sont des constantes."""
+        resultat = self.__empreintes.get(query)
+        if resultat is None:
+            resultat = empreinte(query)
+            if len(self.__empreintes) < 10_000:
+                self.__empreintes[query] = resultat
+        return resultat
+
+    # ---------- Enregistrement ----------
+
+    def enregistrer(self, query: str, duree: float, lignes: int, erreur: bool = False) -> Optional[str]:
+        """
+        Enregistre une exécution. Retourne None, LENTE (au-dessus du seuil) ou
+        A_EXPLIQUER (au-dessus du seuil, et plan pas journalisé depuis une minute).
+        """
+        cle = self.empreinte(query)
+        appelant = appelant_dao()
+        maintenant = time.monotonic()
+        with self.__verrou:
+            stats = self.__stats.get(cle)
+            if stats is None:
+                stats = self.__stats[cle] = _StatistiquesRequete(self.fenetre)
+            stats.appels += 1
+            stats.erreurs += erreur
+            stats.duree_totale += duree
+            stats.duree_max = max(stats.duree_max, duree)
+            stats.lignes += max(lignes, 0)
+            stats.durees.append(duree)
+            stats.appelants[appelant] += 1
+
+            if erreur or duree < self.seuil_lent:
+                return None
+            if maintenant - stats.dernier_plan < self.INTERVALLE_PLANS:
+                return LENTE
+            stats.dernier_plan = maintenant
+            return A_EXPLIQUER
+
+    def journaliser_lente(self, query: str, duree: float, lignes: int, plan: Optional[str] = None) -> None:
+        logger.warning(
+            "Requête lente : %.0f ms, %d ligne(s), appelée par %s\n%s%s",
+            duree * 1000, lignes, appelant_dao(), self.empreinte(query),
+            f"\nPlan :\n{plan}" if plan else "",
+        )
+
+    # ---------- Rapport ----------
+
+    @staticmethod
+    def _quantile(durees: List[float], q: float) -> float:
+        return durees[min(len(durees) - 1, int(q * len(durees)))] if durees else 0.0
+
+    def rapport(self, limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Statistiques par empreinte, de la plus coûteuse (durée totale) à la moins coûteuse. Durées en ms."""
+        with self.__verrou:
+            instantane = [
+                (cle, s.appels, s.erreurs, s.duree_totale, s.duree_max, s.lignes,
+                 sorted(s.durees), s.appelants.most_common(3))
+                for cle, s in self.__stats.items()
+            ]
+        lignes = [
+            {
+                "empreinte": cle,
+                "appels": appels,
+                "erreurs": erreurs,
+                "total_ms": total * 1000,
+                "moyenne_ms": total / appels * 1000,
+                "p50_ms": self._quantile(durees, 0.50) * 1000,
+                "p95_ms": self._quantile(durees, 0.95) * 1000,
+                "p99_ms": self._quantile(durees, 0.99) * 1000,
+                "max_ms": maximum * 1000,
+                "lignes_moyennes": nb_lignes / appels,
+                "appelants": [nom for nom, _ in appelants],
+            }
+            for cle, appels, erreurs, total, maximum, nb_lignes, durees, appelants in instantane
+        ]
+        lignes.sort(key=lambda r: r["total_ms"], reverse=True)
+        return lignes[:limite] if limite else lignes
+
+    def rapport_texte(self, limite: int = 15, largeur: int = 90) -> str:
+        lignes = self.rapport(limite)
+        if not lignes:
+            return "Aucune requête enregistrée."
+        texte = [f"{'Appels':>7} {'Total ms':>10} {'p50':>8} {'p95':>8} {'p99':>8} {'Max':>8} {'Lignes':>7}  Requête"]
+        for r in lignes:
+            texte.append(
+                f"{r['appels']:>7} {r['total_ms']:>10.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                f"{r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {r['lignes_moyennes']:>7.1f}  {r['empreinte'][:largeur]}"
+            )
+            texte.append(f"{'':>60}  ↳ {', '.join(r['appelants'])}"
+                         + (f" ({r['erreurs']} erreur(s))" if r["erreurs"] else ""))
+        return "\n".join(texte)
+
+    def vider(self) -> None:
+        with self.__verrou:
+            self.__stats.clear()
+
+    def _rapport_sortie(self) -> None:
+        if self.__stats:
+            logger.info("Profil des requêtes SQL (par durée totale) :\n%s", self.rapport_texte())
@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import dotenv
+
+from dao.compteur_evenement_dao import CompteurEvenementDao
+
+
+def reconcilier(reparer: bool = False, id_evenement=None) -> int:
+    """
+    Compare les compteurs dénormalisés (`compteur_evenement`) aux réservations réelles.
+    Affiche les dérives et, si `reparer` vaut True, les corrige.
+    Retourne le nombre d'événements en dérive détectés.
+    """
+    dao = CompteurEvenementDao()
+    derives = dao.find_derives(id_evenement)
+
+    if not derives:
+        print("Aucune dérive : tous les compteurs sont cohérents.")
+        return 0
+
+    print(f"{len(derives)} événement(s) en dérive :")
+    for d in derives:
+        print(
+            f"  #{d['id_evenement']:>5} | réservations {d['compteur_reservations']} -> {d['reel_reservations']}"
+            f" | bus aller {d['compteur_bus_aller']} -> {d['reel_bus_aller']}"
+            f" | bus retour {d['compteur_bus_retour']} -> {d['reel_bus_retour']}"
+        )
+
+    if reparer:
+        corriges = dao.reparer(id_evenement)
+        print(f"{len(corriges)} compteur(s) réparé(s).")
+
+    return len(derives)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Détecte (et répare) la dérive des compteurs de places par événement."
+    )
+    parser.add_argument("--reparer", action="store_true", help="Corrige les compteurs en dérive.")
+    parser.add_argument("-e", "--evenement", type=int, default=None, help="Limiter à un événement.")
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+    nb = reconcilier(reparer=args.reparer, id_evenement=args.evenement)
+    sys.exit(1 if nb and not args.reparer else 0)
+
+# Exemple :
+# python src/utils/reconciliation_compteurs.py            # détection seule
+# python src/utils/reconciliation_compteurs.py --reparer  # détection + réparation
@@ -4,45 +4,112 @@ import sys
 # Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+import hashlib
 import logging
 import dotenv
+from typing import Optional
 from unittest import mock
 
 from utils.log_decorator import log
 from utils.singleton import Singleton
 from dao.db_connection import DBConnection
+from utils.migrations import DOSSIER_MIGRATIONS, Migrations
+
+DOSSIER_DATA = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "data"))
+
+# Préfixe du commentaire posé sur un schéma de test construit par `preparer`
+_MARQUE = "reset:"
 
 
 class ResetDatabase(metaclass=Singleton):
     """
     Réinitialisation de la base de données
+
+    - `lancer` reconstruit toujours le schéma (drop / create, scripts SQL, migrations) ;
+    - `preparer` (tests DAO) ne le reconstruit que si nécessaire : le schéma garde en
+      commentaire l'empreinte des scripts qui l'ont construit, et il est réutilisé
+      tel quel, d'une session de tests à l'autre, tant que ni les scripts ni ses
+      données n'ont changé. Les tests annulent leurs écritures (transaction de test,
+      cf. DBConnection.transaction_de_test) ; ceux qui valident réellement les leurs
+      appellent d'abord `marquer_modifie`, ce qui force la reconstruction suivante.
     """
 
+    @staticmethod
+    def _donnees(test_dao: bool) -> str:
+        return os.path.join(DOSSIER_DATA, "pop_db_test.sql" if test_dao else "pop_db.sql")
+
     @log
-    def lancer(self, test_dao=False):
+    def lancer(self, test_dao=False, schema: Optional[str] = None):
         """Lancement de la réinitialisation des données
-        Si test_dao = True : réinitialisation des données de test"""
+        Si test_dao = True : réinitialisation des données de test
+        `schema` : schéma cible (défaut : projet_test_dao ou projet_dao)"""
 
         dotenv.load_dotenv()
 
-        if test_dao:
-            schema = "projet_test_dao"
-            pop_data_path = "data/pop_db_test.sql"
-        else:
-            schema = "projet_dao"
-            pop_data_path = "data/pop_db.sql"
+        if schema is None:
+            schema = "projet_test_dao" if test_dao else "projet_dao"
+        pop_data_path = self._donnees(test_dao)
 
         # On utilise un patch temporaire du dictionnaire os.environ
         with mock.patch.dict(os.environ, {"POSTGRES_SCHEMA": schema}):
             self._reset_schema(schema, pop_data_path)
 
+    # ---------- Schémas de test réutilisables ----------
+
+    def empreinte(self, test_dao: bool = True) -> str:
+        """SHA-256 des scripts qui construisent le schéma (init, données, migrations)."""
+        fichiers = [os.path.join(DOSSIER_DATA, "init_db.sql"), self._donnees(test_dao)]
+        fichiers += [os.path.join(DOSSIER_MIGRATIONS, f) for f in sorted(os.listdir(DOSSIER_MIGRATIONS))]
+        somme = hashlib.sha256()
+        for chemin in fichiers:
+            somme.update(os.path.basename(chemin).encode("utf-8"))
+            with open(chemin, "rb") as f:
+                somme.update(f.read())
+        return somme.hexdigest()
+
+    @staticmethod
+    def _marque(curs, schema: str) -> Optional[str]:
+        curs.execute(
+            "SELECT obj_description(oid, 'pg_namespace') AS marque FROM pg_namespace WHERE nspname = %(schema)s",
+            {"schema": schema},
+        )
+        row = curs.fetchone()
+        return row["marque"] if row else None
+
+    def preparer(self, schema: str, test_dao: bool = True) -> bool:
+        """
+        Schéma prêt pour les tests : reconstruit seulement s'il n'existe pas, si les
+        scripts ont changé depuis sa construction ou s'il a été marqué modifié.
+        Les constructions sont sérialisées entre processus (workers pytest-xdist).
+        Retourne True si le schéma a été reconstruit.
+        """
+        dotenv.load_dotenv()
+        marque = _MARQUE + self.empreinte(test_dao)
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute("SELECT pg_advisory_xact_lock(hashtext('reset_database'))")
+                if self._marque(curs, schema) == marque:
+                    return False
+
+                with mock.patch.dict(os.environ, {"POSTGRES_SCHEMA": schema}):
+                    self._reset_schema(schema, self._donnees(test_dao))
+                curs.execute(f"COMMENT ON SCHEMA {schema} IS %(marque)s", {"marque": marque})
+        return True
+
+    def marquer_modifie(self, schema: str) -> None:
+        """Efface la marque du schéma : le prochain `preparer` le reconstruira."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(f"COMMENT ON SCHEMA {schema} IS NULL")
+
     def _reset_schema(self, schema, pop_data_path):
-        """Exécute le drop / create du schéma et les scripts SQL"""
+        """Exécute le drop / create du schéma, les scripts SQL puis les migrations"""
         print(f" Initialisation du schéma : {schema}")
 
         create_schema = f"DROP SCHEMA IF EXISTS {schema} CASCADE; CREATE SCHEMA {schema};"
 
-        with open("data/init_db.sql", encoding="utf-8") as f:
+        with open(os.path.join(DOSSIER_DATA, "init_db.sql"), encoding="utf-8") as f:
             init_db_as_string = f.read()
         with open(pop_data_path, encoding="utf-8") as f:
             pop_db_as_string = f.read()
@@ -57,6 +124,9 @@ class ResetDatabase(metaclass=Singleton):
                     cursor.execute(init_db_as_string)
                     cursor.execute(pop_db_as_string)
 
+            # Index et évolutions du schéma : mêmes migrations qu'en production
+            Migrations().appliquer(schema)
+
             print(f"Schéma {schema} réinitialisé avec succès !\n")
         except Exception as e:
             logging.exception(f"Erreur lors de la réinitialisation du schéma {schema} :")
@@ -1,13 +1,36 @@
 # utils/password_utils.py
-import bcrypt
-from typing import Optional
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import List, Optional, Sequence
 from getpass import getpass
 
+import bcrypt
+
+from utils.singleton import Singleton
+
+
+def cout_bcrypt() -> int:
+    """Facteur de coût bcrypt configuré (BCRYPT_COUT, 12 par défaut)."""
+    return int(os.getenv("BCRYPT_COUT", "12"))
+
+
+def cout_du_hash(stored_hash: str) -> Optional[int]:
+    """Facteur de coût lu dans un hash bcrypt ($2b$12$...), None si le format est inconnu."""
+    try:
+        return int(stored_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
 
-def hash_password(password: str, rounds: int = 12, salt: Optional[bytes] = None) -> str:
+def hash_password(password: str, rounds: Optional[int] = None, salt: Optional[bytes] = None) -> str:
     """
     Hash un mot de passe avec bcrypt.
-    - rounds : facteur de coût (par défaut 12).
+    - rounds : facteur de coût (par défaut BCRYPT_COUT, 12).
     - salt : sel bcrypt optionnel (généralement on laisse None pour bcrypt.gensalt()).
 
     Retourne une chaîne UTF-8 au format bcrypt, ex: $2b$12$...
@@ -16,7 +39,7 @@ def hash_password(password: str, rounds: int = 12, salt: Optional[bytes] = None)
         password = password.encode("utf-8")
 
     if salt is None:
-        salt = bcrypt.gensalt(rounds=rounds)
+        salt = bcrypt.gensalt(rounds=rounds or cout_bcrypt())
 
     hashed = bcrypt.hashpw(password, salt)
     return hashed.decode("utf-8")
@@ -35,6 +58,102 @@ def verify_password(stored_hash: str, password: str) -> bool:
         return False
 
 
+class HachageMotDePasse(metaclass=Singleton):
+    """
+    Hachage et vérification bcrypt pour tous les DAO (utilisateur, participant,
+    administrateur), hors du thread appelant.
+
+    Le calcul part dans un pool de processus dimensionné aux cœurs : lors d'un pic
+    de connexions (ouverture d'un shotgun), les vérifications s'exécutent en
+    parallèle sur tous les cœurs, et au plus autant à la fois, sans saturer les
+    threads qui servent les requêtes.
+
+    - BCRYPT_COUT : facteur de coût des nouveaux hashs (12 par défaut) ; un hash
+      d'un autre coût est refait à la connexion suivante (`a_rehacher`).
+    - BCRYPT_PROCESSUS : taille du pool (nombre de cœurs par défaut ; 0 calcule
+      dans le thread appelant, utile pour les scripts et les tests).
+    """
+
+    def __init__(self, processus: Optional[int] = None, cout: Optional[int] = None):
+        if processus is None:
+            processus = int(os.getenv("BCRYPT_PROCESSUS") or os.cpu_count() or 1)
+        self.processus = processus
+        self.cout = cout or cout_bcrypt()
+        self.__executor: Optional[ProcessPoolExecutor] = None
+        self.__verrou = threading.Lock()
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        """Pool de processus, créé au premier usage (None si BCRYPT_PROCESSUS=0)."""
+        if self.processus <= 0:
+            return None
+        if self.__executor is None:
+            with self.__verrou:
+                if self.__executor is None:
+                    # Jamais fork : le processus parent a des threads (pool de connexions,
+                    # boucle asyncio, outbox) dont un enfant forké hériterait des verrous pris
+                    methode = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                    self.__executor = ProcessPoolExecutor(
+                        max_workers=self.processus, mp_context=multiprocessing.get_context(methode)
+                    )
+        return self.__executor
+
+    def _executer(self, fonction, *args):
+        executor = self._executor()
+        if executor is None:
+            return fonction(*args)
+        try:
+            return executor.submit(fonction, *args).result()
+        except BrokenProcessPool:
+            # Un processus du pool a été tué : on repart d'un pool neuf au prochain appel
+            self.fermer()
+            raise
+
+    async def _executer_async(self, fonction, *args):
+        executor = self._executor()
+        if executor is None:
+            return await asyncio.to_thread(fonction, *args)
+        return await asyncio.get_running_loop().run_in_executor(executor, fonction, *args)
+
+    # ---------- API ----------
+
+    def hacher(self, mot_de_passe: str) -> str:
+        """Hash bcrypt (au coût configuré) du mot de passe."""
+        return self._executer(hash_password, mot_de_passe, self.cout)
+
+    def hacher_plusieurs(self, mots_de_passe: Sequence[str]) -> List[str]:
+        """Hashs de plusieurs mots de passe, calculés en parallèle sur tout le pool (imports en masse)."""
+        executor = self._executor()
+        if executor is None:
+            return [hash_password(mdp, self.cout) for mdp in mots_de_passe]
+        morceau = max(1, len(mots_de_passe) // (self.processus * 4))
+        try:
+            return list(executor.map(hash_password, mots_de_passe, repeat(self.cout), chunksize=morceau))
+        except BrokenProcessPool:
+            self.fermer()
+            raise
+
+    def verifier(self, mot_de_passe: str, hache: str) -> bool:
+        """True si le mot de passe correspond au hash stocké."""
+        return self._executer(verify_password, hache, mot_de_passe)
+
+    async def hacher_async(self, mot_de_passe: str) -> str:
+        return await self._executer_async(hash_password, mot_de_passe, self.cout)
+
+    async def verifier_async(self, mot_de_passe: str, hache: str) -> bool:
+        return await self._executer_async(verify_password, hache, mot_de_passe)
+
+    def a_rehacher(self, hache: str) -> bool:
+        """True si le hash n'est pas au coût configuré (il sera refait à la connexion)."""
+        return cout_du_hash(hache) != self.cout
+
+    def fermer(self) -> None:
+        """Arrête le pool de processus (il sera recréé au prochain usage)."""
+        with self.__verrou:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 # --- Utilitaire CLI simple ---
 def _cli_hash_interactive():
     """Saisie interactive (masquée) pour hasher un mot de passe et l'afficher."""
@@ -75,8 +194,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "-c", "--cost",
         type=int,
-        default=12,
-        help="Facteur de coût bcrypt (rounds), défaut 12."
+        default=None,
+        help="Facteur de coût bcrypt (rounds), défaut BCRYPT_COUT ou 12."
     )
     args = parser.parse_args()
 
@@ -1,3 +1,6 @@
+import threading
+
+
 class Singleton(type):
     """
     Toutes les classes qui hériteront de Singleton n'auront qu'une seule et unique instance
@@ -5,9 +8,13 @@ class Singleton(type):
     """
 
     _instances = {}
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
+            # Double vérification : deux threads ne doivent pas créer deux instances
+            with cls._lock:
+                if cls not in cls._instances:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
         return cls._instances[cls]
@@ -0,0 +1,73 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import time
+
+import dotenv
+
+from dao.email_outbox_dao import EmailOutboxDao
+from service.outbox_email_service import OutboxEmailService
+from service.reservation_service import ReservationService
+from service.session_service import SessionService
+
+
+def afficher_statut() -> None:
+    compteurs = EmailOutboxDao().compter_par_statut()
+    print(" | ".join(f"{statut} : {n}" for statut, n in compteurs.items()))
+
+
+def afficher_abandonnes(limit: int = 100) -> None:
+    abandonnes = EmailOutboxDao().find_abandonnes(limit)
+    if not abandonnes:
+        print("Aucune lettre morte.")
+    for e in abandonnes:
+        print(f"  #{e.id_email:>6} | {e.destinataire} | {e.sujet} | {e.tentatives} tentative(s) | {e.derniere_erreur}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Envoi en arrière-plan des e-mails de la boîte d'envoi.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Envois simultanés (OUTBOX_WORKERS).")
+    parser.add_argument("-l", "--lot", type=int, default=None, help="E-mails pris par lot (OUTBOX_LOT).")
+    parser.add_argument("--une-fois", action="store_true", help="Vider la file une fois puis s'arrêter.")
+    parser.add_argument("--statut", action="store_true", help="Afficher le nombre d'e-mails par statut.")
+    parser.add_argument("--abandonnes", action="store_true", help="Lister les lettres mortes.")
+    parser.add_argument("--relancer", type=int, nargs="+", metavar="ID", help="Remettre des lettres mortes en file.")
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+
+    if args.statut:
+        afficher_statut()
+    elif args.abandonnes:
+        afficher_abandonnes()
+    elif args.relancer:
+        relances = [i for i in args.relancer if EmailOutboxDao().relancer(i)]
+        print(f"{len(relances)} e-mail(s) remis en file : {relances}")
+    else:
+        service = OutboxEmailService(
+            nb_workers=args.workers,
+            taille_lot=args.lot,
+            entretien=[ReservationService().purger_cles_idempotence, SessionService().purger],
+        )
+        if args.une_fois:
+            print(service.vider())
+        else:
+            service.demarrer()
+            print("Envoi des e-mails en cours (Ctrl+C pour arrêter)...")
+            try:
+                while True:
+                    time.sleep(60)
+                    afficher_statut()
+            except KeyboardInterrupt:
+                pass
+        service.arreter()
+
+# Exemple :
+# python src/utils/worker_emails.py                 # boucle d'envoi
+# python src/utils/worker_emails.py --une-fois -w 8
+# python src/utils/worker_emails.py --abandonnes
+# python src/utils/worker_emails.py --relancer 12 15
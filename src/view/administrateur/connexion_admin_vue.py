@@ -8,6 +8,8 @@ from view.consulter.consulter_evenement_vue import ConsulterVue
 from view.reservations.mes_reservations_vue import MesReservationsVue
 from view.consulter.liste_reservation_vue import ListeInscritsEvenementVue
 from view.consulter.statistiques_vue import StatistiquesInscriptionsVue
+from view.consulter.requetes_sql_vue import RequetesSqlVue
+from view.consulter.metriques_vue import MetriquesVue
 from view.evenement.creer_evenement_vue import CreerEvenementVue
 from view.evenement.modifier_evenement_vue import ModifierEvenementVue
 from view.evenement.supprimer_evenement_vue import SupprimerEvenementVue
@@ -51,6 +53,8 @@ class ConnexionAdminVue(VueAbstraite):
             "Modifier un événement",
             "Supprimer un événement",
             "Statistiques des inscriptions",
+            "Performances des requêtes SQL",
+            "Métriques de l'application",
             "Retour (Se déconnecter)"
         ]
 
@@ -82,6 +86,12 @@ class ConnexionAdminVue(VueAbstraite):
             case "Statistiques des inscriptions":
                 return StatistiquesInscriptionsVue()
 
+            case "Performances des requêtes SQL":
+                return RequetesSqlVue()
+
+            case "Métriques de l'application":
+                return MetriquesVue()
+
             case "Retour (Se déconnecter)":
                 try:
                     self.utilisateur_service.deconnexion()  # Passe par le service
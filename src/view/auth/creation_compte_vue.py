@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 from view.session import Session
 from service.utilisateur_service import UtilisateurService
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
-from utils.api_brevo import send_email_brevo
+from model.email_models import EmailModelIn
 
 load_dotenv()
 
@@ -65,7 +65,19 @@ class CreationCompteVue:
                 administrateur=False,
             )
 
-            user_out: UtilisateurModelOut = self.service.create_user(user_in)  # Service
+            # E-mail de bienvenue déposé dans la boîte d'envoi, dans la transaction de création
+            email_bienvenue = EmailModelIn(
+                destinataire=email,
+                sujet="Confirmation de création de compte — BDE Ensai",
+                contenu=(
+                    f"Bonjour {prenom} {nom},\n\n"
+                    "Votre compte a été créé avec succès.\n\n"
+                    "Vous pouvez désormais vous connecter et réserver vos événements.\n\n"
+                    "Si vous n'êtes pas à l'origine de cette action, veuillez nous contacter.\n\n"
+                    "— L’équipe du BDE Ensai"
+                ),
+            )
+            user_out: UtilisateurModelOut = self.service.create_user(user_in, email=email_bienvenue)  # Service
         except ValidationError as ve:
             print("\n Données invalides :")
             for err in ve.errors():
@@ -87,27 +99,7 @@ class CreationCompteVue:
         except Exception as exc:
             print(f"Compte créé mais échec de la connexion automatique : {exc}")
 
-        # --- Envoi de l'e-mail de confirmation ---
-        try:
-            subject = "Confirmation de création de compte — BDE Ensai"
-            message_text = (
-                f"Bonjour {user_out.prenom} {user_out.nom},\n\n"
-                "Votre compte a été créé avec succès.\n\n"
-                "Vous pouvez désormais vous connecter et réserver vos événements.\n\n"
-                "Si vous n'êtes pas à l'origine de cette action, veuillez nous contacter.\n\n"
-                "— L’équipe du BDE Ensai"
-            )
-            status, _ = send_email_brevo(
-                to_email=user_out.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation vous a été envoyé 🎉")
-            else:
-                print(f" L'e-mail de confirmation n'a pas pu être envoyé (HTTP {status}).")
-        except Exception as exc:
-            print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
+        print("Un e-mail de confirmation va vous être envoyé 🎉")
 
         return AccueilVue("Compte créé — bienvenue !")
 
@@ -1,8 +1,8 @@
 # view/consulter/consulter_vue.py
-from typing import Optional, Any, List
+from typing import Optional, Any
 from datetime import date
 from InquirerPy import inquirer
-from typing import Optional, Any, List
+from typing import Optional, Any
 
 from view.vue_abstraite import VueAbstraite
 from service.consultation_evenement_service import ConsultationEvenementService  # nouveau
@@ -65,18 +65,20 @@ class ConsulterVue(VueAbstraite):
         if action == "retour":
             return vue_de_retour("Retour au menu principal")
 
-        events: List[Any] = []
-
         try:
             # ---------- 1. Récupération selon action ----------
+            # `charger(curseur)` lit une page (pagination par curseur, coût constant à toute profondeur)
             if action == "places":
-                events = self.service.lister_avec_places_restantes(
-                    limit=50,
-                    a_partir_du=date.today()
-                )
+                def charger(curseur):
+                    return self.service.lister_avec_places_restantes_page(
+                        limit=50,
+                        curseur=curseur,
+                        a_partir_du=date.today()
+                    )
 
             elif action == "tous":
-                events = self.service.lister_tous(limit=50)
+                def charger(curseur):
+                    return self.service.lister_tous_page(limit=50, curseur=curseur)
 
             elif action == "recherche":
                 ville = input("Ville (laisser vide pour ignorer) : ").strip() or None
@@ -87,40 +89,51 @@ class ConsulterVue(VueAbstraite):
                 date_min = date.fromisoformat(date_min) if date_min else None
                 date_max = date.fromisoformat(date_max) if date_max else None
 
-                events = self.service.rechercher(
-                    ville=ville,
-                    categorie=categorie,
-                    statut=statut,
-                    date_min=date_min,
-                    date_max=date_max,
-                    limit=50
-                )
+                def charger(curseur):
+                    return self.service.rechercher_page(
+                        ville=ville,
+                        categorie=categorie,
+                        statut=statut,
+                        date_min=date_min,
+                        date_max=date_max,
+                        limit=50,
+                        curseur=curseur
+                    )
+
+            page = charger(None)
 
             # ---------- 2. Vérification ----------
-            if not events:
+            if not page.elements:
                 print("\nAucun événement ne correspond à votre recherche.")
                 input("\n(Entrée) pour continuer...")
                 return self
 
-           # ---------- 3. Formatage (CORRIGÉ) ----------
-            choices_events = []
-            for ev in events:
-                # On utilise notre helper _get_attr
-                places_val = self._get_attr(ev, "places_restantes")
-                places_str = f"({places_val} places)" if places_val is not None else ""
-                date_evt = self._get_attr(ev, "date_evenement", "")
-                titre = self._get_attr(ev, "titre", "N/A")
-
-                titre_affiche = f"{date_evt} | {titre} {places_str}"
-                choices_events.append({"name": titre_affiche, "value": ev})
-
-            choices_events.append({"name": "--- Retour ---", "value": None})
-
-            # ... (La partie 4: Sélection est OK) ...
-            event_selectionne = inquirer.select(
-                message="Sélectionnez un événement pour voir les détails :",
-                choices=choices_events,
-            ).execute()
+            # ---------- 3 & 4. Formatage + sélection, page par page ----------
+            suivante = "__page_suivante__"
+            while True:
+                choices_events = []
+                for ev in page.elements:
+                    # On utilise notre helper _get_attr
+                    places_val = self._get_attr(ev, "places_restantes")
+                    places_str = f"({places_val} places)" if places_val is not None else ""
+                    date_evt = self._get_attr(ev, "date_evenement", "")
+                    titre = self._get_attr(ev, "titre", "N/A")
+
+                    titre_affiche = f"{date_evt} | {titre} {places_str}"
+                    choices_events.append({"name": titre_affiche, "value": ev})
+
+                if page.curseur_suivant:
+                    choices_events.append({"name": "--- Page suivante ---", "value": suivante})
+                choices_events.append({"name": "--- Retour ---", "value": None})
+
+                event_selectionne = inquirer.select(
+                    message="Sélectionnez un événement pour voir les détails :",
+                    choices=choices_events,
+                ).execute()
+
+                if event_selectionne is not suivante:
+                    break
+                page = charger(page.curseur_suivant)
 
             if event_selectionne is None:
                 return self
@@ -8,7 +8,6 @@ from view.session import Session
 
 from service.consultation_evenement_service import ConsultationEvenementService
 from service.reservation_service import ReservationService
-from service.utilisateur_service import UtilisateurService
 
 
 class ListeInscritsEvenementVue(VueAbstraite):
@@ -24,7 +23,6 @@ class ListeInscritsEvenementVue(VueAbstraite):
         super().__init__(message)
         self.service_evt = ConsultationEvenementService()
         self.service_resa = ReservationService()
-        self.service_user = UtilisateurService()
         self.id_evenement = id_evenement
         self._evenement_cache: Any = None  # dict ou modèle EvenementModelOut
 
@@ -86,49 +84,33 @@ class ListeInscritsEvenementVue(VueAbstraite):
     def _fetch_evenement(self, id_evenement: int):
         """Recharge les détails de l’événement (titre/date/ville/places restantes)."""
         try:
-            dispo = self.service_evt.lister_avec_places_restantes(limit=300)
-            for r in dispo:
-                if r.get("id_evenement") == id_evenement:
-                    return r  # dict
-        except Exception:
-            pass
-
-        try:
-            e = self.service_evt.get_evenement_by_id(id_evenement)
-            return e
+            return self.service_evt.get_evenement_avec_places_restantes(id_evenement)  # dict
         except Exception:
             return None
 
     def _load_inscrits(self, id_evenement: int) -> List[Dict[str, Any]]:
-        """Retourne la liste des inscrits enrichie avec les infos utilisateur."""
-        inscrits: List[Dict[str, Any]] = []
+        """Retourne la liste des inscrits enrichie avec les infos utilisateur (une seule requête)."""
         try:
-            reservations = self.service_resa.get_reservations_by_event(id_evenement)
+            inscrits = self.service_resa.get_inscrits_by_event(id_evenement)
         except Exception as exc:
             print(f"Erreur lors de la récupération des réservations : {exc}")
             return []
 
-        for r in reservations:
-            try:
-                user = self.service_user.get_user_by_id(r.fk_utilisateur)
-            except Exception:
-                user = None
-
-            inscrits.append(
-                {
-                    "id_reservation": getattr(r, "id_reservation"),
-                    "nom": getattr(user, "nom", "—") if user else "—",
-                    "prenom": getattr(user, "prenom", "—") if user else "—",
-                    "email": getattr(user, "email", "—") if user else "—",
-                    "bus_aller": bool(getattr(r, "bus_aller", False)),
-                    "bus_retour": bool(getattr(r, "bus_retour", False)),
-                    "adherent": bool(getattr(r, "adherent", False)),
-                    "sam": bool(getattr(r, "sam", False)),
-                    "boisson": bool(getattr(r, "boisson", False)),
-                    "date_reservation": getattr(r, "date_reservation", None),
-                }
-            )
-        return inscrits
+        return [
+            {
+                "id_reservation": i.id_reservation,
+                "nom": i.nom,
+                "prenom": i.prenom,
+                "email": i.email,
+                "bus_aller": bool(i.bus_aller),
+                "bus_retour": bool(i.bus_retour),
+                "adherent": bool(i.adherent),
+                "sam": bool(i.sam),
+                "boisson": bool(i.boisson),
+                "date_reservation": i.date_reservation,
+            }
+            for i in inscrits
+        ]
 
     def _print_header(self):
         titre = self._get_attr(self._evenement_cache, "titre", "—")
@@ -0,0 +1,50 @@
+# view/consulter/metriques_vue.py
+from typing import Optional
+from InquirerPy import inquirer
+
+from view.vue_abstraite import VueAbstraite
+from view.session import Session
+
+from utils.metriques import RegistreMetriques
+
+
+class MetriquesVue(VueAbstraite):
+    """
+    Vue admin : métriques de ce processus (réservations par issue, vérifications
+    de doublon, lectures du catalogue, appels Brevo, attente du pool de connexions),
+    sans serveur Prometheus.
+    """
+
+    def __init__(self, message: str = ""):
+        super().__init__(message)
+        self.registre = RegistreMetriques()
+
+    @staticmethod
+    def _is_admin() -> bool:
+        user = Session().utilisateur
+        return bool(user and getattr(user, "administrateur", False))
+
+    def afficher(self) -> None:
+        super().afficher()
+
+        if not self._is_admin():
+            print("Accès refusé : réservé aux administrateurs.")
+            return
+
+        print("\n--- Métriques de l'application (depuis le lancement) ---")
+        print(self.registre.texte())
+
+    def choisir_menu(self) -> Optional[VueAbstraite]:
+        from view.administrateur.connexion_admin_vue import ConnexionAdminVue
+
+        if not self._is_admin():
+            return ConnexionAdminVue("Accès refusé.")
+
+        action = inquirer.select(
+            message="Actions :",
+            choices=["Actualiser", "--- Retour ---"],
+        ).execute()
+
+        if action == "Actualiser":
+            return MetriquesVue()
+        return ConnexionAdminVue("Retour au menu admin")
@@ -0,0 +1,61 @@
+# view/consulter/requetes_sql_vue.py
+from typing import Optional
+from InquirerPy import inquirer
+
+from view.vue_abstraite import VueAbstraite
+from view.session import Session
+
+from utils.profilage_sql import ProfilageRequetes
+
+
+class RequetesSqlVue(VueAbstraite):
+    """
+    Vue admin : profil des requêtes SQL exécutées par ce processus
+    (appels, durée totale, p50/p95/p99, lignes, méthodes DAO appelantes),
+    les plus coûteuses en premier.
+    """
+
+    def __init__(self, message: str = ""):
+        super().__init__(message)
+        self.profilage = ProfilageRequetes()
+
+    @staticmethod
+    def _is_admin() -> bool:
+        user = Session().utilisateur
+        return bool(user and getattr(user, "administrateur", False))
+
+    def afficher(self) -> None:
+        super().afficher()
+
+        if not self._is_admin():
+            print("Accès refusé : réservé aux administrateurs.")
+            return
+
+        if not self.profilage.actif:
+            print("Profilage désactivé (PROFILAGE_SQL=0).")
+            return
+
+        print(f"\n--- Requêtes SQL (seuil de lenteur : {self.profilage.seuil_lent * 1000:.0f} ms) ---")
+        print(self.profilage.rapport_texte())
+
+    def choisir_menu(self) -> Optional[VueAbstraite]:
+        from view.administrateur.connexion_admin_vue import ConnexionAdminVue
+
+        if not self._is_admin():
+            return ConnexionAdminVue("Accès refusé.")
+
+        action = inquirer.select(
+            message="Actions :",
+            choices=[
+                "Actualiser",
+                "Remettre les compteurs à zéro",
+                "--- Retour ---",
+            ],
+        ).execute()
+
+        if action == "Actualiser":
+            return RequetesSqlVue()
+        if action == "Remettre les compteurs à zéro":
+            self.profilage.vider()
+            return RequetesSqlVue("Compteurs remis à zéro.")
+        return ConnexionAdminVue("Retour au menu admin")
@@ -11,6 +11,7 @@ from view.session import Session
 
 # On passe par le service
 from service.evenement_service import EvenementService
+from service.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +106,15 @@ class SupprimerEvenementVue(VueAbstraite):
             print("Suppression annulée par l'utilisateur.")
             return AccueilVue("Suppression annulée — retour au menu principal")
 
+        # --- Inscrits à prévenir : lus avant la suppression (réservations en cascade) ---
+        destinataires = []
+        if inquirer.confirm(message="Prévenir les inscrits par e-mail ?", default=True).execute():
+            try:
+                destinataires = NotificationService().destinataires_evenement(id_evenement)
+            except Exception as e:
+                logger.exception("Erreur lecture des inscrits: %s", e)
+                print("Impossible de lire la liste des inscrits : aucun e-mail ne sera envoyé.")
+
         # --- Suppression via service ---
         try:
             ok = self.service.delete_event(id_evenement)
@@ -118,4 +128,34 @@ class SupprimerEvenementVue(VueAbstraite):
             return AccueilVue("Échec suppression — retour au menu principal")
 
         print(f"Événement supprimé (id={id_evenement}).")
+
+        if destinataires:
+            self._prevenir_inscrits(evt, destinataires)
+
         return AccueilVue("Événement supprimé — retour au menu principal")
+
+    def _prevenir_inscrits(self, evt, destinataires) -> None:
+        """Notifie l'annulation aux inscrits (envoi groupé) et affiche le rapport."""
+        try:
+            rapport = NotificationService().envoyer(
+                destinataires,
+                f"Annulation : {evt.titre} — BDE Ensai",
+                (
+                    "Bonjour {{ params.prenom }} {{ params.nom }},\n\n"
+                    f"L'événement « {evt.titre} » du {evt.date_evenement} est annulé "
+                    "et votre réservation a été supprimée.\n\n"
+                    "— L’équipe du BDE Ensai"
+                ),
+            )
+        except Exception as e:
+            logger.exception("Erreur notification des inscrits: %s", e)
+            print("Erreur lors de l'envoi des e-mails aux inscrits.")
+            return
+
+        print(
+            f"{rapport.nb_envoyes}/{rapport.nb_destinataires} inscrit(s) prévenu(s) "
+            f"en {rapport.duree:.1f} s ({rapport.nb_requetes} requête(s), {rapport.debit:.0f} e-mails/s)."
+        )
+        for d in rapport.destinataires:
+            if d.statut == "echec":
+                print(f"  - échec pour {d.email} : {d.detail}")
@@ -8,10 +8,8 @@ from view.session import Session
 from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
 
-# Email (Brevo)
-from dotenv import load_dotenv
-from utils.api_brevo import send_email_brevo
-load_dotenv()
+# E-mails : déposés dans la boîte d'envoi (OutboxEmailService)
+from model.email_models import EmailModelIn
 
 
 class ModificationReservationVue(VueAbstraite):
@@ -21,7 +19,7 @@ class ModificationReservationVue(VueAbstraite):
     - Affiche le titre de l'événement associé
     - Permet de modifier les options (bus, adhérent, etc.)
     - Met à jour via ReservationService
-    - Envoie un e-mail de confirmation (best-effort)
+    - Dépose un e-mail de confirmation dans la boîte d'envoi
     """
 
     def __init__(self, message: str = ""):
@@ -133,10 +131,26 @@ class ModificationReservationVue(VueAbstraite):
         if not confirme:
             return ConnexionClientVue("Modification annulée.")
 
-        # 7️ Mise à jour via le service
+        # 7️ Mise à jour via le service, e-mail déposé dans la même transaction
+        ev_label = self._events_title_map().get(getattr(resa, "fk_evenement", None), f"Événement #{getattr(resa, 'fk_evenement', '?')}")
+        options = [k.replace("_", " ").capitalize() for k, v in new.items() if v]
+        options_str = ", ".join(options) if options else "Aucune option"
+        email = EmailModelIn(
+            destinataire=user.email,
+            sujet="Modification de votre réservation — BDE Ensai",
+            contenu=(
+                f"Bonjour {user.prenom} {user.nom},\n\n"
+                f"Les options de votre réservation #{resa.id_reservation} ont été mises à jour.\n\n"
+                f"{ev_label}\n"
+                f"Nouvelles options : {options_str}\n\n"
+                "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
+                "— L’équipe du BDE Ensai"
+            ),
+        )
         try:
             updated = self.reservation_service.update_reservation_flags(
                 resa.id_reservation,
+                email=email,
                 **new
             )
             if not updated:
@@ -145,31 +159,6 @@ class ModificationReservationVue(VueAbstraite):
             print(f"Erreur lors de la mise à jour : {exc}")
             return ConnexionClientVue("Échec de la modification de la réservation.")
 
-        # 8️ E-mail de confirmation (best-effort)
-        try:
-            ev_label = self._events_title_map().get(getattr(resa, "fk_evenement", None), f"Événement #{getattr(resa, 'fk_evenement', '?')}")
-            options = [k.replace("_", " ").capitalize() for k, v in new.items() if v]
-            options_str = ", ".join(options) if options else "Aucune option"
-
-            subject = "Modification de votre réservation — BDE Ensai"
-            message_text = (
-                f"Bonjour {user.prenom} {user.nom},\n\n"
-                f"Les options de votre réservation #{resa.id_reservation} ont été mises à jour.\n\n"
-                f"{ev_label}\n"
-                f"Nouvelles options : {options_str}\n\n"
-                "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
-                "— L’équipe du BDE Ensai"
-            )
-            status, response = send_email_brevo(
-                to_email=user.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation de modification vous a été envoyé.")
-            else:
-                print(f"E-mail non envoyé (HTTP {status}).")
-        except Exception as exc:
-            print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
+        print("Un e-mail de confirmation de modification va vous être envoyé.")
 
         return ConnexionClientVue("Réservation modifiée avec succès.")
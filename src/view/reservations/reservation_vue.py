@@ -1,4 +1,5 @@
 # src/view/reservations/reservation_vue.py
+import time
 from typing import Optional, Any, Union
 from datetime import date
 from InquirerPy import inquirer
@@ -7,24 +8,17 @@ from view.vue_abstraite import VueAbstraite
 from view.session import Session
 
 # Passage aux services
+from service.admission_service import AdmissionService
 from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
 from model.reservation_models import ReservationModelIn
+from model.email_models import EmailModelIn
 # On importe EvenementModelOut pour les type hints
 try:
     from model.evenement_models import EvenementModelOut
 except ImportError:
     EvenementModelOut = object # Fallback si le fichier n'existe pas
 
-# Envoi d’e-mail de confirmation
-from dotenv import load_dotenv
-try:
-    from utils.api_brevo import send_email_brevo
-    LOADED_BREVO = True
-except ImportError:
-    LOADED_BREVO = False
-    print("WARNING: 'api_brevo' non trouvé. L'envoi d'email sera désactivé.")
-load_dotenv()
 
 
 class ReservationVue(VueAbstraite):
@@ -40,6 +34,7 @@ class ReservationVue(VueAbstraite):
         self.user = self.session.utilisateur
         self.reservation_service = ReservationService()
         self.evenement_service = EvenementService()
+        self.admission_service = AdmissionService()
         self.evenement = evenement # Garde l'événement (dict ou objet)
 
     # --- HELPER (la méthode robuste) ---
@@ -53,6 +48,20 @@ class ReservationVue(VueAbstraite):
         return getattr(obj, key, default)
     # --- FIN HELPER ---
 
+    def _attendre_admission(self) -> None:
+        """
+        File d'admission (ouverture de billetterie, ADMISSION_DEBIT) : prend un ticket
+        et patiente jusqu'à l'admission en affichant le rang et l'attente estimée.
+        """
+        ticket = self.admission_service.entrer(self.user.id_utilisateur)
+        while not ticket.admis:
+            print(f"File d'attente : rang {ticket.position}, environ {ticket.attente_estimee:.0f} s…")
+            time.sleep(min(max(ticket.attente_estimee, 1.0), 10.0))
+            ticket = (
+                self.admission_service.statut(self.user.id_utilisateur)
+                or self.admission_service.entrer(self.user.id_utilisateur)
+            )
+
     # ----------------- Cycle Vue -----------------
     def afficher(self) -> None:
         """
@@ -74,6 +83,9 @@ class ReservationVue(VueAbstraite):
             print("Vous devez être connecté pour réserver.")
             return ConsulterVue("Connexion requise pour réserver.")
 
+        # --- File d'admission (ouvertures de billetterie) ---
+        self._attendre_admission()
+
         # --- Étape 1 : sélectionner ou confirmer l’événement ---
         if not self.evenement:
             evenements = self.evenement_service.lister_evenements_disponibles()
@@ -101,9 +113,14 @@ class ReservationVue(VueAbstraite):
 
         # --- Étape 2 : vérifier les places restantes ---
         places = self._get_attr(evt, "places_restantes")
-        if places is not None and places <= 0:# Correction: <= 0
+        attente = places is not None and places <= 0
+        if attente:
             print("L'événement est complet.")
-            return ConsulterVue("Événement complet.")
+            if not inquirer.confirm(
+                message="Rejoindre la liste d'attente ? (place attribuée automatiquement dès qu'elle se libère)",
+                default=False,
+            ).execute():
+                return ConsulterVue("Événement complet.")
 
         # --- Étape 3 : saisie des options de réservation ---
         print("\n--- Choix de vos options ---")
@@ -131,8 +148,34 @@ class ReservationVue(VueAbstraite):
         )
 
         # --- Étape 5 : enregistrement via le service ---
+        # L'e-mail de confirmation est déposé dans la boîte d'envoi, dans la même
+        # transaction que la réservation : il part en arrière-plan (OutboxEmailService).
+        email = EmailModelIn(
+            destinataire=self.user.email,
+            sujet="Confirmation de votre réservation — BDE Ensai",
+            contenu=(
+                f"Bonjour {self.user.prenom} {self.user.nom},\n\n"
+                f"Votre réservation pour l’événement « {titre_evt} » du {date_evt} est confirmée.\n\n"
+                f"Options :\n"
+                f" - Bus aller : {'Oui' if bus_aller else 'Non'}\n"
+                f" - Bus retour : {'Oui' if bus_retour else 'Non'}\n"
+                f" - Adhérent : {'Oui' if adherent else 'Non'}\n"
+                f" - SAM : {'Oui' if sam else 'Non'}\n"
+                f" - Boisson : {'Oui' if boisson else 'Non'}\n\n"
+                "Si vous n’êtes pas à l’origine de cette action, veuillez nous contacter.\n\n"
+                "— L’équipe du BDE Ensai"
+            ),
+        )
         try:
-            resa_out = self.reservation_service.create_reservation(resa_in)
+            if attente:
+                resultat = self.reservation_service.reserver(resa_in, email=email, liste_attente=True)
+                if resultat.statut == "en_attente":
+                    print(f"Vous êtes en liste d'attente pour {titre_evt} (rang {resultat.position}).")
+                    print("Un e-mail vous préviendra dès qu'une place vous sera attribuée.")
+                    return ConnexionClientVue("Inscription en liste d'attente effectuée.")
+                resa_out = resultat.reservation
+            else:
+                resa_out = self.reservation_service.create_reservation(resa_in, email=email)
         except Exception as e:
             print(f"Erreur lors de la création de la réservation : {e}")
             return ConnexionClientVue("Erreur lors de la réservation.")
@@ -142,37 +185,7 @@ class ReservationVue(VueAbstraite):
             return ConnexionClientVue("Échec de la réservation.")
 
         print(f"Réservation confirmée pour {titre_evt} ({date_evt})")
+        print("Un e-mail de confirmation va vous être envoyé.")
 
-        # --- Étape 6 : e-mail de confirmation ---
-        if LOADED_BREVO: # On n'essaie pas si l'import a échoué
-            try:
-                subject = "Confirmation de votre réservation — BDE Ensai"
-                message_text = (
-                    f"Bonjour {self.user.prenom} {self.user.nom},\n\n"
-                    f"Votre réservation pour l’événement « {titre_evt} » du {date_evt} est confirmée.\n\n"
-                    f"Options :\n"
-                    f" - Bus aller : {'Oui' if bus_aller else 'Non'}\n"
-                    f" - Bus retour : {'Oui' if bus_retour else 'Non'}\n"
-                    f" - Adhérent : {'Oui' if adherent else 'Non'}\n"
-                    f" - SAM : {'Oui' if sam else 'Non'}\n"
-                    f" - Boisson : {'Oui' if boisson else 'Non'}\n\n"
-                    "Si vous n’êtes pas à l’origine de cette action, veuillez nous contacter.\n\n"
-                    "— L’équipe du BDE Ensai"
-                )
-
-                status, _ = send_email_brevo(
-                    to_email=self.user.email,
-                    subject=subject,
-                    message_text=message_text,
-                )
-
-                if 200 <= status < 300:
-                    print("Un e-mail de confirmation vous a été envoyé.")
-                else:
-                    print(f"E-mail non envoyé (HTTP {status}).")
-
-            except Exception as exc:
-                print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
-
-        # --- Étape 7 : retour au menu client ---
+        # --- Étape 6 : retour au menu client ---
         return ConnexionClientVue("Réservation effectuée avec succès.")
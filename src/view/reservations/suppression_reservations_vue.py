@@ -9,10 +9,8 @@ from view.session import Session
 from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
 
-# Envoi d'e-mail (Brevo)
-from dotenv import load_dotenv
-from utils.api_brevo import send_email_brevo
-load_dotenv()
+# E-mails : déposés dans la boîte d'envoi (OutboxEmailService)
+from model.email_models import EmailModelIn
 
 
 class SuppressionReservationVue(VueAbstraite):
@@ -127,35 +125,26 @@ class SuppressionReservationVue(VueAbstraite):
         if saisie.strip().upper() != "SUPPRIMER":
             return ConnexionClientVue("Suppression annulée.")
 
-        # 4️ Suppression via le service
+        # 4️ Suppression via le service, e-mail d'annulation déposé dans la même transaction
+        email = EmailModelIn(
+            destinataire=user.email,
+            sujet="Annulation de réservation — BDE Ensai",
+            contenu=(
+                f"Bonjour {user.prenom} {user.nom},\n\n"
+                f"Votre réservation #{resa.id_reservation} a été supprimée.\n"
+                f"Détails : {ev_label}\n\n"
+                "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
+                "— L’équipe du BDE Ensai"
+            ),
+        )
         try:
-            ok = self.reservation_service.delete_reservation(resa.id_reservation)
+            ok = self.reservation_service.delete_reservation(resa.id_reservation, email=email)
             if not ok:
                 return ConnexionClientVue("Échec de la suppression (aucune ligne affectée).")
         except Exception as exc:
             print(f"Erreur lors de la suppression : {exc}")
             return ConnexionClientVue("Échec de la suppression de la réservation.")
 
-        # 5️ E-mail de confirmation (best-effort)
-        try:
-            subject = "Annulation de réservation — BDE Ensai"
-            message_text = (
-                f"Bonjour {user.prenom} {user.nom},\n\n"
-                f"Votre réservation #{resa.id_reservation} a été supprimée.\n"
-                f"Détails : {ev_label}\n\n"
-                "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
-                "— L’équipe du BDE Ensai"
-            )
-            status, _ = send_email_brevo(
-                to_email=user.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation d'annulation vous a été envoyé.")
-            else:
-                print(f" E-mail non envoyé (HTTP {status}).")
-        except Exception as exc:
-            print(f" Impossible d'envoyer l'e-mail de confirmation : {exc}")
+        print("Un e-mail de confirmation d'annulation va vous être envoyé.")
 
         return ConnexionClientVue("✅ Réservation supprimée avec succès.")